@@ -0,0 +1,22 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("account", "0059_customer_order_stats"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="first_order_date",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(
+                fields=["first_order_date"], name="user_first_order_date_idx"
+            ),
+        ),
+    ]
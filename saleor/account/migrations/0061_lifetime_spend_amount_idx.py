@@ -0,0 +1,18 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("account", "0060_user_first_order_date"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="customerlifetimespend",
+            index=models.Index(
+                fields=["currency", "total_gross_amount"],
+                name="lifetime_spend_amount_idx",
+            ),
+        ),
+    ]
@@ -18,6 +18,7 @@ from django.forms.models import model_to_dict
 from django.utils import timezone
 from django.utils.crypto import get_random_string
 from django_countries.fields import Country, CountryField
+from django_prices.models import MoneyField
 from phonenumber_field.modelfields import PhoneNumber, PhoneNumberField
 from versatileimagefield.fields import VersatileImageField
 
@@ -171,6 +172,10 @@ class User(PermissionsMixin, ModelWithMetadata, AbstractBaseUser):
         max_length=35, choices=settings.LANGUAGES, default=settings.LANGUAGE_CODE
     )
     search_document = models.TextField(blank=True, default="")
+    # Aggregates of the user's orders, maintained on order changes.
+    number_of_orders = models.PositiveIntegerField(default=0)
+    first_order_date = models.DateTimeField(null=True, blank=True)
+    last_order_date = models.DateTimeField(null=True, blank=True)
 
     USERNAME_FIELD = "email"
 
@@ -199,6 +204,12 @@ class User(PermissionsMixin, ModelWithMetadata, AbstractBaseUser):
                 fields=["search_document"],
                 opclasses=["gin_trgm_ops"],
             ),
+            # Customers filtering and sorting indexes
+            models.Index(
+                name="user_number_of_orders_idx", fields=["number_of_orders", "email"]
+            ),
+            models.Index(name="user_first_order_date_idx", fields=["first_order_date"]),
+            models.Index(name="user_last_order_date_idx", fields=["last_order_date"]),
         ]
 
     def __init__(self, *args, **kwargs):
@@ -287,6 +298,33 @@ class CustomerNote(models.Model):
         ordering = ("date",)
 
 
+class CustomerLifetimeSpend(models.Model):
+    """Total of the customer's orders in a single currency."""
+
+    user = models.ForeignKey(
+        User, related_name="lifetime_spend", on_delete=models.CASCADE
+    )
+    currency = models.CharField(max_length=settings.DEFAULT_CURRENCY_CODE_LENGTH)
+    total_gross_amount = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        default=0,
+    )
+    total_gross = MoneyField(
+        amount_field="total_gross_amount", currency_field="currency"
+    )
+
+    class Meta:
+        ordering = ("currency",)
+        unique_together = [["user", "currency"]]
+        indexes = [
+            models.Index(
+                name="lifetime_spend_amount_idx",
+                fields=["currency", "total_gross_amount"],
+            )
+        ]
+
+
 class CustomerEvent(models.Model):
     """Model used to store events that happened during the customer lifecycle."""
 
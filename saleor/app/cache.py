@@ -0,0 +1,65 @@
+import hashlib
+from typing import Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Exists, OuterRef
+
+from .models import App, AppToken
+
+
+def _get_token_cache_key(auth_token: str) -> str:
+    # tokens are hashed, so they can't be read from the cache
+    token_hash = hashlib.sha256(auth_token.encode("utf-8")).hexdigest()
+    return f"app_auth:token:{token_hash}"
+
+
+def _get_app_cache_key(app_id: int) -> str:
+    return f"app_auth:app:{app_id}"
+
+
+def fetch_app_by_token(auth_token: str) -> Optional[App]:
+    tokens = AppToken.objects.filter(auth_token=auth_token).values("pk")
+    return App.objects.filter(Exists(tokens.filter(app_id=OuterRef("pk")))).first()
+
+
+def get_active_app_by_token(auth_token: str) -> Optional[App]:
+    """Return the active app owning the token, with its permissions loaded.
+
+    With `APP_AUTH_CACHE_ENABLED`, the token's app ID and the app are cached, so
+    authenticating apps doesn't query the database. Apps are cached with their
+    permissions, and inactive apps are cached too.
+    """
+    if not settings.APP_AUTH_CACHE_ENABLED:
+        app = fetch_app_by_token(auth_token)
+        return app if app and app.is_active else None
+
+    token_key = _get_token_cache_key(auth_token)
+    app_id = cache.get(token_key)
+    app = cache.get(_get_app_cache_key(app_id)) if app_id else None
+    if app is None:
+        app = fetch_app_by_token(auth_token)
+        if app is None:
+            cache.delete(token_key)
+            return None
+        # load permissions before caching, so they're cached with the app
+        app.get_permissions()
+        cache.set_many(
+            {token_key: app.pk, _get_app_cache_key(app.pk): app},
+            timeout=settings.APP_AUTH_CACHE_TIMEOUT.total_seconds(),
+        )
+    return app if app.is_active else None
+
+
+def invalidate_app_cache(app_id: Optional[int] = None, auth_tokens: Iterable[str] = ()):
+    """Drop the cached app and tokens.
+
+    Entries are dropped right away and again once the transaction is committed,
+    so entries cached by other requests in the meantime are dropped as well.
+    """
+    keys = [_get_token_cache_key(auth_token) for auth_token in auth_tokens]
+    if app_id:
+        keys.append(_get_app_cache_key(app_id))
+    cache.delete_many(keys)
+    transaction.on_commit(lambda: cache.delete_many(keys))
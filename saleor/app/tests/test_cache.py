@@ -0,0 +1,106 @@
+import pytest
+from django.core.cache import cache
+
+from ...tests.utils import flush_post_commit_hooks
+from ..cache import get_active_app_by_token, invalidate_app_cache
+
+
+@pytest.fixture
+def app_auth_cache(settings):
+    settings.APP_AUTH_CACHE_ENABLED = True
+    cache.clear()
+
+
+def test_get_active_app_by_token(app, permission_manage_products):
+    # given
+    app.permissions.add(permission_manage_products)
+    token = app.tokens.get()
+
+    # when
+    fetched_app = get_active_app_by_token(token.auth_token)
+
+    # then
+    assert fetched_app == app
+    assert fetched_app.has_perm("product.manage_products")
+
+
+def test_get_active_app_by_token_inactive_app(app):
+    # given
+    app.is_active = False
+    app.save(update_fields=["is_active"])
+    token = app.tokens.get()
+
+    # when
+    fetched_app = get_active_app_by_token(token.auth_token)
+
+    # then
+    assert fetched_app is None
+
+
+def test_get_active_app_by_token_invalid_token(app, app_auth_cache):
+    # when
+    fetched_app = get_active_app_by_token("invalid-token")
+
+    # then
+    assert fetched_app is None
+
+
+def test_get_active_app_by_token_cached(
+    app, permission_manage_products, app_auth_cache, django_assert_num_queries
+):
+    # given
+    app.permissions.add(permission_manage_products)
+    token = app.tokens.get()
+    get_active_app_by_token(token.auth_token)
+
+    # when
+    with django_assert_num_queries(0):
+        fetched_app = get_active_app_by_token(token.auth_token)
+        has_perm = fetched_app.has_perm("product.manage_products")
+
+    # then
+    assert fetched_app == app
+    assert has_perm
+
+
+def test_get_active_app_by_token_cached_inactive_app(app, app_auth_cache):
+    # given
+    app.is_active = False
+    app.save(update_fields=["is_active"])
+    token = app.tokens.get()
+    get_active_app_by_token(token.auth_token)
+
+    # when
+    fetched_app = get_active_app_by_token(token.auth_token)
+
+    # then
+    assert fetched_app is None
+
+
+def test_invalidate_app_cache(app, app_auth_cache):
+    # given
+    token = app.tokens.get()
+    get_active_app_by_token(token.auth_token)
+    app.is_active = False
+    app.save(update_fields=["is_active"])
+
+    # when
+    invalidate_app_cache(app.pk)
+    flush_post_commit_hooks()
+
+    # then
+    assert get_active_app_by_token(token.auth_token) is None
+
+
+def test_invalidate_app_cache_for_deleted_token(app, app_auth_cache):
+    # given
+    token = app.tokens.get()
+    get_active_app_by_token(token.auth_token)
+    token.delete()
+
+    # when
+    invalidate_app_cache(auth_tokens=[token.auth_token])
+    flush_post_commit_hooks()
+
+    # then
+    assert get_active_app_by_token(token.auth_token) is None
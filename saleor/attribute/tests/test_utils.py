@@ -1,7 +1,12 @@
 import pytest
 
 from ...product.models import ProductType
-from ..utils import associate_attribute_values_to_instance
+from ..models import AttributeValue
+from ..utils import (
+    associate_attribute_values_to_instance,
+    associate_attribute_values_to_instances,
+    get_or_create_attribute_values,
+)
 
 
 def test_associate_attribute_to_non_product_instance(color_attribute):
@@ -106,3 +111,98 @@ def test_associate_attribute_to_variant_instance_multiple_values(variant):
     assert list(
         new_assignment.variantvalueassignment.values_list("value__pk", "sort_order")
     ) == [(values[0].pk, 0), (values[1].pk, 1)]
+
+
+def test_get_or_create_attribute_values(color_attribute, size_attribute):
+    # given
+    red = color_attribute.values.get(slug="red")
+    values = [
+        AttributeValue(attribute=color_attribute, slug="red", name="Changed"),
+        AttributeValue(attribute=color_attribute, slug="green", name="Green"),
+        AttributeValue(attribute=color_attribute, slug="white", name="White"),
+        AttributeValue(attribute=size_attribute, slug="medium", name="Medium"),
+    ]
+
+    # when
+    saved_values = get_or_create_attribute_values(values)
+
+    # then
+    assert saved_values[(color_attribute.pk, "red")] == red
+    assert saved_values[(color_attribute.pk, "red")].name == "Red"
+    green = saved_values[(color_attribute.pk, "green")]
+    white = saved_values[(color_attribute.pk, "white")]
+    medium = saved_values[(size_attribute.pk, "medium")]
+    assert (green.name, green.sort_order) == ("Green", 2)
+    assert (white.name, white.sort_order) == ("White", 3)
+    assert (medium.name, medium.sort_order) == ("Medium", 2)
+
+
+def test_get_or_create_attribute_values_with_update_fields(color_attribute):
+    # given
+    red = color_attribute.values.get(slug="red")
+    values = [AttributeValue(attribute=color_attribute, slug="red", name="Changed")]
+
+    # when
+    saved_values = get_or_create_attribute_values(values, update_fields=["name"])
+
+    # then
+    assert saved_values[(color_attribute.pk, "red")] == red
+    red.refresh_from_db()
+    assert red.name == "Changed"
+
+
+def test_associate_attribute_values_to_instances(
+    product_with_two_variants, size_attribute
+):
+    # given
+    first_variant, second_variant = product_with_two_variants.variants.all()
+    small, big = size_attribute.values.all()
+
+    # when
+    assignments = associate_attribute_values_to_instances(
+        [
+            (first_variant, size_attribute, [big, small]),
+            (second_variant, size_attribute, [small]),
+        ]
+    )
+
+    # then
+    first_assignment, second_assignment = assignments
+    assert first_assignment.variant == first_variant
+    assert list(
+        first_assignment.variantvalueassignment.values_list("value__pk", "sort_order")
+    ) == [(big.pk, 0), (small.pk, 1)]
+    assert second_assignment.variant == second_variant
+    assert list(second_assignment.values.all()) == [small]
+
+
+def test_associate_attribute_values_to_instances_replaces_values(product):
+    # given
+    old_assignment = product.attributes.first()
+    attribute = old_assignment.attribute
+    values = attribute.values.all()
+
+    # when
+    (new_assignment,) = associate_attribute_values_to_instances(
+        [(product, attribute, [values[1], values[0]])]
+    )
+
+    # then
+    assert new_assignment.pk == old_assignment.pk
+    assert list(
+        new_assignment.productvalueassignment.values_list("value__pk", "sort_order")
+    ) == [(values[1].pk, 0), (values[0].pk, 1)]
+
+
+def test_associate_attribute_values_to_instances_from_different_attribute(
+    product, color_attribute, size_attribute
+):
+    # given
+    value = size_attribute.values.first()
+
+    # when
+    with pytest.raises(AssertionError) as exc:
+        associate_attribute_values_to_instances([(product, color_attribute, [value])])
+
+    # then
+    assert exc.value.args == ("Some values are not from the provided attribute.",)
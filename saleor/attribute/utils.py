@@ -1,4 +1,6 @@
-from typing import TYPE_CHECKING, Iterable, Set, Union
+from typing import Dict, Iterable, List, Sequence, Set, Tuple, Type, Union
+
+from django.db.models import Max
 
 from ..page.models import Page
 from ..product.models import Product, ProductVariant
@@ -10,7 +12,10 @@ from .models import (
     AssignedVariantAttribute,
     AssignedVariantAttributeValue,
     Attribute,
+    AttributePage,
+    AttributeProduct,
     AttributeValue,
+    AttributeVariant,
 )
 
 AttributeAssignmentType = Union[
@@ -18,9 +23,23 @@ AttributeAssignmentType = Union[
 ]
 T_INSTANCE = Union[Product, ProductVariant, Page]
 
-
-if TYPE_CHECKING:
-    from .models import AttributePage, AttributeProduct, AttributeVariant
+# The attribute relation, assignment and value assignment models of each instance
+# model and the assignment field pointing to the instance.
+ASSIGNMENT_MODELS: Dict[Type[T_INSTANCE], Tuple[Type, Type, str, Type]] = {
+    Product: (
+        AttributeProduct,
+        AssignedProductAttribute,
+        "product",
+        AssignedProductAttributeValue,
+    ),
+    ProductVariant: (
+        AttributeVariant,
+        AssignedVariantAttribute,
+        "variant",
+        AssignedVariantAttributeValue,
+    ),
+    Page: (AttributePage, AssignedPageAttribute, "page", AssignedPageAttributeValue),
+}
 
 
 def associate_attribute_values_to_instance(
@@ -65,7 +84,7 @@ def _associate_attribute_to_instance(
     assignment: AttributeAssignmentType
     if isinstance(instance, Product):
         attribute_rel: Union[
-            "AttributeProduct", "AttributeVariant", "AttributePage"
+            AttributeProduct, AttributeVariant, AttributePage
         ] = instance.product_type.attributeproduct.get(attribute_id=attribute_pk)
 
         assignment, _ = AssignedProductAttribute.objects.get_or_create(
@@ -115,3 +134,163 @@ def sort_assigned_attribute_values(
         value_assignment.sort_order = index
 
     assignment_model.objects.bulk_update(values_assignment, ["sort_order"])
+
+
+def get_or_create_attribute_values(
+    values: Iterable[AttributeValue], update_fields: Sequence[str] = ()
+) -> Dict[Tuple[int, str], AttributeValue]:
+    """Return saved attribute values matching the given ones by attribute and slug.
+
+    The values are looked up with a single query and the missing ones are created
+    with a single bulk insert, at the end of their attributes' values. Values created
+    concurrently are fetched instead of failing on slug conflicts. With
+    `update_fields`, the found values are updated from the given ones, like with
+    `update_or_create`.
+    """
+    values_by_key = {(value.attribute_id, value.slug): value for value in values}
+    if not values_by_key:
+        return {}
+
+    saved_values = _get_attribute_values_by_key(values_by_key)
+    if update_fields:
+        changed_values = []
+        for key, saved_value in saved_values.items():
+            value = values_by_key[key]
+            if any(
+                getattr(saved_value, field) != getattr(value, field)
+                for field in update_fields
+            ):
+                for field in update_fields:
+                    setattr(saved_value, field, getattr(value, field))
+                changed_values.append(saved_value)
+        AttributeValue.objects.bulk_update(changed_values, update_fields)
+
+    missing_values = {
+        key: value for key, value in values_by_key.items() if key not in saved_values
+    }
+    if missing_values:
+        _set_sort_order_of_new_values(missing_values.values())
+        # primary keys aren't set when conflicts are ignored, so values are fetched
+        AttributeValue.objects.bulk_create(
+            missing_values.values(), ignore_conflicts=True
+        )
+        saved_values.update(_get_attribute_values_by_key(missing_values))
+    return saved_values
+
+
+def _get_attribute_values_by_key(
+    values_by_key: Dict[Tuple[int, str], AttributeValue]
+) -> Dict[Tuple[int, str], AttributeValue]:
+    values = AttributeValue.objects.filter(
+        attribute_id__in={attribute_id for attribute_id, _ in values_by_key},
+        slug__in={slug for _, slug in values_by_key},
+    )
+    return {
+        (value.attribute_id, value.slug): value
+        for value in values
+        if (value.attribute_id, value.slug) in values_by_key
+    }
+
+
+def _set_sort_order_of_new_values(values: Iterable[AttributeValue]):
+    values = list(values)
+    max_sort_orders = dict(
+        AttributeValue.objects.filter(
+            attribute_id__in={value.attribute_id for value in values}
+        )
+        .order_by()
+        .values("attribute_id")
+        .annotate(max_sort_order=Max("sort_order"))
+        .values_list("attribute_id", "max_sort_order")
+    )
+    for value in values:
+        existing_max = max_sort_orders.get(value.attribute_id)
+        value.sort_order = 0 if existing_max is None else existing_max + 1
+        max_sort_orders[value.attribute_id] = value.sort_order
+
+
+def _get_instance_type_id(instance: T_INSTANCE) -> int:
+    if isinstance(instance, ProductVariant):
+        return instance.product.product_type_id
+    if isinstance(instance, Product):
+        return instance.product_type_id
+    return instance.page_type_id
+
+
+def associate_attribute_values_to_instances(
+    instances_values: Iterable[Tuple[T_INSTANCE, Attribute, Sequence[AttributeValue]]],
+) -> List[AttributeAssignmentType]:
+    """Assign attribute values to many products, variants or pages at once.
+
+    Like `associate_attribute_values_to_instance`, values already assigned to the
+    given attributes are replaced by the given values in the given order, but
+    assignments of all instances and attributes are saved with a constant number
+    of queries. All instances must be of the same type.
+    """
+    instances_values = list(instances_values)
+    if not instances_values:
+        return []
+
+    instance_model = type(instances_values[0][0])
+    if instance_model not in ASSIGNMENT_MODELS:
+        raise AssertionError(f"{instance_model.__name__} is unsupported")
+    (
+        attribute_rel_model,
+        assignment_model,
+        instance_field,
+        value_assignment_model,
+    ) = ASSIGNMENT_MODELS[instance_model]
+    type_field = "page_type_id" if instance_model is Page else "product_type_id"
+
+    for _instance, attribute, values in instances_values:
+        if any(value.attribute_id != attribute.pk for value in values):
+            raise AssertionError("Some values are not from the provided attribute.")
+
+    instances = [instance for instance, _, _ in instances_values]
+    type_ids = {_get_instance_type_id(instance) for instance in instances}
+    attribute_ids = {attribute.pk for _, attribute, _ in instances_values}
+    attribute_rels = {}
+    for attribute_rel in attribute_rel_model.objects.filter(
+        **{f"{type_field}__in": type_ids}, attribute_id__in=attribute_ids
+    ):
+        type_id = getattr(attribute_rel, type_field)
+        attribute_rels[(type_id, attribute_rel.attribute_id)] = attribute_rel
+    assignments = {}
+    for assignment in assignment_model.objects.filter(
+        **{f"{instance_field}__in": instances},
+        assignment__in=attribute_rels.values(),
+    ):
+        instance_id = getattr(assignment, f"{instance_field}_id")
+        assignments[(instance_id, assignment.assignment_id)] = assignment
+
+    new_assignments = []
+    assignments_values = []
+    for instance, attribute, values in instances_values:
+        type_id = _get_instance_type_id(instance)
+        attribute_rel = attribute_rels.get((type_id, attribute.pk))
+        if attribute_rel is None:
+            raise attribute_rel_model.DoesNotExist(
+                f"Attribute {attribute.pk} is not assigned to type {type_id}."
+            )
+        assignment = assignments.get((instance.pk, attribute_rel.pk))
+        if assignment is None:
+            assignment = assignment_model(
+                **{instance_field: instance}, assignment=attribute_rel
+            )
+            assignments[(instance.pk, attribute_rel.pk)] = assignment
+            new_assignments.append(assignment)
+        # the same value can be given twice, e.g. by names with the same slug
+        assignments_values.append((assignment, list(dict.fromkeys(values))))
+    assignment_model.objects.bulk_create(new_assignments)
+
+    value_assignment_model.objects.filter(
+        assignment__in=[assignment for assignment, _ in assignments_values]
+    ).delete()
+    value_assignment_model.objects.bulk_create(
+        [
+            value_assignment_model(assignment=assignment, value=value, sort_order=index)
+            for assignment, values in assignments_values
+            for index, value in enumerate(values)
+        ]
+    )
+    return [assignment for assignment, _ in assignments_values]
@@ -11,3 +11,21 @@ class AddressType:
         (BILLING, "Billing"),
         (SHIPPING, "Shipping"),
     ]
+
+
+class CheckoutCompleteRequestStatus:
+    """Statuses of checkouts queued to be completed by workers."""
+
+    PENDING = "pending"
+    PROCESSING = "processing"
+    COMPLETED = "completed"
+    CONFIRMATION_NEEDED = "confirmation_needed"
+    FAILED = "failed"
+
+    CHOICES = [
+        (PENDING, "Pending"),
+        (PROCESSING, "Processing"),
+        (COMPLETED, "Completed"),
+        (CONFIRMATION_NEEDED, "Confirmation needed"),
+        (FAILED, "Failed"),
+    ]
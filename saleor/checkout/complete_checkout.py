@@ -14,7 +14,7 @@ from ..checkout import calculations
 from ..checkout.error_codes import CheckoutErrorCode
 from ..core.exceptions import InsufficientStock
 from ..core.taxes import TaxError, zero_taxed_money
-from ..core.tracing import traced_atomic_transaction
+from ..core.tracing import opentracing_trace, traced_atomic_transaction, traced_phase
 from ..core.utils.url import validate_storefront_url
 from ..discount import DiscountInfo, DiscountValueType, OrderDiscountType, VoucherType
 from ..discount.models import NotApplicable
@@ -353,13 +353,20 @@ def _prepare_order_data(
         checkout_info.shipping_address or checkout_info.billing_address
     )  # FIXME: check which address we need here
 
-    taxed_total = calculations.checkout_total(
-        manager=manager,
-        checkout_info=checkout_info,
-        lines=lines,
-        address=address,
-        discounts=discounts,
-    )
+    with traced_phase("checkout_complete.calculate_taxes"):
+        taxed_total = calculations.checkout_total(
+            manager=manager,
+            checkout_info=checkout_info,
+            lines=lines,
+            address=address,
+            discounts=discounts,
+        )
+        shipping_total = manager.calculate_checkout_shipping(
+            checkout_info, lines, address, discounts
+        )
+        shipping_tax_rate = manager.get_checkout_shipping_tax_rate(
+            checkout_info, lines, address, discounts, shipping_total
+        )
     cards_total = checkout.get_total_gift_cards_balance()
     taxed_total.gross -= cards_total
     taxed_total.net -= cards_total
@@ -367,12 +374,6 @@ def _prepare_order_data(
     taxed_total = max(taxed_total, zero_taxed_money(checkout.currency))
     undiscounted_total = taxed_total + checkout.discount
 
-    shipping_total = manager.calculate_checkout_shipping(
-        checkout_info, lines, address, discounts
-    )
-    shipping_tax_rate = manager.get_checkout_shipping_tax_rate(
-        checkout_info, lines, address, discounts, shipping_total
-    )
     order_data.update(
         _process_shipping_data_for_order(checkout_info, shipping_total, manager, lines)
     )
@@ -387,14 +388,15 @@ def _prepare_order_data(
         }
     )
 
-    order_data["lines"] = _create_lines_for_order(
-        manager,
-        checkout_info,
-        lines,
-        discounts,
-        check_reservations,
-        taxes_included_in_prices,
-    )
+    with traced_phase("checkout_complete.create_lines_for_order"):
+        order_data["lines"] = _create_lines_for_order(
+            manager,
+            checkout_info,
+            lines,
+            discounts,
+            check_reservations,
+            taxes_included_in_prices,
+        )
 
     # validate checkout gift cards
     _validate_gift_cards(checkout)
@@ -408,7 +410,8 @@ def _prepare_order_data(
     ).gross
 
     try:
-        manager.preprocess_order_creation(checkout_info, discounts, lines)
+        with traced_phase("checkout_complete.preprocess_order_creation"):
+            manager.preprocess_order_creation(checkout_info, discounts, lines)
     except TaxError:
         release_voucher_usage(order_data)
         raise
@@ -497,21 +500,22 @@ def _create_order(
     additional_warehouse_lookup = (
         checkout_info.delivery_method_info.get_warehouse_filter_lookup()
     )
-    allocate_stocks(
-        order_lines_info,
-        country_code,
-        checkout_info.channel.slug,
-        manager,
-        additional_warehouse_lookup,
-        check_reservations=is_reservation_enabled(site_settings),
-        checkout_lines=[line.line for line in checkout_lines],
-    )
-    allocate_preorders(
-        order_lines_info,
-        checkout_info.channel.slug,
-        check_reservations=is_reservation_enabled(site_settings),
-        checkout_lines=[line.line for line in checkout_lines],
-    )
+    with traced_phase("checkout_complete.allocate_stocks"):
+        allocate_stocks(
+            order_lines_info,
+            country_code,
+            checkout_info.channel.slug,
+            manager,
+            additional_warehouse_lookup,
+            check_reservations=is_reservation_enabled(site_settings),
+            checkout_lines=[line.line for line in checkout_lines],
+        )
+        allocate_preorders(
+            order_lines_info,
+            checkout_info.channel.slug,
+            check_reservations=is_reservation_enabled(site_settings),
+            checkout_lines=[line.line for line in checkout_lines],
+        )
 
     add_gift_cards_to_order(checkout_info, order, total_price_left, user, app)
 
@@ -535,14 +539,18 @@ def _create_order(
     )
 
     transaction.on_commit(
-        lambda: order_created(
-            order_info=order_info, user=user, app=app, manager=manager
+        traced_phase("checkout_complete.on_commit.order_created")(
+            lambda: order_created(
+                order_info=order_info, user=user, app=app, manager=manager
+            )
         )
     )
 
     # Send the order confirmation email
     transaction.on_commit(
-        lambda: send_order_confirmation(order_info, checkout.redirect_url, manager)
+        traced_phase("checkout_complete.on_commit.send_order_confirmation")(
+            lambda: send_order_confirmation(order_info, checkout.redirect_url, manager)
+        )
     )
 
     if site_settings.automatically_fulfill_non_shippable_gift_card:
@@ -648,23 +656,26 @@ def _process_payment(
 ) -> Transaction:
     """Process the payment assigned to checkout."""
     try:
-        if payment.to_confirm:
-            txn = gateway.confirm(
-                payment,
-                manager,
-                additional_data=payment_data,
-                channel_slug=channel_slug,
-            )
-        else:
-            txn = gateway.process_payment(
-                payment=payment,
-                token=payment.token,
-                manager=manager,
-                customer_id=customer_id,
-                store_source=store_source,
-                additional_data=payment_data,
-                channel_slug=channel_slug,
-            )
+        with opentracing_trace(
+            f"payment.{payment.gateway}", "payment", "payment_gateway"
+        ):
+            if payment.to_confirm:
+                txn = gateway.confirm(
+                    payment,
+                    manager,
+                    additional_data=payment_data,
+                    channel_slug=channel_slug,
+                )
+            else:
+                txn = gateway.process_payment(
+                    payment=payment,
+                    token=payment.token,
+                    manager=manager,
+                    customer_id=customer_id,
+                    store_source=store_source,
+                    additional_data=payment_data,
+                    channel_slug=channel_slug,
+                )
         payment.refresh_from_db()
         if not txn.is_success:
             raise PaymentError(txn.error)
@@ -674,6 +685,42 @@ def _process_payment(
     return txn
 
 
+def validate_checkout_for_completion(
+    checkout: Checkout,
+    lines: Iterable["CheckoutLineInfo"],
+    unavailable_variant_pks: Iterable[int],
+):
+    """Validate that the checkout has an email and lines available in its channel."""
+    if not checkout.email:
+        raise ValidationError(
+            "Checkout email must be set.",
+            code=CheckoutErrorCode.EMAIL_NOT_SET.value,
+        )
+    if unavailable_variant_pks:
+        not_available_variants_ids = {
+            graphene.Node.to_global_id("ProductVariant", pk)
+            for pk in unavailable_variant_pks
+        }
+        raise ValidationError(
+            {
+                "lines": ValidationError(
+                    "Some of the checkout lines variants are unavailable.",
+                    code=CheckoutErrorCode.UNAVAILABLE_VARIANT_IN_CHANNEL.value,
+                    params={"variants": not_available_variants_ids},
+                )
+            }
+        )
+    if not lines:
+        raise ValidationError(
+            {
+                "lines": ValidationError(
+                    "Cannot complete checkout without lines.",
+                    code=CheckoutErrorCode.NO_LINES.value,
+                )
+            }
+        )
+
+
 def complete_checkout(
     manager: "PluginsManager",
     checkout_info: "CheckoutInfo",
@@ -696,15 +743,16 @@ def complete_checkout(
     checkout = checkout_info.checkout
     channel_slug = checkout_info.channel.slug
     payment = checkout.get_last_active_payment()
-    _prepare_checkout(
-        manager=manager,
-        checkout_info=checkout_info,
-        lines=lines,
-        discounts=discounts,
-        tracking_code=tracking_code,
-        redirect_url=redirect_url,
-        payment=payment,
-    )
+    with traced_phase("checkout_complete.prepare_checkout"):
+        _prepare_checkout(
+            manager=manager,
+            checkout_info=checkout_info,
+            lines=lines,
+            discounts=discounts,
+            tracking_code=tracking_code,
+            redirect_url=redirect_url,
+            payment=payment,
+        )
 
     if site_settings is None:
         site_settings = Site.objects.get_current().settings
@@ -724,15 +772,16 @@ def complete_checkout(
     action_required = False
     action_data: Dict[str, str] = {}
     if payment:
-        txn = _process_payment(
-            payment=payment,  # type: ignore
-            customer_id=customer_id,
-            store_source=store_source,
-            payment_data=payment_data,
-            order_data=order_data,
-            manager=manager,
-            channel_slug=channel_slug,
-        )
+        with traced_phase("checkout_complete.process_payment"):
+            txn = _process_payment(
+                payment=payment,  # type: ignore
+                customer_id=customer_id,
+                store_source=store_source,
+                payment_data=payment_data,
+                order_data=order_data,
+                manager=manager,
+                channel_slug=channel_slug,
+            )
 
         if txn.customer_id and user.is_authenticated:
             store_customer_id(user, payment.gateway, txn.customer_id)  # type: ignore
@@ -745,15 +794,16 @@ def complete_checkout(
     order = None
     if not action_required:
         try:
-            order = _create_order(
-                checkout_info=checkout_info,
-                checkout_lines=lines,
-                order_data=order_data,
-                user=user,  # type: ignore
-                app=app,
-                manager=manager,
-                site_settings=site_settings,
-            )
+            with traced_phase("checkout_complete.create_order"):
+                order = _create_order(
+                    checkout_info=checkout_info,
+                    checkout_lines=lines,
+                    order_data=order_data,
+                    user=user,  # type: ignore
+                    app=app,
+                    manager=manager,
+                    site_settings=site_settings,
+                )
             # remove checkout after order is successfully created
             checkout.delete()
         except InsufficientStock as e:
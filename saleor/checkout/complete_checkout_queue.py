@@ -0,0 +1,266 @@
+"""Completing checkouts by Celery workers instead of in `checkoutComplete` requests.
+
+With `CHECKOUT_COMPLETE_QUEUE_ENABLED`, the mutation only validates the checkout and
+stores its arguments in a `CheckoutCompleteRequest`. Workers complete the queued
+checkouts of a channel in batches, in the order they were queued, and store the
+outcome in the requests polled by clients.
+"""
+import logging
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.core.exceptions import NON_FIELD_ERRORS, ValidationError
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from ..core.transactions import transaction_with_commit_on_errors
+from ..order.models import Order
+from . import CheckoutCompleteRequestStatus
+from .complete_checkout import complete_checkout, validate_checkout_for_completion
+from .error_codes import CheckoutErrorCode
+from .fetch import fetch_checkout_info, fetch_checkout_lines
+from .models import Checkout, CheckoutCompleteRequest
+
+if TYPE_CHECKING:
+    from ..app.models import App
+    from ..discount import DiscountInfo
+    from ..plugins.manager import PluginsManager
+    from ..site.models import SiteSettings
+
+logger = logging.getLogger(__name__)
+
+# Requests in these statuses are queued again when the checkout is completed again.
+REQUEUED_STATUSES = [
+    CheckoutCompleteRequestStatus.CONFIRMATION_NEEDED,
+    CheckoutCompleteRequestStatus.FAILED,
+]
+
+
+def _get_stale_processing_date():
+    return timezone.now() - settings.CHECKOUT_COMPLETE_PROCESSING_TIMEOUT
+
+
+def schedule_checkout_completion(channel_id: int):
+    from .tasks import complete_checkouts_task
+
+    complete_checkouts_task.apply_async(
+        args=[channel_id], queue=settings.CHECKOUT_COMPLETE_QUEUE
+    )
+
+
+def enqueue_checkout_complete(
+    checkout: Checkout,
+    user,
+    app: Optional["App"],
+    payment_data: Optional[dict],
+    store_source: bool,
+    redirect_url: Optional[str],
+    tracking_code: Optional[str],
+) -> CheckoutCompleteRequest:
+    """Queue the checkout to be completed by a worker.
+
+    A checkout already waiting in the queue isn't queued twice. Checkouts that failed
+    or need the payment to be confirmed are queued again with the new arguments.
+    """
+    arguments = {
+        "user": user if user and user.is_authenticated else None,
+        "app": app,
+        "payment_data": payment_data or {},
+        "store_source": store_source,
+        "redirect_url": redirect_url,
+        "tracking_code": tracking_code,
+    }
+    request, created = CheckoutCompleteRequest.objects.get_or_create(
+        checkout_token=checkout.token,
+        defaults={"channel_id": checkout.channel_id, **arguments},
+    )
+    is_stale = (
+        request.status == CheckoutCompleteRequestStatus.PROCESSING
+        and request.updated_at < _get_stale_processing_date()
+    )
+    if not created and (request.status in REQUEUED_STATUSES or is_stale):
+        for field, value in arguments.items():
+            setattr(request, field, value)
+        request.status = CheckoutCompleteRequestStatus.PENDING
+        request.order = None
+        request.confirmation_data = {}
+        request.errors = []
+        request.save()
+
+    if request.status == CheckoutCompleteRequestStatus.PENDING:
+        transaction.on_commit(lambda: schedule_checkout_completion(checkout.channel_id))
+    return request
+
+
+def claim_checkout_complete_requests(
+    channel_id: int, limit: int
+) -> List[CheckoutCompleteRequest]:
+    """Mark the oldest queued requests of the channel as processed and return them.
+
+    Rows locked by other workers are skipped, so many workers can serve one channel.
+    Requests left in processing by killed workers are claimed again after
+    `CHECKOUT_COMPLETE_PROCESSING_TIMEOUT`.
+    """
+    with transaction.atomic():
+        pks = list(
+            CheckoutCompleteRequest.objects.select_for_update(skip_locked=True)
+            .filter(
+                Q(status=CheckoutCompleteRequestStatus.PENDING)
+                | Q(
+                    status=CheckoutCompleteRequestStatus.PROCESSING,
+                    updated_at__lt=_get_stale_processing_date(),
+                ),
+                channel_id=channel_id,
+            )
+            .order_by("created_at", "pk")
+            .values_list("pk", flat=True)[:limit]
+        )
+        CheckoutCompleteRequest.objects.filter(pk__in=pks).update(
+            status=CheckoutCompleteRequestStatus.PROCESSING, updated_at=timezone.now()
+        )
+    return list(
+        CheckoutCompleteRequest.objects.filter(pk__in=pks)
+        .select_related("user", "app")
+        .order_by("created_at", "pk")
+    )
+
+
+def get_channels_with_stale_checkout_complete_requests() -> List[int]:
+    """Return IDs of channels with requests no worker is going to process.
+
+    These are requests left in processing by killed workers and pending requests
+    whose task was lost, older than `CHECKOUT_COMPLETE_PROCESSING_TIMEOUT`.
+    """
+    stale_date = _get_stale_processing_date()
+    return list(
+        CheckoutCompleteRequest.objects.filter(
+            Q(status=CheckoutCompleteRequestStatus.PENDING, created_at__lt=stale_date)
+            | Q(
+                status=CheckoutCompleteRequestStatus.PROCESSING,
+                updated_at__lt=stale_date,
+            )
+        )
+        .values_list("channel_id", flat=True)
+        .order_by()
+        .distinct()
+    )
+
+
+def process_checkout_complete_request(
+    request: CheckoutCompleteRequest,
+    manager: "PluginsManager",
+    discounts: List["DiscountInfo"],
+    site_settings: "SiteSettings",
+):
+    """Complete the queued checkout and store the outcome in the request.
+
+    The checkout is locked while being completed and requests claimed again by
+    another worker in the meantime are skipped, so a checkout can't be completed by
+    two workers at once.
+    """
+    order = None
+    action_required = False
+    action_data: Dict[str, str] = {}
+    try:
+        with transaction_with_commit_on_errors():
+            # A request claimed again after the timeout can be still processed by a
+            # slow worker; the lock makes the second worker wait for the first one
+            # and find the checkout already completed.
+            checkout = (
+                Checkout.objects.select_for_update()
+                .filter(token=request.checkout_token)
+                .first()
+            )
+            is_claimed_again = not CheckoutCompleteRequest.objects.filter(
+                pk=request.pk, updated_at=request.updated_at
+            ).exists()
+            if is_claimed_again:
+                logger.warning(
+                    "Checkout %s was claimed by another worker.", request.checkout_token
+                )
+                return
+            if checkout is None:
+                # the order could be created by a worker killed or claimed again
+                # before saving the outcome
+                order = Order.objects.get_by_checkout_token(request.checkout_token)
+                if order is None:
+                    raise ValidationError(
+                        {
+                            "token": ValidationError(
+                                "Checkout doesn't exist.",
+                                code=CheckoutErrorCode.NOT_FOUND.value,
+                            )
+                        }
+                    )
+            else:
+                lines, unavailable_variant_pks = fetch_checkout_lines(checkout)
+                validate_checkout_for_completion(
+                    checkout, lines, unavailable_variant_pks
+                )
+                checkout_info = fetch_checkout_info(checkout, lines, discounts, manager)
+                order, action_required, action_data = complete_checkout(
+                    manager=manager,
+                    checkout_info=checkout_info,
+                    lines=lines,
+                    payment_data=request.payment_data,
+                    store_source=request.store_source,
+                    discounts=discounts,
+                    user=request.user or AnonymousUser(),
+                    app=request.app,
+                    site_settings=site_settings,
+                    tracking_code=request.tracking_code,
+                    redirect_url=request.redirect_url,
+                )
+    except ValidationError as error:
+        request.status = CheckoutCompleteRequestStatus.FAILED
+        request.errors = serialize_validation_error(error)
+    except Exception:
+        logger.exception("Failed to complete checkout %s.", request.checkout_token)
+        request.status = CheckoutCompleteRequestStatus.FAILED
+        request.errors = [
+            {
+                "field": None,
+                "message": "Unable to complete the checkout.",
+                "code": CheckoutErrorCode.INVALID.value,
+                "params": {},
+            }
+        ]
+    else:
+        if action_required:
+            request.status = CheckoutCompleteRequestStatus.CONFIRMATION_NEEDED
+            request.confirmation_data = action_data
+        else:
+            request.status = CheckoutCompleteRequestStatus.COMPLETED
+            request.order = order
+    request.payment_data = {}
+    request.save(
+        update_fields=[
+            "status",
+            "order",
+            "confirmation_data",
+            "errors",
+            "payment_data",
+            "updated_at",
+        ]
+    )
+
+
+def serialize_validation_error(error: ValidationError) -> List[Dict[str, Any]]:
+    errors = []
+    for field, field_errors in error.update_error_dict({}).items():
+        for field_error in field_errors:
+            params = {
+                key: list(value) if isinstance(value, (set, tuple)) else value
+                for key, value in (field_error.params or {}).items()
+            }
+            errors.append(
+                {
+                    "field": None if field == NON_FIELD_ERRORS else field,
+                    "message": field_error.messages[0],
+                    "code": getattr(field_error.code, "value", field_error.code),
+                    "params": params,
+                }
+            )
+    return errors
@@ -0,0 +1,105 @@
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("app", "0008_appextension_target"),
+        ("channel", "0003_alter_channel_default_country"),
+        ("order", "0124_sales_rollups"),
+        ("checkout", "0039_alter_checkout_email"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CheckoutCompleteRequest",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("checkout_token", models.UUIDField(unique=True)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("processing", "Processing"),
+                            ("completed", "Completed"),
+                            ("confirmation_needed", "Confirmation needed"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=32,
+                    ),
+                ),
+                ("payment_data", models.JSONField(blank=True, default=dict)),
+                ("store_source", models.BooleanField(default=False)),
+                ("redirect_url", models.URLField(blank=True, null=True)),
+                (
+                    "tracking_code",
+                    models.CharField(blank=True, max_length=255, null=True),
+                ),
+                ("confirmation_data", models.JSONField(blank=True, default=dict)),
+                ("errors", models.JSONField(blank=True, default=list)),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "app",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="app.app",
+                    ),
+                ),
+                (
+                    "channel",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="checkout_complete_requests",
+                        to="channel.channel",
+                    ),
+                ),
+                (
+                    "order",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to="order.order",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        blank=True,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("created_at", "pk"),
+            },
+        ),
+        migrations.AddIndex(
+            model_name="checkoutcompleterequest",
+            index=models.Index(
+                fields=["channel", "status", "created_at"],
+                name="checkout_ch_channel_ed3776_idx",
+            ),
+        ),
+    ]
@@ -7,6 +7,7 @@ from uuid import uuid4
 from django.conf import settings
 from django.core.validators import MinValueValidator
 from django.db import models
+from django.db.models import JSONField  # type: ignore
 from django.db.models.deletion import SET_NULL
 from django.utils.encoding import smart_str
 from django_countries.fields import Country, CountryField
@@ -20,6 +21,7 @@ from ..core.taxes import zero_money
 from ..core.weight import zero_weight
 from ..giftcard.models import GiftCard
 from ..shipping.models import ShippingMethod
+from . import CheckoutCompleteRequestStatus
 
 if TYPE_CHECKING:
     # flake8: noqa
@@ -214,3 +216,51 @@ class CheckoutLine(models.Model):
     def is_shipping_required(self) -> bool:
         """Return `True` if the related product variant requires shipping."""
         return self.variant.is_shipping_required()
+
+
+class CheckoutCompleteRequest(models.Model):
+    """A checkout queued to be completed by a worker.
+
+    Stores arguments of the `checkoutComplete` mutation until the checkout is
+    processed and the outcome afterwards, so clients can poll for the order.
+    """
+
+    checkout_token = models.UUIDField(unique=True)
+    channel = models.ForeignKey(
+        Channel, related_name="checkout_complete_requests", on_delete=models.CASCADE
+    )
+    status = models.CharField(
+        max_length=32,
+        choices=CheckoutCompleteRequestStatus.CHOICES,
+        default=CheckoutCompleteRequestStatus.PENDING,
+    )
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        blank=True,
+        null=True,
+        related_name="+",
+        on_delete=models.SET_NULL,
+    )
+    app = models.ForeignKey(
+        "app.App", blank=True, null=True, related_name="+", on_delete=models.SET_NULL
+    )
+    # cleared once the request is processed
+    payment_data = JSONField(blank=True, default=dict)
+    store_source = models.BooleanField(default=False)
+    redirect_url = models.URLField(blank=True, null=True)
+    tracking_code = models.CharField(max_length=255, blank=True, null=True)
+    order = models.ForeignKey(
+        "order.Order",
+        blank=True,
+        null=True,
+        related_name="+",
+        on_delete=models.SET_NULL,
+    )
+    confirmation_data = JSONField(blank=True, default=dict)
+    errors = JSONField(blank=True, default=list)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ("created_at", "pk")
+        indexes = [models.Index(fields=["channel", "status", "created_at"])]
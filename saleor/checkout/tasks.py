@@ -1,9 +1,19 @@
 from celery.utils.log import get_task_logger
 from django.conf import settings
+from django.contrib.sites.models import Site
 from django.db.models import Q
 from django.utils import timezone
 
 from ..celeryconf import app
+from ..core.db.batches import delete_in_batches
+from ..discount.utils import fetch_active_discounts
+from ..plugins.manager import get_plugins_manager
+from .complete_checkout_queue import (
+    claim_checkout_complete_requests,
+    get_channels_with_stale_checkout_complete_requests,
+    process_checkout_complete_request,
+    schedule_checkout_completion,
+)
 from .models import Checkout
 
 task_logger = get_task_logger(__name__)
@@ -23,8 +33,45 @@ def delete_expired_checkouts():
     empty_checkouts = Q(lines__isnull=True) & Q(
         last_change__lt=now - settings.EMPTY_CHECKOUTS_TIMEDELTA
     )
-    count, _ = Checkout.objects.filter(
-        empty_checkouts | expired_anonymous_checkouts | expired_user_checkout
-    ).delete()
-    if count:
-        task_logger.debug("Removed %s checkouts.", count)
+    result = delete_in_batches(
+        Checkout.objects.filter(
+            empty_checkouts | expired_anonymous_checkouts | expired_user_checkout
+        ),
+        time_budget=settings.MAINTENANCE_TASK_TIME_BUDGET,
+        log=task_logger,
+    )
+    if result.count:
+        task_logger.debug("Removed %s checkouts.", result.count)
+    if not result.finished:
+        delete_expired_checkouts.delay()
+
+
+@app.task
+def complete_checkouts_task(channel_id):
+    """Complete a batch of checkouts of the channel queued by `checkoutComplete`.
+
+    Another task is scheduled while the channel has more checkouts in the queue.
+    """
+    batch_size = settings.CHECKOUT_COMPLETE_BATCH_SIZE
+    requests = claim_checkout_complete_requests(channel_id, batch_size)
+    if not requests:
+        return
+    manager = get_plugins_manager()
+    discounts = fetch_active_discounts()
+    site_settings = Site.objects.get_current().settings
+    for request in requests:
+        process_checkout_complete_request(request, manager, discounts, site_settings)
+    task_logger.debug("Completed %s checkouts.", len(requests))
+    if len(requests) == batch_size:
+        schedule_checkout_completion(channel_id)
+
+
+@app.task
+def complete_stale_checkouts_task():
+    """Schedule completion of checkouts in channels with stale queued requests.
+
+    It covers requests of killed workers and lost tasks in channels where no new
+    checkout is completed, which would otherwise wait forever.
+    """
+    for channel_id in get_channels_with_stale_checkout_complete_requests():
+        schedule_checkout_completion(channel_id)
@@ -1,4 +1,5 @@
 import datetime
+import json
 from unittest.mock import Mock, patch
 
 import graphene
@@ -16,6 +17,7 @@ from ...discount import DiscountValueType, VoucherType
 from ...discount.models import NotApplicable, Voucher, VoucherChannelListing
 from ...payment.models import Payment
 from ...plugins.manager import get_plugins_manager
+from ...plugins.webhook.tasks import WebhookResponse
 from ...shipping.interface import ShippingMethodData
 from ...shipping.models import ShippingZone
 from .. import AddressType, calculations
@@ -74,7 +76,7 @@ def test_is_valid_delivery_method(checkout_with_item, address, shipping_zone):
     assert not delivery_method_info.is_method_in_valid_methods(checkout_info)
 
 
-@patch("saleor.plugins.webhook.tasks.send_webhook_request_sync")
+@patch("saleor.plugins.webhook.tasks._send_webhook_request_sync")
 def test_is_valid_delivery_method_external_method(
     mock_send_request, checkout_with_item, address, settings, shipping_app
 ):
@@ -93,7 +95,10 @@ def test_is_valid_delivery_method_external_method(
         "app", f"{shipping_app.id}:{response_method_id}"
     )
 
-    mock_send_request.return_value = mock_json_response
+    mock_send_request.return_value = (
+        WebhookResponse(content=json.dumps(mock_json_response)),
+        mock_json_response,
+    )
     checkout = checkout_with_item
     checkout.shipping_address = address
     checkout.private_metadata = {PRIVATE_META_APP_SHIPPING_ID: method_id}
@@ -107,7 +112,7 @@ def test_is_valid_delivery_method_external_method(
     assert delivery_method_info.is_method_in_valid_methods(checkout_info)
 
 
-@patch("saleor.plugins.webhook.tasks.send_webhook_request_sync")
+@patch("saleor.plugins.webhook.tasks._send_webhook_request_sync")
 def test_is_valid_delivery_method_external_method_no_longer_available(
     mock_send_request, checkout_with_item, address, settings, shipping_app
 ):
@@ -123,7 +128,10 @@ def test_is_valid_delivery_method_external_method_no_longer_available(
     ]
     method_id = graphene.Node.to_global_id("app", f"{shipping_app.id}:1")
 
-    mock_send_request.return_value = mock_json_response
+    mock_send_request.return_value = (
+        WebhookResponse(content=json.dumps(mock_json_response)),
+        mock_json_response,
+    )
     checkout = checkout_with_item
     checkout.shipping_address = address
     checkout.private_metadata = {PRIVATE_META_APP_SHIPPING_ID: method_id}
@@ -0,0 +1,313 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.core.exceptions import ValidationError
+from django.utils import timezone
+
+from ...plugins.manager import get_plugins_manager
+from ...tests.utils import flush_post_commit_hooks
+from .. import CheckoutCompleteRequestStatus
+from ..complete_checkout_queue import (
+    claim_checkout_complete_requests,
+    enqueue_checkout_complete,
+    get_channels_with_stale_checkout_complete_requests,
+    process_checkout_complete_request,
+    serialize_validation_error,
+)
+from ..error_codes import CheckoutErrorCode
+from ..models import CheckoutCompleteRequest
+from ..tasks import complete_checkouts_task, complete_stale_checkouts_task
+
+
+def _enqueue(checkout, customer_user=None):
+    return enqueue_checkout_complete(
+        checkout,
+        user=customer_user,
+        app=None,
+        payment_data={},
+        store_source=False,
+        redirect_url=None,
+        tracking_code=None,
+    )
+
+
+@patch("saleor.checkout.complete_checkout_queue.schedule_checkout_completion")
+def test_enqueue_checkout_complete(schedule_mock, checkout_with_item, customer_user):
+    # when
+    request = _enqueue(checkout_with_item, customer_user)
+    flush_post_commit_hooks()
+
+    # then
+    assert request.status == CheckoutCompleteRequestStatus.PENDING
+    assert request.checkout_token == checkout_with_item.token
+    assert request.channel_id == checkout_with_item.channel_id
+    assert request.user == customer_user
+    schedule_mock.assert_called_once_with(checkout_with_item.channel_id)
+
+
+@patch("saleor.checkout.complete_checkout_queue.schedule_checkout_completion")
+def test_enqueue_checkout_complete_twice(schedule_mock, checkout_with_item):
+    # given
+    request = _enqueue(checkout_with_item)
+    CheckoutCompleteRequest.objects.filter(pk=request.pk).update(
+        status=CheckoutCompleteRequestStatus.PROCESSING
+    )
+
+    # when
+    same_request = _enqueue(checkout_with_item)
+
+    # then
+    assert same_request.pk == request.pk
+    assert same_request.status == CheckoutCompleteRequestStatus.PROCESSING
+    assert CheckoutCompleteRequest.objects.count() == 1
+
+
+@patch("saleor.checkout.complete_checkout_queue.schedule_checkout_completion")
+def test_enqueue_checkout_complete_requeues_failed_request(
+    schedule_mock, checkout_with_item
+):
+    # given
+    request = _enqueue(checkout_with_item)
+    request.status = CheckoutCompleteRequestStatus.FAILED
+    request.errors = [{"field": None, "message": "Error", "code": "INVALID"}]
+    request.save()
+
+    # when
+    request = _enqueue(checkout_with_item)
+
+    # then
+    assert request.status == CheckoutCompleteRequestStatus.PENDING
+    assert request.errors == []
+
+
+@patch("saleor.checkout.complete_checkout_queue.schedule_checkout_completion")
+def test_claim_checkout_complete_requests(
+    schedule_mock, checkouts_list, channel_USD, settings
+):
+    # given
+    settings.CHECKOUT_COMPLETE_PROCESSING_TIMEOUT = timedelta(minutes=5)
+    pending, stale, processing = [_enqueue(checkout) for checkout in checkouts_list[2:]]
+    CheckoutCompleteRequest.objects.filter(pk=stale.pk).update(
+        status=CheckoutCompleteRequestStatus.PROCESSING,
+        updated_at=timezone.now() - timedelta(minutes=10),
+    )
+    CheckoutCompleteRequest.objects.filter(pk=processing.pk).update(
+        status=CheckoutCompleteRequestStatus.PROCESSING
+    )
+
+    # when
+    requests = claim_checkout_complete_requests(channel_USD.pk, limit=10)
+
+    # then
+    assert [request.pk for request in requests] == [pending.pk, stale.pk]
+    assert all(
+        request.status == CheckoutCompleteRequestStatus.PROCESSING
+        for request in requests
+    )
+
+
+@patch("saleor.checkout.complete_checkout_queue.schedule_checkout_completion")
+@patch("saleor.checkout.complete_checkout_queue.complete_checkout")
+def test_process_checkout_complete_request(
+    complete_checkout_mock,
+    schedule_mock,
+    checkout_ready_to_complete,
+    order,
+    site_settings,
+):
+    # given
+    complete_checkout_mock.return_value = (order, False, {})
+    request = _enqueue(checkout_ready_to_complete)
+    request.payment_data = {"token": "secret"}
+    request.save()
+
+    # when
+    process_checkout_complete_request(request, get_plugins_manager(), [], site_settings)
+
+    # then
+    request.refresh_from_db()
+    assert request.status == CheckoutCompleteRequestStatus.COMPLETED
+    assert request.order == order
+    assert request.payment_data == {}
+    complete_checkout_mock.assert_called_once()
+
+
+@patch("saleor.checkout.complete_checkout_queue.schedule_checkout_completion")
+@patch("saleor.checkout.complete_checkout_queue.complete_checkout")
+def test_process_checkout_complete_request_confirmation_needed(
+    complete_checkout_mock, schedule_mock, checkout_ready_to_complete, site_settings
+):
+    # given
+    action_data = {"url": "https://www.example.com"}
+    complete_checkout_mock.return_value = (None, True, action_data)
+    request = _enqueue(checkout_ready_to_complete)
+
+    # when
+    process_checkout_complete_request(request, get_plugins_manager(), [], site_settings)
+
+    # then
+    request.refresh_from_db()
+    assert request.status == CheckoutCompleteRequestStatus.CONFIRMATION_NEEDED
+    assert request.confirmation_data == action_data
+    assert request.order is None
+
+
+@patch("saleor.checkout.complete_checkout_queue.schedule_checkout_completion")
+@patch("saleor.checkout.complete_checkout_queue.complete_checkout")
+def test_process_checkout_complete_request_validation_error(
+    complete_checkout_mock, schedule_mock, checkout_ready_to_complete, site_settings
+):
+    # given
+    complete_checkout_mock.side_effect = ValidationError(
+        {
+            "payment": ValidationError(
+                "Payment failed.", code=CheckoutErrorCode.PAYMENT_ERROR.value
+            )
+        }
+    )
+    request = _enqueue(checkout_ready_to_complete)
+
+    # when
+    process_checkout_complete_request(request, get_plugins_manager(), [], site_settings)
+
+    # then
+    request.refresh_from_db()
+    assert request.status == CheckoutCompleteRequestStatus.FAILED
+    assert request.errors == [
+        {
+            "field": "payment",
+            "message": "Payment failed.",
+            "code": CheckoutErrorCode.PAYMENT_ERROR.value,
+            "params": {},
+        }
+    ]
+
+
+@patch("saleor.checkout.complete_checkout_queue.schedule_checkout_completion")
+def test_process_checkout_complete_request_order_already_created(
+    schedule_mock, checkout_ready_to_complete, order, site_settings
+):
+    # given
+    request = _enqueue(checkout_ready_to_complete)
+    order.checkout_token = str(checkout_ready_to_complete.token)
+    order.save(update_fields=["checkout_token"])
+    checkout_ready_to_complete.delete()
+
+    # when
+    process_checkout_complete_request(request, get_plugins_manager(), [], site_settings)
+
+    # then
+    request.refresh_from_db()
+    assert request.status == CheckoutCompleteRequestStatus.COMPLETED
+    assert request.order == order
+
+
+@patch("saleor.checkout.complete_checkout_queue.schedule_checkout_completion")
+@patch("saleor.checkout.complete_checkout_queue.complete_checkout")
+def test_process_checkout_complete_request_claimed_again(
+    complete_checkout_mock, schedule_mock, checkout_ready_to_complete, site_settings
+):
+    # given
+    request = _enqueue(checkout_ready_to_complete)
+    CheckoutCompleteRequest.objects.filter(pk=request.pk).update(
+        status=CheckoutCompleteRequestStatus.PROCESSING,
+        updated_at=timezone.now() + timedelta(minutes=1),
+    )
+
+    # when
+    process_checkout_complete_request(request, get_plugins_manager(), [], site_settings)
+
+    # then
+    complete_checkout_mock.assert_not_called()
+    request.refresh_from_db()
+    assert request.status == CheckoutCompleteRequestStatus.PROCESSING
+
+
+@patch("saleor.checkout.complete_checkout_queue.schedule_checkout_completion")
+def test_get_channels_with_stale_checkout_complete_requests(
+    schedule_mock, checkouts_list, channel_USD, settings
+):
+    # given
+    settings.CHECKOUT_COMPLETE_PROCESSING_TIMEOUT = timedelta(minutes=5)
+    pln_checkout, other_pln_checkout, usd_checkout = checkouts_list[:3]
+    processing, pending, stale = [
+        _enqueue(checkout)
+        for checkout in [pln_checkout, other_pln_checkout, usd_checkout]
+    ]
+    stale_date = timezone.now() - timedelta(minutes=10)
+    CheckoutCompleteRequest.objects.filter(pk=stale.pk).update(
+        status=CheckoutCompleteRequestStatus.PROCESSING, updated_at=stale_date
+    )
+    CheckoutCompleteRequest.objects.filter(pk=processing.pk).update(
+        status=CheckoutCompleteRequestStatus.PROCESSING
+    )
+
+    # when
+    channel_ids = get_channels_with_stale_checkout_complete_requests()
+
+    # then
+    assert channel_ids == [channel_USD.pk]
+
+
+def test_serialize_validation_error():
+    # given
+    error = ValidationError(
+        {
+            "lines": ValidationError(
+                "Unavailable.",
+                code=CheckoutErrorCode.UNAVAILABLE_VARIANT_IN_CHANNEL.value,
+                params={"variants": {"UHJvZHVjdFZhcmlhbnQ6MQ=="}},
+            )
+        }
+    )
+
+    # when
+    errors = serialize_validation_error(error)
+
+    # then
+    assert errors == [
+        {
+            "field": "lines",
+            "message": "Unavailable.",
+            "code": CheckoutErrorCode.UNAVAILABLE_VARIANT_IN_CHANNEL.value,
+            "params": {"variants": ["UHJvZHVjdFZhcmlhbnQ6MQ=="]},
+        }
+    ]
+
+
+@patch("saleor.checkout.tasks.schedule_checkout_completion")
+@patch("saleor.checkout.tasks.process_checkout_complete_request")
+@patch("saleor.checkout.complete_checkout_queue.schedule_checkout_completion")
+def test_complete_checkouts_task_schedules_next_batch(
+    enqueue_schedule_mock,
+    process_mock,
+    schedule_mock,
+    checkouts_list,
+    channel_USD,
+    site_settings,
+    settings,
+):
+    # given
+    settings.CHECKOUT_COMPLETE_BATCH_SIZE = 2
+    for checkout in checkouts_list[2:]:
+        _enqueue(checkout)
+
+    # when
+    complete_checkouts_task(channel_USD.pk)
+
+    # then
+    assert process_mock.call_count == 2
+    schedule_mock.assert_called_once_with(channel_USD.pk)
+
+
+@patch("saleor.checkout.tasks.schedule_checkout_completion")
+@patch("saleor.checkout.tasks.get_channels_with_stale_checkout_complete_requests")
+def test_complete_stale_checkouts_task(get_channels_mock, schedule_mock, channel_USD):
+    # given
+    get_channels_mock.return_value = [channel_USD.pk]
+
+    # when
+    complete_stale_checkouts_task()
+
+    # then
+    schedule_mock.assert_called_once_with(channel_USD.pk)
@@ -28,6 +28,7 @@ from ..plugins.manager import PluginsManager
 from ..product import models as product_models
 from ..shipping.interface import ShippingMethodData
 from ..shipping.models import ShippingMethod, ShippingMethodChannelListing
+from ..shipping.rules import get_applicable_shipping_methods_for_instance
 from ..shipping.utils import convert_to_shipping_method_data
 from ..warehouse.availability import (
     check_stock_and_preorder_quantity,
@@ -661,7 +662,7 @@ def get_valid_internal_shipping_methods_for_checkout(
     if not checkout_info.shipping_address:
         return []
 
-    shipping_methods = ShippingMethod.objects.applicable_shipping_methods_for_instance(
+    shipping_methods = get_applicable_shipping_methods_for_instance(
         checkout_info.checkout,
         channel_id=checkout_info.checkout.channel_id,
         price=subtotal.gross,
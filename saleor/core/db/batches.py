@@ -0,0 +1,166 @@
+import logging
+from dataclasses import dataclass
+from datetime import timedelta
+from time import monotonic
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import QuerySet
+
+logger = logging.getLogger(__name__)
+
+BatchCallback = Callable[[List[Any]], None]
+
+
+@dataclass
+class BatchResult:
+    count: int = 0
+    batches: int = 0
+    # Primary key of the last processed object, processing can be resumed after it.
+    last_pk: Any = None
+    finished: bool = True
+
+
+def iterate_pks_in_batches(
+    queryset: QuerySet, batch_size: Optional[int] = None
+) -> Iterator[List[Any]]:
+    """Yield primary keys of objects matching the queryset in ordered batches."""
+    batch_size = batch_size or settings.BULK_OPERATION_BATCH_SIZE
+    pks_qs = queryset.order_by("pk").values_list("pk", flat=True).distinct()
+    last_pk = None
+    while True:
+        batch_qs = pks_qs if last_pk is None else pks_qs.filter(pk__gt=last_pk)
+        pks = list(batch_qs[:batch_size])
+        if not pks:
+            return
+        yield pks
+        last_pk = pks[-1]
+
+
+def get_pk_ranges(queryset: QuerySet, size: int) -> List[Tuple[Any, Any]]:
+    """Split objects matching the queryset into inclusive ranges of primary keys.
+
+    Each range covers at most `size` matching objects, so the work can be split
+    between tasks filtering the same queryset with `pk__range`.
+    """
+    return [(pks[0], pks[-1]) for pks in iterate_pks_in_batches(queryset, size)]
+
+
+def _process_in_batches(
+    queryset: QuerySet,
+    process_batch: Callable[[QuerySet], int],
+    *,
+    action: str,
+    batch_size: Optional[int],
+    time_budget: Optional[timedelta],
+    start_after_pk: Any,
+    before_batch: Optional[BatchCallback],
+    log: logging.Logger,
+) -> BatchResult:
+    batch_size = batch_size or settings.BULK_OPERATION_BATCH_SIZE
+    deadline = None
+    if time_budget is not None:
+        deadline = monotonic() + time_budget.total_seconds()
+    model = queryset.model
+    result = BatchResult(last_pk=start_after_pk)
+    pks_qs = queryset.order_by("pk").values_list("pk", flat=True).distinct()
+    while True:
+        if deadline is not None and monotonic() > deadline:
+            result.finished = False
+            break
+        batch_qs = pks_qs
+        if result.last_pk is not None:
+            batch_qs = batch_qs.filter(pk__gt=result.last_pk)
+        pks = list(batch_qs[:batch_size])
+        if not pks:
+            break
+        with transaction.atomic(using=queryset.db):
+            # Conditions of the queryset are checked again, so objects which stopped
+            # matching after their keys were selected are left untouched.
+            batch = queryset.filter(pk__in=pks).order_by()
+            if before_batch:
+                locked_pks = list(
+                    batch.select_for_update(of=("self",)).values_list("pk", flat=True)
+                )
+                batch = model.objects.using(queryset.db).filter(pk__in=locked_pks)
+                before_batch(locked_pks)
+            result.count += process_batch(batch)
+        result.batches += 1
+        result.last_pk = pks[-1]
+        log.debug(
+            "%s %s %s objects in %s batches.",
+            action,
+            result.count,
+            model.__name__,
+            result.batches,
+        )
+    return result
+
+
+def delete_in_batches(
+    queryset: QuerySet,
+    *,
+    batch_size: Optional[int] = None,
+    time_budget: Optional[timedelta] = None,
+    start_after_pk: Any = None,
+    before_batch: Optional[BatchCallback] = None,
+    raw: bool = False,
+    log: logging.Logger = logger,
+) -> BatchResult:
+    """Delete objects matching the queryset in batches ordered by primary key.
+
+    Each batch is deleted in its own transaction, so locks are held briefly and
+    only a single batch of objects is loaded for the cascade handling. With `raw`
+    the batch is deleted with a single query, skipping signals and cascades;
+    related objects must then be removed by `before_batch`, called with primary
+    keys of the batch. Objects which stopped matching the queryset after their keys
+    were selected are skipped; when `before_batch` is given, objects of the batch are
+    locked first, so it's called only with keys of the processed objects.
+
+    Processing stops once `time_budget` is exceeded; the returned result is then
+    not `finished` and its `last_pk` can be passed as `start_after_pk` to resume.
+    """
+
+    def delete(batch: QuerySet) -> int:
+        if raw:
+            return batch._raw_delete(batch.db)
+        return batch.delete()[1].get(queryset.model._meta.label, 0)
+
+    return _process_in_batches(
+        queryset,
+        delete,
+        action="Deleted",
+        batch_size=batch_size,
+        time_budget=time_budget,
+        start_after_pk=start_after_pk,
+        before_batch=before_batch,
+        log=log,
+    )
+
+
+def update_in_batches(
+    queryset: QuerySet,
+    values: Dict[str, Any],
+    *,
+    batch_size: Optional[int] = None,
+    time_budget: Optional[timedelta] = None,
+    start_after_pk: Any = None,
+    before_batch: Optional[BatchCallback] = None,
+    log: logging.Logger = logger,
+) -> BatchResult:
+    """Update objects matching the queryset in batches ordered by primary key.
+
+    Works like `delete_in_batches`, setting the given values on each batch with
+    a single query.
+    """
+    return _process_in_batches(
+        queryset,
+        lambda batch: batch.update(**values),
+        action="Updated",
+        batch_size=batch_size,
+        time_budget=time_budget,
+        start_after_pk=start_after_pk,
+        before_batch=before_batch,
+        log=log,
+    )
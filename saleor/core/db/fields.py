@@ -1,7 +1,8 @@
 import json
+import zlib
 from typing import Callable
 
-from django.db.models import JSONField  # type: ignore
+from django.db.models import BinaryField, Func, JSONField  # type: ignore
 
 
 class SanitizedJSONField(JSONField):
@@ -20,3 +21,68 @@ class SanitizedJSONField(JSONField):
     def get_db_prep_save(self, value: dict, connection):
         """Sanitize the value for saving using the passed sanitizer."""
         return json.dumps(self._sanitizer_method(value))
+
+
+class CompressedTextField(BinaryField):
+    """A text field stored compressed with zlib in a binary column.
+
+    Values are prefixed with a marker byte, so values that don't compress well are
+    stored as plain UTF-8.
+    """
+
+    description = "Text stored compressed in the database"
+
+    PLAIN = b"\x00"
+    ZLIB = b"\x01"
+
+    def __init__(self, *args, compression_level: int = 6, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.compression_level = compression_level
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if self.compression_level != 6:
+            kwargs["compression_level"] = self.compression_level
+        return name, path, args, kwargs
+
+    def compress(self, value: str) -> bytes:
+        data = value.encode("utf-8")
+        compressed = zlib.compress(data, self.compression_level)
+        if len(compressed) < len(data):
+            return self.ZLIB + compressed
+        return self.PLAIN + data
+
+    def decompress(self, value: bytes) -> str:
+        marker, data = value[:1], value[1:]
+        if marker == self.ZLIB:
+            data = zlib.decompress(data)
+        return data.decode("utf-8")
+
+    def get_default(self):
+        default = super().get_default()
+        return "" if default == b"" else default
+
+    def get_prep_value(self, value):
+        if value is None:
+            return None
+        return self.compress(value if isinstance(value, str) else str(value))
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return None
+        return self.decompress(bytes(value))
+
+    def to_python(self, value):
+        if value is None or isinstance(value, str):
+            return value
+        return self.decompress(bytes(value))
+
+    def value_to_string(self, obj):
+        return self.value_from_object(obj)
+
+
+class PlainCompressedText(Func):
+    """Convert text to the uncompressed format of `CompressedTextField` in SQL."""
+
+    template = "'\\x00'::bytea || convert_to(%(expressions)s, 'UTF8')"
+    output_field = CompressedTextField()
@@ -0,0 +1,180 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.test.utils import override_settings
+
+from ....channel.models import Channel
+from ....core.exceptions import InsufficientStock
+from ....order import OrderOrigin, OrderStatus
+from ....order.fetch import OrderLineInfo
+from ....order.models import Order, OrderLine
+from ....plugins.manager import PluginsManager
+from ....warehouse.management import allocate_stocks
+from ....warehouse.models import Allocation, Stock
+from ...utils.benchmark import run_concurrent_benchmark
+
+MODES = {"locking": False, "atomic": True}
+
+
+class Command(BaseCommand):
+    help = (
+        "Simulate buyers ordering the same variant at once and measure latency of "
+        "stock allocation with locking and atomic allocation modes. An order with "
+        "a line per buyer is committed for the benchmark and removed afterwards "
+        "together with its allocations; use a dedicated database."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--buyers", type=int, default=50)
+        parser.add_argument(
+            "--stock",
+            type=int,
+            help="Quantity in stock during the benchmark; half of buyers by default.",
+        )
+        parser.add_argument(
+            "--quantity", type=int, default=1, help="Quantity bought by each buyer."
+        )
+        parser.add_argument(
+            "--hold-ms",
+            type=float,
+            default=0,
+            help=(
+                "Keep the transaction open after allocating, simulating the rest "
+                "of order creation."
+            ),
+        )
+        parser.add_argument(
+            "--mode", choices=[*MODES, "both"], default="both", help="Allocation mode."
+        )
+        parser.add_argument("--channel", help="Slug of the channel to use.")
+
+    def handle(self, *args, **options):
+        channels = Channel.objects.filter(is_active=True)
+        if options["channel"]:
+            channels = channels.filter(slug=options["channel"])
+        channel = channels.first()
+        if not channel:
+            raise CommandError("Benchmark needs an active channel.")
+        country_code = channel.default_country.code
+        stock = (
+            Stock.objects.for_country_and_channel(country_code, channel.slug)
+            .filter(
+                product_variant__track_inventory=True,
+                product_variant__is_preorder=False,
+            )
+            .select_related("product_variant__product")
+            .order_by("pk")
+            .first()
+        )
+        if not stock:
+            raise CommandError(f"No stocks available in {channel.slug}.")
+
+        buyers = options["buyers"]
+        quantity_in_stock = options["stock"]
+        if quantity_in_stock is None:
+            quantity_in_stock = buyers * options["quantity"] // 2
+        modes = list(MODES) if options["mode"] == "both" else [options["mode"]]
+        self.stdout.write(
+            f"{buyers} buyers of {stock.product_variant} with {quantity_in_stock} "
+            f"in stock."
+        )
+        for mode in modes:
+            summary = self.run_mode(
+                mode, stock, channel, buyers, quantity_in_stock, options
+            )
+            self.stdout.write(
+                f"{mode:<8} p50 {summary['p50_ms']:.1f} ms, "
+                f"p95 {summary['p95_ms']:.1f} ms, p99 {summary['p99_ms']:.1f} ms, "
+                f"max {summary['max_ms']:.1f} ms, total {summary['wall_ms']:.1f} ms, "
+                f"{summary['calls'] - summary['failures']} allocated, "
+                f"{summary['failures']} rejected"
+            )
+
+    def run_mode(self, mode, stock, channel, buyers, quantity_in_stock, options):
+        variant = stock.product_variant
+        order, lines = self.create_order(channel, variant, buyers, options["quantity"])
+        original_stock = Stock.objects.values("quantity", "quantity_allocated").get(
+            pk=stock.pk
+        )
+        Stock.objects.filter(pk=stock.pk).update(
+            quantity=quantity_in_stock, quantity_allocated=0
+        )
+        # only the benchmarked stock is available to the buyers
+        filter_lookup = {"pk": stock.pk}
+        manager = PluginsManager(plugins=[])
+        hold = options["hold_ms"] / 1000
+
+        def buy(index):
+            line = lines[index]
+            with transaction.atomic():
+                allocate_stocks(
+                    [OrderLineInfo(line=line, variant=variant, quantity=line.quantity)],
+                    channel.default_country.code,
+                    channel.slug,
+                    manager,
+                    additional_filter_lookup=filter_lookup,
+                )
+                if hold:
+                    time.sleep(hold)
+
+        try:
+            with override_settings(ATOMIC_STOCK_ALLOCATION=MODES[mode]):
+                result = run_concurrent_benchmark(
+                    mode, buy, buyers, expected_exceptions=(InsufficientStock,)
+                )
+            self.check_allocations(stock, order, quantity_in_stock)
+        finally:
+            order.delete()
+            Stock.objects.filter(pk=stock.pk).update(**original_stock)
+        return result.summary()
+
+    @staticmethod
+    def create_order(channel, variant, buyers, quantity):
+        order = Order.objects.create(
+            channel=channel,
+            currency=channel.currency_code,
+            status=OrderStatus.UNCONFIRMED,
+            origin=OrderOrigin.CHECKOUT,
+            user_email="benchmark@example.com",
+        )
+        lines = OrderLine.objects.bulk_create(
+            [
+                OrderLine(
+                    order=order,
+                    variant=variant,
+                    product_name=variant.product.name,
+                    variant_name=variant.name,
+                    product_sku=variant.sku,
+                    is_shipping_required=True,
+                    is_gift_card=False,
+                    quantity=quantity,
+                    currency=channel.currency_code,
+                    unit_price_net_amount=0,
+                    unit_price_gross_amount=0,
+                    total_price_net_amount=0,
+                    total_price_gross_amount=0,
+                    undiscounted_unit_price_net_amount=0,
+                    undiscounted_unit_price_gross_amount=0,
+                    undiscounted_total_price_net_amount=0,
+                    undiscounted_total_price_gross_amount=0,
+                    tax_rate=0,
+                )
+                for _ in range(buyers)
+            ]
+        )
+        return order, lines
+
+    @staticmethod
+    def check_allocations(stock, order, quantity_in_stock):
+        allocated = sum(
+            Allocation.objects.filter(order_line__order=order).values_list(
+                "quantity_allocated", flat=True
+            )
+        )
+        quantity_allocated = Stock.objects.get(pk=stock.pk).quantity_allocated
+        if allocated > quantity_in_stock or allocated != quantity_allocated:
+            raise CommandError(
+                f"Inconsistent allocations: {allocated} allocated of "
+                f"{quantity_in_stock} in stock, stock counter at {quantity_allocated}."
+            )
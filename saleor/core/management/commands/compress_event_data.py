@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from ...tasks import compress_event_data_task
+
+
+class Command(BaseCommand):
+    help = (
+        "Move webhook payloads and delivery attempt responses stored before "
+        "compression was introduced to the compressed columns."
+    )
+
+    def handle(self, **options):
+        compress_event_data_task()
@@ -3,7 +3,7 @@ from io import StringIO
 from django.apps import apps
 from django.conf import settings
 from django.core.management import call_command
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from django.db import connection
 
 from ....account.utils import create_superuser
@@ -26,6 +26,7 @@ from ...utils.random_data import (
     create_vouchers,
     create_warehouses,
 )
+from ...utils.scaled_data import ScaleConfig, create_scaled_data, scaled_data_exists
 
 
 class Command(BaseCommand):
@@ -57,6 +58,46 @@ class Command(BaseCommand):
             default=False,
             help="Don't reset SQL sequences that are out of sync.",
         )
+        parser.add_argument(
+            "--scale",
+            type=int,
+            help=(
+                "Instead of the demo data, generate the given number of products "
+                "with related objects in bulk."
+            ),
+        )
+        parser.add_argument(
+            "--customers",
+            type=int,
+            help="Number of customers generated with --scale, defaults to --scale.",
+        )
+        parser.add_argument(
+            "--orders",
+            type=int,
+            help="Number of orders generated with --scale, defaults to 10 * --scale.",
+        )
+        parser.add_argument("--variants-per-product", type=int, default=3)
+        parser.add_argument("--attributes", type=int, default=20)
+        parser.add_argument("--channels", type=int, default=2)
+        parser.add_argument("--warehouses", type=int, default=5)
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Seed of generated data, the same seed produces the same data.",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of processes creating orders with --scale.",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of objects created at once with --scale.",
+        )
 
     def sequence_reset(self):
         """Run a SQL sequence reset on all saleor.* apps.
@@ -74,12 +115,55 @@ class Command(BaseCommand):
         with connection.cursor() as cursor:
             cursor.execute(commands.getvalue())
 
+    def populate_scaled_data(self, options):
+        scale = options["scale"]
+        if scaled_data_exists(options["seed"]):
+            raise CommandError(
+                f"Data generated with seed {options['seed']} already exists, "
+                "use a different --seed."
+            )
+        config = ScaleConfig(
+            products=scale,
+            customers=(scale if options["customers"] is None else options["customers"]),
+            orders=scale * 10 if options["orders"] is None else options["orders"],
+            variants_per_product=options["variants_per_product"],
+            attributes=options["attributes"],
+            channels=options["channels"],
+            warehouses=options["warehouses"],
+            seed=options["seed"],
+            batch_size=options["batch_size"],
+            workers=options["workers"],
+            create_images=not options["withoutimages"],
+            placeholder_dir=self.placeholders_dir,
+            user_password=options["user_password"],
+        )
+        if min(config.variants_per_product, config.channels, config.warehouses) < 1:
+            raise CommandError(
+                "Generated data needs at least one variant, channel and warehouse."
+            )
+        for msg in create_scaled_data(config):
+            self.stdout.write(msg)
+
+    def create_admin(self, options):
+        credentials = {
+            "email": "admin@example.com",
+            "password": options["superuser_password"],
+        }
+        msg = create_superuser(credentials)
+        self.stdout.write(msg)
+        add_address_to_admin(credentials["email"])
+
     def handle(self, *args, **options):
+        if options["scale"]:
+            self.populate_scaled_data(options)
+            if options["createsuperuser"]:
+                self.create_admin(options)
+            return
+
         # set only our custom plugin to not call external API when preparing
         # example database
         user_password = options["user_password"]
         staff_password = options["staff_password"]
-        superuser_password = options["superuser_password"]
         settings.PLUGINS = [
             "saleor.payment.gateways.dummy.plugin.DummyGatewayPlugin",
             "saleor.payment.gateways.dummy_credit_card.plugin."
@@ -116,13 +200,7 @@ class Command(BaseCommand):
             self.stdout.write(msg)
 
         if options["createsuperuser"]:
-            credentials = {
-                "email": "admin@example.com",
-                "password": superuser_password,
-            }
-            msg = create_superuser(credentials)
-            self.stdout.write(msg)
-            add_address_to_admin(credentials["email"])
+            self.create_admin(options)
         if not options["skipsequencereset"]:
             self.sequence_reset()
 
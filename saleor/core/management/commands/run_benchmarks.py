@@ -0,0 +1,328 @@
+import json
+
+import graphene
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.core.management.base import BaseCommand, CommandError
+from django.http.request import validate_host
+from django.test import Client
+from django.urls import reverse
+
+from ....account.models import User
+from ....channel.models import Channel
+from ....core.jwt import create_access_token
+from ....order.models import Order
+from ....product.models import Product, ProductVariant
+from ....webhook.payloads import generate_order_payload, generate_product_payload
+from ...utils.benchmark import (
+    compare_with_baseline,
+    dump_summaries,
+    format_changes,
+    format_summaries,
+    load_summaries,
+    run_benchmark,
+)
+
+PRODUCTS_QUERY = """
+    query Products($channel: String) {
+        products(first: 100, channel: $channel) {
+            totalCount
+            edges {
+                node {
+                    id
+                    name
+                    slug
+                    thumbnail { url alt }
+                    category { id name }
+                    pricing {
+                        onSale
+                        priceRange {
+                            start { gross { amount currency } }
+                            stop { gross { amount currency } }
+                        }
+                    }
+                }
+            }
+        }
+    }
+"""
+
+ORDERS_QUERY = """
+    query Orders {
+        orders(first: 100) {
+            totalCount
+            edges {
+                node {
+                    id
+                    number
+                    created
+                    status
+                    paymentStatus
+                    userEmail
+                    total { gross { amount currency } }
+                    lines { id quantity productName }
+                }
+            }
+        }
+    }
+"""
+
+CHECKOUT_CREATE_MUTATION = """
+    mutation CheckoutCreate($input: CheckoutCreateInput!) {
+        checkoutCreate(input: $input) {
+            checkout {
+                token
+                totalPrice { gross { amount } }
+                shippingMethods { id }
+            }
+            errors { field message }
+        }
+    }
+"""
+
+CHECKOUT_DELIVERY_METHOD_UPDATE_MUTATION = """
+    mutation DeliveryMethodUpdate($token: UUID, $deliveryMethodId: ID) {
+        checkoutDeliveryMethodUpdate(
+            token: $token, deliveryMethodId: $deliveryMethodId
+        ) {
+            checkout { totalPrice { gross { amount } } }
+            errors { field message }
+        }
+    }
+"""
+
+CHECKOUT_PAYMENT_CREATE_MUTATION = """
+    mutation PaymentCreate($token: UUID, $input: PaymentInput!) {
+        checkoutPaymentCreate(token: $token, input: $input) {
+            payment { id }
+            errors { field message }
+        }
+    }
+"""
+
+CHECKOUT_COMPLETE_MUTATION = """
+    mutation CheckoutComplete($token: UUID) {
+        checkoutComplete(token: $token) {
+            order { id number total { gross { amount } } }
+            errors { field message }
+        }
+    }
+"""
+
+ADDRESS = {
+    "firstName": "John",
+    "lastName": "Doe",
+    "streetAddress1": "1470 Pinewood Avenue",
+    "city": "Michigan City",
+    "postalCode": "49360",
+    "country": "US",
+    "countryArea": "MI",
+    "phone": "+12025550163",
+}
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure latency, queries and memory of key storefront and dashboard "
+        "operations against the current database. Changes made by benchmarks "
+        "are rolled back; use a dedicated database, e.g. filled by "
+        "`populatedb`."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=20)
+        parser.add_argument("--warmup", type=int, default=2)
+        parser.add_argument(
+            "--memory-iterations",
+            type=int,
+            default=3,
+            help="Number of separate runs measuring queries and peak memory.",
+        )
+        parser.add_argument(
+            "--only",
+            nargs="+",
+            help="Run only benchmarks with the given names.",
+        )
+        parser.add_argument("--channel", help="Slug of the channel to use.")
+        parser.add_argument(
+            "--gateway",
+            default="mirumee.payments.dummy",
+            help="Payment gateway used to complete checkouts.",
+        )
+        parser.add_argument("--output", help="Save the results to a JSON file.")
+        parser.add_argument(
+            "--baseline", help="Compare the results with a saved JSON file."
+        )
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=10.0,
+            help="Fail when a metric grows by more than this percentage.",
+        )
+
+    def handle(self, *args, **options):
+        channels = Channel.objects.filter(is_active=True)
+        if options["channel"]:
+            channels = channels.filter(slug=options["channel"])
+        self.channel = channels.first()
+        self.staff_user = (
+            User.objects.filter(is_superuser=True, is_active=True).first()
+            or User.objects.filter(is_staff=True, is_active=True).first()
+        )
+        if not self.channel or not self.staff_user:
+            raise CommandError(
+                "Benchmarks need an active channel and a staff user; "
+                "run `populatedb --createsuperuser` first."
+            )
+        self.gateway = options["gateway"]
+        self.host = self.get_host()
+
+        benchmarks = {
+            "products_list": (None, self.products_list),
+            "checkout_flow": (None, self.checkout_flow),
+            "checkout_complete": (self.checkout_flow, self.checkout_complete),
+            "order_list": (None, self.order_list),
+            "webhook_order_payload": (None, self.webhook_order_payload),
+            "webhook_product_payload": (None, self.webhook_product_payload),
+        }
+        names = options["only"] or list(benchmarks)
+        unknown = set(names) - set(benchmarks)
+        if unknown:
+            raise CommandError(f"Unknown benchmarks: {', '.join(sorted(unknown))}.")
+
+        summaries = []
+        for name in names:
+            setup, operation = benchmarks[name]
+            self.stdout.write(f"Running {name}...")
+            result = run_benchmark(
+                name,
+                operation,
+                setup=setup,
+                iterations=options["iterations"],
+                warmup=options["warmup"],
+                memory_iterations=options["memory_iterations"],
+            )
+            summaries.append(result.summary())
+        self.stdout.write(format_summaries(summaries))
+
+        if options["output"]:
+            dump_summaries(summaries, options["output"])
+        if options["baseline"]:
+            changes = compare_with_baseline(
+                summaries, load_summaries(options["baseline"]), options["threshold"]
+            )
+            self.stdout.write(format_changes(changes))
+            regressions = [change for change in changes if change["regression"]]
+            if regressions:
+                raise CommandError(
+                    f"{len(regressions)} metrics regressed by more than "
+                    f"{options['threshold']}%."
+                )
+
+    @staticmethod
+    def get_host():
+        """Return the site domain, or an allowed host if the domain isn't allowed."""
+        domain = Site.objects.get_current().domain.split(":")[0]
+        if validate_host(domain, settings.ALLOWED_HOSTS):
+            return domain
+        hosts = [host for host in settings.ALLOWED_HOSTS if host[0] not in ".*"]
+        return hosts[0] if hosts else domain
+
+    def post_graphql(self, query, variables=None, user=None):
+        headers = {"HTTP_HOST": self.host}
+        if user:
+            headers["HTTP_AUTHORIZATION"] = f"JWT {create_access_token(user)}"
+        response = Client().post(
+            reverse("api"),
+            json.dumps({"query": query, "variables": variables or {}}),
+            content_type="application/json",
+            **headers,
+        )
+        content = json.loads(response.content)
+        if "errors" in content:
+            raise CommandError(f"GraphQL errors: {content['errors']}")
+        return content["data"]
+
+    @staticmethod
+    def check_errors(data):
+        if data["errors"]:
+            raise CommandError(f"Mutation errors: {data['errors']}")
+        return data
+
+    def products_list(self, _context):
+        self.post_graphql(PRODUCTS_QUERY, {"channel": self.channel.slug})
+
+    def order_list(self, _context):
+        self.post_graphql(ORDERS_QUERY, user=self.staff_user)
+
+    def checkout_flow(self, _context=None):
+        variant = (
+            ProductVariant.objects.filter(
+                channel_listings__channel=self.channel,
+                channel_listings__price_amount__isnull=False,
+                stocks__quantity__gt=0,
+            )
+            .order_by("pk")
+            .first()
+        )
+        if not variant:
+            raise CommandError(f"No variants in stock in {self.channel.slug}.")
+        variant_id = graphene.Node.to_global_id("ProductVariant", variant.pk)
+        data = self.check_errors(
+            self.post_graphql(
+                CHECKOUT_CREATE_MUTATION,
+                {
+                    "input": {
+                        "channel": self.channel.slug,
+                        "email": "benchmark@example.com",
+                        "lines": [{"quantity": 1, "variantId": variant_id}],
+                        "shippingAddress": ADDRESS,
+                        "billingAddress": ADDRESS,
+                    }
+                },
+            )["checkoutCreate"]
+        )
+        checkout = data["checkout"]
+        if not checkout["shippingMethods"]:
+            raise CommandError("No shipping methods available for the checkout.")
+        data = self.check_errors(
+            self.post_graphql(
+                CHECKOUT_DELIVERY_METHOD_UPDATE_MUTATION,
+                {
+                    "token": checkout["token"],
+                    "deliveryMethodId": checkout["shippingMethods"][0]["id"],
+                },
+            )["checkoutDeliveryMethodUpdate"]
+        )
+        total = data["checkout"]["totalPrice"]["gross"]["amount"]
+        self.check_errors(
+            self.post_graphql(
+                CHECKOUT_PAYMENT_CREATE_MUTATION,
+                {
+                    "token": checkout["token"],
+                    "input": {
+                        "gateway": self.gateway,
+                        "token": "fully_charged",
+                        "amount": total,
+                    },
+                },
+            )["checkoutPaymentCreate"]
+        )
+        return checkout["token"]
+
+    def checkout_complete(self, token):
+        self.check_errors(
+            self.post_graphql(CHECKOUT_COMPLETE_MUTATION, {"token": token})[
+                "checkoutComplete"
+            ]
+        )
+
+    def webhook_order_payload(self, _context):
+        order = Order.objects.non_draft().order_by("-pk").first()
+        if order:
+            generate_order_payload(order)
+
+    def webhook_product_payload(self, _context):
+        product = Product.objects.order_by("-pk").first()
+        if product:
+            generate_product_payload(product)
@@ -13,6 +13,7 @@ from django.utils.translation import get_language
 from ..discount.utils import fetch_discounts
 from ..graphql.utils import get_user_or_app_from_context
 from ..plugins.manager import PluginsManager, get_plugins_manager
+from ..site.utils import site_cache_version_for_request
 from . import analytics
 from .jwt import JWT_REFRESH_TOKEN_COOKIE_NAME, jwt_decode_with_exception_handler
 
@@ -74,15 +75,21 @@ def site(get_response):
     level. This leads to problems when updating Site instances, as it's
     required to restart all application servers in order to invalidate
     the cache. Using this middleware solves this problem.
+
+    With `SITE_CACHE_ENABLED`, the cache is kept between requests and dropped
+    only when the site cache version is changed. The version is checked once per
+    request.
     """
 
     def _get_site():
-        Site.objects.clear_cache()
+        if not settings.SITE_CACHE_ENABLED:
+            Site.objects.clear_cache()
         return Site.objects.get_current()
 
     def _site_middleware(request):
         request.site = SimpleLazyObject(_get_site)
-        return get_response(request)
+        with site_cache_version_for_request():
+            return get_response(request)
 
     return _site_middleware
 
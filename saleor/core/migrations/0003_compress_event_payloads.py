@@ -0,0 +1,75 @@
+from django.db import migrations, models
+
+import saleor.core.db.fields
+
+# Compressed values are stored in new columns, so the tables aren't rewritten under a
+# lock. Existing values stay in the old text columns, renamed to `legacy_*` fields,
+# until `compress_event_data_task` moves them.
+
+
+def rename_to_legacy_field(model_name, name, null=True):
+    return migrations.SeparateDatabaseAndState(
+        state_operations=[
+            migrations.RenameField(
+                model_name=model_name, old_name=name, new_name=f"legacy_{name}"
+            ),
+            migrations.AlterField(
+                model_name=model_name,
+                name=f"legacy_{name}",
+                field=models.TextField(null=null, db_column=name),
+            ),
+        ]
+    )
+
+
+def add_compressed_field(model_name, name):
+    return migrations.AddField(
+        model_name=model_name,
+        name=name,
+        field=saleor.core.db.fields.CompressedTextField(
+            null=True, db_column=f"compressed_{name}"
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0002_initial"),
+    ]
+
+    operations = [
+        rename_to_legacy_field("eventpayload", "payload", null=False),
+        rename_to_legacy_field("eventdeliveryattempt", "response"),
+        rename_to_legacy_field("eventdeliveryattempt", "response_headers"),
+        rename_to_legacy_field("eventdeliveryattempt", "request_headers"),
+        migrations.AlterField(
+            model_name="eventpayload",
+            name="legacy_payload",
+            field=models.TextField(blank=True, null=True, db_column="payload"),
+        ),
+        add_compressed_field("eventpayload", "payload"),
+        add_compressed_field("eventdeliveryattempt", "response"),
+        add_compressed_field("eventdeliveryattempt", "response_headers"),
+        add_compressed_field("eventdeliveryattempt", "request_headers"),
+        migrations.AddField(
+            model_name="eventpayload",
+            name="payload_file",
+            field=models.FileField(blank=True, null=True, upload_to="event_payloads"),
+        ),
+        migrations.AlterField(
+            model_name="eventpayload",
+            name="created_at",
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+        migrations.AlterField(
+            model_name="eventdelivery",
+            name="created_at",
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+        migrations.AlterField(
+            model_name="eventdeliveryattempt",
+            name="created_at",
+            field=models.DateTimeField(auto_now_add=True, db_index=True),
+        ),
+    ]
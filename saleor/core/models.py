@@ -1,12 +1,16 @@
 import datetime
 from typing import Any
+from uuid import uuid4
 
+from django.conf import settings
 from django.contrib.postgres.indexes import GinIndex
+from django.core.files.base import ContentFile
 from django.db import models, transaction
 from django.db.models import JSONField  # type: ignore
 from django.db.models import F, Max, Q
 
 from . import EventDeliveryStatus, JobStatus
+from .db.fields import CompressedTextField
 from .utils.json_serializer import CustomJsonEncoder
 
 
@@ -123,13 +127,42 @@ class Job(models.Model):
         abstract = True
 
 
+class EventPayloadManager(models.Manager):
+    def create_with_payload(self, payload: str) -> "EventPayload":
+        """Create a payload, keeping it in the file storage if it's large."""
+        threshold = settings.EVENT_PAYLOAD_STORAGE_THRESHOLD
+        if threshold and len(payload) > threshold:
+            event_payload = self.model(payload="")
+            event_payload.payload_file.save(
+                f"{uuid4()}.json", ContentFile(payload.encode("utf-8")), save=False
+            )
+            event_payload.save()
+            return event_payload
+        return self.create(payload=payload)
+
+
 class EventPayload(models.Model):
-    payload = models.TextField()
-    created_at = models.DateTimeField(auto_now_add=True)
+    payload = CompressedTextField(null=True, db_column="compressed_payload")
+    # Payloads stored before compression; `compress_event_data_task` moves them to
+    # `payload`, the column will be removed once all of them are moved.
+    legacy_payload = models.TextField(null=True, blank=True, db_column="payload")
+    # Large payloads are kept in the file storage instead of the database.
+    payload_file = models.FileField(upload_to="event_payloads", null=True, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    objects = EventPayloadManager()
+
+    def get_payload(self) -> str:
+        if self.payload_file:
+            with self.payload_file.open("rb") as payload_file:
+                return payload_file.read().decode("utf-8")
+        if self.payload is None:
+            return self.legacy_payload
+        return self.payload
 
 
 class EventDelivery(models.Model):
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     status = models.CharField(
         max_length=255,
         choices=EventDeliveryStatus.CHOICES,
@@ -149,12 +182,20 @@ class EventDeliveryAttempt(models.Model):
     delivery = models.ForeignKey(
         EventDelivery, related_name="attempts", null=True, on_delete=models.CASCADE
     )
-    created_at = models.DateTimeField(auto_now_add=True)
+    created_at = models.DateTimeField(auto_now_add=True, db_index=True)
     task_id = models.CharField(max_length=255, null=True)
     duration = models.FloatField(null=True)
-    response = models.TextField(null=True)
-    response_headers = models.TextField(null=True)
-    request_headers = models.TextField(null=True)
+    response = CompressedTextField(null=True, db_column="compressed_response")
+    response_headers = CompressedTextField(
+        null=True, db_column="compressed_response_headers"
+    )
+    request_headers = CompressedTextField(
+        null=True, db_column="compressed_request_headers"
+    )
+    # Values stored before compression, moved by `compress_event_data_task`.
+    legacy_response = models.TextField(null=True, db_column="response")
+    legacy_response_headers = models.TextField(null=True, db_column="response_headers")
+    legacy_request_headers = models.TextField(null=True, db_column="request_headers")
     status = models.CharField(
         max_length=255,
         choices=EventDeliveryStatus.CHOICES,
@@ -1,23 +1,120 @@
+from datetime import timedelta
+
+from celery.utils.log import get_task_logger
+from django.conf import settings
 from django.core.files.storage import default_storage
+from django.db.models import Exists, OuterRef, Q
 from django.utils import timezone
 
 from ..celeryconf import app
 from ..settings import EVENT_PAYLOAD_DELETE_PERIOD
+from .db.batches import delete_in_batches, update_in_batches
+from .db.fields import PlainCompressedText
 from .models import EventDelivery, EventDeliveryAttempt, EventPayload
 
+task_logger = get_task_logger(__name__)
+
 
 @app.task
 def delete_from_storage_task(path):
     default_storage.delete(path)
 
 
+def _delete_attempts_of_deliveries(delivery_pks):
+    attempts = EventDeliveryAttempt.objects.filter(delivery_id__in=delivery_pks)
+    attempts._raw_delete(attempts.db)
+
+
+def _delete_payload_files(payload_pks):
+    payloads = EventPayload.objects.filter(
+        pk__in=payload_pks, payload_file__isnull=False
+    ).exclude(payload_file="")
+    for path in payloads.values_list("payload_file", flat=True):
+        delete_from_storage_task.delay(path)
+
+
 @app.task
 def delete_event_payloads_task():
     event_payload_delete_period = timezone.now() - EVENT_PAYLOAD_DELETE_PERIOD
-    EventDeliveryAttempt.objects.filter(
-        created_at__lte=event_payload_delete_period
-    ).delete()
-    EventDelivery.objects.filter(created_at__lte=event_payload_delete_period).delete()
-    EventPayload.objects.filter(
-        deliveries__isnull=True, created_at__lte=event_payload_delete_period
-    ).delete()
+    deadline = timezone.now() + settings.MAINTENANCE_TASK_TIME_BUDGET
+    batch_size = settings.EVENT_PAYLOAD_DELETE_BATCH_SIZE
+    deliveries = EventDelivery.objects.filter(payload_id=OuterRef("pk"))
+    querysets_to_delete = [
+        (
+            EventDeliveryAttempt.objects.filter(
+                created_at__lte=event_payload_delete_period
+            ),
+            None,
+        ),
+        (
+            EventDelivery.objects.filter(created_at__lte=event_payload_delete_period),
+            _delete_attempts_of_deliveries,
+        ),
+        (
+            EventPayload.objects.filter(
+                ~Exists(deliveries), created_at__lte=event_payload_delete_period
+            ),
+            _delete_payload_files,
+        ),
+    ]
+    for queryset, before_batch in querysets_to_delete:
+        result = delete_in_batches(
+            queryset,
+            batch_size=batch_size,
+            time_budget=max(deadline - timezone.now(), timedelta(0)),
+            before_batch=before_batch,
+            raw=True,
+            log=task_logger,
+        )
+        if not result.finished:
+            delete_event_payloads_task.delay()
+            return
+
+
+@app.task
+def compress_event_data_task(start_after_pks=None):
+    """Move event data stored before compression to the compressed columns.
+
+    Values are moved in batches, without being compressed, and the legacy columns
+    are cleared. `start_after_pks` maps model labels to primary keys after which
+    the next run resumes.
+    """
+    start_after_pks = start_after_pks or {}
+    deadline = timezone.now() + settings.MAINTENANCE_TASK_TIME_BUDGET
+    querysets_to_update = [
+        (
+            EventPayload.objects.filter(legacy_payload__isnull=False),
+            {
+                "payload": PlainCompressedText("legacy_payload"),
+                "legacy_payload": None,
+            },
+        ),
+        (
+            EventDeliveryAttempt.objects.filter(
+                Q(legacy_response__isnull=False)
+                | Q(legacy_response_headers__isnull=False)
+                | Q(legacy_request_headers__isnull=False)
+            ),
+            {
+                "response": PlainCompressedText("legacy_response"),
+                "response_headers": PlainCompressedText("legacy_response_headers"),
+                "request_headers": PlainCompressedText("legacy_request_headers"),
+                "legacy_response": None,
+                "legacy_response_headers": None,
+                "legacy_request_headers": None,
+            },
+        ),
+    ]
+    for queryset, values in querysets_to_update:
+        label = queryset.model._meta.label
+        result = update_in_batches(
+            queryset,
+            values,
+            time_budget=max(deadline - timezone.now(), timedelta(0)),
+            start_after_pk=start_after_pks.get(label),
+            log=task_logger,
+        )
+        start_after_pks[label] = result.last_pk
+        if not result.finished:
+            compress_event_data_task.delay(start_after_pks)
+            return
@@ -0,0 +1,137 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+import pytest
+from django.db import transaction
+
+from ...tests.models import Book
+from ..db.batches import delete_in_batches, get_pk_ranges, update_in_batches
+
+
+@pytest.fixture
+def books(db):
+    books = [Book(name=f"Book{index}") for index in range(10)]
+    return Book.objects.bulk_create(books)
+
+
+def test_delete_in_batches(books, django_assert_num_queries):
+    # given
+    queryset = Book.objects.filter(name__in=[book.name for book in books[:7]])
+
+    # when
+    # Each batch selects primary keys and deletes them in a savepoint, then the last
+    # select returns no keys.
+    with django_assert_num_queries(3 * 4 + 1):
+        result = delete_in_batches(queryset, batch_size=3, raw=True)
+
+    # then
+    assert result.count == 7
+    assert result.batches == 3
+    assert result.finished
+    assert result.last_pk == books[6].pk
+    assert list(Book.objects.order_by("pk")) == books[7:]
+
+
+def test_delete_in_batches_with_cascades(books):
+    # when
+    result = delete_in_batches(Book.objects.all(), batch_size=4)
+
+    # then
+    assert result.count == len(books)
+    assert result.batches == 3
+    assert not Book.objects.exists()
+
+
+def test_delete_in_batches_calls_before_batch(books):
+    # given
+    batches = []
+
+    # when
+    delete_in_batches(Book.objects.all(), batch_size=6, before_batch=batches.append)
+
+    # then
+    assert batches == [
+        [book.pk for book in books[:6]],
+        [book.pk for book in books[6:]],
+    ]
+
+
+@patch("saleor.core.db.batches.monotonic")
+def test_delete_in_batches_stops_after_time_budget(mocked_monotonic, books):
+    # given
+    mocked_monotonic.side_effect = [0, 1, 2, 61]
+
+    # when
+    result = delete_in_batches(
+        Book.objects.all(), batch_size=2, time_budget=timedelta(minutes=1)
+    )
+
+    # then
+    assert not result.finished
+    assert result.count == 4
+    assert result.last_pk == books[3].pk
+    assert Book.objects.count() == len(books) - 4
+
+
+def test_delete_in_batches_resumes_after_pk(books):
+    # when
+    result = delete_in_batches(
+        Book.objects.all(), batch_size=2, start_after_pk=books[5].pk
+    )
+
+    # then
+    assert result.count == 4
+    assert list(Book.objects.order_by("pk")) == books[:6]
+
+
+def test_delete_in_batches_skips_objects_no_longer_matching(books):
+    # given
+    queryset = Book.objects.filter(name__startswith="Book")
+    atomic = transaction.atomic
+
+    def rename_book_and_start_transaction(*args, **kwargs):
+        # the book changes after its key was selected for the batch
+        Book.objects.filter(pk=books[1].pk).update(name="Renamed")
+        return atomic(*args, **kwargs)
+
+    batches = []
+
+    # when
+    with patch(
+        "saleor.core.db.batches.transaction.atomic",
+        side_effect=rename_book_and_start_transaction,
+    ):
+        result = delete_in_batches(
+            queryset, batch_size=3, before_batch=batches.append, raw=True
+        )
+
+    # then
+    assert result.count == len(books) - 1
+    assert batches[0] == [books[0].pk, books[2].pk]
+    assert list(Book.objects.all()) == [books[1]]
+
+
+def test_update_in_batches(books):
+    # when
+    result = update_in_batches(
+        Book.objects.filter(pk__in=[book.pk for book in books[:5]]),
+        {"name": "Updated"},
+        batch_size=2,
+    )
+
+    # then
+    assert result.count == 5
+    assert result.batches == 3
+    assert Book.objects.filter(name="Updated").count() == 5
+
+
+def test_get_pk_ranges(books):
+    # when
+    ranges = get_pk_ranges(Book.objects.exclude(pk=books[4].pk), 4)
+
+    # then
+    assert ranges == [
+        (books[0].pk, books[3].pk),
+        (books[5].pk, books[8].pk),
+        (books[9].pk, books[9].pk),
+    ]
@@ -0,0 +1,132 @@
+import json
+import tracemalloc
+
+import pytest
+from django.core.management import CommandError, call_command
+
+from ...tests.models import Book
+from ..utils.benchmark import (
+    compare_with_baseline,
+    run_benchmark,
+    run_concurrent_benchmark,
+)
+
+
+def test_run_benchmark(db):
+    # given
+    def operation(name):
+        Book.objects.create(name=name)
+        list(Book.objects.all())
+
+    # when
+    result = run_benchmark(
+        "books", operation, setup=lambda: "Book", iterations=5, warmup=1
+    )
+
+    # then
+    summary = result.summary()
+    assert summary["name"] == "books"
+    assert summary["iterations"] == 5
+    assert summary["queries"] == 2
+    assert summary["p50_ms"] <= summary["p95_ms"] <= summary["p99_ms"]
+    assert summary["peak_memory_kb"] > 0
+    assert not Book.objects.exists()
+
+
+def test_run_benchmark_times_operation_without_tracing(db):
+    # given
+    tracing = []
+
+    def operation(_):
+        tracing.append(tracemalloc.is_tracing())
+
+    # when
+    result = run_benchmark("tracing", operation, iterations=4, memory_iterations=2)
+
+    # then
+    assert tracing == [False] * 5 + [True] * 2
+    assert len(result.durations) == 4
+    assert len(result.memory) == 2
+    assert not tracemalloc.is_tracing()
+
+
+def test_run_concurrent_benchmark():
+    # given
+    def operation(index):
+        if index % 2:
+            raise ValueError()
+
+    # when
+    result = run_concurrent_benchmark(
+        "odd", operation, 4, expected_exceptions=(ValueError,)
+    )
+
+    # then
+    summary = result.summary()
+    assert summary["calls"] == 4
+    assert summary["failures"] == 2
+    assert summary["p50_ms"] <= summary["max_ms"] <= summary["wall_ms"]
+
+
+def test_run_concurrent_benchmark_unexpected_exception():
+    # given
+    def operation(index):
+        raise KeyError()
+
+    # when & then
+    with pytest.raises(KeyError):
+        run_concurrent_benchmark("failing", operation, 2)
+
+
+@pytest.mark.parametrize(
+    "current_p50, regression", [(100.0, False), (109.0, False), (111.0, True)]
+)
+def test_compare_with_baseline(current_p50, regression):
+    # given
+    baseline = [
+        {
+            "name": "books",
+            "p50_ms": 100.0,
+            "p95_ms": 200.0,
+            "queries": 2,
+            "peak_memory_kb": 10.0,
+        }
+    ]
+    summaries = [dict(baseline[0], p50_ms=current_p50)]
+
+    # when
+    changes = compare_with_baseline(summaries, baseline, threshold=10)
+
+    # then
+    changes_by_metric = {change["metric"]: change for change in changes}
+    assert changes_by_metric["p50_ms"]["regression"] is regression
+    assert not changes_by_metric["queries"]["regression"]
+
+
+def test_compare_with_baseline_skips_new_benchmarks():
+    summaries = [{"name": "new", "p50_ms": 1, "p95_ms": 1, "queries": 1}]
+    assert compare_with_baseline(summaries, [], threshold=10) == []
+
+
+def test_run_benchmarks_command(
+    product, order_with_lines, channel_USD, staff_user, tmpdir
+):
+    # given
+    output = str(tmpdir.join("benchmarks.json"))
+    names = ["products_list", "webhook_order_payload", "webhook_product_payload"]
+
+    # when
+    call_command("run_benchmarks", "--only", *names, iterations=2, output=output)
+    call_command(
+        "run_benchmarks", "--only", *names, iterations=2, baseline=output, threshold=1e6
+    )
+
+    # then
+    with open(output) as f:
+        summaries = json.load(f)
+    assert [summary["name"] for summary in summaries] == names
+
+
+def test_run_benchmarks_command_unknown_benchmark(channel_USD, staff_user):
+    with pytest.raises(CommandError):
+        call_command("run_benchmarks", "--only", "unknown")
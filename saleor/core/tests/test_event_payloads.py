@@ -0,0 +1,192 @@
+import json
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.db import connection
+from django.utils import timezone
+from freezegun import freeze_time
+
+from .. import EventDeliveryStatus
+from ..db.batches import BatchResult
+from ..models import EventDelivery, EventDeliveryAttempt, EventPayload
+from ..tasks import compress_event_data_task, delete_event_payloads_task
+
+
+def _get_stored_payload(event_payload):
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT compressed_payload FROM core_eventpayload WHERE id = %s",
+            [event_payload.pk],
+        )
+        return bytes(cursor.fetchone()[0])
+
+
+def test_event_payload_is_stored_compressed(db):
+    # given
+    payload = json.dumps([{"name": "Product"}] * 100)
+
+    # when
+    event_payload = EventPayload.objects.create(payload=payload)
+
+    # then
+    assert len(_get_stored_payload(event_payload)) < len(payload)
+    event_payload.refresh_from_db()
+    assert event_payload.payload == payload
+    assert event_payload.get_payload() == payload
+
+
+def test_event_payload_short_value_is_stored_uncompressed(db):
+    # when
+    event_payload = EventPayload.objects.create(payload="{}")
+
+    # then
+    assert _get_stored_payload(event_payload) == b"\x00{}"
+    event_payload.refresh_from_db()
+    assert event_payload.payload == "{}"
+
+
+def test_event_payload_create_with_payload_uses_file_storage(db, media_root, settings):
+    # given
+    settings.EVENT_PAYLOAD_STORAGE_THRESHOLD = 10
+    payload = json.dumps({"name": "Product"})
+
+    # when
+    event_payload = EventPayload.objects.create_with_payload(payload)
+
+    # then
+    event_payload.refresh_from_db()
+    assert event_payload.payload == ""
+    assert event_payload.payload_file
+    assert event_payload.get_payload() == payload
+
+
+def test_event_payload_create_with_payload_below_threshold(db, settings):
+    # given
+    settings.EVENT_PAYLOAD_STORAGE_THRESHOLD = 100
+    payload = json.dumps({"name": "Product"})
+
+    # when
+    event_payload = EventPayload.objects.create_with_payload(payload)
+
+    # then
+    assert not event_payload.payload_file
+    assert event_payload.get_payload() == payload
+
+
+def _create_event_data(webhook):
+    event_payload = EventPayload.objects.create(payload="{}")
+    delivery = EventDelivery.objects.create(
+        event_type="order_created",
+        payload=event_payload,
+        webhook=webhook,
+        status=EventDeliveryStatus.SUCCESS,
+    )
+    attempt = EventDeliveryAttempt.objects.create(
+        delivery=delivery, response="OK", status=EventDeliveryStatus.SUCCESS
+    )
+    return event_payload, delivery, attempt
+
+
+def test_delete_event_payloads_task(webhook, settings):
+    # given
+    settings.EVENT_PAYLOAD_DELETE_BATCH_SIZE = 2
+    with freeze_time(timezone.now() - timedelta(days=30)):
+        for _ in range(3):
+            _create_event_data(webhook)
+    new_payload, new_delivery, new_attempt = _create_event_data(webhook)
+
+    # when
+    delete_event_payloads_task()
+
+    # then
+    assert list(EventPayload.objects.all()) == [new_payload]
+    assert list(EventDelivery.objects.all()) == [new_delivery]
+    assert list(EventDeliveryAttempt.objects.all()) == [new_attempt]
+
+
+def test_delete_event_payloads_task_deletes_new_attempts_of_old_delivery(webhook):
+    # given
+    with freeze_time(timezone.now() - timedelta(days=30)):
+        _, delivery, _ = _create_event_data(webhook)
+    EventDeliveryAttempt.objects.create(delivery=delivery)
+
+    # when
+    delete_event_payloads_task()
+
+    # then
+    assert not EventDeliveryAttempt.objects.exists()
+    assert not EventDelivery.objects.exists()
+    assert not EventPayload.objects.exists()
+
+
+@patch("saleor.core.tasks.delete_from_storage_task.delay")
+def test_delete_event_payloads_task_deletes_payload_files(
+    mocked_delete_from_storage, db, media_root, settings
+):
+    # given
+    settings.EVENT_PAYLOAD_STORAGE_THRESHOLD = 1
+    with freeze_time(timezone.now() - timedelta(days=30)):
+        event_payload = EventPayload.objects.create_with_payload("{}")
+
+    # when
+    delete_event_payloads_task()
+
+    # then
+    mocked_delete_from_storage.assert_called_once_with(event_payload.payload_file.name)
+    assert not EventPayload.objects.exists()
+
+
+def test_event_payload_get_payload_from_legacy_column(db):
+    # given
+    event_payload = EventPayload.objects.create(payload=None, legacy_payload="{}")
+
+    # when
+    payload = event_payload.get_payload()
+
+    # then
+    assert payload == "{}"
+
+
+def test_compress_event_data_task(db):
+    # given
+    legacy_payload = EventPayload.objects.create(payload=None, legacy_payload="{}")
+    event_payload = EventPayload.objects.create(payload="[]")
+    legacy_attempt = EventDeliveryAttempt.objects.create(
+        legacy_response="OK", legacy_request_headers='{"a": "b"}'
+    )
+
+    # when
+    compress_event_data_task()
+
+    # then
+    legacy_payload.refresh_from_db()
+    assert legacy_payload.payload == "{}"
+    assert legacy_payload.legacy_payload is None
+    assert _get_stored_payload(legacy_payload) == b"\x00{}"
+    event_payload.refresh_from_db()
+    assert event_payload.payload == "[]"
+    legacy_attempt.refresh_from_db()
+    assert legacy_attempt.response == "OK"
+    assert legacy_attempt.request_headers == '{"a": "b"}'
+    assert legacy_attempt.response_headers is None
+    assert legacy_attempt.legacy_response is None
+    assert legacy_attempt.legacy_request_headers is None
+
+
+@patch("saleor.core.tasks.compress_event_data_task.delay")
+@patch("saleor.core.tasks.update_in_batches")
+def test_compress_event_data_task_resumes_after_time_budget(
+    mocked_update_in_batches, mocked_compress_task, db
+):
+    # given
+    mocked_update_in_batches.return_value = BatchResult(
+        count=2, batches=1, last_pk=5, finished=False
+    )
+
+    # when
+    compress_event_data_task({"core.EventPayload": 3})
+
+    # then
+    mocked_update_in_batches.assert_called_once()
+    assert mocked_update_in_batches.call_args.kwargs["start_after_pk"] == 3
+    mocked_compress_task.assert_called_once_with({"core.EventPayload": 5})
@@ -0,0 +1,113 @@
+import pytest
+from django.core.management import CommandError, call_command
+from django.db import transaction
+
+from ...account.models import User
+from ...attribute.models import AssignedProductAttribute, AssignedVariantAttribute
+from ...channel.models import Channel
+from ...order import OrderStatus
+from ...order.models import Fulfillment, Order, OrderLine
+from ...product.models import (
+    Product,
+    ProductChannelListing,
+    ProductVariant,
+    ProductVariantChannelListing,
+)
+from ...warehouse.models import Stock, Warehouse
+from ..utils.scaled_data import ScaleConfig, create_scaled_data
+
+
+def _get_config(**kwargs):
+    defaults = {
+        "products": 5,
+        "customers": 4,
+        "orders": 12,
+        "variants_per_product": 2,
+        "attributes": 3,
+        "values_per_attribute": 2,
+        "channels": 2,
+        "warehouses": 2,
+        "batch_size": 5,
+    }
+    return ScaleConfig(**{**defaults, **kwargs})
+
+
+def test_create_scaled_data(db):
+    # given
+    config = _get_config()
+
+    # when
+    for _ in create_scaled_data(config):
+        pass
+
+    # then
+    assert Channel.objects.count() == 2
+    assert Warehouse.objects.count() == 2
+    assert Product.objects.count() == 5
+    assert ProductVariant.objects.count() == 10
+    assert ProductChannelListing.objects.count() == 10
+    assert ProductVariantChannelListing.objects.count() == 20
+    assert Stock.objects.count() == 20
+    assert AssignedProductAttribute.objects.exists()
+    assert AssignedVariantAttribute.objects.count() == 10
+    assert not Product.objects.filter(default_variant__isnull=True).exists()
+    assert not Product.objects.filter(search_document="").exists()
+    assert User.objects.count() == 4
+    assert Order.objects.count() == 12
+    order = Order.objects.first()
+    assert order.search_document.startswith(f"#{order.pk}\n")
+    assert order.total_gross_amount == order.shipping_price_gross_amount + sum(
+        line.total_price_gross_amount for line in order.lines.all()
+    )
+    fulfilled_orders = Order.objects.filter(status=OrderStatus.FULFILLED)
+    assert Fulfillment.objects.count() == fulfilled_orders.count()
+
+
+def _get_generated_values():
+    products = list(
+        Product.objects.order_by("slug").values_list(
+            "slug", "category__slug", "product_type__slug"
+        )
+    )
+    prices = list(
+        ProductVariantChannelListing.objects.order_by(
+            "variant__sku", "channel__slug"
+        ).values_list("variant__sku", "price_amount")
+    )
+    orders = list(
+        Order.objects.order_by("token").values_list(
+            "token", "status", "user__email", "total_gross_amount"
+        )
+    )
+    lines = list(
+        OrderLine.objects.order_by("order__token", "product_sku").values_list(
+            "order__token", "product_sku", "quantity"
+        )
+    )
+    return products, prices, orders, lines
+
+
+def test_create_scaled_data_is_deterministic(db):
+    # given
+    config = _get_config(seed=7)
+    generated = []
+
+    # when
+    for _ in range(2):
+        with transaction.atomic():
+            for _ in create_scaled_data(config):
+                pass
+            generated.append(_get_generated_values())
+            transaction.set_rollback(True)
+
+    # then
+    assert generated[0] == generated[1]
+
+
+def test_populatedb_scale_with_existing_seed(db):
+    # given
+    call_command("populatedb", "--scale", "1", "--withoutimages", "--orders", "1")
+
+    # when & then
+    with pytest.raises(CommandError):
+        call_command("populatedb", "--scale", "1", "--withoutimages")
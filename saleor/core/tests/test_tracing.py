@@ -0,0 +1,93 @@
+from unittest.mock import patch
+
+from opentracing.mocktracer import MockTracer
+
+from ..models import EventPayload
+from ..tracing import opentracing_trace, record_latency_breakdown, traced_phase
+
+
+def test_record_latency_breakdown(db):
+    # when
+    with record_latency_breakdown("operation") as breakdown:
+        EventPayload.objects.count()
+        with traced_phase("first"):
+            EventPayload.objects.count()
+            with traced_phase("nested"):
+                list(EventPayload.objects.select_for_update())
+        with traced_phase("second"):
+            pass
+
+    # then
+    first, nested, second = breakdown.phases
+    assert breakdown.total.queries == 3
+    assert first.queries == 2
+    assert nested.queries == 1
+    assert second.queries == 0
+    assert nested.lock_wait_time > 0
+    assert first.lock_wait_time == nested.lock_wait_time
+    assert first.wall_time >= nested.wall_time
+    assert breakdown.total.wall_time >= first.wall_time + second.wall_time
+
+
+def test_record_latency_breakdown_external_calls():
+    # when
+    with record_latency_breakdown("operation") as breakdown:
+        with traced_phase("payment"):
+            with opentracing_trace("gateway", "payment", "gateway"):
+                with opentracing_trace("gateway.request", "http", "gateway"):
+                    pass
+
+    # then
+    (payment,) = breakdown.phases
+    assert payment.external_time > 0
+    assert payment.external_time <= payment.wall_time
+    assert breakdown.total.external_time == payment.external_time
+
+
+def test_record_latency_breakdown_as_dict():
+    # given
+    with record_latency_breakdown("operation") as breakdown:
+        with traced_phase("phase"):
+            pass
+
+    # when
+    data = breakdown.as_dict()
+
+    # then
+    assert data["name"] == "operation"
+    assert data["queries"] == 0
+    assert [phase["name"] for phase in data["phases"]] == ["phase"]
+    assert set(data["phases"][0]) == {
+        "name",
+        "wallMs",
+        "queries",
+        "dbMs",
+        "lockWaitMs",
+        "externalMs",
+    }
+
+
+@patch("saleor.core.tracing.opentracing.global_tracer")
+def test_traced_phase_sets_span_tags(tracing_mock, db):
+    # given
+    tracer = MockTracer()
+    tracing_mock.return_value = tracer
+
+    # when
+    with record_latency_breakdown("operation"):
+        with traced_phase("phase"):
+            EventPayload.objects.count()
+
+    # then
+    (span,) = tracer.finished_spans()
+    assert span.operation_name == "phase"
+    assert span.tags["phase.queries"] == 1
+
+
+def test_traced_phase_without_breakdown():
+    # when
+    with traced_phase("phase"):
+        result = True
+
+    # then
+    assert result
@@ -1,7 +1,11 @@
+import time
 from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
 
 import opentracing
-from django.db import transaction
+from django.db import connection, transaction
 from graphql import ResolveInfo
 
 
@@ -34,7 +38,8 @@ def opentracing_trace(span_name, component_name, service_name):
         span = scope.span
         span.set_tag(opentracing.tags.COMPONENT, component_name)
         span.set_tag("service.name", service_name)
-        yield
+        with record_external_call():
+            yield
 
 
 @contextmanager
@@ -49,4 +54,143 @@ def webhooks_opentracing_trace(span_name, domain, sync=False, app_name=None):
         span.set_tag("service.name", "webhooks")
         span.set_tag("webhooks.domain", domain)
         span.set_tag("webhooks.execution_mode", "sync" if sync else "async")
+        with record_external_call():
+            yield
+
+
+@dataclass
+class PhaseTiming:
+    name: str
+    wall_time: float = 0.0
+    queries: int = 0
+    db_time: float = 0.0
+    lock_wait_time: float = 0.0
+    external_time: float = 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "wallMs": round(self.wall_time * 1000, 3),
+            "queries": self.queries,
+            "dbMs": round(self.db_time * 1000, 3),
+            "lockWaitMs": round(self.lock_wait_time * 1000, 3),
+            "externalMs": round(self.external_time * 1000, 3),
+        }
+
+
+class LatencyBreakdown:
+    """Timings of an operation and of its phases marked with `traced_phase`.
+
+    All metrics are inclusive; a query run in a nested phase counts in every
+    enclosing phase and in the total. Lock wait is the time of `SELECT ... FOR
+    UPDATE` queries, external time the time spent in calls to external services traced
+    with `opentracing_trace` or `webhooks_opentracing_trace`.
+    """
+
+    def __init__(self, name: str):
+        self.total = PhaseTiming(name)
+        self.phases: List[PhaseTiming] = []
+        self._open_phases: List[PhaseTiming] = [self.total]
+        self._external_calls = 0
+
+    def start_phase(self, name: str) -> PhaseTiming:
+        phase = PhaseTiming(name)
+        self.phases.append(phase)
+        self._open_phases.append(phase)
+        return phase
+
+    def finish_phase(self, phase: PhaseTiming, wall_time: float):
+        phase.wall_time = wall_time
+        self._open_phases.remove(phase)
+
+    @contextmanager
+    def external_call(self):
+        # nested calls, like a gateway request made by a traced plugin call,
+        # are counted once
+        self._external_calls += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._external_calls -= 1
+            if not self._external_calls:
+                duration = time.perf_counter() - start
+                for phase in self._open_phases:
+                    phase.external_time += duration
+
+    def record_query(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - start
+            is_locking = "FOR UPDATE" in sql
+            for phase in self._open_phases:
+                phase.queries += 1
+                phase.db_time += duration
+                if is_locking:
+                    phase.lock_wait_time += duration
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            **self.total.as_dict(),
+            "phases": [phase.as_dict() for phase in self.phases],
+        }
+
+
+_latency_breakdown: ContextVar[Optional[LatencyBreakdown]] = ContextVar(
+    "latency_breakdown", default=None
+)
+
+
+@contextmanager
+def record_latency_breakdown(name: str):
+    """Collect timings of phases run in the block into a `LatencyBreakdown`."""
+    breakdown = LatencyBreakdown(name)
+    token = _latency_breakdown.set(breakdown)
+    start = time.perf_counter()
+    try:
+        with connection.execute_wrapper(breakdown.record_query):
+            yield breakdown
+    finally:
+        breakdown.total.wall_time = time.perf_counter() - start
+        _latency_breakdown.reset(token)
+
+
+def _set_phase_tags(span, phase: PhaseTiming):
+    span.set_tag("phase.wall_ms", phase.wall_time * 1000)
+    span.set_tag("phase.queries", phase.queries)
+    span.set_tag("phase.db_ms", phase.db_time * 1000)
+    span.set_tag("phase.lock_wait_ms", phase.lock_wait_time * 1000)
+    span.set_tag("phase.external_ms", phase.external_time * 1000)
+
+
+@contextmanager
+def traced_phase(name: str):
+    """Trace a phase of an operation and record it in the current breakdown.
+
+    Can be used as a decorator as well, e.g. for functions run on commit.
+    """
+    breakdown = _latency_breakdown.get()
+    with opentracing.global_tracer().start_active_span(name) as scope:
+        span = scope.span
+        span.set_tag(opentracing.tags.COMPONENT, "phase")
+        phase = breakdown.start_phase(name) if breakdown else None
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            if breakdown and phase:
+                breakdown.finish_phase(phase, time.perf_counter() - start)
+                _set_phase_tags(span, phase)
+
+
+@contextmanager
+def record_external_call():
+    """Count the time spent in the block as external in the current breakdown."""
+    breakdown = _latency_breakdown.get()
+    if breakdown is None:
+        yield
+        return
+    with breakdown.external_call():
         yield
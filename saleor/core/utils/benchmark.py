@@ -0,0 +1,230 @@
+"""Wall-clock benchmarks of operations run against the configured database."""
+import json
+import math
+import statistics
+import threading
+import time
+import tracemalloc
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from django.db import connection, connections, transaction
+from django.test.utils import CaptureQueriesContext
+
+
+@dataclass
+class BenchmarkResult:
+    name: str
+    durations: List[float] = field(default_factory=list)
+    queries: List[int] = field(default_factory=list)
+    memory: List[int] = field(default_factory=list)
+
+    def summary(self) -> Dict[str, Any]:
+        """Return latency percentiles in milliseconds, queries and peak memory."""
+        return {
+            "name": self.name,
+            "iterations": len(self.durations),
+            "p50_ms": _percentile(self.durations, 50) * 1000,
+            "p95_ms": _percentile(self.durations, 95) * 1000,
+            "p99_ms": _percentile(self.durations, 99) * 1000,
+            "mean_ms": statistics.mean(self.durations) * 1000,
+            "queries": max(self.queries),
+            "peak_memory_kb": max(self.memory) / 1024,
+        }
+
+
+def _percentile(values: List[float], percent: int) -> float:
+    ordered = sorted(values)
+    index = max(math.ceil(len(ordered) * percent / 100) - 1, 0)
+    return ordered[index]
+
+
+def run_benchmark(
+    name: str,
+    operation: Callable[[Any], Any],
+    *,
+    setup: Optional[Callable[[], Any]] = None,
+    iterations: int = 10,
+    warmup: int = 1,
+    memory_iterations: int = 3,
+) -> BenchmarkResult:
+    """Run the operation in a loop, measuring duration, queries and memory.
+
+    Each iteration runs in a transaction that is rolled back, so operations can
+    modify data without affecting following iterations. The value returned by
+    `setup` is passed to the operation; setup itself is not measured.
+
+    Timed iterations run without tracing, since both `tracemalloc` and capturing
+    queries slow down the operation. Queries and peak memory are measured in
+    separate `memory_iterations` run afterwards.
+    """
+    result = BenchmarkResult(name=name)
+    for iteration in range(warmup + iterations):
+        with transaction.atomic():
+            context = setup() if setup else None
+            start = time.perf_counter()
+            operation(context)
+            duration = time.perf_counter() - start
+            transaction.set_rollback(True)
+        if iteration >= warmup:
+            result.durations.append(duration)
+
+    tracemalloc.start()
+    try:
+        for _ in range(max(memory_iterations, 1)):
+            with transaction.atomic():
+                context = setup() if setup else None
+                tracemalloc.reset_peak()
+                memory_before, _ = tracemalloc.get_traced_memory()
+                with CaptureQueriesContext(connection) as queries:
+                    operation(context)
+                _, memory_peak = tracemalloc.get_traced_memory()
+                transaction.set_rollback(True)
+            result.queries.append(len(queries))
+            result.memory.append(memory_peak - memory_before)
+    finally:
+        tracemalloc.stop()
+    return result
+
+
+@dataclass
+class ConcurrentBenchmarkResult:
+    name: str
+    durations: List[float] = field(default_factory=list)
+    failures: int = 0
+    wall_time: float = 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        """Return latency percentiles of all calls and the total time in ms."""
+        return {
+            "name": self.name,
+            "calls": len(self.durations),
+            "failures": self.failures,
+            "p50_ms": _percentile(self.durations, 50) * 1000,
+            "p95_ms": _percentile(self.durations, 95) * 1000,
+            "p99_ms": _percentile(self.durations, 99) * 1000,
+            "max_ms": max(self.durations) * 1000,
+            "wall_ms": self.wall_time * 1000,
+        }
+
+
+def run_concurrent_benchmark(
+    name: str,
+    operation: Callable[[int], Any],
+    concurrency: int,
+    expected_exceptions: Tuple[Type[Exception], ...] = (),
+) -> ConcurrentBenchmarkResult:
+    """Call the operation from many threads at once, measuring each call.
+
+    The operation gets the index of its thread. Threads use their own database
+    connections, so changes aren't rolled back and data created for the benchmark
+    has to be committed. Calls raising `expected_exceptions` are counted as
+    failures; other exceptions are re-raised after all threads finish.
+    """
+    result = ConcurrentBenchmarkResult(name=name)
+    barrier = threading.Barrier(concurrency)
+    lock = threading.Lock()
+    errors: List[Exception] = []
+
+    def run(index):
+        failed = False
+        try:
+            barrier.wait()
+            start = time.perf_counter()
+            try:
+                operation(index)
+            except expected_exceptions:
+                failed = True
+            duration = time.perf_counter() - start
+            with lock:
+                result.durations.append(duration)
+                result.failures += failed
+        except Exception as e:
+            with lock:
+                errors.append(e)
+        finally:
+            connections.close_all()
+
+    threads = [
+        threading.Thread(target=run, args=(index,)) for index in range(concurrency)
+    ]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    result.wall_time = time.perf_counter() - start
+    if errors:
+        raise errors[0]
+    return result
+
+
+# Metrics compared with the baseline; higher values are worse for all of them.
+COMPARED_METRICS = ["p50_ms", "p95_ms", "queries", "peak_memory_kb"]
+
+
+def compare_with_baseline(
+    summaries: List[Dict[str, Any]], baseline: List[Dict[str, Any]], threshold: float
+) -> List[Dict[str, Any]]:
+    """Return changes of metrics against the baseline, flagging regressions.
+
+    A metric regresses when it grows by more than `threshold` percent.
+    """
+    baseline_by_name = {summary["name"]: summary for summary in baseline}
+    changes = []
+    for summary in summaries:
+        base = baseline_by_name.get(summary["name"])
+        if not base:
+            continue
+        for metric in COMPARED_METRICS:
+            current, previous = summary[metric], base[metric]
+            change = (current - previous) / previous * 100 if previous else 0.0
+            changes.append(
+                {
+                    "name": summary["name"],
+                    "metric": metric,
+                    "baseline": previous,
+                    "current": current,
+                    "change_percent": change,
+                    "regression": change > threshold,
+                }
+            )
+    return changes
+
+
+def format_summaries(summaries: List[Dict[str, Any]]) -> str:
+    header = (
+        f"{'benchmark':<30} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} "
+        f"{'queries':>8} {'memory KB':>10}"
+    )
+    lines = [header]
+    for s in summaries:
+        lines.append(
+            f"{s['name']:<30} {s['p50_ms']:>9.1f} {s['p95_ms']:>9.1f} "
+            f"{s['p99_ms']:>9.1f} {s['queries']:>8} {s['peak_memory_kb']:>10.0f}"
+        )
+    return "\n".join(lines)
+
+
+def format_changes(changes: List[Dict[str, Any]]) -> str:
+    lines = [
+        f"{'benchmark':<30} {'metric':<15} {'baseline':>10} {'current':>10} "
+        f"{'change':>8}"
+    ]
+    for c in changes:
+        flag = "  REGRESSION" if c["regression"] else ""
+        lines.append(
+            f"{c['name']:<30} {c['metric']:<15} {c['baseline']:>10.1f} "
+            f"{c['current']:>10.1f} {c['change_percent']:>+7.1f}%{flag}"
+        )
+    return "\n".join(lines)
+
+
+def dump_summaries(summaries: List[Dict[str, Any]], path: str):
+    with open(path, "w") as f:
+        json.dump(summaries, f, indent=2)
+
+
+def load_summaries(path: str) -> List[Dict[str, Any]]:
+    with open(path) as f:
+        return json.load(f)
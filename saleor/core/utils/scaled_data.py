@@ -0,0 +1,775 @@
+"""Generate large deterministic datasets for reproducing performance problems.
+
+Objects are created with `bulk_create` in batches instead of one by one, so
+creating millions of orders takes minutes. All values are drawn from random
+generators seeded with the configured seed, so the same configuration always
+produces the same data. Orders can be created by several worker processes.
+
+Generated orders have lines and fulfillments but no payments or stock
+allocations.
+"""
+import datetime
+import multiprocessing
+import random
+import uuid
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+import graphene
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.core.files.storage import default_storage
+from django.db import connections, transaction
+from django.db.models import CharField, F, Value
+from django.db.models.functions import Cast, Concat
+from django.utils import timezone
+from django_countries import countries
+from faker import Factory
+
+from ...account.models import Address, User
+from ...account.search import (
+    generate_address_search_document_value,
+    generate_user_fields_search_document_value,
+)
+from ...attribute import AttributeType
+from ...attribute.models import (
+    AssignedProductAttribute,
+    AssignedProductAttributeValue,
+    AssignedVariantAttribute,
+    AssignedVariantAttributeValue,
+    Attribute,
+    AttributeProduct,
+    AttributeValue,
+    AttributeVariant,
+)
+from ...channel.models import Channel
+from ...order import FulfillmentStatus, OrderOrigin, OrderStatus
+from ...order.models import Fulfillment, FulfillmentLine, Order, OrderLine
+from ...order.reports import update_all_customer_order_stats, update_all_sales_rollups
+from ...product import ProductMediaTypes, ProductTypeKind
+from ...product.models import (
+    Category,
+    Product,
+    ProductChannelListing,
+    ProductMedia,
+    ProductType,
+    ProductVariant,
+    ProductVariantChannelListing,
+)
+from ...product.search import update_products_search_document
+from ...shipping import ShippingMethodType
+from ...shipping.models import (
+    ShippingMethod,
+    ShippingMethodChannelListing,
+    ShippingZone,
+)
+from ...warehouse import WarehouseClickAndCollectOption
+from ...warehouse.models import Stock, Warehouse
+from .random_data import (
+    IMAGES_MAPPING,
+    get_email,
+    get_image,
+    get_product_list_images_dir,
+)
+
+CURRENCIES = ["USD", "EUR", "PLN", "GBP", "JPY", "CAD", "AUD", "CHF"]
+SHIPPING_METHOD_NAMES = ["Standard", "Express", "Economy"]
+PRODUCT_TYPES_COUNT = 10
+CATEGORY_SIZE = 1000
+FAKE_VALUES_POOL_SIZE = 500
+ORDERS_PERIOD = datetime.timedelta(days=365)
+CUSTOMER_ORDERS_RATIO = 0.7
+ORDER_STATUSES = [
+    OrderStatus.UNFULFILLED,
+    OrderStatus.FULFILLED,
+    OrderStatus.UNCONFIRMED,
+    OrderStatus.CANCELED,
+]
+ORDER_STATUS_WEIGHTS = [45, 45, 5, 5]
+
+
+@dataclass
+class ScaleConfig:
+    products: int
+    customers: int
+    orders: int
+    variants_per_product: int = 3
+    attributes: int = 20
+    values_per_attribute: int = 10
+    channels: int = 2
+    warehouses: int = 5
+    max_order_lines: int = 5
+    seed: int = 0
+    batch_size: int = 1000
+    workers: int = 1
+    create_images: bool = False
+    placeholder_dir: str = ""
+    user_password: str = "password"
+
+    @property
+    def prefix(self) -> str:
+        return f"scale-{self.seed}"
+
+
+class ChannelData(NamedTuple):
+    id: int
+    currency: str
+    shipping_methods: List[Tuple[int, str, Decimal]]
+    variants: List[Tuple[int, str, str, str, Decimal]]
+
+
+@dataclass
+class OrdersContext:
+    config: ScaleConfig
+    channels: List[ChannelData]
+    # Customer ID, email and the user part of order search document.
+    customers: List[Tuple[int, str, str]]
+    addresses: List[Dict[str, Any]]
+    now: datetime.datetime = field(default_factory=timezone.now)
+
+
+# Set before the order worker processes are forked, so they inherit it.
+_orders_context: Optional[OrdersContext] = None
+
+
+def scaled_data_exists(seed: int) -> bool:
+    return Channel.objects.filter(slug__startswith=f"scale-{seed}-").exists()
+
+
+def _get_random(config: ScaleConfig, name: str, index: int = 0) -> random.Random:
+    """Return a generator seeded independently of the order of creation."""
+    return random.Random(f"{config.seed}:{name}:{index}")
+
+
+def _get_uuid(rng: random.Random) -> uuid.UUID:
+    return uuid.UUID(int=rng.getrandbits(128), version=4)
+
+
+def _get_price(rng: random.Random, minimum: int = 1, maximum: int = 200) -> Decimal:
+    return Decimal(rng.randint(minimum * 100, maximum * 100)) / 100
+
+
+def _get_batches(total: int, batch_size: int) -> Iterator[Tuple[int, range]]:
+    for index, start in enumerate(range(0, total, batch_size)):
+        yield index, range(start, min(start + batch_size, total))
+
+
+def _get_address_pool(config: ScaleConfig) -> List[Dict[str, Any]]:
+    """Return fake address values to pick from, faker is too slow to call per row."""
+    fake = Factory.create()
+    fake.seed_instance(config.seed)
+    addresses = []
+    for _ in range(FAKE_VALUES_POOL_SIZE):
+        address = {
+            "first_name": fake.first_name(),
+            "last_name": fake.last_name(),
+            "street_address_1": fake.street_address(),
+            "city": fake.city(),
+            "country": settings.DEFAULT_COUNTRY,
+        }
+        if address["country"] == "US":
+            state = fake.state_abbr()
+            address["country_area"] = state
+            address["postal_code"] = fake.postalcode_in_state(state)
+        else:
+            address["postal_code"] = fake.postalcode()
+        addresses.append(address)
+    return addresses
+
+
+def create_scaled_channels(config: ScaleConfig) -> List[Channel]:
+    channels = Channel.objects.bulk_create(
+        [
+            Channel(
+                name=f"Scale channel {index} {CURRENCIES[index % len(CURRENCIES)]}",
+                slug=f"{config.prefix}-channel-{index}",
+                currency_code=CURRENCIES[index % len(CURRENCIES)],
+                default_country=settings.DEFAULT_COUNTRY,
+                is_active=True,
+            )
+            for index in range(config.channels)
+        ]
+    )
+    rng = _get_random(config, "shipping")
+    shipping_zone = ShippingZone.objects.create(
+        name=f"Scale zone {config.seed}",
+        countries=[code for code, _name in countries],
+    )
+    shipping_zone.channels.add(*channels)
+    shipping_methods = ShippingMethod.objects.bulk_create(
+        [
+            ShippingMethod(
+                name=name,
+                shipping_zone=shipping_zone,
+                type=ShippingMethodType.PRICE_BASED,
+            )
+            for name in SHIPPING_METHOD_NAMES
+        ]
+    )
+    ShippingMethodChannelListing.objects.bulk_create(
+        [
+            ShippingMethodChannelListing(
+                shipping_method=shipping_method,
+                channel=channel,
+                price_amount=_get_price(rng, 5, 30),
+                minimum_order_price_amount=Decimal(0),
+                currency=channel.currency_code,
+            )
+            for channel in channels
+            for shipping_method in shipping_methods
+        ]
+    )
+    return channels
+
+
+def create_scaled_warehouses(
+    config: ScaleConfig, addresses: List[Dict[str, Any]]
+) -> List[Warehouse]:
+    rng = _get_random(config, "warehouses")
+    shipping_zone = ShippingZone.objects.get(name=f"Scale zone {config.seed}")
+    warehouse_addresses = Address.objects.bulk_create(
+        [Address(**rng.choice(addresses)) for _ in range(config.warehouses)]
+    )
+    warehouses = Warehouse.objects.bulk_create(
+        [
+            Warehouse(
+                id=_get_uuid(rng),
+                name=f"Scale warehouse {index}",
+                slug=f"{config.prefix}-warehouse-{index}",
+                address=address,
+                is_private=False,
+                click_and_collect_option=WarehouseClickAndCollectOption.DISABLED,
+            )
+            for index, address in enumerate(warehouse_addresses)
+        ]
+    )
+    Warehouse.shipping_zones.through.objects.bulk_create(
+        [
+            Warehouse.shipping_zones.through(
+                warehouse=warehouse, shippingzone=shipping_zone
+            )
+            for warehouse in warehouses
+        ]
+    )
+    return warehouses
+
+
+def create_scaled_customers(
+    config: ScaleConfig, addresses: List[Dict[str, Any]]
+) -> Iterator[int]:
+    """Create customers in batches, yielding the number created in each batch."""
+    # Hashing is slow on purpose, so all customers share the same hash.
+    password = make_password(config.user_password)
+    for batch_index, indexes in _get_batches(config.customers, config.batch_size):
+        rng = _get_random(config, "customers", batch_index)
+        with transaction.atomic():
+            customer_addresses = Address.objects.bulk_create(
+                [Address(**rng.choice(addresses)) for _ in indexes]
+            )
+            users = []
+            for index, address in zip(indexes, customer_addresses):
+                email = get_email(address.first_name, address.last_name)
+                user = User(
+                    email=email.replace("@", f".{config.prefix}-{index}@"),
+                    first_name=address.first_name,
+                    last_name=address.last_name,
+                    password=password,
+                    default_billing_address=address,
+                    default_shipping_address=address,
+                    is_active=True,
+                    date_joined=timezone.now()
+                    - datetime.timedelta(days=rng.randint(0, 1000)),
+                )
+                user.search_document = generate_user_fields_search_document_value(
+                    user
+                ) + generate_address_search_document_value(address)
+                users.append(user)
+            users = User.objects.bulk_create(users)
+            User.addresses.through.objects.bulk_create(
+                [
+                    User.addresses.through(user=user, address=address)
+                    for user, address in zip(users, customer_addresses)
+                ]
+            )
+        yield len(users)
+
+
+def create_scaled_attributes(config: ScaleConfig) -> List[ProductType]:
+    """Create attributes and product types they are assigned to."""
+    rng = _get_random(config, "attributes")
+    attributes = Attribute.objects.bulk_create(
+        [
+            Attribute(
+                name=f"Attribute {index}",
+                slug=f"{config.prefix}-attribute-{index}",
+                type=AttributeType.PRODUCT_TYPE,
+                filterable_in_dashboard=True,
+                filterable_in_storefront=True,
+                visible_in_storefront=True,
+            )
+            for index in range(config.attributes)
+        ]
+    )
+    AttributeValue.objects.bulk_create(
+        [
+            AttributeValue(
+                attribute=attribute,
+                name=f"Value {index}",
+                slug=f"{attribute.slug}-value-{index}",
+                sort_order=index,
+            )
+            for attribute in attributes
+            for index in range(config.values_per_attribute)
+        ]
+    )
+    product_types = ProductType.objects.bulk_create(
+        [
+            ProductType(
+                name=f"Scale product type {index}",
+                slug=f"{config.prefix}-product-type-{index}",
+                kind=ProductTypeKind.NORMAL,
+                has_variants=config.variants_per_product > 1,
+            )
+            for index in range(PRODUCT_TYPES_COUNT)
+        ]
+    )
+    product_assignments = []
+    variant_assignments = []
+    for product_type in product_types:
+        selected = rng.sample(attributes, k=min(4, len(attributes)))
+        for sort_order, attribute in enumerate(selected[1:]):
+            product_assignments.append(
+                AttributeProduct(
+                    attribute=attribute,
+                    product_type=product_type,
+                    sort_order=sort_order,
+                )
+            )
+        if selected:
+            variant_assignments.append(
+                AttributeVariant(
+                    attribute=selected[0],
+                    product_type=product_type,
+                    variant_selection=True,
+                    sort_order=0,
+                )
+            )
+    AttributeProduct.objects.bulk_create(product_assignments)
+    AttributeVariant.objects.bulk_create(variant_assignments)
+    return product_types
+
+
+def _store_placeholder_images(config: ScaleConfig) -> List[str]:
+    """Upload the placeholder images once; all products share the stored files."""
+    image_dir = get_product_list_images_dir(config.placeholder_dir)
+    image_names = sorted({name for names in IMAGES_MAPPING.values() for name in names})
+    return [
+        default_storage.save(f"products/{name}", get_image(image_dir, name))
+        for name in image_names
+    ]
+
+
+def create_scaled_products(
+    config: ScaleConfig, product_types: List[ProductType], warehouses: List[Warehouse]
+) -> Iterator[int]:
+    """Create products with variants in batches, yielding the batch sizes.
+
+    Products are listed in all generated channels and stocked in up to two
+    warehouses.
+    """
+    channels = list(Channel.objects.filter(slug__startswith=f"{config.prefix}-"))
+    categories = [
+        Category.objects.create(
+            name=f"Scale category {index}", slug=f"{config.prefix}-category-{index}"
+        )
+        for index in range(max(config.products // CATEGORY_SIZE, 1))
+    ]
+    # Attribute values and assignments of each product type.
+    type_attributes = {}
+    for product_type in product_types:
+        product_assignments = [
+            (assignment, list(assignment.attribute.values.all()))
+            for assignment in product_type.attributeproduct.select_related("attribute")
+        ]
+        variant_assignments = [
+            (assignment, list(assignment.attribute.values.all()))
+            for assignment in product_type.attributevariant.select_related("attribute")
+        ]
+        type_attributes[product_type.pk] = (product_assignments, variant_assignments)
+    images = _store_placeholder_images(config) if config.create_images else []
+    today = timezone.now().date()
+
+    for batch_index, indexes in _get_batches(config.products, config.batch_size):
+        rng = _get_random(config, "products", batch_index)
+        with transaction.atomic():
+            products = Product.objects.bulk_create(
+                [
+                    Product(
+                        name=f"Scale product {index}",
+                        slug=f"{config.prefix}-product-{index}",
+                        product_type=rng.choice(product_types),
+                        category=rng.choice(categories),
+                    )
+                    for index in indexes
+                ]
+            )
+            variants = ProductVariant.objects.bulk_create(
+                [
+                    ProductVariant(
+                        product=product,
+                        sku=f"{product.slug}-{i}",
+                        name=f"{product.name} / {i}",
+                        sort_order=i,
+                    )
+                    for product in products
+                    for i in range(config.variants_per_product)
+                ]
+            )
+            variant_listings = []
+            product_prices: Dict[Tuple[int, int], Decimal] = {}
+            for variant in variants:
+                for channel in channels:
+                    price = _get_price(rng)
+                    key = (variant.product_id, channel.pk)
+                    product_prices[key] = min(price, product_prices.get(key, price))
+                    variant_listings.append(
+                        ProductVariantChannelListing(
+                            variant=variant,
+                            channel=channel,
+                            currency=channel.currency_code,
+                            price_amount=price,
+                            cost_price_amount=price / 2,
+                        )
+                    )
+            ProductVariantChannelListing.objects.bulk_create(variant_listings)
+            ProductChannelListing.objects.bulk_create(
+                [
+                    ProductChannelListing(
+                        product=product,
+                        channel=channel,
+                        currency=channel.currency_code,
+                        is_published=True,
+                        publication_date=today,
+                        visible_in_listings=True,
+                        available_for_purchase=today,
+                        discounted_price_amount=product_prices[
+                            (product.pk, channel.pk)
+                        ],
+                    )
+                    for product in products
+                    for channel in channels
+                ]
+            )
+            Stock.objects.bulk_create(
+                [
+                    Stock(
+                        product_variant=variant,
+                        warehouse=warehouse,
+                        quantity=rng.randint(100, 1000),
+                    )
+                    for variant in variants
+                    for warehouse in rng.sample(warehouses, k=min(2, len(warehouses)))
+                ]
+            )
+            _assign_scaled_attributes(rng, products, variants, type_attributes)
+            for product in products:
+                product.default_variant = next(
+                    variant for variant in variants if variant.product_id == product.pk
+                )
+            Product.objects.bulk_update(products, ["default_variant"])
+            if images:
+                ProductMedia.objects.bulk_create(
+                    [
+                        ProductMedia(
+                            product=product,
+                            image=rng.choice(images),
+                            alt=product.name,
+                            type=ProductMediaTypes.IMAGE,
+                            sort_order=0,
+                        )
+                        for product in products
+                    ]
+                )
+            update_products_search_document(
+                Product.objects.filter(pk__in=[product.pk for product in products])
+            )
+        yield len(products)
+
+
+def _assign_scaled_attributes(rng, products, variants, type_attributes):
+    product_types = {product.pk: product.product_type_id for product in products}
+    assigned_products = []
+    product_values = []
+    for product in products:
+        for assignment, values in type_attributes[product.product_type_id][0]:
+            assigned_products.append(
+                AssignedProductAttribute(product=product, assignment=assignment)
+            )
+            product_values.append(rng.choice(values) if values else None)
+    assigned_variants = []
+    variant_values = []
+    for variant in variants:
+        variant_assignments = type_attributes[product_types[variant.product_id]][1]
+        for assignment, values in variant_assignments:
+            assigned_variants.append(
+                AssignedVariantAttribute(variant=variant, assignment=assignment)
+            )
+            # Variants of a product get distinct values of the selection attribute.
+            variant_values.append(
+                values[variant.sort_order % len(values)] if values else None
+            )
+    assigned_products = AssignedProductAttribute.objects.bulk_create(assigned_products)
+    AssignedProductAttributeValue.objects.bulk_create(
+        [
+            AssignedProductAttributeValue(
+                assignment=assigned, value=value, sort_order=0
+            )
+            for assigned, value in zip(assigned_products, product_values)
+            if value
+        ]
+    )
+    assigned_variants = AssignedVariantAttribute.objects.bulk_create(assigned_variants)
+    AssignedVariantAttributeValue.objects.bulk_create(
+        [
+            AssignedVariantAttributeValue(
+                assignment=assigned, value=value, sort_order=0
+            )
+            for assigned, value in zip(assigned_variants, variant_values)
+            if value
+        ]
+    )
+
+
+def get_orders_context(
+    config: ScaleConfig, addresses: List[Dict[str, Any]]
+) -> OrdersContext:
+    """Load data needed to build orders, so workers don't query it per order."""
+    channels = []
+    for channel in Channel.objects.filter(slug__startswith=f"{config.prefix}-"):
+        shipping_methods = list(
+            ShippingMethodChannelListing.objects.filter(channel=channel)
+            .order_by("pk")
+            .values_list("shipping_method_id", "shipping_method__name", "price_amount")
+        )
+        variants = list(
+            ProductVariantChannelListing.objects.filter(
+                channel=channel,
+                price_amount__isnull=False,
+                variant__product__slug__startswith=f"{config.prefix}-",
+            )
+            .order_by("variant_id")
+            .values_list(
+                "variant_id",
+                "variant__product__name",
+                "variant__name",
+                "variant__sku",
+                "price_amount",
+            )
+            .iterator()
+        )
+        channels.append(
+            ChannelData(channel.pk, channel.currency_code, shipping_methods, variants)
+        )
+    customers = [
+        (user.pk, user.email, generate_user_fields_search_document_value(user))
+        for user in User.objects.filter(email__contains=f".{config.prefix}-").order_by(
+            "pk"
+        )
+    ]
+    return OrdersContext(
+        config=config, channels=channels, customers=customers, addresses=addresses
+    )
+
+
+def _build_order_lines(rng, order, channel, max_lines):
+    variants = rng.sample(
+        channel.variants, k=min(rng.randint(1, max_lines), len(channel.variants))
+    )
+    lines = []
+    for variant_id, product_name, variant_name, sku, price in variants:
+        quantity = rng.randint(1, 5)
+        total = price * quantity
+        lines.append(
+            OrderLine(
+                order=order,
+                variant_id=variant_id,
+                product_name=product_name,
+                variant_name=variant_name,
+                product_sku=sku,
+                product_variant_id=graphene.Node.to_global_id(
+                    "ProductVariant", variant_id
+                ),
+                is_shipping_required=True,
+                is_gift_card=False,
+                quantity=quantity,
+                quantity_fulfilled=(
+                    quantity if order.status == OrderStatus.FULFILLED else 0
+                ),
+                currency=channel.currency,
+                unit_price_net_amount=price,
+                unit_price_gross_amount=price,
+                total_price_net_amount=total,
+                total_price_gross_amount=total,
+                undiscounted_unit_price_net_amount=price,
+                undiscounted_unit_price_gross_amount=price,
+                undiscounted_total_price_net_amount=total,
+                undiscounted_total_price_gross_amount=total,
+                tax_rate=0,
+            )
+        )
+    return lines
+
+
+def create_scaled_orders_batch(batch_index: int) -> int:
+    """Create a batch of orders; the batch index determines the generated data."""
+    context = _orders_context
+    assert context, "Orders context is not set."
+    config = context.config
+    rng = _get_random(config, "orders", batch_index)
+    start = batch_index * config.batch_size
+    count = min(config.batch_size, config.orders - start)
+    with transaction.atomic():
+        addresses = Address.objects.bulk_create(
+            [Address(**rng.choice(context.addresses)) for _ in range(count)]
+        )
+        orders = []
+        order_lines = []
+        for address in addresses:
+            channel = rng.choice(context.channels)
+            customer = None
+            if context.customers and rng.random() < CUSTOMER_ORDERS_RATIO:
+                customer = rng.choice(context.customers)
+            method_id, method_name, shipping_price = rng.choice(
+                channel.shipping_methods
+            )
+            order = Order(
+                created=context.now
+                - datetime.timedelta(
+                    seconds=rng.randint(0, int(ORDERS_PERIOD.total_seconds()))
+                ),
+                status=rng.choices(ORDER_STATUSES, weights=ORDER_STATUS_WEIGHTS)[0],
+                user_id=customer[0] if customer else None,
+                user_email=(
+                    customer[1]
+                    if customer
+                    else get_email(address.first_name, address.last_name)
+                ),
+                billing_address=address,
+                shipping_address=address,
+                origin=OrderOrigin.CHECKOUT,
+                channel_id=channel.id,
+                currency=channel.currency,
+                shipping_method_id=method_id,
+                shipping_method_name=method_name,
+                shipping_price_net_amount=shipping_price,
+                shipping_price_gross_amount=shipping_price,
+                token=str(_get_uuid(rng)),
+            )
+            lines = _build_order_lines(rng, order, channel, config.max_order_lines)
+            total = sum(
+                (line.total_price_gross_amount for line in lines), shipping_price
+            )
+            order.total_net_amount = order.total_gross_amount = total
+            order.undiscounted_total_net_amount = total
+            order.undiscounted_total_gross_amount = total
+            # The order number prefix is added once IDs are known.
+            order.search_document = (
+                order.user_email
+                + "\n"
+                + (customer[2] if customer else "")
+                + generate_address_search_document_value(address) * 2
+                + "".join(line.product_sku + "\n" for line in lines)
+            ).lower()
+            orders.append(order)
+            order_lines.extend(lines)
+        orders = Order.objects.bulk_create(orders)
+        for line in order_lines:
+            line.order_id = line.order.pk
+        order_lines = OrderLine.objects.bulk_create(order_lines)
+        Order.objects.filter(pk__in=[order.pk for order in orders]).update(
+            search_document=Concat(
+                Value("#"), Cast("id", CharField()), Value("\n"), F("search_document")
+            )
+        )
+        _create_scaled_fulfillments(orders, order_lines)
+    return count
+
+
+def _create_scaled_fulfillments(orders, order_lines):
+    fulfillments = Fulfillment.objects.bulk_create(
+        [
+            Fulfillment(
+                order=order, fulfillment_order=1, status=FulfillmentStatus.FULFILLED
+            )
+            for order in orders
+            if order.status == OrderStatus.FULFILLED
+        ]
+    )
+    fulfillment_by_order = {
+        fulfillment.order_id: fulfillment for fulfillment in fulfillments
+    }
+    FulfillmentLine.objects.bulk_create(
+        [
+            FulfillmentLine(
+                order_line=line,
+                fulfillment=fulfillment_by_order[line.order_id],
+                quantity=line.quantity,
+            )
+            for line in order_lines
+            if line.order_id in fulfillment_by_order
+        ]
+    )
+
+
+def create_scaled_orders(context: OrdersContext) -> Iterator[int]:
+    """Create orders in batches, yielding the batch sizes.
+
+    With more than one worker, batches are created by forked processes; the data
+    doesn't depend on the number of workers.
+    """
+    global _orders_context
+    config = context.config
+    _orders_context = context
+    batches = range((config.orders + config.batch_size - 1) // config.batch_size)
+    try:
+        if config.workers > 1:
+            # Forked processes can't share database connections.
+            connections.close_all()
+            with multiprocessing.get_context("fork").Pool(config.workers) as pool:
+                yield from pool.imap_unordered(create_scaled_orders_batch, batches)
+        else:
+            for batch_index in batches:
+                yield create_scaled_orders_batch(batch_index)
+    finally:
+        _orders_context = None
+
+
+def create_scaled_data(config: ScaleConfig) -> Iterator[str]:
+    addresses = _get_address_pool(config)
+    channels = create_scaled_channels(config)
+    yield f"Created {len(channels)} channels"
+    warehouses = create_scaled_warehouses(config, addresses)
+    yield f"Created {len(warehouses)} warehouses"
+    product_types = create_scaled_attributes(config)
+    yield f"Created {config.attributes} attributes"
+
+    created = 0
+    for count in create_scaled_products(config, product_types, warehouses):
+        created += count
+        yield f"Created {created}/{config.products} products"
+    created = 0
+    for count in create_scaled_customers(config, addresses):
+        created += count
+        yield f"Created {created}/{config.customers} customers"
+    created = 0
+    for count in create_scaled_orders(get_orders_context(config, addresses)):
+        created += count
+        yield f"Created {created}/{config.orders} orders"
+
+    if settings.SALES_ROLLUPS_ENABLED:
+        update_all_sales_rollups()
+        yield "Updated sales rollups"
+    if settings.CUSTOMER_ORDER_STATS_ENABLED:
+        update_all_customer_order_stats()
+        yield "Updated customer order stats"
@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("csv", "0004_auto_20210709_1043"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="exportfile",
+            name="processed_count",
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="exportfile",
+            name="total_count",
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+    ]
@@ -17,6 +17,22 @@ class ExportFile(Job):
         App, related_name="export_files", on_delete=models.CASCADE, null=True
     )
     content_file = models.FileField(upload_to="export_files", null=True)
+    total_count = models.PositiveIntegerField(null=True, blank=True)
+    processed_count = models.PositiveIntegerField(default=0)
+
+
+class ImportFile(Job):
+    user = models.ForeignKey(
+        User, related_name="import_files", on_delete=models.CASCADE, null=True
+    )
+    app = models.ForeignKey(
+        App, related_name="import_files", on_delete=models.CASCADE, null=True
+    )
+    content_file = models.FileField(upload_to="import_files")
+    total_count = models.PositiveIntegerField(null=True, blank=True)
+    processed_count = models.PositiveIntegerField(default=0)
+    # rows which couldn't be imported, with the reasons
+    errors = JSONField(blank=True, default=list, encoder=CustomJsonEncoder)
 
 
 class ExportEvent(models.Model):
@@ -2,10 +2,12 @@ from typing import Dict, Union
 
 from ..celeryconf import app
 from ..core import JobStatus
+from ..plugins.manager import get_plugins_manager
 from . import events
-from .models import ExportFile
+from .models import ExportFile, ImportFile
 from .notifications import send_export_failed_info
 from .utils.export import export_gift_cards, export_products
+from .utils.import_products import import_products
 
 
 def on_task_failure(self, exc, task_id, args, kwargs, einfo):
@@ -59,3 +61,24 @@ def export_gift_cards_task(
 ):
     export_file = ExportFile.objects.get(pk=export_file_id)
     export_gift_cards(export_file, scope, file_type, delimiter)
+
+
+def on_import_task_failure(self, exc, task_id, args, kwargs, einfo):
+    import_file_id = args[0]
+    import_file = ImportFile.objects.get(pk=import_file_id)
+    import_file.status = JobStatus.FAILED
+    import_file.message = str(exc)[:255]
+    import_file.save(update_fields=["status", "message", "updated_at"])
+
+
+def on_import_task_success(self, retval, task_id, args, kwargs):
+    import_file_id = args[0]
+    import_file = ImportFile.objects.get(pk=import_file_id)
+    import_file.status = JobStatus.SUCCESS
+    import_file.save(update_fields=["status", "updated_at"])
+
+
+@app.task(on_success=on_import_task_success, on_failure=on_import_task_failure)
+def import_products_task(import_file_id: int, file_type: str, delimiter: str = ","):
+    import_file = ImportFile.objects.get(pk=import_file_id)
+    import_products(import_file, file_type, get_plugins_manager(), delimiter)
@@ -1,12 +1,10 @@
 import datetime
 import json
 import shutil
-from tempfile import NamedTemporaryFile
 from unittest.mock import ANY, MagicMock, patch
 
 import graphene
 import openpyxl
-import petl as etl
 import pytest
 from django.core.files import File
 from freezegun import freeze_time
@@ -18,7 +16,6 @@ from ....graphql.product.filters import ProductFilter
 from ....product.models import Product, ProductChannelListing
 from ... import FileTypes
 from ...utils.export import (
-    append_to_file,
     create_file_with_headers,
     export_gift_cards,
     export_gift_cards_in_batches,
@@ -27,6 +24,7 @@ from ...utils.export import (
     get_filename,
     get_queryset,
     parse_input,
+    prepare_batches_in_threads,
     save_csv_file_in_export_file,
 )
 
@@ -60,8 +58,9 @@ def test_export_products(
         "channels": [],
     }
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock()
+    create_file_with_headers_mock.return_value = mock_writer
+    mock_file = mock_writer.finish.return_value
 
     product_list[0].variants.update(sku=None)
 
@@ -81,10 +80,9 @@ def test_export_products(
         export_info,
         {"id", "name", "variants__id", "variants__sku"},
         ["id", "name", "variants__id", "variants__sku"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
+    assert kwargs == {"export_file": user_export_file}
     send_email_mock.assert_called_once_with(user_export_file, "products")
     save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
 
@@ -109,8 +107,9 @@ def test_export_products_ids(
     assert user_export_file.status == JobStatus.PENDING
     assert not user_export_file.content_file
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock()
+    create_file_with_headers_mock.return_value = mock_writer
+    mock_file = mock_writer.finish.return_value
 
     # when
     export_products(user_export_file, {"ids": pks}, export_info, file_type)
@@ -128,9 +127,7 @@ def test_export_products_ids(
         export_info,
         {"id"},
         ["id"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
     send_email_mock.assert_called_once_with(user_export_file, "products")
     save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
@@ -160,8 +157,9 @@ def test_export_products_filter_is_published(
     assert user_export_file.status == JobStatus.PENDING
     assert not user_export_file.content_file
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock()
+    create_file_with_headers_mock.return_value = mock_writer
+    mock_file = mock_writer.finish.return_value
 
     # when
     export_products(
@@ -185,9 +183,7 @@ def test_export_products_filter_is_published(
         export_info,
         {"id"},
         ["id"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
     send_email_mock.assert_called_once_with(user_export_file, "products")
     save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
@@ -216,8 +212,9 @@ def test_export_products_filter_collections(
     assert user_export_file.status == JobStatus.PENDING
     assert not user_export_file.content_file
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock()
+    create_file_with_headers_mock.return_value = mock_writer
+    mock_file = mock_writer.finish.return_value
 
     # when
     export_products(
@@ -237,7 +234,7 @@ def test_export_products_filter_collections(
     assert export_products_in_batches_mock.call_count == 1
     batch_args, _ = export_products_in_batches_mock.call_args
     assert set(batch_args[0].values_list("pk", flat=True)) == {product_list[-1].pk}
-    assert batch_args[1:] == (export_info, {"id"}, ["id"], ",", mock_file, file_type)
+    assert batch_args[1:] == (export_info, {"id"}, ["id"], mock_writer)
     send_email_mock.assert_called_once_with(user_export_file, "products")
     save_file_mock.assert_called_once_with(user_export_file, mock_file, ANY)
 
@@ -263,8 +260,9 @@ def test_export_products_by_app(
     }
     file_type = FileTypes.CSV
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock()
+    create_file_with_headers_mock.return_value = mock_writer
+    mock_file = mock_writer.finish.return_value
 
     # when
     export_products(app_export_file, {"all": ""}, export_info, file_type)
@@ -283,9 +281,7 @@ def test_export_products_by_app(
         export_info,
         {"id", "name"},
         ["id", "name"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
 
     send_email_mock.assert_called_once_with(app_export_file, "products")
@@ -309,8 +305,9 @@ def test_export_gift_cards(
 ):
     file_type = FileTypes.CSV
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock()
+    create_file_with_headers_mock.return_value = mock_writer
+    mock_file = mock_writer.finish.return_value
 
     # when
     export_gift_cards(user_export_file, {"all": ""}, file_type)
@@ -325,10 +322,9 @@ def test_export_gift_cards(
     )
     assert args[1:] == (
         ["code"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
+    assert kwargs == {"export_file": user_export_file}
 
     send_email_mock.assert_called_once_with(user_export_file, "gift cards")
 
@@ -351,8 +347,9 @@ def test_export_gift_cards_by_app(
 ):
     file_type = FileTypes.CSV
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock()
+    create_file_with_headers_mock.return_value = mock_writer
+    mock_file = mock_writer.finish.return_value
 
     # when
     export_gift_cards(app_export_file, {"all": ""}, file_type)
@@ -367,9 +364,7 @@ def test_export_gift_cards_by_app(
     )
     assert args[1:] == (
         ["code"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
 
     send_email_mock.assert_called_once_with(app_export_file, "gift cards")
@@ -393,8 +388,9 @@ def test_export_gift_cards_ids(
 ):
     file_type = FileTypes.CSV
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock()
+    create_file_with_headers_mock.return_value = mock_writer
+    mock_file = mock_writer.finish.return_value
     pks = [gift_card.pk]
 
     # when
@@ -408,9 +404,7 @@ def test_export_gift_cards_ids(
     assert set(args[0].values_list("pk", flat=True)) == set(pks)
     assert args[1:] == (
         ["code"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
 
     send_email_mock.assert_called_once_with(user_export_file, "gift cards")
@@ -435,8 +429,9 @@ def test_export_gift_cards_with_filter(
 ):
     file_type = FileTypes.CSV
 
-    mock_file = MagicMock(spec=File)
-    create_file_with_headers_mock.return_value = mock_file
+    mock_writer = MagicMock()
+    create_file_with_headers_mock.return_value = mock_writer
+    mock_file = mock_writer.finish.return_value
 
     gift_card_expiry_date.product = shippable_gift_card_product
     gift_card_used.product = shippable_gift_card_product
@@ -465,9 +460,7 @@ def test_export_gift_cards_with_filter(
     assert set(args[0].values_list("pk", flat=True)) == {gift_card_expiry_date.pk}
     assert args[1:] == (
         ["code"],
-        ",",
-        mock_file,
-        file_type,
+        mock_writer,
     )
 
     send_email_mock.assert_called_once_with(user_export_file, "gift cards")
@@ -521,10 +514,10 @@ def test_create_file_with_headers_csv(user_export_file, tmpdir, media_root):
     assert not user_export_file.content_file
 
     # when
-    csv_file = create_file_with_headers(file_headers, ",", FileTypes.CSV)
+    writer = create_file_with_headers(file_headers, ",", FileTypes.CSV)
 
     # then
-    assert csv_file
+    csv_file = writer.finish()
 
     file_content = csv_file.read().decode().split("\r\n")
 
@@ -540,10 +533,10 @@ def test_create_file_with_headers_xlsx(user_export_file, tmpdir, media_root):
     assert not user_export_file.content_file
 
     # when
-    xlsx_file = create_file_with_headers(file_headers, ",", FileTypes.XLSX)
+    writer = create_file_with_headers(file_headers, ",", FileTypes.XLSX)
 
     # then
-    assert xlsx_file
+    xlsx_file = writer.finish()
 
     wb_obj = openpyxl.load_workbook(xlsx_file)
 
@@ -571,7 +564,7 @@ def test_save_csv_file_in_export_file(user_export_file, tmpdir, media_root):
     shutil.rmtree(tmpdir)
 
 
-def test_append_to_file_for_csv(user_export_file, tmpdir, media_root):
+def test_write_to_csv_file(user_export_file, tmpdir, media_root):
     # given
     export_data = [
         {"id": "123", "name": "test1", "collections": "coll1"},
@@ -580,17 +573,14 @@ def test_append_to_file_for_csv(user_export_file, tmpdir, media_root):
     headers = ["id", "name", "collections"]
     delimiter = ","
 
-    table = etl.fromdicts([{"id": "1", "name": "A"}], header=headers, missing=" ")
-
-    temp_file = NamedTemporaryFile()
-    etl.tocsv(table, temp_file.name, delimiter=delimiter)
+    writer = create_file_with_headers(headers, delimiter, FileTypes.CSV)
+    writer.write([{"id": "1", "name": "A"}], headers)
 
     # when
-    append_to_file(export_data, headers, temp_file, FileTypes.CSV, delimiter)
+    writer.write(export_data, headers)
 
     # then
-    user_export_file.refresh_from_db()
-
+    temp_file = writer.finish()
     file_content = temp_file.read().decode().split("\r\n")
     assert ",".join(headers) in file_content
     assert ",".join(export_data[0].values()) in file_content
@@ -600,7 +590,7 @@ def test_append_to_file_for_csv(user_export_file, tmpdir, media_root):
     shutil.rmtree(tmpdir)
 
 
-def test_append_to_file_for_xlsx(user_export_file, tmpdir, media_root):
+def test_write_to_xlsx_file(user_export_file, tmpdir, media_root):
     # given
     export_data = [
         {"id": "123", "name": "test1", "collections": "coll1"},
@@ -609,19 +599,14 @@ def test_append_to_file_for_xlsx(user_export_file, tmpdir, media_root):
     expected_headers = ["id", "name", "collections"]
     delimiter = ","
 
-    table = etl.fromdicts(
-        [{"id": "1", "name": "A"}], header=expected_headers, missing=" "
-    )
-
-    temp_file = NamedTemporaryFile(suffix=".xlsx")
-    etl.io.xlsx.toxlsx(table, temp_file.name)
+    writer = create_file_with_headers(expected_headers, delimiter, FileTypes.XLSX)
+    writer.write([{"id": "1", "name": "A"}], expected_headers)
 
     # when
-    append_to_file(export_data, expected_headers, temp_file, FileTypes.XLSX, delimiter)
+    writer.write(export_data, expected_headers)
 
     # then
-    user_export_file.refresh_from_db()
-
+    temp_file = writer.finish()
     wb_obj = openpyxl.load_workbook(temp_file)
 
     sheet_obj = wb_obj.active
@@ -669,10 +654,7 @@ def test_export_products_in_batches_for_csv(
     export_fields = ["id", "name", "variants__sku"]
     expected_headers = ["id", "name", "variant sku"]
 
-    table = etl.wrap([expected_headers])
-
-    temp_file = NamedTemporaryFile()
-    etl.tocsv(table, temp_file.name, delimiter=",")
+    writer = create_file_with_headers(expected_headers, ",", FileTypes.CSV)
 
     # when
     export_products_in_batches(
@@ -680,12 +662,14 @@ def test_export_products_in_batches_for_csv(
         export_info,
         set(export_fields),
         export_fields,
-        ",",
-        temp_file,
-        FileTypes.CSV,
+        writer,
+        export_file=user_export_file,
     )
 
     # then
+    user_export_file.refresh_from_db()
+    assert user_export_file.total_count == len(product_list)
+    assert user_export_file.processed_count == len(product_list)
 
     expected_data = []
     for product in qs.order_by("pk"):
@@ -698,7 +682,7 @@ def test_export_products_in_batches_for_csv(
             product_data.append(str(variant.sku))
             expected_data.append(product_data)
 
-    file_content = temp_file.read().decode().split("\r\n")
+    file_content = writer.finish().read().decode().split("\r\n")
 
     # ensure headers are in file
     assert ",".join(expected_headers) in file_content
@@ -739,20 +723,11 @@ def test_export_products_in_batches_for_xlsx(
     export_fields = ["id", "name", "description_as_str", "variants__sku"]
     expected_headers = ["id", "name", "description", "variant sku"]
 
-    table = etl.wrap([expected_headers])
-
-    temp_file = NamedTemporaryFile(suffix=".xlsx")
-    etl.io.xlsx.toxlsx(table, temp_file.name)
+    writer = create_file_with_headers(expected_headers, ",", FileTypes.XLSX)
 
     # when
     export_products_in_batches(
-        qs,
-        export_info,
-        set(export_fields),
-        export_fields,
-        ",",
-        temp_file,
-        FileTypes.XLSX,
+        qs, export_info, set(export_fields), export_fields, writer
     )
 
     # then
@@ -768,7 +743,7 @@ def test_export_products_in_batches_for_xlsx(
             product_data.append(variant.sku)
             expected_data.append(product_data)
 
-    wb_obj = openpyxl.load_workbook(temp_file)
+    wb_obj = openpyxl.load_workbook(writer.finish())
 
     sheet_obj = wb_obj.active
     max_col = sheet_obj.max_column
@@ -798,21 +773,13 @@ def test_export_gift_cards_in_batches_to_csv(
     # given
     gift_cards = GiftCard.objects.exclude(id=gift_card_used.id).order_by("pk")
 
-    table = etl.wrap([["code"]])
-    temp_file = NamedTemporaryFile()
-    etl.tocsv(table, temp_file.name, delimiter=",")
+    writer = create_file_with_headers(["code"], ",", FileTypes.CSV)
 
     # when
-    export_gift_cards_in_batches(
-        gift_cards,
-        ["code"],
-        ",",
-        temp_file,
-        "csv",
-    )
+    export_gift_cards_in_batches(gift_cards, ["code"], writer)
 
     # then
-    file_content = temp_file.read().decode().split("\r\n")
+    file_content = writer.finish().read().decode().split("\r\n")
 
     # ensure headers are in the file
     assert "code" in file_content
@@ -833,21 +800,13 @@ def test_export_gift_cards_in_batches_to_xlsx(
     # given
     gift_cards = GiftCard.objects.exclude(id=gift_card_used.id).order_by("pk")
 
-    table = etl.wrap([["code"]])
-    temp_file = NamedTemporaryFile(suffix=".xlsx")
-    etl.io.xlsx.toxlsx(table, temp_file.name)
+    writer = create_file_with_headers(["code"], ",", FileTypes.XLSX)
 
     # when
-    export_gift_cards_in_batches(
-        gift_cards,
-        ["code"],
-        ",",
-        temp_file,
-        "xlsx",
-    )
+    export_gift_cards_in_batches(gift_cards, ["code"], writer)
 
     # then
-    wb_obj = openpyxl.load_workbook(temp_file)
+    wb_obj = openpyxl.load_workbook(writer.finish())
 
     sheet_obj = wb_obj.active
     max_col = sheet_obj.max_column
@@ -867,6 +826,22 @@ def test_export_gift_cards_in_batches_to_xlsx(
     shutil.rmtree(tmpdir)
 
 
+@patch("saleor.csv.utils.export.connections")
+def test_prepare_batches_in_threads(connections_mock):
+    # given
+    batches = [[1, 2], [3], [4, 5], [6]]
+
+    def get_batch_data(batch_pks):
+        return [{"id": pk} for pk in batch_pks]
+
+    # when
+    batches_data = list(prepare_batches_in_threads(get_batch_data, batches, 3))
+
+    # then
+    assert batches_data == [(pks, get_batch_data(pks)) for pks in batches]
+    assert connections_mock.close_all.call_count == len(batches)
+
+
 def test_parse_input():
     data = {
         "collections": None,
@@ -0,0 +1,312 @@
+import csv
+import io
+from decimal import Decimal
+from unittest.mock import patch
+
+import graphene
+import openpyxl
+from django.core.files.base import ContentFile
+
+from ...plugins.manager import get_plugins_manager
+from ...product.models import Product, ProductVariant
+from ...tests.utils import flush_post_commit_hooks
+from .. import FileTypes
+from ..error_codes import ImportErrorCode
+from ..models import ImportFile
+from ..utils import import_products as import_products_module
+from ..utils.import_products import import_products
+
+
+def _create_import_file(staff_user, rows, file_type=FileTypes.CSV):
+    stream = io.BytesIO()
+    if file_type == FileTypes.CSV:
+        text_stream = io.TextIOWrapper(stream, encoding="utf-8", newline="")
+        csv.writer(text_stream).writerows(rows)
+        text_stream.flush()
+        text_stream.detach()
+    else:
+        workbook = openpyxl.Workbook()
+        for row in rows:
+            workbook.active.append(row)
+        workbook.save(stream)
+    import_file = ImportFile(user=staff_user)
+    import_file.content_file.save(
+        f"products.{file_type}", ContentFile(stream.getvalue()), save=False
+    )
+    import_file.save()
+    return import_file
+
+
+@patch("saleor.csv.utils.import_products.update_products_discounted_prices_task")
+def test_import_products_creates_products(
+    update_prices_task_mock,
+    staff_user,
+    product_type,
+    category,
+    collection,
+    warehouse,
+    channel_USD,
+    media_root,
+):
+    # given
+    rows = [
+        [
+            "name",
+            "product type",
+            "category",
+            "collections",
+            "color (product attribute)",
+            "variant sku",
+            "size (variant attribute)",
+            "example-warehouse (warehouse quantity)",
+            f"{channel_USD.slug} (channel published)",
+            f"{channel_USD.slug} (channel price amount)",
+        ],
+        [
+            "Shirt",
+            product_type.name,
+            category.slug,
+            collection.slug,
+            "Red",
+            "shirt-s",
+            "Small",
+            "5",
+            "True",
+            "9.99",
+        ],
+        ["Shirt", product_type.name, "", "", "", "shirt-xl", "XL", "3", "", "12"],
+    ]
+    import_file = _create_import_file(staff_user, rows)
+
+    # when
+    import_products(import_file, FileTypes.CSV, get_plugins_manager())
+    flush_post_commit_hooks()
+
+    # then
+    import_file.refresh_from_db()
+    assert import_file.errors == []
+    assert import_file.total_count == 2
+    assert import_file.processed_count == 2
+
+    product = Product.objects.get(name="Shirt")
+    assert product.slug == "shirt"
+    assert product.category == category
+    assert list(product.collections.all()) == [collection]
+    assert "red" in product.search_document
+    assert product.attributes.get().values.get().slug == "red"
+    listing = product.channel_listings.get()
+    assert listing.channel == channel_USD
+    assert listing.is_published
+
+    small, xl = product.variants.all()
+    assert product.default_variant == small
+    assert (small.sku, small.name, small.sort_order) == ("shirt-s", "Small", 0)
+    assert (xl.sku, xl.name, xl.sort_order) == ("shirt-xl", "XL", 1)
+    assert small.stocks.get(warehouse=warehouse).quantity == 5
+    assert xl.channel_listings.get().price_amount == Decimal(12)
+    update_prices_task_mock.delay.assert_called_once_with([product.pk])
+
+
+def test_import_products_updates_existing_product(
+    staff_user, product, warehouse, channel_USD, media_root
+):
+    # given
+    variant = product.variants.get()
+    rows = [
+        [
+            "id",
+            "name",
+            "charge taxes",
+            "product weight",
+            "variant id",
+            "variant is preorder",
+            "example-warehouse (warehouse quantity)",
+            f"{channel_USD.slug} (channel price amount)",
+            f"{channel_USD.slug} (channel variant cost price)",
+        ],
+        [
+            graphene.Node.to_global_id("Product", product.pk),
+            "New name",
+            "False",
+            "1.5 kg",
+            graphene.Node.to_global_id("ProductVariant", variant.pk),
+            " ",
+            "25",
+            "15.50",
+            "",
+        ],
+    ]
+    import_file = _create_import_file(staff_user, rows)
+
+    # when
+    import_products(import_file, FileTypes.CSV, get_plugins_manager())
+
+    # then
+    import_file.refresh_from_db()
+    assert import_file.errors == []
+    product.refresh_from_db()
+    assert product.name == "New name"
+    assert product.slug == "test-product-11"
+    assert not product.charge_taxes
+    assert product.weight.kg == 1.5
+    assert product.variants.count() == 1
+    variant.refresh_from_db()
+    assert not variant.is_preorder
+    assert variant.stocks.get(warehouse=warehouse).quantity == 25
+    listing = variant.channel_listings.get(channel=channel_USD)
+    assert listing.price_amount == Decimal("15.50")
+    assert listing.cost_price_amount == Decimal(1)
+
+
+def test_import_products_finds_variants_by_sku(staff_user, product, media_root):
+    # given
+    variant = product.variants.get()
+    rows = [
+        ["id", "variant sku", "variant preorder global threshold"],
+        [graphene.Node.to_global_id("Product", product.pk), variant.sku, "10"],
+    ]
+    import_file = _create_import_file(staff_user, rows)
+
+    # when
+    import_products(import_file, FileTypes.CSV, get_plugins_manager())
+
+    # then
+    variant.refresh_from_db()
+    assert variant.preorder_global_threshold == 10
+    assert product.variants.count() == 1
+
+
+def test_import_products_skips_products_with_invalid_rows(
+    staff_user, product, product_type, media_root
+):
+    # given
+    rows = [
+        ["name", "product type", "category", "variant sku", "unknown"],
+        ["Valid", product_type.name, "", "valid", "value"],
+        ["Invalid", product_type.name, "", "invalid", ""],
+        ["Invalid", product_type.name, "missing-category", "invalid-2", ""],
+        ["Duplicated SKU", product_type.name, "", "123", ""],
+    ]
+    import_file = _create_import_file(staff_user, rows)
+
+    # when
+    import_products(import_file, FileTypes.CSV, get_plugins_manager())
+
+    # then
+    import_file.refresh_from_db()
+    assert import_file.errors == [
+        {
+            "row": 1,
+            "field": "unknown",
+            "message": "Unknown column.",
+            "code": ImportErrorCode.INVALID.value,
+        },
+        {
+            "row": 4,
+            "field": "category",
+            "message": "Category doesn't exist.",
+            "code": ImportErrorCode.NOT_FOUND.value,
+        },
+        {
+            "row": 5,
+            "field": "variant sku",
+            "message": "Variant with this SKU already exists.",
+            "code": ImportErrorCode.UNIQUE.value,
+        },
+    ]
+    assert import_file.processed_count == 4
+    assert Product.objects.filter(name="Valid").exists()
+    assert not Product.objects.filter(name__in=["Invalid", "Duplicated SKU"]).exists()
+    assert not ProductVariant.objects.filter(sku="invalid").exists()
+
+
+def test_import_products_validates_variant_channel_listings(
+    staff_user, product, product_type, channel_USD, channel_PLN, media_root
+):
+    # given
+    variant = product.variants.get()
+    rows = [
+        [
+            "id",
+            "name",
+            "product type",
+            "variant sku",
+            f"{channel_PLN.slug} (channel published)",
+            f"{channel_PLN.slug} (channel price amount)",
+            f"{channel_USD.slug} (channel price amount)",
+        ],
+        [
+            graphene.Node.to_global_id("Product", product.pk),
+            "",
+            "",
+            variant.sku,
+            "",
+            "10",
+            "",
+        ],
+        ["", "Shirt", product_type.name, "shirt", "True", "10", ""],
+        ["", "Hat", product_type.name, "hat", "", "", "9.999"],
+    ]
+    import_file = _create_import_file(staff_user, rows)
+
+    # when
+    import_products(import_file, FileTypes.CSV, get_plugins_manager())
+
+    # then
+    import_file.refresh_from_db()
+    assert import_file.errors == [
+        {
+            "row": 2,
+            "field": f"{channel_PLN.slug} (channel price amount)",
+            "message": "Product isn't available in the channel.",
+            "code": ImportErrorCode.PRODUCT_NOT_ASSIGNED_TO_CHANNEL.value,
+        },
+        {
+            "row": 4,
+            "field": f"{channel_USD.slug} (channel price amount)",
+            "message": "Value cannot have more than 2 decimal places.",
+            "code": ImportErrorCode.INVALID.value,
+        },
+    ]
+    assert not variant.channel_listings.filter(channel=channel_PLN).exists()
+    shirt = ProductVariant.objects.get(sku="shirt")
+    assert shirt.channel_listings.get().channel == channel_PLN
+    assert not Product.objects.filter(name="Hat").exists()
+
+
+@patch("saleor.csv.utils.import_products.update_products_discounted_prices_task")
+def test_import_products_in_batches(
+    update_prices_task_mock, staff_user, product_type, media_root, monkeypatch
+):
+    # given
+    monkeypatch.setattr(import_products_module, "BATCH_SIZE", 2)
+    rows = [["name", "product type", "variant sku"]]
+    rows += [[f"Product {i}", product_type.name, f"sku-{i}"] for i in range(5)]
+    import_file = _create_import_file(staff_user, rows)
+
+    # when
+    import_products(import_file, FileTypes.CSV, get_plugins_manager())
+    flush_post_commit_hooks()
+
+    # then
+    import_file.refresh_from_db()
+    assert import_file.processed_count == 5
+    assert Product.objects.filter(name__startswith="Product ").count() == 5
+    assert update_prices_task_mock.delay.call_count == 3
+
+
+def test_import_products_from_xlsx_file(staff_user, product_type, media_root):
+    # given
+    rows = [
+        ["name", "product type", "variant sku", "variant preorder global threshold"],
+        ["Shirt", product_type.name, "shirt", 10],
+    ]
+    import_file = _create_import_file(staff_user, rows, FileTypes.XLSX)
+
+    # when
+    import_products(import_file, FileTypes.XLSX, get_plugins_manager())
+
+    # then
+    variant = ProductVariant.objects.get(sku="shirt")
+    assert variant.product.name == "Shirt"
+    assert variant.preorder_global_threshold == 10
@@ -1,13 +1,20 @@
 import datetime
-from unittest.mock import Mock, patch
+from unittest.mock import ANY, Mock, patch
 
 import pytz
 from freezegun import freeze_time
 
 from ...core import JobStatus
 from .. import ExportEvents, FileTypes
-from ..models import ExportEvent
-from ..tasks import export_products_task, on_task_failure, on_task_success
+from ..models import ExportEvent, ImportFile
+from ..tasks import (
+    export_products_task,
+    import_products_task,
+    on_import_task_failure,
+    on_import_task_success,
+    on_task_failure,
+    on_task_success,
+)
 
 
 @patch("saleor.csv.tasks.export_products")
@@ -131,3 +138,41 @@ def test_on_task_success(user_export_file):
         user=user_export_file.user,
         type=ExportEvents.EXPORT_SUCCESS,
     )
+
+
+@patch("saleor.csv.tasks.import_products")
+def test_import_products_task(import_products_mock, staff_user):
+    # given
+    import_file = ImportFile.objects.create(user=staff_user)
+
+    # when
+    import_products_task(import_file.pk, FileTypes.CSV)
+
+    # then
+    import_products_mock.assert_called_once_with(import_file, FileTypes.CSV, ANY, ",")
+
+
+def test_on_import_task_failure(staff_user):
+    # given
+    import_file = ImportFile.objects.create(user=staff_user)
+    exc = Exception("Test")
+
+    # when
+    on_import_task_failure(None, exc, "task_id", [import_file.pk], {}, Mock())
+
+    # then
+    import_file.refresh_from_db()
+    assert import_file.status == JobStatus.FAILED
+    assert import_file.message == str(exc)
+
+
+def test_on_import_task_success(staff_user):
+    # given
+    import_file = ImportFile.objects.create(user=staff_user)
+
+    # when
+    on_import_task_success(None, None, "task_id", [import_file.pk], {})
+
+    # then
+    import_file.refresh_from_db()
+    assert import_file.status == JobStatus.SUCCESS
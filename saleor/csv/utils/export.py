@@ -1,14 +1,33 @@
+import csv
+import io
 import secrets
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
 from tempfile import NamedTemporaryFile
-from typing import IO, TYPE_CHECKING, Any, Dict, List, Set, Union
-
-import petl as etl
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Union,
+)
+
+import openpyxl
+from django.conf import settings
+from django.db import connections
 from django.utils import timezone
 
 from ...giftcard.models import GiftCard
 from ...product.models import Product
 from .. import FileTypes
+from ..models import ExportFile
 from ..notifications import send_export_download_link_notification
 from .product_headers import get_product_export_fields_and_headers_info
 from .products_data import get_products_data
@@ -17,11 +36,12 @@ if TYPE_CHECKING:
     # flake8: noqa
     from django.db.models import QuerySet
 
-    from ..models import ExportFile
-
 
 BATCH_SIZE = 10000
 
+# Value written for fields missing in the exported data.
+MISSING_VALUE = " "
+
 
 def export_products(
     export_file: "ExportFile",
@@ -41,18 +61,18 @@ def export_products(
         data_headers,
     ) = get_product_export_fields_and_headers_info(export_info)
 
-    temporary_file = create_file_with_headers(file_headers, delimiter, file_type)
+    writer = create_file_with_headers(file_headers, delimiter, file_type)
 
     export_products_in_batches(
         queryset,
         export_info,
         set(export_fields),
         data_headers,
-        delimiter,
-        temporary_file,
-        file_type,
+        writer,
+        export_file=export_file,
     )
 
+    temporary_file = writer.finish()
     save_csv_file_in_export_file(export_file, temporary_file, file_name)
     temporary_file.close()
 
@@ -74,16 +94,13 @@ def export_gift_cards(
     queryset = queryset.filter(used_by_email__isnull=True)
 
     export_fields = ["code"]
-    temporary_file = create_file_with_headers(export_fields, delimiter, file_type)
+    writer = create_file_with_headers(export_fields, delimiter, file_type)
 
     export_gift_cards_in_batches(
-        queryset,
-        export_fields,
-        delimiter,
-        temporary_file,
-        file_type,
+        queryset, export_fields, writer, export_file=export_file
     )
 
+    temporary_file = writer.finish()
     save_csv_file_in_export_file(export_file, temporary_file, file_name)
     temporary_file.close()
 
@@ -135,17 +152,78 @@ def parse_input(data: Any) -> Dict[str, Union[str, dict]]:
     return data
 
 
-def create_file_with_headers(file_headers: List[str], delimiter: str, file_type: str):
-    table = etl.wrap([file_headers])
+class ExportFileWriter:
+    """Write exported rows to a temporary file kept open for the whole export.
+
+    Rows are streamed to the file, so the time and memory needed to write a batch
+    don't depend on the size of the already exported data.
+    """
+
+    suffix = ""
+
+    def __init__(self, headers: List[str], delimiter: str = ","):
+        self.file = NamedTemporaryFile("wb+", suffix=self.suffix)
+        self.delimiter = delimiter
+        self.open()
+        self.write_row(headers)
+
+    def open(self):
+        raise NotImplementedError()
+
+    def write_row(self, row: List[Any]):
+        raise NotImplementedError()
+
+    def flush(self):
+        raise NotImplementedError()
+
+    def write(self, export_data: List[Dict[str, Any]], headers: List[str]):
+        for data in export_data:
+            self.write_row([data.get(header, MISSING_VALUE) for header in headers])
+
+    def finish(self) -> IO[bytes]:
+        """Complete the file and return it rewound to the beginning."""
+        self.flush()
+        self.file.seek(0)
+        return self.file
+
+
+class CSVFileWriter(ExportFileWriter):
+    suffix = ".csv"
+
+    def open(self):
+        self.stream = io.TextIOWrapper(self.file, encoding="utf-8", newline="")
+        self.writer = csv.writer(self.stream, delimiter=self.delimiter)
+
+    def write_row(self, row: List[Any]):
+        self.writer.writerow(row)
+
+    def flush(self):
+        self.stream.flush()
+        # detach the wrapper, so it doesn't close the file when garbage collected
+        self.stream.detach()
+
+
+class XLSXFileWriter(ExportFileWriter):
+    suffix = ".xlsx"
+
+    def open(self):
+        # write-only workbooks keep only the rows that weren't saved yet in memory
+        self.workbook = openpyxl.Workbook(write_only=True)
+        self.sheet = self.workbook.create_sheet()
+
+    def write_row(self, row: List[Any]):
+        self.sheet.append(row)
+
+    def flush(self):
+        self.workbook.save(self.file)
 
-    if file_type == FileTypes.CSV:
-        temp_file = NamedTemporaryFile("ab+", suffix=".csv")
-        etl.tocsv(table, temp_file.name, delimiter=delimiter)
-    else:
-        temp_file = NamedTemporaryFile("ab+", suffix=".xlsx")
-        etl.io.xlsx.toxlsx(table, temp_file.name)
 
-    return temp_file
+def create_file_with_headers(
+    file_headers: List[str], delimiter: str, file_type: str
+) -> ExportFileWriter:
+    if file_type == FileTypes.CSV:
+        return CSVFileWriter(file_headers, delimiter)
+    return XLSXFileWriter(file_headers, delimiter)
 
 
 def export_products_in_batches(
@@ -153,15 +231,14 @@ def export_products_in_batches(
     export_info: Dict[str, list],
     export_fields: Set[str],
     headers: List[str],
-    delimiter: str,
-    temporary_file: Any,
-    file_type: str,
+    writer: ExportFileWriter,
+    export_file: Optional["ExportFile"] = None,
 ):
     warehouses = export_info.get("warehouses")
     attributes = export_info.get("attributes")
     channels = export_info.get("channels")
 
-    for batch_pks in queryset_in_batches(queryset):
+    def get_batch_data(batch_pks):
         product_batch = Product.objects.filter(pk__in=batch_pks).prefetch_related(
             "attributes",
             "variants",
@@ -170,27 +247,101 @@ def export_products_in_batches(
             "product_type",
             "category",
         )
-
-        export_data = get_products_data(
+        return get_products_data(
             product_batch, export_fields, attributes, warehouses, channels
         )
 
-        append_to_file(export_data, headers, temporary_file, file_type, delimiter)
+    write_batches(
+        queryset,
+        get_batch_data,
+        headers,
+        writer,
+        export_file,
+        workers=settings.EXPORT_FILE_WORKERS,
+    )
 
 
 def export_gift_cards_in_batches(
     queryset: "QuerySet",
     export_fields: List[str],
-    delimiter: str,
-    temporary_file: Any,
-    file_type: str,
+    writer: ExportFileWriter,
+    export_file: Optional["ExportFile"] = None,
 ):
-    for batch_pks in queryset_in_batches(queryset):
+    def get_batch_data(batch_pks):
         gift_card_batch = GiftCard.objects.filter(pk__in=batch_pks)
+        return list(gift_card_batch.values(*export_fields))
+
+    write_batches(queryset, get_batch_data, export_fields, writer, export_file)
+
+
+def write_batches(
+    queryset: "QuerySet",
+    get_batch_data: Callable[[List[int]], List[Dict[str, Any]]],
+    headers: List[str],
+    writer: ExportFileWriter,
+    export_file: Optional["ExportFile"] = None,
+    workers: int = 1,
+):
+    """Write data of the queryset objects in batches and report the progress."""
+    if export_file:
+        update_export_progress(export_file, 0, queryset.count())
+    batches = queryset_in_batches(queryset)
+    if workers > 1:
+        batches_data = prepare_batches_in_threads(get_batch_data, batches, workers)
+    else:
+        batches_data = ((pks, get_batch_data(pks)) for pks in batches)
+
+    processed_count = 0
+    for batch_pks, export_data in batches_data:
+        writer.write(export_data, headers)
+        processed_count += len(batch_pks)
+        if export_file:
+            update_export_progress(export_file, processed_count)
+
+
+def prepare_batches_in_threads(
+    get_batch_data: Callable[[List[int]], List[Dict[str, Any]]],
+    batches: Iterable[List[int]],
+    workers: int,
+) -> Iterator[tuple]:
+    """Prepare data of the next batches in threads while the current one is written.
+
+    Batches are yielded in order and at most `workers` of them are prepared at once,
+    so memory usage stays bounded. Each thread uses its own database connection, so
+    the exported data has to be committed.
+    """
+
+    def prepare(batch_pks):
+        try:
+            return batch_pks, get_batch_data(batch_pks)
+        finally:
+            connections.close_all()
 
-        export_data = list(gift_card_batch.values(*export_fields))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending: deque = deque()
+        for batch_pks in batches:
+            pending.append(executor.submit(prepare, batch_pks))
+            if len(pending) >= workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
 
-        append_to_file(export_data, export_fields, temporary_file, file_type, delimiter)
+
+def update_export_progress(
+    export_file: "ExportFile",
+    processed_count: int,
+    total_count: Optional[int] = None,
+):
+    export_file.processed_count = processed_count
+    fields: Dict[str, Any] = {
+        "processed_count": processed_count,
+        "updated_at": timezone.now(),
+    }
+    if total_count is not None:
+        export_file.total_count = total_count
+        fields["total_count"] = total_count
+    # update the row directly, so the progress doesn't override other changes
+    ExportFile.objects.filter(pk=export_file.pk).update(**fields)
 
 
 def queryset_in_batches(queryset):
@@ -212,21 +363,6 @@ def queryset_in_batches(queryset):
         start_pk = pks[-1]
 
 
-def append_to_file(
-    export_data: List[Dict[str, Union[str, bool]]],
-    headers: List[str],
-    temporary_file: Any,
-    file_type: str,
-    delimiter: str,
-):
-    table = etl.fromdicts(export_data, header=headers, missing=" ")
-
-    if file_type == FileTypes.CSV:
-        etl.io.csv.appendcsv(table, temporary_file.name, delimiter=delimiter)
-    else:
-        etl.io.xlsx.appendxlsx(table, temporary_file.name)
-
-
 def save_csv_file_in_export_file(
     export_file: "ExportFile", temporary_file: IO[bytes], file_name: str
 ):
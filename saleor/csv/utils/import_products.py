@@ -0,0 +1,1156 @@
+"""Import products from files in the format of the products export.
+
+Every row of the file describes a product and one of its variants, like in the
+exported files. Rows of the same product have to follow each other; they are
+matched to existing products by the `id` column and grouped by the product name
+otherwise. Variants are matched by the `variant id` and `variant sku` columns.
+
+The file is streamed and imported in batches of products. Every batch is validated
+with a constant number of queries, saved with bulk operations in its own
+transaction, and the search documents and discounted prices of its products are
+updated once. Products with invalid rows are skipped; the errors are stored in
+the import file together with the numbers of the rows.
+
+Blank cells don't change the imported objects, so the imported file may contain
+only some of the exported columns. Media columns are ignored.
+"""
+import csv
+import io
+import json
+import re
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime, time
+from decimal import Decimal, InvalidOperation
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
+
+import graphene
+import openpyxl
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Max
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from django.utils.text import slugify
+from measurement.measures import Weight
+
+from ...attribute import AttributeEntityType, AttributeInputType
+from ...attribute.models import Attribute, AttributeProduct, AttributeVariant
+from ...channel.models import Channel
+from ...core.units import WeightUnits
+from ...core.utils.editorjs import clean_editor_js
+from ...page.models import Page
+from ...product.models import (
+    Category,
+    Collection,
+    CollectionProduct,
+    Product,
+    ProductChannelListing,
+    ProductType,
+    ProductVariant,
+    ProductVariantChannelListing,
+)
+from ...product.search import update_products_search_document
+from ...product.tasks import update_products_discounted_prices_task
+from ...product.utils.variants import generate_and_set_variants_names
+from ...warehouse.models import Stock, Warehouse
+from .. import FileTypes
+from ..error_codes import ImportErrorCode
+from ..models import ImportFile
+from .export import MISSING_VALUE
+
+if TYPE_CHECKING:
+    from ...plugins.manager import PluginsManager
+
+# Minimal number of rows imported in one transaction.
+BATCH_SIZE = 1000
+
+# Errors above the limit aren't stored in the import file.
+MAX_ROW_ERRORS = 1000
+
+# The header row is the first row of the file.
+FIRST_DATA_ROW = 2
+
+PRODUCT_FIELDS = {
+    "id",
+    "name",
+    "description",
+    "category",
+    "product type",
+    "charge taxes",
+    "product weight",
+    "collections",
+}
+VARIANT_FIELDS = {
+    "variant id",
+    "variant sku",
+    "variant weight",
+    "variant is preorder",
+    "variant preorder global threshold",
+    "variant preorder end date",
+}
+IGNORED_FIELDS = {"product media", "variant media"}
+
+PRODUCT_ATTRIBUTE_HEADER = re.compile(r"^(?P<slug>.+) \(product attribute\)$")
+VARIANT_ATTRIBUTE_HEADER = re.compile(r"^(?P<slug>.+) \(variant attribute\)$")
+WAREHOUSE_HEADER = re.compile(r"^(?P<slug>.+) \(warehouse quantity\)$")
+CHANNEL_HEADER = re.compile(r"^(?P<slug>.+) \(channel (?P<field>.+)\)$")
+
+# Channel headers fields mapped to the fields of the channel listings.
+PRODUCT_CHANNEL_FIELDS = {
+    "published": "is_published",
+    "publication date": "publication_date",
+    "searchable": "visible_in_listings",
+    "available for purchase": "available_for_purchase",
+}
+VARIANT_CHANNEL_FIELDS = {
+    "price amount": "price_amount",
+    "variant cost price": "cost_price_amount",
+    "variant preorder quantity threshold": "preorder_quantity_threshold",
+}
+# amounts in the currencies of the channels
+PRICE_CHANNEL_FIELDS = {"price amount", "variant cost price"}
+# currencies of the listings are always the currencies of their channels
+IGNORED_CHANNEL_FIELDS = {"product currency code", "variant currency code"}
+
+SUPPORTED_ATTRIBUTE_INPUT_TYPES = {
+    AttributeInputType.DROPDOWN,
+    AttributeInputType.MULTISELECT,
+    AttributeInputType.REFERENCE,
+    AttributeInputType.NUMERIC,
+    AttributeInputType.RICH_TEXT,
+    AttributeInputType.BOOLEAN,
+    AttributeInputType.DATE,
+    AttributeInputType.DATE_TIME,
+}
+REFERENCE_MODELS = {
+    AttributeEntityType.PAGE: Page,
+    AttributeEntityType.PRODUCT: Product,
+}
+# separator of many values in one cell
+VALUES_SEPARATOR = ", "
+
+PRODUCT_UPDATE_FIELDS = [
+    "name",
+    "description",
+    "description_plaintext",
+    "category",
+    "charge_taxes",
+    "weight",
+    "updated_at",
+]
+VARIANT_UPDATE_FIELDS = [
+    "sku",
+    "weight",
+    "is_preorder",
+    "preorder_global_threshold",
+    "preorder_end_date",
+]
+
+
+class RowError(Exception):
+    def __init__(self, field: Optional[str], message: str, code: ImportErrorCode):
+        super().__init__(message)
+        self.field = field
+        self.message = message
+        self.code = code
+
+
+@dataclass
+class ImportRow:
+    number: int
+    data: Dict[str, str]
+
+
+@dataclass
+class ImportColumns:
+    """Columns of the imported file, with the objects they refer to."""
+
+    product_attributes: Dict[str, Attribute] = field(default_factory=dict)
+    variant_attributes: Dict[str, Attribute] = field(default_factory=dict)
+    warehouses: Dict[str, Warehouse] = field(default_factory=dict)
+    product_channels: Dict[str, Tuple[Channel, str]] = field(default_factory=dict)
+    variant_channels: Dict[str, Tuple[Channel, str]] = field(default_factory=dict)
+    headers: List[Optional[str]] = field(default_factory=list)
+
+    @property
+    def variant_headers(self) -> Set[str]:
+        return (
+            VARIANT_FIELDS
+            | set(self.variant_attributes)
+            | set(self.warehouses)
+            | set(self.variant_channels)
+        )
+
+
+@dataclass
+class VariantData:
+    row: ImportRow
+    instance: ProductVariant
+    attributes: list = field(default_factory=list)
+    channel_listings: Dict[Channel, Dict[str, Any]] = field(
+        default_factory=lambda: defaultdict(dict)
+    )
+    stocks: Dict[Warehouse, int] = field(default_factory=dict)
+
+
+@dataclass
+class ProductData:
+    rows: List[ImportRow]
+    instance: Product
+    collections: Set[Collection] = field(default_factory=set)
+    attributes: list = field(default_factory=list)
+    channel_listings: Dict[Channel, Dict[str, Any]] = field(
+        default_factory=lambda: defaultdict(dict)
+    )
+    variants: List[VariantData] = field(default_factory=list)
+
+
+def import_products(
+    import_file: "ImportFile",
+    file_type: str,
+    manager: "PluginsManager",
+    delimiter: str = ",",
+):
+    errors: List[Dict[str, Any]] = []
+    with import_file.content_file.open("rb") as file:
+        rows_count = sum(1 for _ in read_rows(file, file_type, delimiter))
+    update_import_progress(import_file, 0, errors, max(rows_count - 1, 0))
+
+    with import_file.content_file.open("rb") as file:
+        rows = read_rows(file, file_type, delimiter)
+        header_row = next(rows, None)
+        if header_row is None:
+            return
+        columns = get_import_columns(header_row, errors)
+
+        processed_count = 0
+        for batch in get_products_rows_batches(rows, columns):
+            errors.extend(ProductsImportBatch(batch, columns, manager).save())
+            processed_count += sum(len(product_rows) for product_rows in batch)
+            update_import_progress(import_file, processed_count, errors)
+
+
+def read_rows(file: IO[bytes], file_type: str, delimiter: str = ",") -> Iterator[list]:
+    """Stream the rows of the file without loading the whole file into memory."""
+    if file_type == FileTypes.CSV:
+        # the BOM is added to CSV files by spreadsheet applications
+        stream = io.TextIOWrapper(file, encoding="utf-8-sig", newline="")
+        try:
+            yield from csv.reader(stream, delimiter=delimiter)
+        finally:
+            # detach the wrapper, so it doesn't close the file
+            stream.detach()
+    else:
+        workbook = openpyxl.load_workbook(file, read_only=True, data_only=True)
+        try:
+            yield from workbook.worksheets[0].iter_rows(values_only=True)
+        finally:
+            workbook.close()
+
+
+def clean_cell(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        value = value.isoformat()
+    elif isinstance(value, date):
+        value = value.isoformat()
+    value = str(value).strip()
+    if not value or value == MISSING_VALUE.strip():
+        return None
+    return value
+
+
+def get_import_columns(header_row: list, errors: List[Dict[str, Any]]):
+    """Match the headers with the attributes, warehouses and channels.
+
+    Columns with unknown headers are skipped.
+    """
+    headers = [clean_cell(header) for header in header_row]
+    attribute_slugs, warehouse_slugs, channel_slugs = set(), set(), set()
+    for header in filter(None, headers):
+        if match := (
+            PRODUCT_ATTRIBUTE_HEADER.match(header)
+            or VARIANT_ATTRIBUTE_HEADER.match(header)
+        ):
+            attribute_slugs.add(match["slug"])
+        elif match := WAREHOUSE_HEADER.match(header):
+            warehouse_slugs.add(match["slug"])
+        elif match := CHANNEL_HEADER.match(header):
+            channel_slugs.add(match["slug"])
+    attributes = Attribute.objects.in_bulk(attribute_slugs, field_name="slug")
+    warehouses = Warehouse.objects.in_bulk(warehouse_slugs, field_name="slug")
+    channels = Channel.objects.in_bulk(channel_slugs, field_name="slug")
+
+    columns = ImportColumns()
+    for header in headers:
+        try:
+            header = add_column(columns, header, attributes, warehouses, channels)
+        except RowError as error:
+            add_row_error(errors, 1, error)
+            header = None
+        columns.headers.append(header)
+    return columns
+
+
+def add_column(columns: ImportColumns, header, attributes, warehouses, channels):
+    if header is None or header in IGNORED_FIELDS:
+        return None
+    if header in PRODUCT_FIELDS or header in VARIANT_FIELDS:
+        return header
+    if match := PRODUCT_ATTRIBUTE_HEADER.match(header):
+        columns.product_attributes[header] = get_column_attribute(
+            header, attributes.get(match["slug"])
+        )
+    elif match := VARIANT_ATTRIBUTE_HEADER.match(header):
+        columns.variant_attributes[header] = get_column_attribute(
+            header, attributes.get(match["slug"])
+        )
+    elif match := WAREHOUSE_HEADER.match(header):
+        if match["slug"] not in warehouses:
+            raise RowError(
+                header, "Warehouse doesn't exist.", ImportErrorCode.NOT_FOUND
+            )
+        columns.warehouses[header] = warehouses[match["slug"]]
+    elif match := CHANNEL_HEADER.match(header):
+        channel = channels.get(match["slug"])
+        if channel is None:
+            raise RowError(header, "Channel doesn't exist.", ImportErrorCode.NOT_FOUND)
+        channel_field = match["field"]
+        if channel_field in PRODUCT_CHANNEL_FIELDS:
+            columns.product_channels[header] = (channel, channel_field)
+        elif channel_field in VARIANT_CHANNEL_FIELDS:
+            columns.variant_channels[header] = (channel, channel_field)
+        elif channel_field not in IGNORED_CHANNEL_FIELDS:
+            raise RowError(header, "Unknown column.", ImportErrorCode.INVALID)
+        else:
+            return None
+    else:
+        raise RowError(header, "Unknown column.", ImportErrorCode.INVALID)
+    return header
+
+
+def get_column_attribute(header: str, attribute: Optional[Attribute]) -> Attribute:
+    if attribute is None:
+        raise RowError(header, "Attribute doesn't exist.", ImportErrorCode.NOT_FOUND)
+    if attribute.input_type not in SUPPORTED_ATTRIBUTE_INPUT_TYPES:
+        raise RowError(
+            header,
+            f"Importing {attribute.input_type} attributes is not supported.",
+            ImportErrorCode.INVALID,
+        )
+    return attribute
+
+
+def get_products_rows_batches(
+    rows: Iterable[list], columns: ImportColumns
+) -> Iterator[List[List[ImportRow]]]:
+    """Group the rows by products and the products in batches.
+
+    Rows of a product are never split between batches.
+    """
+    batch: List[List[ImportRow]] = []
+    rows_count = 0
+    product_key = None
+    for number, row in enumerate(rows, start=FIRST_DATA_ROW):
+        data = {
+            header: value
+            for header, value in zip(columns.headers, map(clean_cell, row))
+            if header and value is not None
+        }
+        row_product_key = data.get("id") or data.get("name")
+        if not batch or row_product_key is None or row_product_key != product_key:
+            if rows_count >= BATCH_SIZE:
+                yield batch
+                batch, rows_count = [], 0
+            batch.append([])
+        batch[-1].append(ImportRow(number, data))
+        rows_count += 1
+        product_key = row_product_key
+    if batch:
+        yield batch
+
+
+def add_row_error(errors: List[Dict[str, Any]], row: int, error: RowError):
+    errors.append(
+        {
+            "row": row,
+            "field": error.field,
+            "message": error.message,
+            "code": error.code.value,
+        }
+    )
+
+
+def update_import_progress(
+    import_file: "ImportFile",
+    processed_count: int,
+    errors: List[Dict[str, Any]],
+    total_count: Optional[int] = None,
+):
+    import_file.processed_count = processed_count
+    import_file.errors = errors[:MAX_ROW_ERRORS]
+    fields: Dict[str, Any] = {
+        "processed_count": processed_count,
+        "errors": import_file.errors,
+        "updated_at": timezone.now(),
+    }
+    if total_count is not None:
+        import_file.total_count = total_count
+        fields["total_count"] = total_count
+    # update the row directly, so the progress doesn't override other changes
+    ImportFile.objects.filter(pk=import_file.pk).update(**fields)
+
+
+class ProductsImportBatch:
+    """Validate and save the products of a batch of rows with bulk operations."""
+
+    def __init__(
+        self,
+        products_rows: List[List[ImportRow]],
+        columns: ImportColumns,
+        manager: "PluginsManager",
+    ):
+        self.products_rows = products_rows
+        self.columns = columns
+        self.manager = manager
+        self.errors: List[Dict[str, Any]] = []
+
+    def save(self) -> List[Dict[str, Any]]:
+        """Import the batch and return the errors of the skipped rows."""
+        self.load()
+        products_data = []
+        for product_rows in self.products_rows:
+            try:
+                products_data.append(self.clean_product(product_rows))
+            except RowError as error:
+                add_row_error(self.errors, self.current_row.number, error)
+        if products_data:
+            with transaction.atomic():
+                self.save_products(products_data)
+        return self.errors
+
+    def load(self):
+        """Fetch all objects referred by the rows of the batch at once."""
+        rows = [row for product_rows in self.products_rows for row in product_rows]
+        values: Dict[str, Set[Any]] = defaultdict(set)
+        for row in rows:
+            for header in ["category", "product type", "variant sku"]:
+                if header in row.data:
+                    values[header].add(row.data[header])
+            for header in ["id", "variant id"]:
+                if header in row.data:
+                    values[header].add(self.get_pk(row.data[header]))
+            values["collections"].update(split_values(row.data.get("collections")))
+        values["id"].discard(None)
+        values["variant id"].discard(None)
+
+        self.products = Product.objects.select_related("product_type").in_bulk(
+            values["id"]
+        )
+        self.variants = ProductVariant.objects.in_bulk(values["variant id"])
+        self.product_channels = set(
+            ProductChannelListing.objects.filter(
+                product_id__in=self.products
+            ).values_list("product_id", "channel_id")
+        )
+        self.variants_by_sku = ProductVariant.objects.in_bulk(
+            values["variant sku"], field_name="sku"
+        )
+        self.categories = Category.objects.in_bulk(
+            values["category"], field_name="slug"
+        )
+        self.collections = Collection.objects.in_bulk(
+            values["collections"], field_name="slug"
+        )
+        # product types names aren't unique, the oldest one is used
+        self.product_types: Dict[str, ProductType] = {}
+        for product_type in ProductType.objects.filter(
+            name__in=values["product type"]
+        ).order_by("-pk"):
+            self.product_types[product_type.name] = product_type
+
+        product_type_ids = {
+            product.product_type_id for product in self.products.values()
+        }
+        product_type_ids.update(
+            product_type.pk for product_type in self.product_types.values()
+        )
+        self.product_attributes = set(
+            AttributeProduct.objects.filter(
+                product_type_id__in=product_type_ids
+            ).values_list("product_type_id", "attribute_id")
+        )
+        self.variant_attributes = set(
+            AttributeVariant.objects.filter(
+                product_type_id__in=product_type_ids
+            ).values_list("product_type_id", "attribute_id")
+        )
+        self.references = self.load_references(rows)
+        self.skus: Set[str] = set()
+
+    def load_references(self, rows: List[ImportRow]):
+        reference_attributes = [
+            (header, attribute)
+            for header, attribute in {
+                **self.columns.product_attributes,
+                **self.columns.variant_attributes,
+            }.items()
+            if attribute.input_type == AttributeInputType.REFERENCE
+        ]
+        pks: Dict[str, Set[int]] = defaultdict(set)
+        for row in rows:
+            for header, attribute in reference_attributes:
+                for reference in split_values(row.data.get(header)):
+                    entity_type, _, pk = reference.rpartition("_")
+                    if entity_type == attribute.entity_type and pk.isnumeric():
+                        pks[entity_type].add(int(pk))
+        return {
+            entity_type: REFERENCE_MODELS[entity_type].objects.in_bulk(entity_pks)
+            for entity_type, entity_pks in pks.items()
+        }
+
+    @staticmethod
+    def get_pk(global_id: str) -> Optional[int]:
+        try:
+            _, pk = graphene.Node.from_global_id(global_id)
+        except Exception:
+            return None
+        return int(pk) if pk and pk.isnumeric() else None
+
+    def clean_product(self, product_rows: List[ImportRow]) -> ProductData:
+        self.current_row = product_rows[0]
+        data = self.current_row.data
+        if "id" in data:
+            product = self.products.get(self.get_pk(data["id"]))
+            if product is None:
+                raise RowError(
+                    "id", "Product doesn't exist.", ImportErrorCode.NOT_FOUND
+                )
+        else:
+            if "name" not in data:
+                raise RowError(
+                    "name",
+                    "Name of a new product is required.",
+                    ImportErrorCode.REQUIRED,
+                )
+            if "product type" not in data:
+                raise RowError(
+                    "product type",
+                    "Product type of a new product is required.",
+                    ImportErrorCode.REQUIRED,
+                )
+            product_type = self.product_types.get(data["product type"])
+            if product_type is None:
+                raise RowError(
+                    "product type",
+                    "Product type doesn't exist.",
+                    ImportErrorCode.NOT_FOUND,
+                )
+            product = Product(product_type=product_type)
+
+        product_data = ProductData(rows=product_rows, instance=product)
+        for row in product_rows:
+            self.current_row = row
+            self.clean_product_fields(product_data, row.data)
+            if self.has_variant_data(row.data):
+                product_data.variants.append(self.clean_variant(product, row))
+        # the product can be added to channels by any of its rows
+        for variant_data in product_data.variants:
+            self.current_row = variant_data.row
+            self.clean_variant_channels(product_data, variant_data)
+        return product_data
+
+    def clean_product_fields(self, product_data: ProductData, data: Dict[str, str]):
+        product = product_data.instance
+        if "name" in data:
+            product.name = clean_max_length("name", data["name"], 250)
+        if "description" in data:
+            product.description = parse_rich_text("description", data["description"])
+            product.description_plaintext = clean_editor_js(
+                product.description, to_string=True
+            )
+        if "category" in data:
+            product.category = self.categories.get(data["category"])
+            if product.category is None:
+                raise RowError(
+                    "category", "Category doesn't exist.", ImportErrorCode.NOT_FOUND
+                )
+        if "charge taxes" in data:
+            product.charge_taxes = parse_bool("charge taxes", data["charge taxes"])
+        if "product weight" in data:
+            product.weight = parse_weight("product weight", data["product weight"])
+        for slug in split_values(data.get("collections")):
+            if slug not in self.collections:
+                raise RowError(
+                    "collections",
+                    "Collection doesn't exist.",
+                    ImportErrorCode.NOT_FOUND,
+                )
+            product_data.collections.add(self.collections[slug])
+        product_data.attributes.extend(
+            self.clean_attributes(
+                data,
+                self.columns.product_attributes,
+                self.product_attributes,
+                product.product_type_id,
+            )
+        )
+        self.clean_channel_listings(
+            data,
+            self.columns.product_channels,
+            PRODUCT_CHANNEL_FIELDS,
+            product_data.channel_listings,
+        )
+
+    def has_variant_data(self, data: Dict[str, str]) -> bool:
+        return any(header in data for header in self.columns.variant_headers)
+
+    def clean_variant(self, product: Product, row: ImportRow) -> VariantData:
+        data = row.data
+        sku = data.get("variant sku")
+        if "variant id" in data:
+            variant = self.variants.get(self.get_pk(data["variant id"]))
+            if variant is None or variant.product_id != product.pk:
+                raise RowError(
+                    "variant id",
+                    "Variant of the product doesn't exist.",
+                    ImportErrorCode.NOT_FOUND,
+                )
+            used_by = self.variants_by_sku.get(sku) if sku else None
+            if used_by and used_by.pk != variant.pk:
+                raise RowError(
+                    "variant sku",
+                    "Variant with this SKU already exists.",
+                    ImportErrorCode.UNIQUE,
+                )
+        elif sku and sku in self.variants_by_sku:
+            variant = self.variants_by_sku[sku]
+            if variant.product_id != product.pk:
+                raise RowError(
+                    "variant sku",
+                    "Variant with this SKU already exists.",
+                    ImportErrorCode.UNIQUE,
+                )
+        else:
+            variant = ProductVariant()
+        variant.product = product
+
+        if sku:
+            if sku in self.skus:
+                raise RowError(
+                    "variant sku",
+                    "SKU is used by many rows of the file.",
+                    ImportErrorCode.UNIQUE,
+                )
+            self.skus.add(sku)
+            variant.sku = clean_max_length("variant sku", sku, 255)
+        if "variant weight" in data:
+            variant.weight = parse_weight("variant weight", data["variant weight"])
+        if "variant is preorder" in data:
+            variant.is_preorder = parse_bool(
+                "variant is preorder", data["variant is preorder"]
+            )
+        if "variant preorder global threshold" in data:
+            variant.preorder_global_threshold = parse_int(
+                "variant preorder global threshold",
+                data["variant preorder global threshold"],
+            )
+        if "variant preorder end date" in data:
+            variant.preorder_end_date = parse_date_time(
+                "variant preorder end date", data["variant preorder end date"]
+            )
+
+        variant_data = VariantData(row=row, instance=variant)
+        variant_data.attributes = self.clean_attributes(
+            data,
+            self.columns.variant_attributes,
+            self.variant_attributes,
+            product.product_type_id,
+        )
+        self.clean_channel_listings(
+            data,
+            self.columns.variant_channels,
+            VARIANT_CHANNEL_FIELDS,
+            variant_data.channel_listings,
+        )
+        for header, warehouse in self.columns.warehouses.items():
+            if header in data:
+                variant_data.stocks[warehouse] = parse_int(header, data[header])
+        return variant_data
+
+    def clean_attributes(
+        self,
+        data: Dict[str, str],
+        attribute_columns: Dict[str, Attribute],
+        assigned_attributes: Set[Tuple[int, int]],
+        product_type_id: int,
+    ) -> list:
+        from ...graphql.attribute.utils import AttrValuesInput
+
+        cleaned_input = []
+        for header, attribute in attribute_columns.items():
+            if header not in data:
+                continue
+            if (product_type_id, attribute.pk) not in assigned_attributes:
+                raise RowError(
+                    header,
+                    "Attribute isn't assigned to the product type.",
+                    ImportErrorCode.INVALID,
+                )
+            value = data[header]
+            values_input = AttrValuesInput(
+                global_id=graphene.Node.to_global_id("Attribute", attribute.pk),
+                values=[],
+                references=[],
+            )
+            input_type = attribute.input_type
+            if input_type == AttributeInputType.MULTISELECT:
+                values_input.values = [
+                    clean_max_length(header, name, 250) for name in split_values(value)
+                ]
+            elif input_type == AttributeInputType.DROPDOWN:
+                values_input.values = [clean_max_length(header, value, 250)]
+            elif input_type == AttributeInputType.NUMERIC:
+                values_input.values = [parse_numeric_value(header, value, attribute)]
+            elif input_type == AttributeInputType.BOOLEAN:
+                values_input.boolean = parse_bool(header, value)
+            elif input_type == AttributeInputType.DATE:
+                values_input.date = parse_date_value(header, value)
+            elif input_type == AttributeInputType.DATE_TIME:
+                values_input.date_time = parse_date_time(header, value)
+            elif input_type == AttributeInputType.RICH_TEXT:
+                values_input.rich_text = parse_rich_text(header, value)
+            elif input_type == AttributeInputType.REFERENCE:
+                values_input.references = self.get_references(header, value, attribute)
+            cleaned_input.append((attribute, values_input))
+        return cleaned_input
+
+    def clean_variant_channels(
+        self, product_data: ProductData, variant_data: VariantData
+    ):
+        """Check that the product is available in the channels of the variant."""
+        product = product_data.instance
+        for channel in variant_data.channel_listings:
+            if channel in product_data.channel_listings:
+                continue
+            if (product.pk, channel.pk) in self.product_channels:
+                continue
+            header = next(
+                header
+                for header, (column_channel, _) in self.columns.variant_channels.items()
+                if column_channel == channel and header in variant_data.row.data
+            )
+            raise RowError(
+                header,
+                "Product isn't available in the channel.",
+                ImportErrorCode.PRODUCT_NOT_ASSIGNED_TO_CHANNEL,
+            )
+
+    def get_references(self, header: str, value: str, attribute: Attribute) -> list:
+        references = []
+        entities = self.references.get(attribute.entity_type, {})
+        for reference in split_values(value):
+            entity_type, _, pk = reference.rpartition("_")
+            entity = entities.get(int(pk)) if pk.isnumeric() else None
+            if entity_type != attribute.entity_type or entity is None:
+                raise RowError(
+                    header,
+                    f"Referenced object {reference} doesn't exist.",
+                    ImportErrorCode.NOT_FOUND,
+                )
+            references.append(entity)
+        return references
+
+    @staticmethod
+    def clean_channel_listings(
+        data: Dict[str, str],
+        channel_columns: Dict[str, Tuple[Channel, str]],
+        fields_mapping: Dict[str, str],
+        channel_listings: Dict[Channel, Dict[str, Any]],
+    ):
+        from ...graphql.core.validators import validate_price_precision
+
+        parsers = {
+            "published": parse_bool,
+            "publication date": parse_date_value,
+            "searchable": parse_bool,
+            "available for purchase": parse_date_value,
+            "price amount": parse_decimal,
+            "variant cost price": parse_decimal,
+            "variant preorder quantity threshold": parse_int,
+        }
+        for header, (channel, channel_field) in channel_columns.items():
+            if header not in data:
+                continue
+            value = parsers[channel_field](header, data[header])
+            if channel_field in PRICE_CHANNEL_FIELDS:
+                try:
+                    validate_price_precision(value, channel.currency_code)
+                except ValidationError as error:
+                    raise RowError(header, error.messages[0], ImportErrorCode.INVALID)
+            channel_listings[channel][fields_mapping[channel_field]] = value
+
+    def save_products(self, products_data: List[ProductData]):
+        now = timezone.now()
+        new_products = [
+            data.instance for data in products_data if data.instance.pk is None
+        ]
+        updated_products = [
+            data.instance for data in products_data if data.instance.pk is not None
+        ]
+        for product, slug in zip(
+            new_products,
+            generate_unique_slugs([product.name for product in new_products]),
+        ):
+            product.slug = slug
+        Product.objects.bulk_create(new_products)
+        for product in updated_products:
+            product.updated_at = now
+        Product.objects.bulk_update(updated_products, PRODUCT_UPDATE_FIELDS)
+
+        CollectionProduct.objects.bulk_create(
+            [
+                CollectionProduct(collection=collection, product=data.instance)
+                for data in products_data
+                for collection in data.collections
+            ],
+            ignore_conflicts=True,
+        )
+        variants_data = [
+            variant_data for data in products_data for variant_data in data.variants
+        ]
+        new_variants = set(self.save_variants(variants_data))
+        self.save_attributes(products_data, variants_data)
+        generate_and_set_variants_names(
+            data.instance
+            for data in variants_data
+            if data.instance in new_variants or data.attributes
+        )
+        self.set_default_variants(products_data)
+        self.save_product_channel_listings(products_data)
+        self.save_variant_channel_listings(variants_data)
+        self.save_stocks(variants_data)
+
+        product_ids = [data.instance.pk for data in products_data]
+        update_products_search_document(Product.objects.filter(pk__in=product_ids))
+        transaction.on_commit(
+            lambda: self.call_events(
+                new_products, updated_products, new_variants, variants_data
+            )
+        )
+        transaction.on_commit(
+            lambda: update_products_discounted_prices_task.delay(product_ids)
+        )
+
+    @staticmethod
+    def save_variants(variants_data: List[VariantData]) -> List[ProductVariant]:
+        new_variants = [
+            data.instance for data in variants_data if data.instance.pk is None
+        ]
+        updated_variants = [
+            data.instance for data in variants_data if data.instance.pk is not None
+        ]
+        # new variants are added at the end of the products' variants
+        sort_orders = dict(
+            ProductVariant.objects.filter(
+                product_id__in={variant.product.pk for variant in new_variants}
+            )
+            .values("product_id")
+            .annotate(max_sort_order=Max("sort_order"))
+            .values_list("product_id", "max_sort_order")
+        )
+        for variant in new_variants:
+            sort_order = sort_orders.get(variant.product.pk)
+            variant.sort_order = 0 if sort_order is None else sort_order + 1
+            sort_orders[variant.product.pk] = variant.sort_order
+        ProductVariant.objects.bulk_create(new_variants)
+        ProductVariant.objects.bulk_update(updated_variants, VARIANT_UPDATE_FIELDS)
+        return new_variants
+
+    @staticmethod
+    def save_attributes(
+        products_data: List[ProductData], variants_data: List[VariantData]
+    ):
+        from ...graphql.attribute.utils import AttributeAssignmentMixin
+
+        AttributeAssignmentMixin.save_many(
+            (data.instance, data.attributes)
+            for data in products_data
+            if data.attributes
+        )
+        AttributeAssignmentMixin.save_many(
+            (data.instance, data.attributes)
+            for data in variants_data
+            if data.attributes
+        )
+
+    @staticmethod
+    def set_default_variants(products_data: List[ProductData]):
+        products = []
+        for data in products_data:
+            product = data.instance
+            if product.default_variant_id is None and data.variants:
+                product.default_variant = data.variants[0].instance
+                products.append(product)
+        Product.objects.bulk_update(products, ["default_variant"])
+
+    @staticmethod
+    def save_product_channel_listings(products_data: List[ProductData]):
+        listings = {
+            (data.instance, channel): fields
+            for data in products_data
+            for channel, fields in data.channel_listings.items()
+        }
+        existing_listings = {
+            (listing.product_id, listing.channel_id): listing
+            for listing in ProductChannelListing.objects.filter(
+                product__in={product for product, _ in listings}
+            )
+        }
+        save_channel_listings(
+            ProductChannelListing,
+            "product",
+            listings,
+            existing_listings,
+            list(PRODUCT_CHANNEL_FIELDS.values()),
+        )
+
+    def save_variant_channel_listings(self, variants_data: List[VariantData]):
+        listings = {
+            (data.instance, channel): fields
+            for data in variants_data
+            for channel, fields in data.channel_listings.items()
+        }
+        existing_listings = {
+            (listing.variant_id, listing.channel_id): listing
+            for listing in ProductVariantChannelListing.objects.filter(
+                variant__in={variant for variant, _ in listings}
+            )
+        }
+        for data in variants_data:
+            for channel, fields in data.channel_listings.items():
+                is_new = (data.instance.pk, channel.pk) not in existing_listings
+                if is_new and fields.get("price_amount") is None:
+                    # the rest of the batch is saved, so the error is only reported
+                    add_row_error(
+                        self.errors,
+                        data.row.number,
+                        RowError(
+                            f"{channel.slug} (channel price amount)",
+                            "Price is required to add the variant to the channel.",
+                            ImportErrorCode.REQUIRED,
+                        ),
+                    )
+                    del listings[(data.instance, channel)]
+        save_channel_listings(
+            ProductVariantChannelListing,
+            "variant",
+            listings,
+            existing_listings,
+            list(VARIANT_CHANNEL_FIELDS.values()),
+        )
+
+    @staticmethod
+    def save_stocks(variants_data: List[VariantData]):
+        quantities = {
+            (data.instance.pk, warehouse.pk): quantity
+            for data in variants_data
+            for warehouse, quantity in data.stocks.items()
+        }
+        if not quantities:
+            return
+        stocks = Stock.objects.filter(
+            product_variant_id__in={variant_pk for variant_pk, _ in quantities},
+            warehouse_id__in={warehouse_pk for _, warehouse_pk in quantities},
+        )
+        updated_stocks = []
+        for stock in stocks:
+            quantity = quantities.pop(
+                (stock.product_variant_id, stock.warehouse_id), None
+            )
+            if quantity is not None:
+                stock.quantity = quantity
+                updated_stocks.append(stock)
+        Stock.objects.bulk_update(updated_stocks, ["quantity"])
+        Stock.objects.bulk_create(
+            [
+                Stock(
+                    product_variant_id=variant_pk,
+                    warehouse_id=warehouse_pk,
+                    quantity=quantity,
+                )
+                for (variant_pk, warehouse_pk), quantity in quantities.items()
+            ]
+        )
+
+    def call_events(
+        self,
+        new_products: List[Product],
+        updated_products: List[Product],
+        new_variants: Set[ProductVariant],
+        variants_data: List[VariantData],
+    ):
+        for product in new_products:
+            self.manager.product_created(product)
+        for product in updated_products:
+            self.manager.product_updated(product)
+        for data in variants_data:
+            if data.instance in new_variants:
+                self.manager.product_variant_created(data.instance)
+            else:
+                self.manager.product_variant_updated(data.instance)
+
+
+def save_channel_listings(model, instance_field, listings, existing_listings, fields):
+    """Update the existing channel listings and create the missing ones."""
+    updated_listings, new_listings = [], []
+    for (instance, channel), values in listings.items():
+        listing = existing_listings.get((instance.pk, channel.pk))
+        if listing is None:
+            listing = model(
+                **{instance_field: instance},
+                channel=channel,
+                currency=channel.currency_code,
+            )
+            new_listings.append(listing)
+        else:
+            updated_listings.append(listing)
+        for listing_field, value in values.items():
+            setattr(listing, listing_field, value)
+    model.objects.bulk_update(updated_listings, fields)
+    model.objects.bulk_create(new_listings)
+
+
+def generate_unique_slugs(names: List[str]) -> List[str]:
+    """Generate unique slugs of many new products at once.
+
+    Like `generate_unique_slug`, slugs are suffixed with the lowest number making
+    them unique, but the existing slugs are fetched with a single query.
+    """
+    slugs = [slugify(name, allow_unicode=True) for name in names]
+    if not slugs:
+        return []
+    pattern = "|".join(re.escape(slug) for slug in set(slugs))
+    used_slugs = set(
+        Product.objects.filter(slug__iregex=rf"^({pattern})(-\d+)?$").values_list(
+            "slug", flat=True
+        )
+    )
+    unique_slugs = []
+    for slug in slugs:
+        unique_slug, extension = slug, 1
+        while unique_slug in used_slugs:
+            extension += 1
+            unique_slug = f"{slug}-{extension}"
+        used_slugs.add(unique_slug)
+        unique_slugs.append(unique_slug)
+    return unique_slugs
+
+
+def split_values(value: Optional[str]) -> List[str]:
+    if not value:
+        return []
+    return [item.strip() for item in value.split(VALUES_SEPARATOR) if item.strip()]
+
+
+def clean_max_length(header: str, value: str, max_length: int) -> str:
+    if len(value) > max_length:
+        raise RowError(
+            header,
+            f"Ensure this value has at most {max_length} characters.",
+            ImportErrorCode.INVALID,
+        )
+    return value
+
+
+def parse_bool(header: str, value: str) -> bool:
+    normalized_value = value.lower()
+    if normalized_value in ("true", "yes", "1"):
+        return True
+    if normalized_value in ("false", "no", "0"):
+        return False
+    raise RowError(header, "Enter true or false.", ImportErrorCode.INVALID)
+
+
+def parse_decimal(header: str, value: str) -> Decimal:
+    try:
+        number = Decimal(value)
+    except InvalidOperation:
+        number = None
+    if number is None or not number.is_finite() or number < 0:
+        raise RowError(header, "Enter a non-negative number.", ImportErrorCode.INVALID)
+    return number
+
+
+def parse_int(header: str, value: str) -> int:
+    number = parse_decimal(header, value)
+    if number != number.to_integral_value():
+        raise RowError(header, "Enter a whole number.", ImportErrorCode.INVALID)
+    return int(number)
+
+
+def parse_weight(header: str, value: str) -> Weight:
+    amount, _, unit = value.partition(" ")
+    unit = unit.strip() or WeightUnits.G
+    if unit not in dict(WeightUnits.CHOICES):
+        raise RowError(header, "Unknown weight unit.", ImportErrorCode.INVALID)
+    return Weight(**{unit: parse_decimal(header, amount)})
+
+
+def parse_numeric_value(header: str, value: str, attribute: Attribute) -> str:
+    # numeric values are exported with the unit of the attribute
+    if attribute.unit and value.endswith(f" {attribute.unit}"):
+        value = value[: -len(attribute.unit) - 1]
+    try:
+        float(value)
+    except ValueError:
+        raise RowError(header, "Numeric value is required.", ImportErrorCode.INVALID)
+    return value
+
+
+def parse_date_value(header: str, value: str) -> date:
+    try:
+        parsed_date = parse_date(value[:10])
+    except ValueError:
+        parsed_date = None
+    if parsed_date is None:
+        raise RowError(header, "Enter a valid date.", ImportErrorCode.INVALID)
+    return parsed_date
+
+
+def parse_date_time(header: str, value: str) -> datetime:
+    try:
+        parsed_date_time = parse_datetime(value)
+    except ValueError:
+        parsed_date_time = None
+    if parsed_date_time is None:
+        parsed_date_time = datetime.combine(parse_date_value(header, value), time())
+    if timezone.is_naive(parsed_date_time):
+        parsed_date_time = timezone.make_aware(parsed_date_time, timezone.utc)
+    return parsed_date_time
+
+
+def parse_rich_text(header: str, value: str) -> dict:
+    """Parse EditorJS JSON, or a plain text as exported for rich text attributes."""
+    try:
+        rich_text = json.loads(value)
+    except ValueError:
+        rich_text = None
+    if not isinstance(rich_text, dict):
+        rich_text = {"blocks": [{"type": "paragraph", "data": {"text": value}}]}
+    elif not isinstance(rich_text.get("blocks"), list):
+        raise RowError(header, "Enter a valid EditorJS JSON.", ImportErrorCode.INVALID)
+    return rich_text
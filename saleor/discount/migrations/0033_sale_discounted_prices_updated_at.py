@@ -0,0 +1,21 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("discount", "0032_merge_20211109_1210"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="sale",
+            name="discounted_prices_updated_at",
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+        # Existing sales keep their current prices, as if they were just recalculated.
+        migrations.RunSQL(
+            "UPDATE discount_sale SET discounted_prices_updated_at = now();",
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -233,6 +233,17 @@ class SaleQueryset(models.QuerySet):
             date = timezone.now()
         return self.filter(end_date__lt=date, start_date__lt=date)
 
+    def with_pending_price_transitions(self, date=None):
+        """Return sales started or ended since their discounted prices were updated."""
+        if date is None:
+            date = timezone.now()
+        updated_at = F("discounted_prices_updated_at")
+        return self.filter(
+            Q(discounted_prices_updated_at__isnull=True, start_date__lte=date)
+            | Q(start_date__lte=date, start_date__gt=updated_at)
+            | Q(end_date__lte=date, end_date__gt=updated_at)
+        )
+
 
 class VoucherTranslation(Translation):
     voucher = models.ForeignKey(
@@ -264,6 +275,11 @@ class Sale(ModelWithMetadata):
     variants = models.ManyToManyField("product.ProductVariant", blank=True)
     start_date = models.DateTimeField(default=timezone.now)
     end_date = models.DateTimeField(null=True, blank=True)
+    # When discounted prices of products on sale were last recalculated; used to
+    # find sales that started or ended since then.
+    discounted_prices_updated_at = models.DateTimeField(
+        null=True, blank=True, editable=False
+    )
 
     objects = models.Manager.from_queryset(SaleQueryset)()
     translated = TranslationProxy()
@@ -0,0 +1,40 @@
+from django.db.models import Q
+from django.utils import timezone
+
+from ..celeryconf import app
+from ..product.tasks import update_products_discounted_prices_of_discount_task
+from .models import Sale
+from .utils import (
+    get_sale_price_transitions_schedule_end,
+    schedule_sale_price_transitions,
+)
+
+
+@app.task
+def apply_sale_price_transitions_task():
+    """Recalculate discounted prices of products of sales that started or ended."""
+    now = timezone.now()
+    sale_pks = list(
+        Sale.objects.with_pending_price_transitions(now).values_list("pk", flat=True)
+    )
+    # Mark sales first, so following runs don't schedule them again.
+    Sale.objects.filter(pk__in=sale_pks).update(discounted_prices_updated_at=now)
+    for sale_pk in sale_pks:
+        update_products_discounted_prices_of_discount_task.delay(sale_pk)
+
+
+@app.task
+def schedule_sale_price_transitions_task():
+    """Apply pending price transitions and schedule the upcoming ones.
+
+    Transitions before the next run are applied at the exact start and end dates
+    of sales.
+    """
+    apply_sale_price_transitions_task()
+    now = timezone.now()
+    until = get_sale_price_transitions_schedule_end()
+    sales = Sale.objects.filter(
+        Q(start_date__gt=now, start_date__lte=until)
+        | Q(end_date__gt=now, end_date__lte=until)
+    )
+    schedule_sale_price_transitions(sales, until)
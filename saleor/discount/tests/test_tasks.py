@@ -0,0 +1,89 @@
+from datetime import timedelta
+from unittest.mock import patch
+
+from django.utils import timezone
+from prices import Money
+
+from ..tasks import (
+    apply_sale_price_transitions_task,
+    schedule_sale_price_transitions_task,
+)
+
+
+def test_apply_sale_price_transitions_task_for_started_sale(
+    new_sale, product, category, channel_USD
+):
+    # given
+    new_sale.categories.add(category)
+    now = timezone.now()
+    new_sale.start_date = now - timedelta(minutes=1)
+    new_sale.discounted_prices_updated_at = now - timedelta(hours=1)
+    new_sale.save(update_fields=["start_date", "discounted_prices_updated_at"])
+    product_channel_listing = product.channel_listings.get(channel=channel_USD)
+    assert product_channel_listing.discounted_price == Money(10, "USD")
+
+    # when
+    apply_sale_price_transitions_task()
+
+    # then
+    product_channel_listing.refresh_from_db()
+    assert product_channel_listing.discounted_price == Money(5, "USD")
+    new_sale.refresh_from_db()
+    assert new_sale.discounted_prices_updated_at > now
+
+
+def test_apply_sale_price_transitions_task_for_ended_sale(
+    new_sale, product, category, channel_USD
+):
+    # given
+    new_sale.categories.add(category)
+    now = timezone.now()
+    new_sale.start_date = now - timedelta(days=1)
+    new_sale.end_date = now - timedelta(minutes=1)
+    new_sale.discounted_prices_updated_at = now - timedelta(hours=1)
+    new_sale.save(
+        update_fields=["start_date", "end_date", "discounted_prices_updated_at"]
+    )
+    product_channel_listing = product.channel_listings.get(channel=channel_USD)
+    product_channel_listing.discounted_price_amount = 5
+    product_channel_listing.save(update_fields=["discounted_price_amount"])
+
+    # when
+    apply_sale_price_transitions_task()
+
+    # then
+    product_channel_listing.refresh_from_db()
+    assert product_channel_listing.discounted_price == Money(10, "USD")
+
+
+@patch("saleor.discount.tasks.update_products_discounted_prices_of_discount_task.delay")
+def test_apply_sale_price_transitions_task_skips_updated_sale(
+    update_prices_task_mock, new_sale
+):
+    # given
+    now = timezone.now()
+    new_sale.start_date = now - timedelta(hours=1)
+    new_sale.discounted_prices_updated_at = now - timedelta(minutes=1)
+    new_sale.save(update_fields=["start_date", "discounted_prices_updated_at"])
+
+    # when
+    apply_sale_price_transitions_task()
+
+    # then
+    update_prices_task_mock.assert_not_called()
+
+
+@patch("saleor.discount.tasks.apply_sale_price_transitions_task.apply_async")
+def test_schedule_sale_price_transitions_task(apply_task_mock, new_sale, settings):
+    # given
+    settings.SALE_PRICE_TRANSITIONS_CHECK_INTERVAL = timedelta(minutes=5)
+    now = timezone.now()
+    new_sale.start_date = now + timedelta(minutes=3)
+    new_sale.end_date = now + timedelta(minutes=30)
+    new_sale.save(update_fields=["start_date", "end_date"])
+
+    # when
+    schedule_sale_price_transitions_task()
+
+    # then
+    apply_task_mock.assert_called_once_with(eta=new_sale.start_date)
@@ -14,6 +14,7 @@ from typing import (
     cast,
 )
 
+from django.conf import settings
 from django.db.models import F
 from django.utils import timezone
 from prices import Money, TaxedMoney
@@ -353,6 +354,34 @@ def fetch_active_discounts() -> List[DiscountInfo]:
     return fetch_discounts(timezone.now())
 
 
+def get_sale_price_transitions_schedule_end() -> datetime.datetime:
+    # The window overlaps with the one of the next periodic run, as scheduling
+    # a transition twice is harmless.
+    return timezone.now() + settings.SALE_PRICE_TRANSITIONS_CHECK_INTERVAL * 2
+
+
+def schedule_sale_price_transitions(
+    sales: Iterable[Sale], until: Optional[datetime.datetime] = None
+):
+    """Schedule recalculation of prices at start and end dates of sales.
+
+    Only dates before `until` are scheduled, later ones are scheduled by
+    the periodic task when they get close.
+    """
+    from .tasks import apply_sale_price_transitions_task
+
+    now = timezone.now()
+    until = until or get_sale_price_transitions_schedule_end()
+    transition_dates = {
+        date
+        for sale in sales
+        for date in (sale.start_date, sale.end_date)
+        if date and now < date <= until
+    }
+    for date in sorted(transition_dates):
+        apply_sale_price_transitions_task.apply_async(eta=date)
+
+
 def fetch_catalogue_info(instance: Sale) -> CatalogueInfo:
     catalogue_fields = ["categories", "collections", "products", "variants"]
     catalogue_info: CatalogueInfo = defaultdict(set)
@@ -1,7 +1,9 @@
 from celery.utils.log import get_task_logger
+from django.conf import settings
 from django.utils import timezone
 
 from ..celeryconf import app
+from ..core.db.batches import update_in_batches
 from .events import gift_cards_deactivated_event
 from .models import GiftCard
 
@@ -12,9 +14,14 @@ task_logger = get_task_logger(__name__)
 def deactivate_expired_cards_task():
     today = timezone.now().date()
     gift_cards = GiftCard.objects.filter(expiry_date__lt=today, is_active=True)
-    if not gift_cards:
-        return
-    gift_card_ids = list(gift_cards.values_list("id", flat=True))
-    count = gift_cards.update(is_active=False)
-    gift_cards_deactivated_event(gift_card_ids, user=None, app=None)
-    task_logger.debug("Deactivate %s gift cards", count)
+    result = update_in_batches(
+        gift_cards,
+        {"is_active": False},
+        time_budget=settings.MAINTENANCE_TASK_TIME_BUDGET,
+        before_batch=lambda ids: gift_cards_deactivated_event(ids, user=None, app=None),
+        log=task_logger,
+    )
+    if result.count:
+        task_logger.debug("Deactivate %s gift cards", result.count)
+    if not result.finished:
+        deactivate_expired_cards_task.delay()
@@ -1,8 +1,12 @@
 import django_filters
-from django.db.models import Count
+import graphene
+from django.conf import settings
+from django.db.models import Count, Exists, OuterRef, Sum
 
-from ...account.models import User
+from ...account.models import CustomerLifetimeSpend, User
 from ...account.search import search_users
+from ...order import OrderStatus
+from ...order.models import Order
 from ..core.filters import (
     EnumFilter,
     GlobalIDMultipleChoiceFilter,
@@ -20,12 +24,47 @@ def filter_date_joined(qs, _, value):
 
 
 def filter_number_of_orders(qs, _, value):
+    if settings.CUSTOMER_ORDER_STATS_ENABLED:
+        return filter_range_field(qs, "number_of_orders", value)
     qs = qs.annotate(total_orders=Count("orders"))
     return filter_range_field(qs, "total_orders", value)
 
 
 def filter_placed_orders(qs, _, value):
-    return filter_range_field(qs, "orders__created__date", value)
+    if not settings.CUSTOMER_ORDER_STATS_ENABLED:
+        return filter_range_field(qs, "orders__created__date", value)
+    # customers with an order in the range ordered first before its end and last
+    # after its start
+    gte, lte = value.get("gte"), value.get("lte")
+    qs = filter_range_field(qs, "last_order_date__date", {"gte": gte})
+    qs = filter_range_field(qs, "first_order_date__date", {"lte": lte})
+    if gte and lte:
+        # orders before and after the range don't mean there is one within it
+        orders = Order.objects.non_draft().filter(
+            user_id=OuterRef("pk"), created__date__range=(gte, lte)
+        )
+        qs = qs.filter(Exists(orders))
+    return qs
+
+
+def filter_lifetime_spend(qs, _, value):
+    currency = value["currency"]
+    if settings.CUSTOMER_ORDER_STATS_ENABLED:
+        spend = CustomerLifetimeSpend.objects.filter(
+            user_id=OuterRef("pk"), currency=currency
+        )
+        spend = filter_range_field(spend, "total_gross_amount", value)
+        return qs.filter(Exists(spend))
+    spend = (
+        Order.objects.non_draft()
+        .exclude(status=OrderStatus.CANCELED)
+        .filter(currency=currency)
+        .order_by()
+        .values("user_id")
+        .annotate(total_gross_amount=Sum("total_gross_amount"))
+    )
+    spend = filter_range_field(spend, "total_gross_amount", value)
+    return qs.filter(pk__in=spend.values("user_id"))
 
 
 def filter_staff_status(qs, _, value):
@@ -46,6 +85,18 @@ def filter_search(qs, _, value):
     return qs
 
 
+class LifetimeSpendFilterInput(graphene.InputObjectType):
+    currency = graphene.String(
+        description="Currency of the customer's orders.", required=True
+    )
+    gte = graphene.Float(
+        description="Total of the orders greater than or equal to.", required=False
+    )
+    lte = graphene.Float(
+        description="Total of the orders less than or equal to.", required=False
+    )
+
+
 class CustomerFilter(MetadataFilterBase):
     date_joined = ObjectTypeFilter(
         input_class=DateRangeInput, method=filter_date_joined
@@ -56,6 +107,9 @@ class CustomerFilter(MetadataFilterBase):
     placed_orders = ObjectTypeFilter(
         input_class=DateRangeInput, method=filter_placed_orders
     )
+    lifetime_spend = ObjectTypeFilter(
+        input_class=LifetimeSpendFilterInput, method=filter_lifetime_spend
+    )
     search = django_filters.CharFilter(method=filter_user_search)
 
     class Meta:
@@ -64,6 +118,7 @@ class CustomerFilter(MetadataFilterBase):
             "date_joined",
             "number_of_orders",
             "placed_orders",
+            "lifetime_spend",
             "search",
         ]
 
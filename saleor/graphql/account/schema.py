@@ -1,7 +1,11 @@
 import graphene
 
 from ...core.permissions import AccountPermissions, OrderPermissions
-from ..core.connection import create_connection_slice, filter_connection_queryset
+from ..core.connection import (
+    create_connection_slice,
+    filter_connection_queryset,
+    get_list_total_count,
+)
 from ..core.fields import FilterConnectionField
 from ..core.types import FilterInputObjectType
 from ..core.utils import from_global_id_or_error
@@ -121,7 +125,10 @@ class AccountQueries(graphene.ObjectType):
         UserCountableConnection,
         filter=CustomerFilterInput(description="Filtering options for customers."),
         sort_by=UserSortingInput(description="Sort customers."),
-        description="List of the shop's customers.",
+        description=(
+            "List of the shop's customers. The total count of customers is "
+            "estimated for large unfiltered lists."
+        ),
     )
     permission_groups = FilterConnectionField(
         GroupCountableConnection,
@@ -169,9 +176,17 @@ class AccountQueries(graphene.ObjectType):
         [OrderPermissions.MANAGE_ORDERS, AccountPermissions.MANAGE_USERS]
     )
     def resolve_customers(self, info, **kwargs):
+        # checked before filtering, which adds the channel to the filter input
+        total_count = get_list_total_count(kwargs)
         qs = resolve_customers(info, **kwargs)
         qs = filter_connection_queryset(qs, kwargs)
-        return create_connection_slice(qs, info, kwargs, UserCountableConnection)
+        return create_connection_slice(
+            qs,
+            info,
+            kwargs,
+            UserCountableConnection,
+            total_count=total_count,
+        )
 
     @permission_required(AccountPermissions.MANAGE_STAFF)
     def resolve_permission_groups(self, info, **kwargs):
@@ -1,5 +1,6 @@
 import graphene
-from django.db.models import Count, QuerySet
+from django.conf import settings
+from django.db.models import Count, F, QuerySet
 
 from ..core.types import SortInputObjectType
 
@@ -19,6 +20,8 @@ class UserSortField(graphene.Enum):
 
     @staticmethod
     def qs_with_order_count(queryset: QuerySet, **_kwargs) -> QuerySet:
+        if settings.CUSTOMER_ORDER_STATS_ENABLED:
+            return queryset.annotate(order_count=F("number_of_orders"))
         return queryset.annotate(order_count=Count("orders__id"))
 
 
@@ -34,6 +34,7 @@ from ....core.tokens import account_delete_token_generator
 from ....core.utils.url import prepare_url
 from ....order import OrderStatus
 from ....order.models import FulfillmentStatus, Order
+from ....order.reports import update_all_customer_order_stats
 from ....product.tests.utils import create_image
 from ...core.utils import str_to_enum
 from ...tests.utils import (
@@ -4631,6 +4632,138 @@ def test_query_customers_with_filter_placed_orders_(
     assert len(users) == count
 
 
+@pytest.mark.parametrize(
+    "customer_filter, count",
+    [
+        ({"numberOfOrders": {"gte": 0, "lte": 1}}, 1),
+        ({"numberOfOrders": {"gte": 1, "lte": 3}}, 2),
+        ({"placedOrders": {"lte": "2012-01-14"}}, 1),
+        ({"placedOrders": {"gte": "2012-01-14"}}, 2),
+    ],
+)
+def test_query_customers_with_filter_customer_order_stats(
+    customer_filter,
+    count,
+    query_customer_with_filter,
+    staff_api_client,
+    permission_manage_users,
+    customer_user,
+    channel_USD,
+    settings,
+):
+    # given
+    settings.CUSTOMER_ORDER_STATS_ENABLED = True
+    Order.objects.bulk_create(
+        [
+            Order(user=customer_user, token=str(uuid.uuid4()), channel=channel_USD),
+            Order(user=customer_user, token=str(uuid.uuid4()), channel=channel_USD),
+        ]
+    )
+    second_customer = User.objects.create(email="second_example@example.com")
+    with freeze_time("2012-01-14 11:00:00"):
+        Order.objects.create(user=second_customer, channel=channel_USD)
+    update_all_customer_order_stats()
+    variables = {"filter": customer_filter}
+
+    # when
+    response = staff_api_client.post_graphql(
+        query_customer_with_filter, variables, permissions=[permission_manage_users]
+    )
+
+    # then
+    content = get_graphql_content(response)
+    users = content["data"]["customers"]["edges"]
+    assert len(users) == count
+
+
+@pytest.mark.parametrize(
+    "placed_orders, count",
+    [
+        ({"gte": "2012-01-10", "lte": "2012-01-20"}, 1),
+        ({"gte": "2012-01-16", "lte": "2012-01-20"}, 0),
+        ({"lte": "2012-01-10"}, 1),
+        ({"gte": "2012-02-01"}, 0),
+    ],
+)
+def test_query_customers_with_filter_placed_orders_customer_order_stats(
+    placed_orders,
+    count,
+    query_customer_with_filter,
+    staff_api_client,
+    permission_manage_users,
+    customer_user,
+    channel_USD,
+    settings,
+):
+    # given
+    settings.CUSTOMER_ORDER_STATS_ENABLED = True
+    for date in ["2012-01-05", "2012-01-14", "2012-01-25"]:
+        with freeze_time(date):
+            Order.objects.create(user=customer_user, channel=channel_USD)
+    update_all_customer_order_stats()
+    variables = {"filter": {"placedOrders": placed_orders}}
+
+    # when
+    response = staff_api_client.post_graphql(
+        query_customer_with_filter, variables, permissions=[permission_manage_users]
+    )
+
+    # then
+    content = get_graphql_content(response)
+    users = content["data"]["customers"]["edges"]
+    assert len(users) == count
+
+
+@pytest.mark.parametrize("customer_order_stats_enabled", [True, False])
+@pytest.mark.parametrize(
+    "lifetime_spend, count",
+    [
+        ({"currency": "USD"}, 1),
+        ({"currency": "USD", "gte": 25, "lte": 40}, 1),
+        ({"currency": "USD", "gte": 35}, 0),
+        ({"currency": "PLN"}, 0),
+    ],
+)
+def test_query_customers_with_filter_lifetime_spend(
+    lifetime_spend,
+    count,
+    customer_order_stats_enabled,
+    query_customer_with_filter,
+    staff_api_client,
+    permission_manage_users,
+    customer_user,
+    channel_USD,
+    settings,
+):
+    # given
+    settings.CUSTOMER_ORDER_STATS_ENABLED = customer_order_stats_enabled
+    for status, amount in [
+        (OrderStatus.UNFULFILLED, 10),
+        (OrderStatus.FULFILLED, 20),
+        (OrderStatus.CANCELED, 100),
+        (OrderStatus.DRAFT, 100),
+    ]:
+        Order.objects.create(
+            user=customer_user,
+            channel=channel_USD,
+            status=status,
+            currency="USD",
+            total_gross_amount=amount,
+        )
+    update_all_customer_order_stats()
+    variables = {"filter": {"lifetimeSpend": lifetime_spend}}
+
+    # when
+    response = staff_api_client.post_graphql(
+        query_customer_with_filter, variables, permissions=[permission_manage_users]
+    )
+
+    # then
+    content = get_graphql_content(response)
+    users = content["data"]["customers"]["edges"]
+    assert len(users) == count
+
+
 def test_query_customers_with_filter_metadata(
     query_customer_with_filter,
     staff_api_client,
@@ -4770,6 +4903,39 @@ def test_query_customers_with_sort(
         assert users[order]["node"]["firstName"] == user_first_name
 
 
+@pytest.mark.parametrize("direction, result_order", [("ASC", [0, 1]), ("DESC", [1, 0])])
+def test_query_customers_with_sort_by_customer_order_stats(
+    direction,
+    result_order,
+    staff_api_client,
+    permission_manage_users,
+    channel_USD,
+    settings,
+):
+    # given
+    settings.CUSTOMER_ORDER_STATS_ENABLED = True
+    customers = User.objects.bulk_create(
+        [
+            User(first_name="John", email="john@example.com"),
+            User(first_name="Joe", email="joe@example.com"),
+        ]
+    )
+    Order.objects.create(user=customers[1], channel=channel_USD)
+    update_all_customer_order_stats()
+    variables = {"sort_by": {"field": "ORDER_COUNT", "direction": direction}}
+    staff_api_client.user.user_permissions.add(permission_manage_users)
+
+    # when
+    response = staff_api_client.post_graphql(QUERY_CUSTOMERS_WITH_SORT, variables)
+
+    # then
+    content = get_graphql_content(response)
+    users = content["data"]["customers"]["edges"]
+    assert [user["node"]["firstName"] for user in users] == [
+        customers[index].first_name for index in result_order
+    ]
+
+
 @pytest.mark.parametrize(
     "customer_filter, count",
     [
@@ -5,6 +5,7 @@ import requests
 from django.core.exceptions import ValidationError
 
 from ...app import models
+from ...app.cache import invalidate_app_cache
 from ...app.error_codes import AppErrorCode
 from ...app.installation_utils import REQUEST_TIMEOUT
 from ...app.manifest_validations import clean_manifest_data, clean_manifest_url
@@ -100,6 +101,12 @@ class AppTokenDelete(ModelDeleteMutation):
             code = AppErrorCode.OUT_OF_SCOPE_APP.value
             raise ValidationError({"id": ValidationError(msg, code=code)})
 
+    @classmethod
+    def perform_mutation(cls, _root, info, **data):
+        response = super().perform_mutation(_root, info, **data)
+        invalidate_app_cache(auth_tokens=[response.app_token.auth_token])
+        return response
+
 
 class AppTokenVerify(BaseMutation):
     valid = graphene.Boolean(
@@ -201,6 +208,10 @@ class AppUpdate(ModelMutation):
             ensure_can_manage_permissions(requestor, permissions)
         return cleaned_input
 
+    @classmethod
+    def post_save_action(cls, info, instance, cleaned_input):
+        invalidate_app_cache(instance.pk)
+
 
 class AppDelete(ModelDeleteMutation):
     class Arguments:
@@ -224,6 +235,12 @@ class AppDelete(ModelDeleteMutation):
             code = AppErrorCode.OUT_OF_SCOPE_APP.value
             raise ValidationError({"id": ValidationError(msg, code=code)})
 
+    @classmethod
+    def perform_mutation(cls, _root, info, **data):
+        response = super().perform_mutation(_root, info, **data)
+        invalidate_app_cache(response.app.pk)
+        return response
+
 
 class AppActivate(ModelMutation):
     class Arguments:
@@ -242,6 +259,7 @@ class AppActivate(ModelMutation):
         app = cls.get_instance(info, **data)
         app.is_active = True
         cls.save(info, app, cleaned_input=None)
+        invalidate_app_cache(app.pk)
         return cls.success_response(app)
 
 
@@ -262,6 +280,7 @@ class AppDeactivate(ModelMutation):
         app = cls.get_instance(info, **data)
         app.is_active = False
         cls.save(info, app, cleaned_input=None)
+        invalidate_app_cache(app.pk)
         return cls.success_response(app)
 
 
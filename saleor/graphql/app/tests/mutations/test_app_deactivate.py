@@ -1,6 +1,9 @@
 import graphene
+from django.core.cache import cache
 
+from .....app.cache import get_active_app_by_token
 from .....app.models import App
+from .....tests.utils import flush_post_commit_hooks
 from ....tests.utils import assert_no_permission, get_graphql_content
 
 APP_DEACTIVATE_MUTATION = """
@@ -42,6 +45,29 @@ def test_deactivate_app(app, staff_api_client, permission_manage_apps):
     assert not app.is_active
 
 
+def test_deactivate_app_invalidates_app_auth_cache(
+    app, staff_api_client, permission_manage_apps, settings
+):
+    # given
+    settings.APP_AUTH_CACHE_ENABLED = True
+    cache.clear()
+    token = app.tokens.get()
+    assert get_active_app_by_token(token.auth_token) == app
+    variables = {"id": graphene.Node.to_global_id("App", app.id)}
+
+    # when
+    response = staff_api_client.post_graphql(
+        APP_DEACTIVATE_MUTATION,
+        variables=variables,
+        permissions=(permission_manage_apps,),
+    )
+    flush_post_commit_hooks()
+
+    # then
+    get_graphql_content(response)
+    assert get_active_app_by_token(token.auth_token) is None
+
+
 def test_deactivate_app_by_app(app, app_api_client, permission_manage_apps):
     # given
     app = App.objects.create(name="Sample app objects", is_active=True)
@@ -1,5 +1,7 @@
 import graphene
 import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
 from ....attribute import AttributeInputType
 from ....page.error_codes import PageErrorCode
@@ -1272,3 +1274,44 @@ def test_clean_file_url_in_attribute_assignment_mixin(file_url, expected_value):
     result = AttributeAssignmentMixin._clean_file_url(file_url)
 
     assert result == expected_value
+
+
+def test_save_many_in_attribute_assignment_mixin(
+    product_with_two_variants, size_attribute
+):
+    # given
+    first_variant, second_variant = product_with_two_variants.variants.select_related(
+        "product"
+    )
+    global_id = graphene.Node.to_global_id("Attribute", size_attribute.pk)
+
+    def _get_input(*values):
+        attr_values = AttrValuesInput(
+            global_id=global_id, values=list(values), references=[]
+        )
+        return [(size_attribute, attr_values)]
+
+    # when
+    with CaptureQueriesContext(connection) as single_instance_queries:
+        AttributeAssignmentMixin.save_many([(first_variant, _get_input("Medium"))])
+    with CaptureQueriesContext(connection) as many_instances_queries:
+        AttributeAssignmentMixin.save_many(
+            [
+                (first_variant, _get_input("Large", "Big")),
+                (second_variant, _get_input("Huge", "Large")),
+            ]
+        )
+
+    # then
+    first_assignment = first_variant.attributes.get()
+    assert list(
+        first_assignment.variantvalueassignment.values_list("value__slug", flat=True)
+    ) == ["large", "big"]
+    second_assignment = second_variant.attributes.get()
+    assert list(
+        second_assignment.variantvalueassignment.values_list("value__slug", flat=True)
+    ) == ["huge", "large"]
+    assert size_attribute.values.filter(slug="large").count() == 1
+    assert len(many_instances_queries.captured_queries) == len(
+        single_instance_queries.captured_queries
+    )
@@ -16,7 +16,10 @@ from graphql.error import GraphQLError
 
 from ...attribute import AttributeEntityType, AttributeInputType, AttributeType
 from ...attribute import models as attribute_models
-from ...attribute.utils import associate_attribute_values_to_instance
+from ...attribute.utils import (
+    associate_attribute_values_to_instances,
+    get_or_create_attribute_values,
+)
 from ...core.utils import generate_unique_slug
 from ...core.utils.editorjs import clean_editor_js
 from ...page import models as page_models
@@ -78,6 +81,14 @@ class AttributeAssignmentMixin:
         AttributeEntityType.PRODUCT: product_models.Product,
     }
 
+    # Values of these input types are unique per instance and updated from the input.
+    UPDATED_VALUE_FIELDS_MAPPING = {
+        AttributeInputType.NUMERIC: ("name",),
+        AttributeInputType.RICH_TEXT: ("name", "rich_text"),
+        AttributeInputType.DATE: ("name", "date_time"),
+        AttributeInputType.DATE_TIME: ("name", "date_time"),
+    }
+
     @classmethod
     def _resolve_attribute_nodes(
         cls,
@@ -143,15 +154,13 @@ class AttributeAssignmentMixin:
     def _pre_save_values(
         cls, attribute: attribute_models.Attribute, attr_values: AttrValuesInput
     ):
-        """Lazy-retrieve or create the database objects from the supplied raw values."""
-        get_or_create = attribute.values.get_or_create
-
+        """Prepare the values to retrieve or create from the supplied raw values."""
         return tuple(
-            get_or_create(
+            attribute_models.AttributeValue(
                 attribute=attribute,
                 slug=slugify(value, allow_unicode=True),
-                defaults={"name": value},
-            )[0]
+                name=value,
+            )
             for value in attr_values.values
         )
 
@@ -167,7 +176,7 @@ class AttributeAssignmentMixin:
         defaults = {
             "name": attr_values.values[0],
         }
-        return cls._update_or_create_value(instance, attribute, defaults)
+        return cls._prepare_instance_value(instance, attribute, defaults)
 
     @classmethod
     def _pre_save_rich_text_values(
@@ -182,7 +191,7 @@ class AttributeAssignmentMixin:
                 clean_editor_js(attr_values.rich_text, to_string=True), 200
             ),
         }
-        return cls._update_or_create_value(instance, attribute, defaults)
+        return cls._prepare_instance_value(instance, attribute, defaults)
 
     @classmethod
     def _pre_save_boolean_values(
@@ -191,15 +200,12 @@ class AttributeAssignmentMixin:
         attribute: attribute_models.Attribute,
         attr_values: AttrValuesInput,
     ):
-        get_or_create = attribute.values.get_or_create
         boolean = bool(attr_values.boolean)
-        value, _ = get_or_create(
+        value = attribute_models.AttributeValue(
             attribute=attribute,
             slug=slugify(f"{attribute.id}_{boolean}", allow_unicode=True),
-            defaults={
-                "name": f"{attribute.name}: {'Yes' if boolean else 'No'}",
-                "boolean": boolean,
-            },
+            name=f"{attribute.name}: {'Yes' if boolean else 'No'}",
+            boolean=boolean,
         )
         return (value,)
 
@@ -223,22 +229,20 @@ class AttributeAssignmentMixin:
         )
         defaults = {"name": value, "date_time": date_time}
         return (
-            cls._update_or_create_value(instance, attribute, defaults) if value else ()
+            cls._prepare_instance_value(instance, attribute, defaults) if value else ()
         )
 
     @classmethod
-    def _update_or_create_value(
+    def _prepare_instance_value(
         cls,
         instance: T_INSTANCE,
         attribute: attribute_models.Attribute,
         value_defaults: dict,
     ):
-        update_or_create = attribute.values.update_or_create
+        """Prepare the value to update or create, unique for the instance."""
         slug = slugify(f"{instance.id}_{attribute.id}", allow_unicode=True)
-        value, _created = update_or_create(
-            attribute=attribute,
-            slug=slug,
-            defaults=value_defaults,
+        value = attribute_models.AttributeValue(
+            attribute=attribute, slug=slug, **value_defaults
         )
         return (value,)
 
@@ -249,23 +253,22 @@ class AttributeAssignmentMixin:
         attribute: attribute_models.Attribute,
         attr_values: AttrValuesInput,
     ):
-        """Lazy-retrieve or create the database objects from the supplied raw values.
+        """Prepare the values to retrieve or create from the supplied references.
 
         Slug value is generated based on instance and reference entity id.
         """
         field_name = cls.REFERENCE_VALUE_NAME_MAPPING[
             attribute.entity_type  # type: ignore
         ]
-        get_or_create = attribute.values.get_or_create
         return tuple(
-            get_or_create(
+            attribute_models.AttributeValue(
                 attribute=attribute,
                 slug=slugify(
                     f"{instance.id}_{reference.id}",  # type: ignore
                     allow_unicode=True,
                 ),
-                defaults={"name": getattr(reference, field_name)},
-            )[0]
+                name=getattr(reference, field_name),
+            )
             for reference in attr_values.references
         )
 
@@ -474,6 +477,18 @@ class AttributeAssignmentMixin:
         :param instance: the product or variant to associate the attribute against.
         :param cleaned_input: the cleaned user input (refer to clean_attributes)
         """
+        cls.save_many([(instance, cleaned_input)])
+
+    @classmethod
+    def save_many(cls, instances_input: Iterable[Tuple[T_INSTANCE, T_INPUT_MAP]]):
+        """Save the cleaned input of many instances of the same type at once.
+
+        Values of all instances are retrieved or created in bulk, and assigned to
+        the instances in bulk, so the number of queries doesn't grow with the number
+        of instances, attributes and values.
+
+        Note: this should always be ran inside a transaction.
+        """
         pre_save_methods_mapping = {
             AttributeInputType.FILE: cls._pre_save_file_value,
             AttributeInputType.REFERENCE: cls._pre_save_reference_values,
@@ -483,24 +498,50 @@ class AttributeAssignmentMixin:
             AttributeInputType.DATE: cls._pre_save_date_time_values,
             AttributeInputType.DATE_TIME: cls._pre_save_date_time_values,
         }
-        clean_assignment = []
-        for attribute, attr_values in cleaned_input:
-            if (input_type := attribute.input_type) in pre_save_methods_mapping:
-                pre_save_func = pre_save_methods_mapping[input_type]
-                attribute_values = pre_save_func(instance, attribute, attr_values)
-            else:
-                attribute_values = cls._pre_save_values(attribute, attr_values)
-
-            associate_attribute_values_to_instance(
-                instance, attribute, *attribute_values
+        instances_values = []
+        # unsaved values grouped by the fields updated when they already exist
+        new_values: Dict[tuple, List[attribute_models.AttributeValue]] = defaultdict(
+            list
+        )
+        clean_assignment = defaultdict(list)
+        for instance, cleaned_input in instances_input:
+            for attribute, attr_values in cleaned_input:
+                if (input_type := attribute.input_type) in pre_save_methods_mapping:
+                    pre_save_func = pre_save_methods_mapping[input_type]
+                    attribute_values = pre_save_func(instance, attribute, attr_values)
+                else:
+                    attribute_values = cls._pre_save_values(attribute, attr_values)
+
+                if not attribute_values:
+                    clean_assignment[instance].append(attribute.pk)
+                    continue
+                update_fields = cls.UPDATED_VALUE_FIELDS_MAPPING.get(input_type, ())
+                new_values[update_fields].extend(
+                    value for value in attribute_values if value.pk is None
+                )
+                instances_values.append((instance, attribute, attribute_values))
+
+        saved_values = {}
+        for update_fields, values in new_values.items():
+            saved_values.update(get_or_create_attribute_values(values, update_fields))
+        associate_attribute_values_to_instances(
+            (
+                instance,
+                attribute,
+                [
+                    saved_values[(value.attribute_id, value.slug)]
+                    if value.pk is None
+                    else value
+                    for value in values
+                ],
             )
-            if not attribute_values:
-                clean_assignment.append(attribute.pk)
+            for instance, attribute, values in instances_values
+        )
 
         # drop attribute assignment model when values are unassigned from instance
-        if clean_assignment:
+        for instance, attribute_ids in clean_assignment.items():
             instance.attributes.filter(
-                assignment__attribute_id__in=clean_assignment
+                assignment__attribute_id__in=attribute_ids
             ).delete()
 
 
@@ -10,6 +10,7 @@ from ...checkout.models import Checkout
 from ...core.permissions import ChannelPermissions
 from ...core.tracing import traced_atomic_transaction
 from ...order.models import Order
+from ...shipping.rules import invalidate_shipping_rules_index
 from ...shipping.tasks import drop_invalid_shipping_methods_relations_for_given_channels
 from ..account.enums import CountryCodeEnum
 from ..core.descriptions import ADDED_IN_31
@@ -154,6 +155,8 @@ class ChannelUpdate(ModelMutation):
             drop_invalid_shipping_methods_relations_for_given_channels.delay(
                 shipping_method_ids, [instance.id]
             )
+        if add_shipping_zones or remove_shipping_zones:
+            invalidate_shipping_rules_index()
 
 
 class ChannelDeleteInput(graphene.InputObjectType):
@@ -0,0 +1,4 @@
+from ...checkout import CheckoutCompleteRequestStatus
+from ..core.enums import to_enum
+
+CheckoutCompleteRequestStatusEnum = to_enum(CheckoutCompleteRequestStatus)
@@ -11,7 +11,11 @@ from django.db.models import Q
 from graphql.error import GraphQLError
 
 from ...checkout import AddressType, models
-from ...checkout.complete_checkout import complete_checkout
+from ...checkout.complete_checkout import (
+    complete_checkout,
+    validate_checkout_for_completion,
+)
+from ...checkout.complete_checkout_queue import enqueue_checkout_complete
 from ...checkout.error_codes import CheckoutErrorCode
 from ...checkout.fetch import (
     CheckoutLineInfo,
@@ -36,7 +40,11 @@ from ...checkout.utils import (
 from ...core import analytics
 from ...core.exceptions import InsufficientStock, PermissionDenied
 from ...core.permissions import AccountPermissions
-from ...core.tracing import traced_atomic_transaction
+from ...core.tracing import (
+    record_latency_breakdown,
+    traced_atomic_transaction,
+    traced_phase,
+)
 from ...core.transactions import transaction_with_commit_on_errors
 from ...order import models as order_models
 from ...product import models as product_models
@@ -71,7 +79,7 @@ from ..product.types import ProductVariant
 from ..shipping.types import ShippingMethod
 from ..utils import get_user_or_app_from_context, resolve_global_ids_to_primary_keys
 from ..warehouse.types import Warehouse
-from .types import Checkout, CheckoutLine
+from .types import Checkout, CheckoutCompleteRequest, CheckoutLine
 
 ERROR_DOES_NOT_SHIP = "This checkout doesn't need shipping"
 
@@ -1640,6 +1648,14 @@ class CheckoutComplete(BaseMutation):
             "Confirmation data used to process additional authorization steps."
         ),
     )
+    checkout_complete_request = graphene.Field(
+        CheckoutCompleteRequest,
+        description=(
+            f"{ADDED_IN_31} The checkout queued to be completed, returned instead "
+            "of the order when orders are placed asynchronously. Poll "
+            "`checkoutCompleteRequest` query for the order."
+        ),
+    )
 
     class Arguments:
         checkout_id = graphene.ID(
@@ -1686,6 +1702,14 @@ class CheckoutComplete(BaseMutation):
     def perform_mutation(
         cls, _root, info, store_source, checkout_id=None, token=None, **data
     ):
+        with record_latency_breakdown("checkout_complete") as breakdown:
+            info.context.latency_breakdowns.append(breakdown)
+            return cls.complete(
+                info, store_source, checkout_id=checkout_id, token=token, **data
+            )
+
+    @classmethod
+    def complete(cls, info, store_source, checkout_id=None, token=None, **data):
         # DEPRECATED
         validate_one_of_args_is_in_mutation(
             CheckoutErrorCode, "checkout_id", checkout_id, "token", token
@@ -1730,37 +1754,10 @@ class CheckoutComplete(BaseMutation):
                     )
                 raise e
 
-            validate_checkout_email(checkout)
-
             manager = info.context.plugins
-            lines, unavailable_variant_pks = fetch_checkout_lines(checkout)
-            if unavailable_variant_pks:
-                not_available_variants_ids = {
-                    graphene.Node.to_global_id("ProductVariant", pk)
-                    for pk in unavailable_variant_pks
-                }
-                raise ValidationError(
-                    {
-                        "lines": ValidationError(
-                            "Some of the checkout lines variants are unavailable.",
-                            code=CheckoutErrorCode.UNAVAILABLE_VARIANT_IN_CHANNEL.value,
-                            params={"variants": not_available_variants_ids},
-                        )
-                    }
-                )
-            if not lines:
-                raise ValidationError(
-                    {
-                        "lines": ValidationError(
-                            "Cannot complete checkout without lines.",
-                            code=CheckoutErrorCode.NO_LINES.value,
-                        )
-                    }
-                )
-            checkout_info = fetch_checkout_info(
-                checkout, lines, info.context.discounts, manager
-            )
-
+            with traced_phase("checkout_complete.fetch_checkout_lines"):
+                lines, unavailable_variant_pks = fetch_checkout_lines(checkout)
+            validate_checkout_for_completion(checkout, lines, unavailable_variant_pks)
             requestor = get_user_or_app_from_context(info.context)
             if requestor.has_perm(AccountPermissions.IMPERSONATE_USER):
                 # Allow impersonating user and process a checkout by using user details
@@ -1769,6 +1766,28 @@ class CheckoutComplete(BaseMutation):
             else:
                 customer = info.context.user
 
+            if settings.CHECKOUT_COMPLETE_QUEUE_ENABLED:
+                # The order is created by a worker; clients poll the request for it.
+                checkout_complete_request = enqueue_checkout_complete(
+                    checkout,
+                    user=customer,
+                    app=info.context.app,
+                    payment_data=data.get("payment_data", {}),
+                    store_source=store_source,
+                    redirect_url=data.get("redirect_url"),
+                    tracking_code=tracking_code,
+                )
+                return CheckoutComplete(
+                    confirmation_needed=False,
+                    confirmation_data={},
+                    checkout_complete_request=checkout_complete_request,
+                )
+
+            with traced_phase("checkout_complete.fetch_checkout_info"):
+                checkout_info = fetch_checkout_info(
+                    checkout, lines, info.context.discounts, manager
+                )
+
             order, action_required, action_data = complete_checkout(
                 manager=manager,
                 checkout_info=checkout_info,
@@ -16,6 +16,10 @@ def resolve_checkouts(channel_slug):
     return queryset
 
 
+def resolve_checkout_complete_request(token):
+    return models.CheckoutCompleteRequest.objects.filter(checkout_token=token).first()
+
+
 @traced_resolver
 def resolve_checkout(info, token):
     checkout = models.Checkout.objects.filter(token=token).first()
@@ -1,7 +1,11 @@
 import graphene
 
 from ...core.permissions import CheckoutPermissions
-from ..core.connection import create_connection_slice, filter_connection_queryset
+from ..core.connection import (
+    CappedCount,
+    create_connection_slice,
+    filter_connection_queryset,
+)
 from ..core.descriptions import ADDED_IN_31, DEPRECATED_IN_3X_FIELD
 from ..core.fields import ConnectionField, FilterConnectionField
 from ..core.scalars import UUID
@@ -26,10 +30,16 @@ from .mutations import (
     CheckoutShippingAddressUpdate,
     CheckoutShippingMethodUpdate,
 )
-from .resolvers import resolve_checkout, resolve_checkout_lines, resolve_checkouts
+from .resolvers import (
+    resolve_checkout,
+    resolve_checkout_complete_request,
+    resolve_checkout_lines,
+    resolve_checkouts,
+)
 from .sorters import CheckoutSortingInput
 from .types import (
     Checkout,
+    CheckoutCompleteRequest,
     CheckoutCountableConnection,
     CheckoutLineCountableConnection,
 )
@@ -51,26 +61,47 @@ class CheckoutQueries(graphene.ObjectType):
         channel=graphene.String(
             description="Slug of a channel for which the data should be returned."
         ),
-        description="List of checkouts.",
+        description=(
+            "List of checkouts. The total count of checkouts is capped for large "
+            "lists."
+        ),
     )
     checkout_lines = ConnectionField(
-        CheckoutLineCountableConnection, description="List of checkout lines."
+        CheckoutLineCountableConnection,
+        description=(
+            "List of checkout lines. The total count of lines is capped for large "
+            "lists."
+        ),
+    )
+    checkout_complete_request = graphene.Field(
+        CheckoutCompleteRequest,
+        description=(
+            f"{ADDED_IN_31} Look up a checkout queued to be completed by its token."
+        ),
+        token=graphene.Argument(
+            UUID, description="The checkout's token.", required=True
+        ),
     )
 
     def resolve_checkout(self, info, token):
         return resolve_checkout(info, token)
 
+    def resolve_checkout_complete_request(self, _info, token):
+        return resolve_checkout_complete_request(token)
+
     @permission_required(CheckoutPermissions.MANAGE_CHECKOUTS)
     def resolve_checkouts(self, info, *_args, channel=None, **kwargs):
         qs = resolve_checkouts(channel)
         qs = filter_connection_queryset(qs, kwargs)
-        return create_connection_slice(qs, info, kwargs, CheckoutCountableConnection)
+        return create_connection_slice(
+            qs, info, kwargs, CheckoutCountableConnection, total_count=CappedCount()
+        )
 
     @permission_required(CheckoutPermissions.MANAGE_CHECKOUTS)
     def resolve_checkout_lines(self, info, *_args, **kwargs):
         qs = resolve_checkout_lines()
         return create_connection_slice(
-            qs, info, kwargs, CheckoutLineCountableConnection
+            qs, info, kwargs, CheckoutLineCountableConnection, total_count=CappedCount()
         )
 
 
@@ -1,3 +1,4 @@
+import json
 from decimal import Decimal
 from unittest.mock import patch
 
@@ -10,7 +11,12 @@ from .....checkout.fetch import fetch_checkout_info, fetch_checkout_lines
 from .....checkout.models import Checkout
 from .....checkout.utils import add_variants_to_checkout, set_external_shipping_id
 from .....plugins.manager import get_plugins_manager
+from .....plugins.webhook.tasks import WebhookResponse
 from .....product.models import ProductVariant, ProductVariantChannelListing
+from .....shipping import PostalCodeRuleInclusionType
+from .....shipping.models import ShippingMethodPostalCodeRule
+from .....shipping.rules import invalidate_shipping_rules_index
+from .....tests.utils import flush_post_commit_hooks
 from .....warehouse.models import Stock
 from ....tests.utils import get_graphql_content
 
@@ -761,7 +767,7 @@ MUTATION_CHECKOUT_LINES_ADD = (
 
 @pytest.mark.django_db
 @pytest.mark.count_queries(autouse=False)
-@patch("saleor.plugins.webhook.tasks.send_webhook_request_sync")
+@patch("saleor.plugins.webhook.tasks._send_webhook_request_sync")
 def test_add_checkout_lines(
     mock_send_request,
     api_client,
@@ -784,7 +790,10 @@ def test_add_checkout_lines(
             "maximum_delivery_days": "7",
         }
     ]
-    mock_send_request.return_value = mock_json_response
+    mock_send_request.return_value = (
+        WebhookResponse(content=json.dumps(mock_json_response)),
+        mock_json_response,
+    )
 
     variables = {
         "checkoutId": Node.to_global_id("Checkout", checkout_with_single_item.pk),
@@ -834,7 +843,7 @@ def test_add_checkout_lines(
 
 @pytest.mark.django_db
 @pytest.mark.count_queries(autouse=False)
-@patch("saleor.plugins.webhook.tasks.send_webhook_request_sync")
+@patch("saleor.plugins.webhook.tasks._send_webhook_request_sync")
 def test_add_checkout_lines_with_external_shipping(
     mock_send_request,
     api_client,
@@ -859,7 +868,10 @@ def test_add_checkout_lines_with_external_shipping(
             "maximum_delivery_days": "7",
         }
     ]
-    mock_send_request.return_value = mock_json_response
+    mock_send_request.return_value = (
+        WebhookResponse(content=json.dumps(mock_json_response)),
+        mock_json_response,
+    )
 
     external_shipping_method_id = Node.to_global_id(
         "app", f"{shipping_app.id}:{response_method_id}"
@@ -1019,6 +1031,64 @@ def test_checkout_shipping_address_update(
     assert not response["data"]["checkoutShippingAddressUpdate"]["errors"]
 
 
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+def test_checkout_shipping_address_update_with_shipping_rules_index(
+    api_client,
+    graphql_address_data,
+    checkout_with_variants,
+    shipping_zone,
+    settings,
+    count_queries,
+):
+    settings.SHIPPING_RULES_INDEX_ENABLED = True
+    shipping_method = shipping_zone.shipping_methods.get()
+    ShippingMethodPostalCodeRule.objects.bulk_create(
+        [
+            ShippingMethodPostalCodeRule(
+                shipping_method=shipping_method,
+                start=f"{i:02d}-000",
+                end=f"{i:02d}-{j:03d}",
+                inclusion_type=PostalCodeRuleInclusionType.EXCLUDE,
+            )
+            for i in range(100)
+            if i != 53
+            for j in range(0, 1000, 20)
+        ]
+    )
+    invalidate_shipping_rules_index()
+    flush_post_commit_hooks()
+
+    query = (
+        FRAGMENT_CHECKOUT
+        + """
+            mutation UpdateCheckoutShippingAddress(
+              $token: UUID, $shippingAddress: AddressInput!
+            ) {
+              checkoutShippingAddressUpdate(
+                token: $token, shippingAddress: $shippingAddress
+              ) {
+                errors {
+                  field
+                  message
+                }
+                checkout {
+                  ...Checkout
+                }
+              }
+            }
+        """
+    )
+    variables = {
+        "token": checkout_with_variants.pk,
+        "shippingAddress": graphql_address_data,
+    }
+    response = get_graphql_content(api_client.post_graphql(query, variables))
+    data = response["data"]["checkoutShippingAddressUpdate"]
+    assert not data["errors"]
+    assert data["checkout"]["availableShippingMethods"]
+
+
 @pytest.mark.django_db
 @pytest.mark.count_queries(autouse=False)
 def test_checkout_email_update(api_client, checkout_with_variants, count_queries):
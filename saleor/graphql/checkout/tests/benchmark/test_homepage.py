@@ -1,8 +1,10 @@
+import json
 from unittest.mock import patch
 
 import pytest
 
 from .....checkout.utils import set_external_shipping_id
+from .....plugins.webhook.tasks import WebhookResponse
 from ....tests.utils import get_graphql_content
 
 
@@ -144,7 +146,7 @@ def test_user_checkout_details(user_api_client, customer_checkout, count_queries
     get_graphql_content(user_api_client.post_graphql(query))
 
 
-@patch("saleor.plugins.webhook.tasks.send_webhook_request_sync")
+@patch("saleor.plugins.webhook.tasks._send_webhook_request_sync")
 def test_user_checkout_details_with_external_shipping_method(
     mock_send_request,
     user_api_client,
@@ -168,7 +170,10 @@ def test_user_checkout_details_with_external_shipping_method(
     checkout.shipping_method = None
     set_external_shipping_id(checkout, external_id)
     checkout.save()
-    mock_send_request.return_value = mock_json_response
+    mock_send_request.return_value = (
+        WebhookResponse(content=json.dumps(mock_json_response)),
+        mock_json_response,
+    )
     query = """
         query {
           me {
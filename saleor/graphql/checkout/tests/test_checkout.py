@@ -1,4 +1,5 @@
 import datetime
+import json
 import uuid
 import warnings
 from decimal import Decimal
@@ -41,6 +42,7 @@ from ....payment.interface import GatewayResponse
 from ....plugins.base_plugin import ExcludedShippingMethod
 from ....plugins.manager import get_plugins_manager
 from ....plugins.tests.sample_plugins import ActiveDummyPaymentGateway
+from ....plugins.webhook.tasks import WebhookResponse
 from ....product.models import ProductChannelListing, ProductVariant
 from ....shipping import models as shipping_models
 from ....shipping.models import ShippingMethodTranslation
@@ -2023,9 +2025,9 @@ def test_checkout_available_shipping_methods_excluded_postal_codes(
     assert data["availableShippingMethods"] == []
 
 
-@mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_sync")
+@mock.patch("saleor.plugins.webhook.tasks._send_webhook_request_sync")
 def test_checkout_available_shipping_methods_with_price_displayed(
-    send_webhook_request_sync,
+    mock_send_request,
     monkeypatch,
     api_client,
     checkout_with_item,
@@ -2034,6 +2036,7 @@ def test_checkout_available_shipping_methods_with_price_displayed(
     site_settings,
     shipping_app,
 ):
+    mock_send_request.return_value = (WebhookResponse(content="[]"), [])
     shipping_method = shipping_zone.shipping_methods.first()
     listing = shipping_zone.shipping_methods.first().channel_listings.first()
     expected_shipping_price = Money(10, "USD")
@@ -3561,7 +3564,7 @@ def test_checkout_shipping_method_update(
         assert checkout.last_change == previous_last_change
 
 
-@mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_sync")
+@mock.patch("saleor.plugins.webhook.tasks._send_webhook_request_sync")
 def test_checkout_shipping_method_update_external_shipping_method(
     mock_send_request,
     staff_api_client,
@@ -3582,7 +3585,10 @@ def test_checkout_shipping_method_update_external_shipping_method(
             "maximum_delivery_days": "7",
         }
     ]
-    mock_send_request.return_value = mock_json_response
+    mock_send_request.return_value = (
+        WebhookResponse(content=json.dumps(mock_json_response)),
+        mock_json_response,
+    )
 
     checkout = checkout_with_item
     checkout.shipping_address = address
@@ -3605,7 +3611,7 @@ def test_checkout_shipping_method_update_external_shipping_method(
     assert PRIVATE_META_APP_SHIPPING_ID in checkout.private_metadata
 
 
-@mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_sync")
+@mock.patch("saleor.plugins.webhook.tasks._send_webhook_request_sync")
 def test_checkout_shipping_method_update_external_shipping_method_with_tax_plugin(
     mock_send_request,
     staff_api_client,
@@ -3629,7 +3635,10 @@ def test_checkout_shipping_method_update_external_shipping_method_with_tax_plugi
             "maximum_delivery_days": "7",
         }
     ]
-    mock_send_request.return_value = mock_json_response
+    mock_send_request.return_value = (
+        WebhookResponse(content=json.dumps(mock_json_response)),
+        mock_json_response,
+    )
 
     checkout = checkout_with_item
     checkout.shipping_address = address
@@ -3720,7 +3729,7 @@ def test_checkout_delivery_method_update(
 
 
 @pytest.mark.parametrize("is_valid_delivery_method", (True, False))
-@mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_sync")
+@mock.patch("saleor.plugins.webhook.tasks._send_webhook_request_sync")
 @patch("saleor.graphql.checkout.mutations.clean_delivery_method")
 def test_checkout_delivery_method_update_external_shipping(
     mock_clean_delivery,
@@ -3747,7 +3756,10 @@ def test_checkout_delivery_method_update_external_shipping(
             "maximum_delivery_days": "7",
         }
     ]
-    mock_send_request.return_value = mock_json_response
+    mock_send_request.return_value = (
+        WebhookResponse(content=json.dumps(mock_json_response)),
+        mock_json_response,
+    )
 
     method_id = graphene.Node.to_global_id(
         "app", f"{shipping_app.id}:{response_method_id}"
@@ -10,10 +10,10 @@ from django.db.models.aggregates import Sum
 from django.utils import timezone
 from prices import Money
 
-from ....checkout import calculations
+from ....checkout import CheckoutCompleteRequestStatus, calculations
 from ....checkout.error_codes import CheckoutErrorCode
 from ....checkout.fetch import fetch_checkout_info, fetch_checkout_lines
-from ....checkout.models import Checkout
+from ....checkout.models import Checkout, CheckoutCompleteRequest
 from ....core.exceptions import InsufficientStock, InsufficientStockData
 from ....core.taxes import TaxError, zero_money, zero_taxed_money
 from ....giftcard import GiftCardEvents
@@ -2482,3 +2482,187 @@ def test_checkout_complete_0_total_value_from_giftcard(
     assert not Checkout.objects.filter(
         pk=checkout.pk
     ).exists(), "Checkout should have been deleted"
+
+
+MUTATION_CHECKOUT_COMPLETE_QUEUED = """
+    mutation checkoutComplete($token: UUID) {
+        checkoutComplete(token: $token) {
+            order {
+                id
+            }
+            checkoutCompleteRequest {
+                token
+                status
+            }
+            errors {
+                field
+                code
+            }
+        }
+    }
+"""
+
+
+@patch("saleor.checkout.complete_checkout_queue.schedule_checkout_completion")
+def test_checkout_complete_queued(
+    schedule_mock, user_api_client, checkout_ready_to_complete, settings
+):
+    # given
+    settings.CHECKOUT_COMPLETE_QUEUE_ENABLED = True
+    checkout = checkout_ready_to_complete
+    orders_count = Order.objects.count()
+    variables = {"token": checkout.token}
+
+    # when
+    response = user_api_client.post_graphql(
+        MUTATION_CHECKOUT_COMPLETE_QUEUED, variables
+    )
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["checkoutComplete"]
+    assert not data["errors"]
+    assert data["order"] is None
+    assert data["checkoutCompleteRequest"] == {
+        "token": str(checkout.token),
+        "status": CheckoutCompleteRequestStatus.PENDING.upper(),
+    }
+    assert Order.objects.count() == orders_count
+    assert Checkout.objects.filter(pk=checkout.pk).exists()
+    flush_post_commit_hooks()
+    schedule_mock.assert_called_once_with(checkout.channel_id)
+
+
+def test_checkout_complete_queued_without_lines(
+    user_api_client, checkout_ready_to_complete, settings
+):
+    # given
+    settings.CHECKOUT_COMPLETE_QUEUE_ENABLED = True
+    checkout = checkout_ready_to_complete
+    checkout.lines.all().delete()
+    variables = {"token": checkout.token}
+
+    # when
+    response = user_api_client.post_graphql(
+        MUTATION_CHECKOUT_COMPLETE_QUEUED, variables
+    )
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["checkoutComplete"]
+    assert data["errors"] == [
+        {"field": "lines", "code": CheckoutErrorCode.NO_LINES.name}
+    ]
+    assert data["checkoutCompleteRequest"] is None
+    assert not CheckoutCompleteRequest.objects.exists()
+
+
+QUERY_CHECKOUT_COMPLETE_REQUEST = """
+    query checkoutCompleteRequest($token: UUID!) {
+        checkoutCompleteRequest(token: $token) {
+            status
+            order {
+                token
+            }
+            errors {
+                field
+                message
+                code
+            }
+        }
+    }
+"""
+
+
+def test_query_checkout_complete_request(api_client, order, channel_USD):
+    # given
+    token = uuid.uuid4()
+    CheckoutCompleteRequest.objects.create(
+        checkout_token=token,
+        channel=channel_USD,
+        status=CheckoutCompleteRequestStatus.COMPLETED,
+        order=order,
+    )
+
+    # when
+    response = api_client.post_graphql(
+        QUERY_CHECKOUT_COMPLETE_REQUEST, {"token": token}
+    )
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["checkoutCompleteRequest"]
+    assert data["status"] == "COMPLETED"
+    assert data["order"]["token"] == str(order.token)
+    assert data["errors"] == []
+
+
+def test_query_checkout_complete_request_failed(api_client, channel_USD):
+    # given
+    token = uuid.uuid4()
+    CheckoutCompleteRequest.objects.create(
+        checkout_token=token,
+        channel=channel_USD,
+        status=CheckoutCompleteRequestStatus.FAILED,
+        errors=[
+            {
+                "field": "payment",
+                "message": "Payment failed.",
+                "code": CheckoutErrorCode.PAYMENT_ERROR.value,
+                "params": {},
+            }
+        ],
+    )
+
+    # when
+    response = api_client.post_graphql(
+        QUERY_CHECKOUT_COMPLETE_REQUEST, {"token": token}
+    )
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["checkoutCompleteRequest"]
+    assert data["status"] == "FAILED"
+    assert data["order"] is None
+    assert data["errors"] == [
+        {
+            "field": "payment",
+            "message": "Payment failed.",
+            "code": CheckoutErrorCode.PAYMENT_ERROR.name,
+        }
+    ]
+
+
+def test_checkout_complete_latency_breakdown(
+    app_api_client, checkout_ready_to_complete, settings
+):
+    # given
+    settings.GRAPHQL_LATENCY_BREAKDOWN_ENABLED = True
+    variables = {"token": checkout_ready_to_complete.token}
+
+    # when
+    response = app_api_client.post_graphql(MUTATION_CHECKOUT_COMPLETE, variables)
+
+    # then
+    content = get_graphql_content(response)
+    (breakdown,) = content["extensions"]["latencyBreakdown"]
+    assert breakdown["name"] == "checkout_complete"
+    assert breakdown["queries"] > 0
+    phase_names = [phase["name"] for phase in breakdown["phases"]]
+    assert "checkout_complete.fetch_checkout_info" in phase_names
+    assert "checkout_complete.prepare_checkout" in phase_names
+
+
+def test_checkout_complete_latency_breakdown_not_returned_to_customers(
+    user_api_client, checkout_ready_to_complete, settings
+):
+    # given
+    settings.GRAPHQL_LATENCY_BREAKDOWN_ENABLED = True
+    variables = {"token": checkout_ready_to_complete.token}
+
+    # when
+    response = user_api_client.post_graphql(MUTATION_CHECKOUT_COMPLETE, variables)
+
+    # then
+    content = get_graphql_content(response)
+    assert "latencyBreakdown" not in content.get("extensions", {})
@@ -1,3 +1,4 @@
+import json
 import uuid
 from datetime import date, timedelta
 from decimal import Decimal
@@ -18,6 +19,7 @@ from ....checkout.utils import (
 from ....core.taxes import TaxedMoney
 from ....discount import DiscountInfo, VoucherType
 from ....plugins.manager import get_plugins_manager
+from ....plugins.webhook.tasks import WebhookResponse
 from ....warehouse.models import Stock
 from ...tests.utils import get_graphql_content
 from .test_checkout import MUTATION_CHECKOUT_SHIPPING_ADDRESS_UPDATE
@@ -284,7 +286,7 @@ def test_checkout_add_voucher_code_by_token(api_client, checkout_with_item, vouc
     assert data["checkout"]["voucherCode"] == voucher.code
 
 
-@mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_sync")
+@mock.patch("saleor.plugins.webhook.tasks._send_webhook_request_sync")
 def test_checkout_add_voucher_code_by_token_with_external_shipment(
     mock_send_request,
     api_client,
@@ -305,7 +307,10 @@ def test_checkout_add_voucher_code_by_token_with_external_shipment(
             "maximum_delivery_days": "7",
         }
     ]
-    mock_send_request.return_value = mock_json_response
+    mock_send_request.return_value = (
+        WebhookResponse(content=json.dumps(mock_json_response)),
+        mock_json_response,
+    )
 
     external_shipping_method_id = graphene.Node.to_global_id(
         "app", f"{shipping_app.id}:{response_method_id}"
@@ -1,7 +1,10 @@
+from collections import defaultdict
+
 import graphene
+from django.core.exceptions import NON_FIELD_ERRORS, ValidationError
 from promise import Promise
 
-from ...checkout import calculations, models
+from ...checkout import CheckoutCompleteRequestStatus, calculations, models
 from ...checkout.utils import get_valid_collection_points_for_checkout
 from ...core.exceptions import PermissionDenied
 from ...core.permissions import AccountPermissions
@@ -18,8 +21,10 @@ from ..channel.types import Channel
 from ..core.connection import CountableConnection
 from ..core.descriptions import ADDED_IN_31, DEPRECATED_IN_3X_FIELD
 from ..core.enums import LanguageCodeEnum
+from ..core.mutations import validation_error_to_error_type
 from ..core.scalars import UUID
 from ..core.types import ModelObjectType, Money, TaxedMoney
+from ..core.types.common import CheckoutError
 from ..core.utils import str_to_enum
 from ..discount.dataloaders import DiscountsByDateTimeLoader
 from ..giftcard.types import GiftCard
@@ -39,6 +44,7 @@ from .dataloaders import (
     CheckoutLinesByCheckoutTokenLoader,
     CheckoutLinesInfoByCheckoutTokenLoader,
 )
+from .enums import CheckoutCompleteRequestStatusEnum
 
 
 class GatewayConfigLine(graphene.ObjectType):
@@ -530,3 +536,65 @@ class Checkout(ModelObjectType):
 class CheckoutCountableConnection(CountableConnection):
     class Meta:
         node = Checkout
+
+
+class CheckoutCompleteRequest(ModelObjectType):
+    token = graphene.Field(
+        UUID, required=True, description="The token of the queued checkout."
+    )
+    status = graphene.Field(
+        CheckoutCompleteRequestStatusEnum,
+        required=True,
+        description="Status of completing the checkout.",
+    )
+    order = graphene.Field(
+        "saleor.graphql.order.types.Order",
+        description="Placed order; set when the checkout is completed.",
+    )
+    confirmation_needed = graphene.Boolean(
+        required=True,
+        description=(
+            "Set to true if payment needs to be confirmed before checkout is "
+            "complete. The checkout is completed with `checkoutComplete` again "
+            "after the confirmation."
+        ),
+    )
+    confirmation_data = graphene.JSONString(
+        description="Confirmation data used to process additional authorization steps."
+    )
+    errors = graphene.List(
+        graphene.NonNull(CheckoutError),
+        required=True,
+        description="Errors that prevented completing the checkout.",
+    )
+    created_at = graphene.DateTime(required=True)
+    updated_at = graphene.DateTime(required=True)
+
+    class Meta:
+        description = (
+            f"{ADDED_IN_31} Checkout queued to be completed by `checkoutComplete` "
+            "when orders are placed asynchronously."
+        )
+        model = models.CheckoutCompleteRequest
+
+    @staticmethod
+    def resolve_token(root: models.CheckoutCompleteRequest, _info):
+        return root.checkout_token
+
+    @staticmethod
+    def resolve_confirmation_needed(root: models.CheckoutCompleteRequest, _info):
+        return root.status == CheckoutCompleteRequestStatus.CONFIRMATION_NEEDED
+
+    @staticmethod
+    def resolve_errors(root: models.CheckoutCompleteRequest, _info):
+        # errors are stored by `serialize_validation_error` of the queue worker
+        error_dict = defaultdict(list)
+        for error in root.errors:
+            error_dict[error["field"] or NON_FIELD_ERRORS].append(
+                ValidationError(
+                    error["message"], code=error["code"], params=error["params"]
+                )
+            )
+        return validation_error_to_error_type(
+            ValidationError(dict(error_dict)), CheckoutError
+        )
@@ -2,10 +2,10 @@ from typing import Optional
 
 from django.contrib.auth import authenticate
 from django.contrib.auth.models import AnonymousUser
-from django.db.models import Exists, OuterRef
 from django.utils.functional import SimpleLazyObject
 
-from ..app.models import App, AppToken
+from ..app.cache import get_active_app_by_token
+from ..app.models import App
 from ..core.auth import get_token_from_request
 from .api import API_PATH
 
@@ -13,14 +13,13 @@ from .api import API_PATH
 def get_context_value(request):
     set_app_on_context(request)
     set_auth_on_context(request)
+    # timings recorded by mutations, returned in extensions to staff and apps
+    request.latency_breakdowns = []
     return request
 
 
 def get_app(auth_token) -> Optional[App]:
-    tokens = AppToken.objects.filter(auth_token=auth_token).values("pk")
-    return App.objects.filter(
-        Exists(tokens.filter(app_id=OuterRef("pk"))), is_active=True
-    ).first()
+    return get_active_app_by_token(auth_token)
 
 
 def set_app_on_context(request):
@@ -1,9 +1,13 @@
+import hashlib
 import json
 from decimal import Decimal
 from typing import Any, Dict, Iterable, List, Optional, Tuple, Union, cast
 
 import graphene
 from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import EmptyResultSet
+from django.db import connections
 from django.db.models import Model as DjangoModel
 from django.db.models import Q, QuerySet
 from graphene.relay import Connection
@@ -162,6 +166,111 @@ def _get_page_info(matching_records, cursor, first, last):
     return page_info
 
 
+class TotalCount:
+    """Strategy of counting all items of a connection for the `totalCount` field."""
+
+    def __call__(self, qs: QuerySet) -> int:
+        raise NotImplementedError()
+
+
+class ExactCount(TotalCount):
+    def __call__(self, qs):
+        return qs.count()
+
+
+class CachedCount(TotalCount):
+    """Count items exactly and reuse the count for a short period.
+
+    The cache key is built from the SQL of the queryset, so the count is stored
+    separately for every filter, channel and visibility scope of the requestor.
+    """
+
+    def __init__(self, timeout: Optional[int] = None):
+        self.timeout = timeout
+
+    def __call__(self, qs):
+        try:
+            sql, params = qs.order_by().query.sql_with_params()
+        except EmptyResultSet:
+            return 0
+        query_hash = hashlib.sha256(f"{qs.db}:{sql}:{params}".encode()).hexdigest()
+        cache_key = f"connection_total_count:{query_hash}"
+        total_count = cache.get(cache_key)
+        if total_count is None:
+            total_count = qs.count()
+            timeout = self.timeout
+            if timeout is None:
+                timeout = settings.GRAPHQL_TOTAL_COUNT_CACHE_TIMEOUT.total_seconds()
+            cache.set(cache_key, total_count, timeout=timeout)
+        return total_count
+
+
+class EstimatedCount(TotalCount):
+    """Use the query planner's estimate when it expects many items.
+
+    Counts expected to be lower than the threshold, as well as counts on databases
+    other than PostgreSQL, are resolved with the fallback strategy.
+    """
+
+    def __init__(
+        self, threshold: Optional[int] = None, fallback: Optional[TotalCount] = None
+    ):
+        self.threshold = threshold
+        self.fallback = fallback or ExactCount()
+
+    def __call__(self, qs):
+        threshold = self.threshold
+        if threshold is None:
+            threshold = settings.GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD
+        estimated_count = self.get_estimated_count(qs)
+        if estimated_count is None or estimated_count < threshold:
+            return self.fallback(qs)
+        return estimated_count
+
+    @staticmethod
+    def get_estimated_count(qs: QuerySet) -> Optional[int]:
+        connection = connections[qs.db]
+        if connection.vendor != "postgresql":
+            return None
+        try:
+            sql, params = qs.order_by().query.sql_with_params()
+        except EmptyResultSet:
+            return 0
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def get_list_total_count(args) -> TotalCount:
+    """Return the count strategy of a large list for the given connection arguments.
+
+    Counts of unfiltered lists are estimated. Estimates for filters and searches
+    can be wrong by orders of magnitude, so filtered lists are counted exactly and
+    the count is cached.
+    """
+    filter_input = args.get("filter") or {}
+    is_filtered = args.get("search") or any(
+        value not in (None, "", []) for value in filter_input.values()
+    )
+    if is_filtered:
+        return CachedCount()
+    return EstimatedCount(fallback=CachedCount())
+
+
+class CappedCount(TotalCount):
+    """Count items up to the cap; larger connections return the cap itself."""
+
+    def __init__(self, cap: Optional[int] = None):
+        self.cap = cap
+
+    def __call__(self, qs):
+        cap = self.cap or settings.GRAPHQL_TOTAL_COUNT_CAP
+        return qs.order_by()[:cap].count()
+
+
 def _get_edges_for_connection(edge_type, qs, args, sorting_fields):
     before = args.get("before")
     after = args.get("after")
@@ -208,6 +317,7 @@ def connection_from_queryset_slice(
     connection_type: Any = Connection,
     edge_type: Any = Edge,
     pageinfo_type: Any = PageInfo,
+    total_count: Optional[TotalCount] = None,
 ) -> Connection:
     """Create a connection object from a QuerySet."""
     args = args or {}
@@ -241,9 +351,10 @@ def connection_from_queryset_slice(
     )
 
     if "total_count" in connection_type._meta.fields:
+        count = total_count or ExactCount()
 
         def get_total_count():
-            return qs.count()
+            return count(qs)
 
         return connection_type(
             edges=edges,
@@ -265,6 +376,7 @@ def create_connection_slice(
     edge_type=None,
     pageinfo_type=graphene.relay.PageInfo,
     max_limit: Optional[int] = None,
+    total_count: Optional[TotalCount] = None,
 ):
     _validate_slice_args(info, args, max_limit)
 
@@ -291,6 +403,7 @@ def create_connection_slice(
         connection_type,
         edge_type or connection_type.Edge,
         pageinfo_type or graphene.relay.PageInfo,
+        total_count,
     )
 
     if isinstance(iterable, ChannelQsContext):
@@ -0,0 +1,135 @@
+from unittest.mock import patch
+
+import graphene
+import pytest
+
+from ....tests.models import Book
+from ..connection import (
+    CachedCount,
+    CappedCount,
+    CountableConnection,
+    EstimatedCount,
+    ExactCount,
+    create_connection_slice,
+    get_list_total_count,
+)
+from ..fields import ConnectionField
+
+
+class BookType(graphene.ObjectType):
+    name = graphene.String()
+
+
+class BookTypeCountableConnection(CountableConnection):
+    class Meta:
+        node = BookType
+
+
+class Query(graphene.ObjectType):
+    books = ConnectionField(BookTypeCountableConnection)
+
+    def resolve_books(self, info, **kwargs):
+        qs = Book.objects.all()
+        return create_connection_slice(
+            qs, info, kwargs, BookTypeCountableConnection, total_count=CappedCount(5)
+        )
+
+
+schema = graphene.Schema(query=Query)
+
+
+@pytest.fixture
+def books(db):
+    books = [Book(name=f"Book{index}") for index in range(24)]
+    return Book.objects.bulk_create(books)
+
+
+QUERY_BOOKS_TOTAL_COUNT = """
+    query {
+        books(first: 1) {
+            totalCount
+        }
+    }
+"""
+
+
+def test_connection_total_count_strategy(books):
+    # when
+    result = schema.execute(QUERY_BOOKS_TOTAL_COUNT)
+
+    # then
+    assert not result.errors
+    assert result.data["books"]["totalCount"] == 5
+
+
+def test_exact_count(books):
+    assert ExactCount()(Book.objects.all()) == len(books)
+
+
+def test_cached_count(books, django_assert_num_queries):
+    # given
+    count = CachedCount(timeout=60)
+    qs = Book.objects.filter(name__startswith="Book1")
+    expected_count = qs.count()
+    assert count(qs) == expected_count
+    Book.objects.create(name="Book100")
+
+    # when
+    with django_assert_num_queries(0):
+        total_count = count(qs)
+
+    # then
+    assert total_count == expected_count
+    assert count(Book.objects.all()) == len(books) + 1
+
+
+def test_cached_count_empty_queryset(db, django_assert_num_queries):
+    with django_assert_num_queries(0):
+        assert CachedCount(timeout=60)(Book.objects.none()) == 0
+
+
+def test_estimated_count_returns_estimate_above_threshold(books):
+    # given
+    count = EstimatedCount(threshold=0)
+
+    # when
+    total_count = count(Book.objects.all())
+
+    # then
+    assert total_count == EstimatedCount.get_estimated_count(Book.objects.all())
+    assert total_count > 0
+
+
+@patch.object(EstimatedCount, "get_estimated_count", return_value=10)
+def test_estimated_count_falls_back_below_threshold(mocked_get_estimated_count, books):
+    # given
+    count = EstimatedCount(threshold=11)
+
+    # when
+    total_count = count(Book.objects.all())
+
+    # then
+    assert total_count == len(books)
+    mocked_get_estimated_count.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "args", [{}, {"filter": {}}, {"filter": {"search": "", "customer": None}}]
+)
+def test_get_list_total_count_estimates_unfiltered_lists(args):
+    total_count = get_list_total_count(args)
+
+    assert isinstance(total_count, EstimatedCount)
+    assert isinstance(total_count.fallback, CachedCount)
+
+
+@pytest.mark.parametrize(
+    "args", [{"filter": {"search": "john"}}, {"filter": {"status": []}, "search": "a"}]
+)
+def test_get_list_total_count_counts_filtered_lists(args):
+    assert isinstance(get_list_total_count(args), CachedCount)
+
+
+@pytest.mark.parametrize("cap, expected_count", [(5, 5), (24, 24), (100, 24)])
+def test_capped_count(books, cap, expected_count):
+    assert CappedCount(cap)(Book.objects.all()) == expected_count
@@ -18,6 +18,7 @@ from ..enums import (
     ExternalNotificationTriggerErrorCode,
     GiftCardErrorCode,
     GiftCardSettingsErrorCode,
+    ImportErrorCode,
     InvoiceErrorCode,
     JobStatusEnum,
     LanguageCodeEnum,
@@ -167,6 +168,10 @@ class ExportError(Error):
     code = ExportErrorCode(description="The error code.", required=True)
 
 
+class ImportFileError(Error):
+    code = ImportErrorCode(description="The error code.", required=True)
+
+
 class ExternalNotificationError(Error):
     code = ExternalNotificationTriggerErrorCode(
         description="The error code.", required=True
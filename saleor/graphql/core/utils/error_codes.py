@@ -11,7 +11,7 @@ from ....core.error_codes import (
     TranslationErrorCode,
     UploadErrorCode,
 )
-from ....csv.error_codes import ExportErrorCode
+from ....csv.error_codes import ExportErrorCode, ImportErrorCode
 from ....discount.error_codes import DiscountErrorCode
 from ....giftcard.error_codes import GiftCardErrorCode
 from ....invoice.error_codes import InvoiceErrorCode
@@ -65,6 +65,7 @@ SALEOR_ERROR_CODE_ENUMS = [
     ExternalNotificationErrorCodes,
     PluginErrorCode,
     GiftCardErrorCode,
+    ImportErrorCode,
     InvoiceErrorCode,
     MenuErrorCode,
     MetadataErrorCode,
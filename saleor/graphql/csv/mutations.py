@@ -1,25 +1,32 @@
+import os
 from typing import Dict, List, Mapping, Union
 
 import graphene
 from django.core.exceptions import ValidationError
 
 from ...core.permissions import GiftcardPermissions, ProductPermissions
+from ...csv import FileTypes
 from ...csv import models as csv_models
 from ...csv.events import export_started_event
-from ...csv.tasks import export_gift_cards_task, export_products_task
+from ...csv.tasks import (
+    export_gift_cards_task,
+    export_products_task,
+    import_products_task,
+)
 from ..attribute.types import Attribute
 from ..channel.types import Channel
 from ..core.descriptions import ADDED_IN_31
-from ..core.enums import ExportErrorCode
+from ..core.enums import ExportErrorCode, ImportErrorCode
 from ..core.mutations import BaseMutation
-from ..core.types.common import ExportError
+from ..core.types.common import ExportError, ImportFileError
+from ..core.types.upload import Upload
 from ..giftcard.filters import GiftCardFilterInput
 from ..giftcard.types import GiftCard
 from ..product.filters import ProductFilterInput
 from ..product.types import Product
 from ..warehouse.types import Warehouse
 from .enums import ExportScope, FileTypeEnum, ProductFieldEnum
-from .types import ExportFile
+from .types import ExportFile, ImportFile
 
 
 class BaseExportMutation(BaseMutation):
@@ -207,3 +214,67 @@ class ExportGiftCards(BaseExportMutation):
 
         export_file.refresh_from_db()
         return cls(export_file=export_file)
+
+
+class ImportProducts(BaseMutation):
+    import_file = graphene.Field(
+        ImportFile,
+        description="The newly created import file job which imports the products.",
+    )
+
+    class Arguments:
+        file = Upload(
+            required=True,
+            description=(
+                "CSV or XLSX file in the format of exported products. The mutation "
+                "must be sent as a `multipart` request."
+            ),
+        )
+
+    class Meta:
+        description = (
+            f"{ADDED_IN_31} Import products from csv or xlsx file. Products are "
+            "created or updated in the background; the progress and errors of the "
+            "rows are available in the import file."
+        )
+        permissions = (ProductPermissions.MANAGE_PRODUCTS,)
+        error_type_class = ImportFileError
+
+    @classmethod
+    def perform_mutation(cls, root, info, **data):
+        file_data = info.context.FILES.get(data["file"])
+        file_type = cls.clean_file_type(file_data)
+
+        app = info.context.app
+        kwargs = {"app": app} if app else {"user": info.context.user}
+
+        import_file = csv_models.ImportFile(**kwargs)
+        import_file.content_file.save(file_data.name, file_data, save=False)
+        import_file.save()
+        import_products_task.delay(import_file.pk, file_type)
+
+        import_file.refresh_from_db()
+        return cls(import_file=import_file)
+
+    @staticmethod
+    def clean_file_type(file_data) -> str:
+        if file_data is None:
+            raise ValidationError(
+                {
+                    "file": ValidationError(
+                        "File is required.", code=ImportErrorCode.REQUIRED.value
+                    )
+                }
+            )
+        _, extension = os.path.splitext(file_data.name)
+        file_type = extension.lstrip(".").lower()
+        if file_type not in dict(FileTypes.CHOICES):
+            raise ValidationError(
+                {
+                    "file": ValidationError(
+                        "Only csv and xlsx files can be imported.",
+                        code=ImportErrorCode.INVALID.value,
+                    )
+                }
+            )
+        return file_type
@@ -2,14 +2,15 @@ import graphene
 
 from ...core.permissions import ProductPermissions
 from ..core.connection import create_connection_slice, filter_connection_queryset
+from ..core.descriptions import ADDED_IN_31
 from ..core.fields import FilterConnectionField
 from ..core.utils import from_global_id_or_error
 from ..decorators import permission_required
 from .filters import ExportFileFilterInput
-from .mutations import ExportGiftCards, ExportProducts
-from .resolvers import resolve_export_file, resolve_export_files
+from .mutations import ExportGiftCards, ExportProducts, ImportProducts
+from .resolvers import resolve_export_file, resolve_export_files, resolve_import_file
 from .sorters import ExportFileSortingInput
-from .types import ExportFile, ExportFileCountableConnection
+from .types import ExportFile, ExportFileCountableConnection, ImportFile
 
 
 class CsvQueries(graphene.ObjectType):
@@ -26,6 +27,13 @@ class CsvQueries(graphene.ObjectType):
         sort_by=ExportFileSortingInput(description="Sort export files."),
         description="List of export files.",
     )
+    import_file = graphene.Field(
+        ImportFile,
+        id=graphene.Argument(
+            graphene.ID, description="ID of the import file job.", required=True
+        ),
+        description=f"{ADDED_IN_31} Look up an import file by ID.",
+    )
 
     @permission_required(ProductPermissions.MANAGE_PRODUCTS)
     def resolve_export_file(self, info, id):
@@ -38,7 +46,13 @@ class CsvQueries(graphene.ObjectType):
         qs = filter_connection_queryset(qs, kwargs)
         return create_connection_slice(qs, info, kwargs, ExportFileCountableConnection)
 
+    @permission_required(ProductPermissions.MANAGE_PRODUCTS)
+    def resolve_import_file(self, info, id):
+        _, id = from_global_id_or_error(id, ImportFile)
+        return resolve_import_file(id)
+
 
 class CsvMutations(graphene.ObjectType):
     export_products = ExportProducts.Field()
     export_gift_cards = ExportGiftCards.Field()
+    import_products = ImportProducts.Field()
@@ -0,0 +1,108 @@
+from unittest.mock import patch
+
+from django.core.files.uploadedfile import SimpleUploadedFile
+
+from .....core import JobStatus
+from .....csv import FileTypes
+from .....csv.error_codes import ImportErrorCode
+from .....csv.models import ImportFile
+from ....tests.utils import (
+    assert_no_permission,
+    get_graphql_content,
+    get_multipart_request_body,
+)
+
+IMPORT_PRODUCTS_MUTATION = """
+    mutation ImportProducts($file: Upload!) {
+        importProducts(file: $file) {
+            importFile {
+                id
+                status
+                processedCount
+                rowErrors {
+                    row
+                }
+                user {
+                    email
+                }
+            }
+            errors {
+                field
+                code
+            }
+        }
+    }
+"""
+
+
+def _get_file(name="products.csv"):
+    return SimpleUploadedFile(name, b"name,product type\n", content_type="text/csv")
+
+
+@patch("saleor.graphql.csv.mutations.import_products_task.delay")
+def test_import_products(
+    import_products_task_mock,
+    staff_api_client,
+    permission_manage_products,
+    media_root,
+):
+    # given
+    staff_api_client.user.user_permissions.add(permission_manage_products)
+    file = _get_file()
+    body = get_multipart_request_body(
+        IMPORT_PRODUCTS_MUTATION, {"file": file.name}, file, file.name
+    )
+
+    # when
+    response = staff_api_client.post_multipart(body)
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["importProducts"]
+    assert not data["errors"]
+    assert data["importFile"]["status"] == JobStatus.PENDING.upper()
+    assert data["importFile"]["processedCount"] == 0
+    assert data["importFile"]["rowErrors"] == []
+    assert data["importFile"]["user"]["email"] == staff_api_client.user.email
+    import_file = ImportFile.objects.get()
+    assert import_file.content_file.name.startswith("import_files/products")
+    import_products_task_mock.assert_called_once_with(import_file.pk, FileTypes.CSV)
+
+
+@patch("saleor.graphql.csv.mutations.import_products_task.delay")
+def test_import_products_invalid_file_type(
+    import_products_task_mock,
+    staff_api_client,
+    permission_manage_products,
+    media_root,
+):
+    # given
+    staff_api_client.user.user_permissions.add(permission_manage_products)
+    file = _get_file("products.txt")
+    body = get_multipart_request_body(
+        IMPORT_PRODUCTS_MUTATION, {"file": file.name}, file, file.name
+    )
+
+    # when
+    response = staff_api_client.post_multipart(body)
+
+    # then
+    content = get_graphql_content(response)
+    errors = content["data"]["importProducts"]["errors"]
+    assert errors == [{"field": "file", "code": ImportErrorCode.INVALID.name}]
+    assert not ImportFile.objects.exists()
+    import_products_task_mock.assert_not_called()
+
+
+def test_import_products_no_permission(staff_api_client, media_root):
+    # given
+    file = _get_file()
+    body = get_multipart_request_body(
+        IMPORT_PRODUCTS_MUTATION, {"file": file.name}, file, file.name
+    )
+
+    # when
+    response = staff_api_client.post_multipart(body)
+
+    # then
+    assert_no_permission(response)
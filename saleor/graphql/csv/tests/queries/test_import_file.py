@@ -0,0 +1,74 @@
+import graphene
+
+from .....csv.error_codes import ImportErrorCode
+from .....csv.models import ImportFile
+from ....tests.utils import assert_no_permission, get_graphql_content
+
+IMPORT_FILE_QUERY = """
+    query ImportFile($id: ID!) {
+        importFile(id: $id) {
+            id
+            totalCount
+            processedCount
+            rowErrors {
+                row
+                field
+                message
+                code
+            }
+        }
+    }
+"""
+
+
+def test_import_file_query(staff_api_client, staff_user, permission_manage_products):
+    # given
+    import_file = ImportFile.objects.create(
+        user=staff_user,
+        total_count=2,
+        processed_count=2,
+        errors=[
+            {
+                "row": 3,
+                "field": "category",
+                "message": "Category doesn't exist.",
+                "code": ImportErrorCode.NOT_FOUND.value,
+            }
+        ],
+    )
+    import_file_id = graphene.Node.to_global_id("ImportFile", import_file.pk)
+
+    # when
+    response = staff_api_client.post_graphql(
+        IMPORT_FILE_QUERY,
+        {"id": import_file_id},
+        permissions=[permission_manage_products],
+    )
+
+    # then
+    data = get_graphql_content(response)["data"]["importFile"]
+    assert data == {
+        "id": import_file_id,
+        "totalCount": 2,
+        "processedCount": 2,
+        "rowErrors": [
+            {
+                "row": 3,
+                "field": "category",
+                "message": "Category doesn't exist.",
+                "code": ImportErrorCode.NOT_FOUND.name,
+            }
+        ],
+    }
+
+
+def test_import_file_query_no_permission(staff_api_client, staff_user):
+    # given
+    import_file = ImportFile.objects.create(user=staff_user)
+    import_file_id = graphene.Node.to_global_id("ImportFile", import_file.pk)
+
+    # when
+    response = staff_api_client.post_graphql(IMPORT_FILE_QUERY, {"id": import_file_id})
+
+    # then
+    assert_no_permission(response)
@@ -8,6 +8,8 @@ from ..account.utils import requestor_has_access
 from ..app.dataloaders import AppByIdLoader
 from ..app.types import App
 from ..core.connection import CountableConnection
+from ..core.descriptions import ADDED_IN_31
+from ..core.enums import ImportErrorCode
 from ..core.types import ModelObjectType
 from ..core.types.common import Job
 from ..utils import get_user_or_app_from_context
@@ -64,6 +66,12 @@ class ExportFile(ModelObjectType):
     )
     user = graphene.Field(User)
     app = graphene.Field(App)
+    total_count = graphene.Int(
+        description=f"{ADDED_IN_31} Number of objects to export."
+    )
+    processed_count = graphene.Int(
+        required=True, description=f"{ADDED_IN_31} Number of already exported objects."
+    )
 
     class Meta:
         description = "Represents a job data of exported file."
@@ -101,3 +109,63 @@ class ExportFile(ModelObjectType):
 class ExportFileCountableConnection(CountableConnection):
     class Meta:
         node = ExportFile
+
+
+class ImportRowError(graphene.ObjectType):
+    row = graphene.Int(
+        required=True, description="Number of the row, counting from the header row."
+    )
+    field = graphene.String(description="Header of the column which causes the error.")
+    message = graphene.String(required=True, description="The error message.")
+    code = ImportErrorCode(required=True, description="The error code.")
+
+    class Meta:
+        description = f"{ADDED_IN_31} Represents an error in a row of imported file."
+
+
+class ImportFile(ModelObjectType):
+    id = graphene.GlobalID(required=True)
+    user = graphene.Field(User)
+    app = graphene.Field(App)
+    total_count = graphene.Int(description="Number of rows to import.")
+    processed_count = graphene.Int(
+        required=True, description="Number of already imported rows."
+    )
+    row_errors = graphene.List(
+        graphene.NonNull(ImportRowError),
+        required=True,
+        description="Errors of the rows which weren't imported.",
+    )
+
+    class Meta:
+        description = f"{ADDED_IN_31} Represents a job data of imported file."
+        interfaces = [graphene.relay.Node, Job]
+        model = models.ImportFile
+
+    @staticmethod
+    def resolve_user(root: models.ImportFile, info):
+        requestor = get_user_or_app_from_context(info.context)
+        if requestor_has_access(requestor, root.user, AccountPermissions.MANAGE_STAFF):
+            return root.user
+        raise PermissionDenied()
+
+    @staticmethod
+    def resolve_app(root: models.ImportFile, info):
+        requestor = get_user_or_app_from_context(info.context)
+        if requestor_has_access(requestor, root.user, AppPermission.MANAGE_APPS):
+            return (
+                AppByIdLoader(info.context).load(root.app_id) if root.app_id else None
+            )
+        raise PermissionDenied()
+
+    @staticmethod
+    def resolve_row_errors(root: models.ImportFile, _info):
+        return [
+            ImportRowError(
+                row=error["row"],
+                field=error["field"],
+                message=error["message"],
+                code=error["code"],
+            )
+            for error in root.errors
+        ]
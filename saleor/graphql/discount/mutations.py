@@ -11,7 +11,11 @@ from ...core.utils.promo_code import generate_promo_code, is_available_promo_cod
 from ...discount import DiscountValueType, models
 from ...discount.error_codes import DiscountErrorCode
 from ...discount.models import SaleChannelListing
-from ...discount.utils import CatalogueInfo, fetch_catalogue_info
+from ...discount.utils import (
+    CatalogueInfo,
+    fetch_catalogue_info,
+    schedule_sale_price_transitions,
+)
 from ...product.tasks import (
     update_products_discounted_prices_of_catalogues_task,
     update_products_discounted_prices_of_discount_task,
@@ -600,6 +604,7 @@ class SaleCreate(SaleUpdateDiscountedPriceMixin, ModelMutation):
                 convert_catalogue_info_to_global_ids(current_catalogue),
             )
         )
+        transaction.on_commit(lambda: schedule_sale_price_transitions([instance]))
         return response
 
 
@@ -633,6 +638,7 @@ class SaleUpdate(SaleUpdateDiscountedPriceMixin, ModelMutation):
                 convert_catalogue_info_to_global_ids(current_catalogue),
             )
         )
+        transaction.on_commit(lambda: schedule_sale_price_transitions([instance]))
         return response
 
 
@@ -0,0 +1,49 @@
+import graphene
+from django.core.exceptions import ValidationError
+
+from ...core.permissions import OrderPermissions
+from ...core.tracing import traced_atomic_transaction
+from ...order import models as order_models
+from ..core.descriptions import ADDED_IN_31
+from ..core.mutations import BaseBulkMutation
+from ..core.types.common import InvoiceError
+from ..order.types import Order
+from .mutations import InvoiceRequest
+
+
+class InvoiceBulkRequest(BaseBulkMutation):
+    class Arguments:
+        ids = graphene.List(
+            graphene.ID,
+            required=True,
+            description="List of IDs of orders to request invoices for.",
+        )
+
+    class Meta:
+        description = (
+            f"{ADDED_IN_31} Request invoices for the orders using plugin. Invoice "
+            "numbers are generated for all orders at once, while files may be "
+            "generated later."
+        )
+        model = order_models.Order
+        object_type = Order
+        permissions = (OrderPermissions.MANAGE_ORDERS,)
+        error_type_class = InvoiceError
+
+    @classmethod
+    def clean_instance(cls, info, instance):
+        InvoiceRequest.clean_order(instance)
+
+    @classmethod
+    def perform_mutation(cls, _root, info, ids, **data):
+        try:
+            InvoiceRequest.check_invoice_plugin(info, "ids")
+        except ValidationError as error:
+            return 0, error
+        return super().perform_mutation(_root, info, ids, **data)
+
+    @classmethod
+    @traced_atomic_transaction()
+    def bulk_action(cls, info, queryset):
+        for order in queryset.select_related("channel").order_by("pk"):
+            InvoiceRequest.request_invoice(info, order)
@@ -56,32 +56,26 @@ class InvoiceRequest(ModelMutation):
                 }
             )
 
-    @classmethod
-    def perform_mutation(cls, _root, info, **data):
-        order = cls.get_node_or_error(
-            info, data["order_id"], only_type=Order, field="orderId"
-        )
-        cls.clean_order(order)
-
+    @staticmethod
+    def check_invoice_plugin(info, field):
         if not is_event_active_for_any_plugin(
             "invoice_request", info.context.plugins.all_plugins
         ):
             raise ValidationError(
                 {
-                    "orderId": ValidationError(
+                    field: ValidationError(
                         "No app or plugin is configured to handle invoice requests.",
                         code=InvoiceErrorCode.NO_INVOICE_PLUGIN,
                     )
                 }
             )
 
-        shallow_invoice = models.Invoice.objects.create(
-            order=order,
-            number=data.get("number"),
-        )
+    @staticmethod
+    def request_invoice(info, order, number=None):
+        shallow_invoice = models.Invoice.objects.create(order=order, number=number)
 
         invoice = info.context.plugins.invoice_request(
-            order=order, invoice=shallow_invoice, number=data.get("number")
+            order=order, invoice=shallow_invoice, number=number
         )
 
         if invoice and invoice.status == JobStatus.SUCCESS:
@@ -100,8 +94,18 @@ class InvoiceRequest(ModelMutation):
             user=info.context.user,
             app=info.context.app,
             order=order,
-            number=data.get("number"),
+            number=number,
         )
+        return invoice
+
+    @classmethod
+    def perform_mutation(cls, _root, info, **data):
+        order = cls.get_node_or_error(
+            info, data["order_id"], only_type=Order, field="orderId"
+        )
+        cls.clean_order(order)
+        cls.check_invoice_plugin(info, "orderId")
+        invoice = cls.request_invoice(info, order, data.get("number"))
         return InvoiceRequest(invoice=invoice, order=order)
 
 
@@ -1,5 +1,6 @@
 import graphene
 
+from .bulk_mutations import InvoiceBulkRequest
 from .mutations import (
     InvoiceCreate,
     InvoiceDelete,
@@ -12,6 +13,7 @@ from .mutations import (
 
 class InvoiceMutations(graphene.ObjectType):
     invoice_request = InvoiceRequest.Field()
+    invoice_bulk_request = InvoiceBulkRequest.Field()
     invoice_request_delete = InvoiceRequestDelete.Field()
     invoice_create = InvoiceCreate.Field()
     invoice_delete = InvoiceDelete.Field()
@@ -0,0 +1,114 @@
+from unittest.mock import patch
+
+import graphene
+
+from ....core import JobStatus
+from ....invoice.error_codes import InvoiceErrorCode
+from ....invoice.models import Invoice, InvoiceEvent, InvoiceEvents
+from ....order import OrderEvents, OrderStatus
+from ....order.models import OrderEvent
+from ...tests.utils import get_graphql_content
+
+INVOICE_BULK_REQUEST_MUTATION = """
+    mutation InvoiceBulkRequest($ids: [ID]!) {
+        invoiceBulkRequest(ids: $ids) {
+            count
+            errors {
+                field
+                code
+            }
+        }
+    }
+"""
+
+
+@patch("saleor.plugins.invoicing.plugin.generate_invoice_pdf_task.apply_async")
+def test_invoice_bulk_request(
+    apply_async_mock, staff_api_client, permission_manage_orders, order_list, settings
+):
+    # given
+    settings.PLUGINS = ["saleor.plugins.invoicing.plugin.InvoicingPlugin"]
+    variables = {
+        "ids": [graphene.Node.to_global_id("Order", order.pk) for order in order_list]
+    }
+
+    # when
+    response = staff_api_client.post_graphql(
+        INVOICE_BULK_REQUEST_MUTATION,
+        variables,
+        permissions=[permission_manage_orders],
+    )
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["invoiceBulkRequest"]
+    assert data["count"] == len(order_list)
+    assert not data["errors"]
+    invoices = Invoice.objects.filter(order__in=order_list)
+    assert all(invoice.status == JobStatus.PENDING for invoice in invoices)
+    numbers = [int(invoice.number.split("/")[0]) for invoice in invoices]
+    assert sorted(numbers) == list(range(1, len(order_list) + 1))
+    assert apply_async_mock.call_count == len(order_list)
+    assert InvoiceEvent.objects.filter(type=InvoiceEvents.REQUESTED).count() == len(
+        order_list
+    )
+    assert OrderEvent.objects.filter(type=OrderEvents.INVOICE_REQUESTED).count() == (
+        len(order_list)
+    )
+
+
+@patch("saleor.plugins.invoicing.plugin.generate_invoice_pdf_task.apply_async")
+def test_invoice_bulk_request_skips_draft_orders(
+    apply_async_mock, staff_api_client, permission_manage_orders, order_list, settings
+):
+    # given
+    settings.PLUGINS = ["saleor.plugins.invoicing.plugin.InvoicingPlugin"]
+    draft_order = order_list[0]
+    draft_order.status = OrderStatus.DRAFT
+    draft_order.save(update_fields=["status"])
+    draft_order_id = graphene.Node.to_global_id("Order", draft_order.pk)
+    variables = {
+        "ids": [graphene.Node.to_global_id("Order", order.pk) for order in order_list]
+    }
+
+    # when
+    response = staff_api_client.post_graphql(
+        INVOICE_BULK_REQUEST_MUTATION,
+        variables,
+        permissions=[permission_manage_orders],
+    )
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["invoiceBulkRequest"]
+    assert data["count"] == len(order_list) - 1
+    assert data["errors"] == [
+        {"field": draft_order_id, "code": InvoiceErrorCode.INVALID.name}
+    ]
+    assert not Invoice.objects.filter(order=draft_order).exists()
+
+
+def test_invoice_bulk_request_no_invoice_plugin(
+    staff_api_client, permission_manage_orders, order_list, settings
+):
+    # given
+    settings.PLUGINS = []
+    variables = {
+        "ids": [graphene.Node.to_global_id("Order", order.pk) for order in order_list]
+    }
+
+    # when
+    response = staff_api_client.post_graphql(
+        INVOICE_BULK_REQUEST_MUTATION,
+        variables,
+        permissions=[permission_manage_orders],
+    )
+
+    # then
+    content = get_graphql_content(response)
+    data = content["data"]["invoiceBulkRequest"]
+    assert data["count"] == 0
+    assert data["errors"] == [
+        {"field": "ids", "code": InvoiceErrorCode.NO_INVOICE_PLUGIN.name}
+    ]
+    assert not Invoice.objects.exists()
@@ -2,6 +2,8 @@ import graphene
 
 from ...core.permissions import MenuPermissions
 from ...menu import models
+from ...menu.utils import invalidate_menu_cache
+from ...site.utils import invalidate_site_cache
 from ..core.mutations import ModelBulkDeleteMutation
 from ..core.types.common import MenuError
 from .types import Menu, MenuItem
@@ -21,6 +23,12 @@ class MenuBulkDelete(ModelBulkDeleteMutation):
         error_type_class = MenuError
         error_type_field = "menu_errors"
 
+    @classmethod
+    def bulk_action(cls, info, queryset):
+        super().bulk_action(info, queryset)
+        # navigation menus of site settings are unassigned on delete
+        invalidate_site_cache()
+
 
 class MenuItemBulkDelete(ModelBulkDeleteMutation):
     class Arguments:
@@ -35,3 +43,8 @@ class MenuItemBulkDelete(ModelBulkDeleteMutation):
         permissions = (MenuPermissions.MANAGE_MENUS,)
         error_type_class = MenuError
         error_type_field = "menu_errors"
+
+    @classmethod
+    def bulk_action(cls, info, queryset):
+        super().bulk_action(info, queryset)
+        invalidate_menu_cache()
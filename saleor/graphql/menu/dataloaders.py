@@ -1,7 +1,20 @@
 from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
 
-from ...menu.models import Menu, MenuItem
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F
+
+from ...menu.models import Menu, MenuItem, MenuItemTranslation
+from ...menu.utils import get_menu_cache_key, get_menu_cache_version
+from ...product.models import CollectionChannelListing
 from ..core.dataloaders import DataLoader
+from ..page.dataloaders import PageByIdLoader
+from ..product.dataloaders import (
+    CategoryByIdLoader,
+    CollectionByIdLoader,
+    CollectionChannelListingByCollectionIdAndChannelSlugLoader,
+)
 
 
 class MenuByIdLoader(DataLoader):
@@ -20,27 +33,163 @@ class MenuItemByIdLoader(DataLoader):
         return [menu_items.get(menu_item_id) for menu_item_id in keys]
 
 
-class MenuItemsByParentMenuLoader(DataLoader):
-    context_key = "menuitems_by_parent_menu"
+class MenuTree:
+    """Items of a menu along with the objects they link to.
+
+    Trees are shared between requests through the cache, so they hold only data
+    that doesn't depend on the requestor.
+    """
+
+    def __init__(
+        self,
+        items: List[MenuItem],
+        collection_channel_listings: Dict[int, Optional[CollectionChannelListing]],
+    ):
+        self.items = items
+        self.collection_channel_listings = collection_channel_listings
+        self.children: Dict[Optional[int], List[MenuItem]] = defaultdict(list)
+        for item in items:
+            self.children[item.parent_id].append(item)
+
+    def get_children(self, menu_item_id: Optional[int]) -> List[MenuItem]:
+        return self.children.get(menu_item_id, [])
+
+
+class BaseMenuCacheLoader(DataLoader):
+    """Load values that can be shared between requests through the cache."""
+
+    cache_name: str
 
     def batch_load(self, keys):
-        menu_items = MenuItem.objects.using(self.database_connection_name).filter(
-            menu_id__in=keys, level=0
+        if not settings.MENU_CACHE_ENABLED:
+            values = self.fetch(keys)
+            return [values[key] for key in keys]
+
+        version = get_menu_cache_version()
+        cache_keys = {
+            key: get_menu_cache_key(version, self.cache_name, *key) for key in keys
+        }
+        cached_values = cache.get_many(cache_keys.values())
+        values = {
+            key: cached_values[cache_key]
+            for key, cache_key in cache_keys.items()
+            if cache_key in cached_values
+        }
+        missing_keys = [key for key in keys if key not in values]
+        if missing_keys:
+            fetched_values = self.fetch(missing_keys)
+            cache.set_many(
+                {cache_keys[key]: value for key, value in fetched_values.items()},
+                timeout=settings.MENU_CACHE_TIMEOUT.total_seconds(),
+            )
+            values.update(fetched_values)
+        return [values[key] for key in keys]
+
+    def fetch(self, keys) -> Dict:
+        raise NotImplementedError()
+
+
+class MenuTreeByMenuIdAndChannelSlugLoader(BaseMenuCacheLoader):
+    """Load whole menu trees with a single query.
+
+    Categories, collections and pages linked by the items are fetched along with
+    them and used to prime their loaders, as are collection channel listings, so
+    the tree can be resolved without further queries.
+    """
+
+    context_key = "menu_tree_by_menu_id_and_channel_slug"
+    cache_name = "tree"
+
+    def batch_load(self, keys):
+        trees = super().batch_load(keys)
+        for (_, channel_slug), tree in zip(keys, trees):
+            self.prime_loaders(tree, channel_slug)
+        return trees
+
+    def fetch(self, keys):
+        menu_ids = {menu_id for menu_id, _ in keys}
+        channel_slugs = {channel_slug for _, channel_slug in keys if channel_slug}
+        menu_items = list(
+            MenuItem.objects.using(self.database_connection_name)
+            .filter(menu_id__in=menu_ids)
+            .select_related("category", "collection", "page")
         )
         items_map = defaultdict(list)
         for menu_item in menu_items:
             items_map[menu_item.menu_id].append(menu_item)
-        return [items_map[menu_id] for menu_id in keys]
 
+        collection_ids = {
+            menu_item.collection_id
+            for menu_item in menu_items
+            if menu_item.collection_id
+        }
+        listings_map: Dict[Tuple[int, str], CollectionChannelListing] = {}
+        if collection_ids and channel_slugs:
+            listings = (
+                CollectionChannelListing.objects.using(self.database_connection_name)
+                .filter(
+                    collection_id__in=collection_ids, channel__slug__in=channel_slugs
+                )
+                .annotate(channel_slug=F("channel__slug"))
+            )
+            for listing in listings:
+                listings_map[(listing.collection_id, listing.channel_slug)] = listing
 
-class MenuItemChildrenLoader(DataLoader):
-    context_key = "menuitem_children"
+        trees = {}
+        for menu_id, channel_slug in keys:
+            items = items_map[menu_id]
+            trees[(menu_id, channel_slug)] = MenuTree(
+                items,
+                {
+                    item.collection_id: listings_map.get(
+                        (item.collection_id, channel_slug)
+                    )
+                    for item in items
+                    if item.collection_id
+                },
+            )
+        return trees
 
-    def batch_load(self, keys):
-        menu_items = MenuItem.objects.using(self.database_connection_name).filter(
-            parent_id__in=keys
+    def prime_loaders(self, tree: MenuTree, channel_slug: Optional[str]):
+        menu_item_loader = MenuItemByIdLoader(self.context)
+        category_loader = CategoryByIdLoader(self.context)
+        collection_loader = CollectionByIdLoader(self.context)
+        page_loader = PageByIdLoader(self.context)
+        for menu_item in tree.items:
+            menu_item_loader.prime(menu_item.id, menu_item)
+            if menu_item.category_id:
+                category_loader.prime(menu_item.category_id, menu_item.category)
+            if menu_item.collection_id:
+                collection_loader.prime(menu_item.collection_id, menu_item.collection)
+            if menu_item.page_id:
+                page_loader.prime(menu_item.page_id, menu_item.page)
+
+        listing_loader = CollectionChannelListingByCollectionIdAndChannelSlugLoader(
+            self.context
         )
-        items_map = defaultdict(list)
-        for menu_item in menu_items:
-            items_map[menu_item.parent_id].append(menu_item)
-        return [items_map[menu_item_id] for menu_item_id in keys]
+        for collection_id, listing in tree.collection_channel_listings.items():
+            listing_loader.prime((collection_id, str(channel_slug)), listing)
+
+
+class MenuItemTranslationsByMenuIdAndLanguageCodeLoader(BaseMenuCacheLoader):
+    """Load translations of all items of a menu, mapped by the item ID."""
+
+    context_key = "menu_item_translations_by_menu_id_and_language_code"
+    cache_name = "translations"
+
+    def fetch(self, keys):
+        menu_ids = {menu_id for menu_id, _ in keys}
+        language_codes = {language_code for _, language_code in keys}
+        translations = (
+            MenuItemTranslation.objects.using(self.database_connection_name)
+            .filter(menu_item__menu_id__in=menu_ids, language_code__in=language_codes)
+            .annotate(menu_id=F("menu_item__menu_id"))
+        )
+        translations_map: Dict[Tuple[int, str], Dict[int, MenuItemTranslation]] = {
+            key: {} for key in keys
+        }
+        for translation in translations:
+            key = (translation.menu_id, translation.language_code)
+            if key in translations_map:
+                translations_map[key][translation.menu_item_id] = translation
+        return translations_map
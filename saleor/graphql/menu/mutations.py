@@ -10,8 +10,10 @@ from ...core.permissions import MenuPermissions, SitePermissions
 from ...core.tracing import traced_atomic_transaction
 from ...menu import models
 from ...menu.error_codes import MenuErrorCode
+from ...menu.utils import invalidate_menu_cache
 from ...page import models as page_models
 from ...product import models as product_models
+from ...site.utils import get_site_for_update, invalidate_site_cache
 from ..channel import ChannelContext
 from ..core.mutations import BaseMutation, ModelDeleteMutation, ModelMutation
 from ..core.types.common import MenuError
@@ -173,6 +175,13 @@ class MenuDelete(ModelDeleteMutation):
         error_type_class = MenuError
         error_type_field = "menu_errors"
 
+    @classmethod
+    def perform_mutation(cls, _root, info, **data):
+        response = super().perform_mutation(_root, info, **data)
+        # navigation menus of site settings are unassigned on delete
+        invalidate_site_cache()
+        return response
+
     @classmethod
     def success_response(cls, instance):
         instance = ChannelContext(node=instance, channel_slug=None)
@@ -245,6 +254,10 @@ class MenuItemCreate(ModelMutation):
             )
         return cleaned_input
 
+    @classmethod
+    def post_save_action(cls, info, instance, cleaned_input):
+        invalidate_menu_cache()
+
 
 class MenuItemUpdate(MenuItemCreate):
     class Arguments:
@@ -287,6 +300,12 @@ class MenuItemDelete(ModelDeleteMutation):
         error_type_class = MenuError
         error_type_field = "menu_errors"
 
+    @classmethod
+    def perform_mutation(cls, _root, info, **data):
+        response = super().perform_mutation(_root, info, **data)
+        invalidate_menu_cache()
+        return response
+
     @classmethod
     def success_response(cls, instance):
         instance = ChannelContext(node=instance, channel_slug=None)
@@ -434,6 +453,7 @@ class MenuItemMove(BaseMutation):
         for parent_pk, operations in sort_operations.items():
             ordering_qs = sort_querysets[parent_pk]
             perform_reordering(ordering_qs, operations)
+        invalidate_menu_cache()
 
         menu = qs.get(pk=menu.pk)
         return MenuItemMove(menu=ChannelContext(node=menu, channel_slug=None))
@@ -457,7 +477,7 @@ class AssignNavigation(BaseMutation):
 
     @classmethod
     def perform_mutation(cls, _root, info, navigation_type, menu=None):
-        site_settings = info.context.site.settings
+        site_settings = get_site_for_update(info.context).settings
         if menu is not None:
             menu = cls.get_node_or_error(info, menu, field="menu")
 
@@ -467,6 +487,7 @@ class AssignNavigation(BaseMutation):
         elif navigation_type == NavigationType.SECONDARY:
             site_settings.bottom_menu = menu
             site_settings.save(update_fields=["bottom_menu"])
+        invalidate_site_cache()
 
         if menu is None:
             return AssignNavigation(menu=None)
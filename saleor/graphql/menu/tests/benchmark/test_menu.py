@@ -0,0 +1,88 @@
+import graphene
+import pytest
+
+from .....menu.models import MenuItem
+from ....tests.utils import get_graphql_content
+
+QUERY_MENU = """
+    query ($id: ID, $channel: String) {
+        menu(id: $id, channel: $channel) {
+            id
+            name
+            items {
+                ...MenuItemFragment
+                children {
+                    ...MenuItemFragment
+                    children {
+                        ...MenuItemFragment
+                        children {
+                            ...MenuItemFragment
+                        }
+                    }
+                }
+            }
+        }
+    }
+
+    fragment MenuItemFragment on MenuItem {
+        id
+        name
+        url
+        translation(languageCode: FR) {
+            name
+        }
+        category {
+            id
+            slug
+        }
+        collection {
+            id
+            slug
+        }
+        page {
+            id
+            slug
+        }
+    }
+"""
+
+
+@pytest.mark.django_db
+@pytest.mark.count_queries(autouse=False)
+def test_query_menu_tree(
+    user_api_client,
+    menu,
+    categories_tree,
+    published_collection,
+    page,
+    channel_USD,
+    count_queries,
+):
+    parent = None
+    for level in range(4):
+        items = [
+            MenuItem.objects.create(
+                menu=menu,
+                parent=parent,
+                name=f"Category {level}",
+                category=categories_tree,
+            ),
+            MenuItem.objects.create(
+                menu=menu,
+                parent=parent,
+                name=f"Collection {level}",
+                collection=published_collection,
+            ),
+            MenuItem.objects.create(
+                menu=menu, parent=parent, name=f"Page {level}", page=page
+            ),
+        ]
+        parent = items[0]
+
+    variables = {
+        "id": graphene.Node.to_global_id("Menu", menu.pk),
+        "channel": channel_USD.slug,
+    }
+    response = user_api_client.post_graphql(QUERY_MENU, variables)
+    content = get_graphql_content(response)
+    assert len(content["data"]["menu"]["items"]) == 3
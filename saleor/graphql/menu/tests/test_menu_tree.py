@@ -0,0 +1,175 @@
+import graphene
+import pytest
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from ....menu.models import MenuItem
+from ....menu.utils import MENU_CACHE_VERSION_CACHE_KEY, invalidate_menu_cache
+from ....tests.utils import flush_post_commit_hooks
+from ...tests.utils import get_graphql_content
+
+QUERY_MENU_TREE = """
+    query ($id: ID, $channel: String) {
+        menu(id: $id, channel: $channel) {
+            items {
+                name
+                translation(languageCode: FR) {
+                    name
+                }
+                children {
+                    name
+                    category {
+                        name
+                    }
+                    collection {
+                        name
+                    }
+                    children {
+                        name
+                        page {
+                            title
+                        }
+                    }
+                }
+            }
+        }
+    }
+"""
+
+
+@pytest.fixture
+def menu_cache(settings):
+    settings.MENU_CACHE_ENABLED = True
+    cache.delete(MENU_CACHE_VERSION_CACHE_KEY)
+
+
+def _query_menu_tree(api_client, menu, channel):
+    variables = {
+        "id": graphene.Node.to_global_id("Menu", menu.pk),
+        "channel": channel.slug,
+    }
+    response = api_client.post_graphql(QUERY_MENU_TREE, variables)
+    return get_graphql_content(response)["data"]["menu"]["items"]
+
+
+def _count_menu_item_queries(queries):
+    return len([query for query in queries if 'FROM "menu_menuitem" ' in query["sql"]])
+
+
+def test_menu_tree_query(
+    user_api_client, menu_with_items, page, published_collection, channel_USD
+):
+    # given
+    parent = MenuItem.objects.get(menu=menu_with_items, name="Link 2")
+    category_item = parent.children.get(category__isnull=False)
+    category_item.children.create(menu=menu_with_items, name="Page", page=page)
+
+    # when
+    with CaptureQueriesContext(connection) as ctx:
+        items = _query_menu_tree(user_api_client, menu_with_items, channel_USD)
+
+    # then
+    assert _count_menu_item_queries(ctx.captured_queries) == 1
+    assert [item["name"] for item in items] == ["Link 1", "Link 2"]
+    assert items[0]["children"] == []
+    category_data, collection_data = items[1]["children"]
+    assert category_data["category"]["name"] == category_item.category.name
+    assert category_data["children"] == [
+        {"name": "Page", "page": {"title": page.title}}
+    ]
+    assert collection_data["collection"]["name"] == published_collection.name
+
+
+def test_menu_tree_query_hides_collection_not_visible_in_channel(
+    user_api_client, menu_with_items, published_collection, channel_USD
+):
+    # given
+    published_collection.channel_listings.update(is_published=False)
+
+    # when
+    items = _query_menu_tree(user_api_client, menu_with_items, channel_USD)
+
+    # then
+    _, collection_data = items[1]["children"]
+    assert collection_data["collection"] is None
+
+
+def test_menu_tree_query_translation(
+    user_api_client, menu_item, menu_item_translation_fr, channel_USD
+):
+    # when
+    items = _query_menu_tree(user_api_client, menu_item.menu, channel_USD)
+
+    # then
+    assert items[0]["translation"]["name"] == menu_item_translation_fr.name
+
+
+def test_menu_tree_query_uses_shared_cache(
+    user_api_client, menu_with_items, menu_cache, channel_USD
+):
+    # given
+    items = _query_menu_tree(user_api_client, menu_with_items, channel_USD)
+
+    # when
+    with CaptureQueriesContext(connection) as ctx:
+        cached_items = _query_menu_tree(user_api_client, menu_with_items, channel_USD)
+
+    # then
+    assert _count_menu_item_queries(ctx.captured_queries) == 0
+    assert cached_items == items
+
+
+def test_menu_tree_query_cache_invalidated(
+    user_api_client, menu_with_items, menu_cache, channel_USD
+):
+    # given
+    _query_menu_tree(user_api_client, menu_with_items, channel_USD)
+    MenuItem.objects.filter(menu=menu_with_items, name="Link 1").update(name="New")
+
+    # when
+    invalidate_menu_cache()
+    flush_post_commit_hooks()
+    items = _query_menu_tree(user_api_client, menu_with_items, channel_USD)
+
+    # then
+    assert items[0]["name"] == "New"
+
+
+MENU_ITEM_UPDATE_MUTATION = """
+    mutation menuItemUpdate($id: ID!, $name: String) {
+        menuItemUpdate(id: $id, input: {name: $name}) {
+            menuItem {
+                name
+            }
+        }
+    }
+"""
+
+
+def test_menu_item_update_invalidates_menu_cache(
+    staff_api_client,
+    user_api_client,
+    menu_item,
+    menu_cache,
+    permission_manage_menus,
+    channel_USD,
+):
+    # given
+    _query_menu_tree(user_api_client, menu_item.menu, channel_USD)
+    variables = {
+        "id": graphene.Node.to_global_id("MenuItem", menu_item.pk),
+        "name": "New name",
+    }
+
+    # when
+    staff_api_client.post_graphql(
+        MENU_ITEM_UPDATE_MUTATION,
+        variables,
+        permissions=[permission_manage_menus],
+    )
+    flush_post_commit_hooks()
+
+    # then
+    items = _query_menu_tree(user_api_client, menu_item.menu, channel_USD)
+    assert items[0]["name"] == "New name"
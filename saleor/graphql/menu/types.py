@@ -27,8 +27,8 @@ from ..utils import get_user_or_app_from_context
 from .dataloaders import (
     MenuByIdLoader,
     MenuItemByIdLoader,
-    MenuItemChildrenLoader,
-    MenuItemsByParentMenuLoader,
+    MenuItemTranslationsByMenuIdAndLanguageCodeLoader,
+    MenuTreeByMenuIdAndChannelSlugLoader,
 )
 
 
@@ -49,11 +49,13 @@ class Menu(ChannelContextTypeWithMetadata, ModelObjectType):
 
     @staticmethod
     def resolve_items(root: ChannelContext[models.Menu], info, **_kwargs):
-        menu_items = MenuItemsByParentMenuLoader(info.context).load(root.node.id)
-        return menu_items.then(
-            lambda menu_items: [
+        tree = MenuTreeByMenuIdAndChannelSlugLoader(info.context).load(
+            (root.node.id, root.channel_slug)
+        )
+        return tree.then(
+            lambda tree: [
                 ChannelContext(node=menu_item, channel_slug=root.channel_slug)
-                for menu_item in menu_items
+                for menu_item in tree.get_children(None)
             ]
         )
 
@@ -77,7 +79,7 @@ class MenuItem(ChannelContextTypeWithMetadata, ModelObjectType):
     translation = TranslationField(
         MenuItemTranslation,
         type_name="menu item",
-        resolver=ChannelContextType.resolve_translation,
+        resolver=None,  # Disable default resolver
     )
 
     class Meta:
@@ -97,11 +99,13 @@ class MenuItem(ChannelContextTypeWithMetadata, ModelObjectType):
 
     @staticmethod
     def resolve_children(root: ChannelContext[models.MenuItem], info, **_kwargs):
-        menus = MenuItemChildrenLoader(info.context).load(root.node.id)
-        return menus.then(
-            lambda menus: [
-                ChannelContext(node=menu, channel_slug=root.channel_slug)
-                for menu in menus
+        tree = MenuTreeByMenuIdAndChannelSlugLoader(info.context).load(
+            (root.node.menu_id, root.channel_slug)
+        )
+        return tree.then(
+            lambda tree: [
+                ChannelContext(node=menu_item, channel_slug=root.channel_slug)
+                for menu_item in tree.get_children(root.node.id)
             ]
         )
 
@@ -182,6 +186,13 @@ class MenuItem(ChannelContextTypeWithMetadata, ModelObjectType):
             )
         return None
 
+    @staticmethod
+    def resolve_translation(root: ChannelContext[models.MenuItem], info, language_code):
+        translations = MenuItemTranslationsByMenuIdAndLanguageCodeLoader(
+            info.context
+        ).load((root.node.menu_id, language_code))
+        return translations.then(lambda translations: translations.get(root.node.id))
+
     @staticmethod
     def resolve_page(root: ChannelContext[models.MenuItem], info, **kwargs):
         if root.node.page_id:
@@ -1,6 +1,11 @@
+from ...app.cache import invalidate_app_cache
 from ...product.models import Product, ProductVariant
 
 
+def extra_app_actions(instance, info, **data):
+    invalidate_app_cache(instance.pk)
+
+
 def extra_checkout_actions(instance, info, **data):
     info.context.plugins.checkout_updated(instance)
 
@@ -18,6 +23,7 @@ def extra_user_actions(instance, info, **data):
 
 
 MODEL_EXTRA_METHODS = {
+    "App": extra_app_actions,
     "Checkout": extra_checkout_actions,
     "Product": extra_product_actions,
     "ProductVariant": extra_variant_actions,
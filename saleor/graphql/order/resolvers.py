@@ -1,11 +1,14 @@
+from django.conf import settings
+
 from ...channel.models import Channel
 from ...core.tracing import traced_resolver
 from ...order import OrderStatus, models
 from ...order.events import OrderEvents
 from ...order.models import OrderEvent
+from ...order.reports import get_sales_total
 from ...order.utils import sum_order_totals
 from ..channel.utils import get_default_channel_slug_or_graphql_error
-from ..utils.filters import filter_by_period
+from ..utils.filters import filter_by_period, reporting_period_to_date
 
 ORDER_SEARCH_FIELDS = ("id", "discount_name", "token", "user_email", "user__email")
 
@@ -29,6 +32,8 @@ def resolve_orders_total(_info, period, channel_slug):
     channel = Channel.objects.filter(slug=str(channel_slug)).first()
     if not channel:
         return None
+    if settings.SALES_ROLLUPS_ENABLED:
+        return get_sales_total(channel, reporting_period_to_date(period))
     qs = (
         models.Order.objects.non_draft()
         .exclude(status=OrderStatus.CANCELED)
@@ -1,7 +1,12 @@
 import graphene
 
 from ...core.permissions import OrderPermissions
-from ..core.connection import create_connection_slice, filter_connection_queryset
+from ..core.connection import (
+    CachedCount,
+    create_connection_slice,
+    filter_connection_queryset,
+    get_list_total_count,
+)
 from ..core.descriptions import DEPRECATED_IN_3X_FIELD
 from ..core.enums import ReportingPeriod
 from ..core.fields import ConnectionField, FilterConnectionField
@@ -89,7 +94,10 @@ class OrderQueries(graphene.ObjectType):
         channel=graphene.String(
             description="Slug of a channel for which the data should be returned."
         ),
-        description="List of orders.",
+        description=(
+            "List of orders. The total count of orders is estimated for large "
+            "unfiltered lists."
+        ),
     )
     draft_orders = FilterConnectionField(
         OrderCountableConnection,
@@ -124,15 +132,25 @@ class OrderQueries(graphene.ObjectType):
 
     @permission_required(OrderPermissions.MANAGE_ORDERS)
     def resolve_orders(self, info, channel=None, **kwargs):
+        # checked before filtering, which adds the channel to the filter input
+        total_count = get_list_total_count(kwargs)
         qs = resolve_orders(info, channel)
         qs = filter_connection_queryset(qs, kwargs)
-        return create_connection_slice(qs, info, kwargs, OrderCountableConnection)
+        return create_connection_slice(
+            qs,
+            info,
+            kwargs,
+            OrderCountableConnection,
+            total_count=total_count,
+        )
 
     @permission_required(OrderPermissions.MANAGE_ORDERS)
     def resolve_draft_orders(self, info, **kwargs):
         qs = resolve_draft_orders(info)
         qs = filter_connection_queryset(qs, kwargs)
-        return create_connection_slice(qs, info, kwargs, OrderCountableConnection)
+        return create_connection_slice(
+            qs, info, kwargs, OrderCountableConnection, total_count=CachedCount()
+        )
 
     @permission_required(OrderPermissions.MANAGE_ORDERS)
     def resolve_orders_total(self, info, period, channel=None, **_kwargs):
@@ -2,6 +2,7 @@ from datetime import date, timedelta
 
 from prices import Money
 
+from ....order.reports import update_all_sales_rollups
 from ...core.enums import ReportingPeriod
 from ...tests.utils import assert_no_permission, get_graphql_content
 
@@ -66,6 +67,31 @@ def test_orders_total(
     assert Money(amount, "USD") == order.total.gross
 
 
+def test_orders_total_from_sales_rollups(
+    staff_api_client,
+    permission_manage_orders,
+    order_with_lines,
+    order_with_lines_channel_PLN,
+    channel_USD,
+    settings,
+):
+    # given
+    settings.SALES_ROLLUPS_ENABLED = True
+    order = order_with_lines
+    update_all_sales_rollups()
+    variables = {"period": ReportingPeriod.TODAY.name, "channel": channel_USD.slug}
+
+    # when
+    response = staff_api_client.post_graphql(
+        QUERY_ORDER_TOTAL, variables, permissions=[permission_manage_orders]
+    )
+
+    # then
+    content = get_graphql_content(response)
+    amount = str(content["data"]["ordersTotal"]["gross"]["amount"])
+    assert Money(amount, "USD") == order.total.gross
+
+
 def test_orders_total_channel_pln(
     staff_api_client,
     permission_manage_orders,
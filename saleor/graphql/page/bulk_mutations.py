@@ -1,6 +1,7 @@
 import graphene
 
 from ...core.permissions import PagePermissions, PageTypePermissions
+from ...menu.utils import invalidate_menu_cache
 from ...page import models
 from ..core.mutations import BaseBulkMutation, ModelBulkDeleteMutation
 from ..core.types.common import PageError
@@ -21,6 +22,11 @@ class PageBulkDelete(ModelBulkDeleteMutation):
         error_type_class = PageError
         error_type_field = "page_errors"
 
+    @classmethod
+    def bulk_action(cls, info, queryset):
+        super().bulk_action(info, queryset)
+        invalidate_menu_cache()
+
 
 class PageBulkPublish(BaseBulkMutation):
     class Arguments:
@@ -42,6 +48,7 @@ class PageBulkPublish(BaseBulkMutation):
     @classmethod
     def bulk_action(cls, info, queryset, is_published):
         queryset.update(is_published=is_published)
+        invalidate_menu_cache()
 
 
 class PageTypeBulkDelete(ModelBulkDeleteMutation):
@@ -9,6 +9,7 @@ from ....attribute import AttributeInputType, AttributeType
 from ....attribute import models as attribute_models
 from ....core.permissions import PagePermissions, PageTypePermissions
 from ....core.tracing import traced_atomic_transaction
+from ....menu.utils import invalidate_menu_cache
 from ....page import models
 from ....page.error_codes import PageErrorCode
 from ...attribute.types import AttributeValueInput
@@ -141,6 +142,7 @@ class PageUpdate(PageCreate):
     def save(cls, info, instance, cleaned_input):
         super(PageCreate, cls).save(info, instance, cleaned_input)
         info.context.plugins.page_updated(instance)
+        invalidate_menu_cache()
 
 
 class PageDelete(ModelDeleteMutation):
@@ -162,6 +164,7 @@ class PageDelete(ModelDeleteMutation):
         cls.delete_assigned_attribute_values(page)
         response = super().perform_mutation(_root, info, **data)
         info.context.plugins.page_deleted(page)
+        invalidate_menu_cache()
         return response
 
     @staticmethod
@@ -1,15 +1,18 @@
 from collections import defaultdict
 
 import graphene
+from django.conf import settings
 from django.core.exceptions import ValidationError
 from django.db import transaction
-from django.db.models import Q
+from django.db.models import F, Q
 from graphene.types import InputObjectType
+from graphql.error import GraphQLError
 
 from ....attribute import AttributeInputType
 from ....attribute import models as attribute_models
 from ....core.permissions import ProductPermissions, ProductTypePermissions
 from ....core.tracing import traced_atomic_transaction
+from ....menu.utils import invalidate_menu_cache
 from ....order import events as order_events
 from ....order import models as order_models
 from ....order.tasks import recalculate_orders_task
@@ -19,14 +22,19 @@ from ....product.search import (
     prepare_product_search_document_value,
     update_product_search_document,
 )
-from ....product.tasks import update_product_discounted_price_task
+from ....product.tasks import (
+    update_product_discounted_price_task,
+    update_products_discounted_prices_task,
+)
 from ....product.utils import delete_categories
 from ....product.utils.variants import generate_and_set_variant_name
 from ....warehouse import models as warehouse_models
 from ....warehouse.error_codes import StockErrorCode
 from ...channel import ChannelContext
 from ...channel.types import Channel
+from ...core.descriptions import ADDED_IN_31
 from ...core.mutations import BaseMutation, ModelBulkDeleteMutation, ModelMutation
+from ...core.scalars import PositiveDecimal
 from ...core.types.common import (
     BulkProductError,
     BulkStockError,
@@ -34,7 +42,7 @@ from ...core.types.common import (
     ProductError,
     StockError,
 )
-from ...core.utils import get_duplicated_values
+from ...core.utils import from_global_id_or_error, get_duplicated_values
 from ...core.validators import validate_price_precision
 from ...warehouse.types import Warehouse
 from ..mutations.channels import ProductVariantChannelListingAddInput
@@ -105,6 +113,7 @@ class CollectionBulkDelete(ModelBulkDeleteMutation):
         for collection in queryset.iterator():
             info.context.plugins.collection_deleted(collection)
         queryset.delete()
+        invalidate_menu_cache()
 
         for product in products:
             info.context.plugins.product_updated(product)
@@ -398,15 +407,6 @@ class ProductVariantBulkCreate(BaseMutation):
                     e.params = {"index": index}
             error_dict[key].extend(value)
 
-    @classmethod
-    def save(cls, info, instance, cleaned_input):
-        instance.save()
-
-        attributes = cleaned_input.get("attributes")
-        if attributes:
-            AttributeAssignmentMixin.save(instance, attributes)
-            generate_and_set_variant_name(instance, cleaned_input.get("sku"))
-
     @classmethod
     def create_variants(cls, info, cleaned_inputs, product, errors):
         instances = []
@@ -510,8 +510,17 @@ class ProductVariantBulkCreate(BaseMutation):
         assert len(instances) == len(
             cleaned_inputs
         ), "There should be the same number of instances and cleaned inputs."
+        for instance in instances:
+            instance.save()
+        # attributes of all variants are saved at once
+        AttributeAssignmentMixin.save_many(
+            (instance, cleaned_input["attributes"])
+            for instance, cleaned_input in zip(instances, cleaned_inputs)
+            if cleaned_input.get("attributes")
+        )
         for instance, cleaned_input in zip(instances, cleaned_inputs):
-            cls.save(info, instance, cleaned_input)
+            if cleaned_input.get("attributes"):
+                generate_and_set_variant_name(instance, cleaned_input.get("sku"))
             cls.create_variant_stocks(instance, cleaned_input)
             cls.create_variant_channel_listings(instance, cleaned_input)
 
@@ -837,6 +846,372 @@ class ProductVariantStocksDelete(BaseMutation):
         return cls(product_variant=variant)
 
 
+class BulkInputErrorsMixin:
+    """Report errors of bulk mutation input items with the item index."""
+
+    @classmethod
+    def get_pk_or_error(cls, global_id, only_type, field, errors, index):
+        try:
+            _, pk = from_global_id_or_error(global_id, only_type, raise_error=True)
+            return int(pk)
+        except (GraphQLError, ValueError):
+            cls.update_errors(
+                errors,
+                f"Couldn't resolve {only_type} ID: {global_id}.",
+                field,
+                ProductErrorCode.GRAPHQL_ERROR,
+                index,
+            )
+            return None
+
+    @classmethod
+    def update_errors(cls, errors, msg, field, code, index):
+        error = ValidationError(msg, code=code.value, params={"index": index})
+        errors[field].append(error)
+
+
+class StockBulkUpdateInput(InputObjectType):
+    variant_id = graphene.ID(
+        description="ID of the product variant. Required when SKU is not given."
+    )
+    variant_sku = graphene.String(
+        description="SKU of the product variant. Required when ID is not given."
+    )
+    warehouse = graphene.ID(
+        required=True, description="Warehouse in which stock is located."
+    )
+    quantity = graphene.Int(
+        required=True, description="Quantity of items available for sell."
+    )
+
+
+class StockBulkUpdate(BulkInputErrorsMixin, BaseMutation):
+    count = graphene.Int(
+        required=True,
+        default_value=0,
+        description="Returns how many stocks were updated.",
+    )
+
+    class Arguments:
+        stocks = graphene.List(
+            graphene.NonNull(StockBulkUpdateInput),
+            required=True,
+            description="Input list of stocks to update.",
+        )
+
+    class Meta:
+        description = (
+            f"{ADDED_IN_31} Updates quantities of stocks identified by a product "
+            "variant ID or SKU and a warehouse. Missing stocks are created."
+        )
+        permissions = (ProductPermissions.MANAGE_PRODUCTS,)
+        error_type_class = BulkStockError
+
+    @classmethod
+    def perform_mutation(cls, root, info, **data):
+        errors = defaultdict(list)
+        stocks_data = cls.clean_stocks_input(data["stocks"], errors)
+        if errors:
+            raise ValidationError(errors)
+        if stocks_data:
+            cls.update_or_create_stocks(stocks_data, info.context.plugins)
+        return cls(count=len(stocks_data))
+
+    @classmethod
+    def clean_stocks_input(cls, stocks_input, errors):
+        """Return the (variant, warehouse, quantity) tuples to save.
+
+        Variants and warehouses are fetched with a single query each. Errors are
+        reported with the index of the input item.
+        """
+        items = []
+        for index, stock_data in enumerate(stocks_input):
+            variant_id = stock_data.get("variant_id")
+            variant_sku = stock_data.get("variant_sku")
+            variant_pk = None
+            if bool(variant_id) == bool(variant_sku):
+                cls.update_errors(
+                    errors,
+                    "Either variant ID or SKU is required.",
+                    "variant_id",
+                    ProductErrorCode.REQUIRED,
+                    index,
+                )
+            elif variant_id:
+                variant_pk = cls.get_pk_or_error(
+                    variant_id, ProductVariant, "variant_id", errors, index
+                )
+            warehouse_pk = cls.get_pk_or_error(
+                stock_data["warehouse"], Warehouse, "warehouse", errors, index
+            )
+            if stock_data["quantity"] < 0:
+                cls.update_errors(
+                    errors,
+                    "Quantity can't be negative.",
+                    "quantity",
+                    ProductErrorCode.INVALID,
+                    index,
+                )
+            items.append(
+                (variant_pk, variant_sku, warehouse_pk, stock_data["quantity"])
+            )
+        if errors:
+            return []
+
+        variants = models.ProductVariant.objects.filter(
+            Q(pk__in=[item[0] for item in items if item[0]])
+            | Q(sku__in=[item[1] for item in items if item[1]])
+        )
+        variants_by_pk = {variant.pk: variant for variant in variants}
+        variants_by_sku = {variant.sku: variant for variant in variants if variant.sku}
+        warehouses = warehouse_models.Warehouse.objects.in_bulk(
+            [item[2] for item in items]
+        )
+
+        stocks_data = []
+        keys = set()
+        for index, (variant_pk, variant_sku, warehouse_pk, quantity) in enumerate(
+            items
+        ):
+            if variant_pk:
+                variant = variants_by_pk.get(variant_pk)
+            else:
+                variant = variants_by_sku.get(variant_sku)
+            warehouse = warehouses.get(warehouse_pk)
+            if not variant:
+                cls.update_errors(
+                    errors,
+                    "Product variant doesn't exist.",
+                    "variant_id" if variant_pk else "variant_sku",
+                    ProductErrorCode.NOT_FOUND,
+                    index,
+                )
+            if not warehouse:
+                cls.update_errors(
+                    errors,
+                    "Warehouse doesn't exist.",
+                    "warehouse",
+                    ProductErrorCode.NOT_FOUND,
+                    index,
+                )
+            if not variant or not warehouse:
+                continue
+            key = (variant.pk, warehouse.pk)
+            if key in keys:
+                cls.update_errors(
+                    errors,
+                    "Duplicated stock for this variant and warehouse.",
+                    "warehouse",
+                    ProductErrorCode.DUPLICATED_INPUT_ITEM,
+                    index,
+                )
+                continue
+            keys.add(key)
+            stocks_data.append((variant, warehouse, quantity))
+        return stocks_data
+
+    @classmethod
+    @traced_atomic_transaction()
+    def update_or_create_stocks(cls, stocks_data, manager):
+        """Save quantities with one update and one insert.
+
+        Stock events are sent only for stocks whose quantity crossed zero.
+        """
+        variant_pks = {variant.pk for variant, _, _ in stocks_data}
+        warehouse_pks = {warehouse.pk for _, warehouse, _ in stocks_data}
+        existing_stocks = {
+            (stock.product_variant_id, stock.warehouse_id): stock
+            for stock in warehouse_models.Stock.objects.select_for_update()
+            .filter(product_variant_id__in=variant_pks, warehouse_id__in=warehouse_pks)
+            .order_by("pk")
+        }
+
+        stocks_to_update, stocks_to_create = [], []
+        back_in_stock, out_of_stock = [], []
+        for variant, warehouse, quantity in stocks_data:
+            stock = existing_stocks.get((variant.pk, warehouse.pk))
+            if stock is None:
+                stock = warehouse_models.Stock(
+                    product_variant=variant, warehouse=warehouse, quantity=quantity
+                )
+                stocks_to_create.append(stock)
+                if quantity > 0:
+                    back_in_stock.append(stock)
+                continue
+            stock.product_variant = variant
+            stock.warehouse = warehouse
+            if stock.quantity <= 0 < quantity:
+                back_in_stock.append(stock)
+            elif quantity <= 0 < stock.quantity:
+                out_of_stock.append(stock)
+            stock.quantity = quantity
+            stocks_to_update.append(stock)
+
+        warehouse_models.Stock.objects.bulk_update(stocks_to_update, ["quantity"])
+        warehouse_models.Stock.objects.bulk_create(stocks_to_create)
+
+        def send_stock_events():
+            for stock in back_in_stock:
+                manager.product_variant_back_in_stock(stock)
+            for stock in out_of_stock:
+                manager.product_variant_out_of_stock(stock)
+
+        if back_in_stock or out_of_stock:
+            transaction.on_commit(send_stock_events)
+
+
+class ProductVariantChannelListingBulkUpdateInput(InputObjectType):
+    variant_id = graphene.ID(required=True, description="ID of a product variant.")
+    channel_id = graphene.ID(required=True, description="ID of a channel.")
+    price = PositiveDecimal(description="Price of the particular variant in channel.")
+    cost_price = PositiveDecimal(description="Cost price of the variant in channel.")
+
+
+class ProductVariantChannelListingBulkUpdate(BulkInputErrorsMixin, BaseMutation):
+    count = graphene.Int(
+        required=True,
+        default_value=0,
+        description="Returns how many channel listings were updated.",
+    )
+
+    class Arguments:
+        input = graphene.List(
+            graphene.NonNull(ProductVariantChannelListingBulkUpdateInput),
+            required=True,
+            description="List of product variant prices in channels to update.",
+        )
+
+    class Meta:
+        description = (
+            f"{ADDED_IN_31} Updates prices of product variants in channels the "
+            "variants are available in. Discounted prices of the affected products "
+            "are recalculated in the background and `PRODUCT_UPDATED` webhook is "
+            "sent once per affected product."
+        )
+        permissions = (ProductPermissions.MANAGE_PRODUCTS,)
+        error_type_class = BulkProductError
+
+    @classmethod
+    @traced_atomic_transaction()
+    def perform_mutation(cls, root, info, **data):
+        errors = defaultdict(list)
+        listings = cls.clean_listings_input(data["input"], errors)
+        if errors:
+            raise ValidationError(errors)
+        models.ProductVariantChannelListing.objects.bulk_update(
+            listings,
+            ["price_amount", "cost_price_amount"],
+            batch_size=settings.BULK_OPERATION_BATCH_SIZE,
+        )
+        product_ids = sorted({listing.product_id for listing in listings})
+        manager = info.context.plugins
+        transaction.on_commit(lambda: cls.post_save_action(product_ids, manager))
+        return cls(count=len(listings))
+
+    @classmethod
+    def clean_listings_input(cls, listings_input, errors):
+        """Return the channel listings with the new prices set.
+
+        Listings are fetched with a single query. Errors are reported with the
+        index of the input item.
+        """
+        items = []
+        keys = set()
+        for index, listing_data in enumerate(listings_input):
+            variant_pk = cls.get_pk_or_error(
+                listing_data["variant_id"], ProductVariant, "variant_id", errors, index
+            )
+            channel_pk = cls.get_pk_or_error(
+                listing_data["channel_id"], Channel, "channel_id", errors, index
+            )
+            if "price" not in listing_data and "cost_price" not in listing_data:
+                cls.update_errors(
+                    errors,
+                    "Price or cost price is required.",
+                    "price",
+                    ProductErrorCode.REQUIRED,
+                    index,
+                )
+            elif "price" in listing_data and listing_data["price"] is None:
+                cls.update_errors(
+                    errors,
+                    "Price can't be removed.",
+                    "price",
+                    ProductErrorCode.REQUIRED,
+                    index,
+                )
+            if (variant_pk, channel_pk) in keys:
+                cls.update_errors(
+                    errors,
+                    "Duplicated variant and channel.",
+                    "channel_id",
+                    ProductErrorCode.DUPLICATED_INPUT_ITEM,
+                    index,
+                )
+            keys.add((variant_pk, channel_pk))
+            items.append((variant_pk, channel_pk, listing_data))
+        if errors:
+            return []
+
+        listings_qs = (
+            models.ProductVariantChannelListing.objects.select_for_update(of=("self",))
+            .filter(
+                variant_id__in={variant_pk for variant_pk, _, _ in items},
+                channel_id__in={channel_pk for _, channel_pk, _ in items},
+            )
+            .annotate(product_id=F("variant__product_id"))
+            .order_by("pk")
+        )
+        listings = {
+            (listing.variant_id, listing.channel_id): listing for listing in listings_qs
+        }
+        listings_to_update = []
+        for index, (variant_pk, channel_pk, listing_data) in enumerate(items):
+            listing = listings.get((variant_pk, channel_pk))
+            if listing is None:
+                cls.update_errors(
+                    errors,
+                    "Product variant isn't available in the channel.",
+                    "channel_id",
+                    ProductErrorCode.NOT_FOUND,
+                    index,
+                )
+                continue
+            for field in ["price", "cost_price"]:
+                if field not in listing_data:
+                    continue
+                try:
+                    validate_price_precision(listing_data[field], listing.currency)
+                except ValidationError as error:
+                    cls.update_errors(
+                        errors, error.message, field, ProductErrorCode.INVALID, index
+                    )
+                    continue
+                setattr(listing, f"{field}_amount", listing_data[field])
+            listings_to_update.append(listing)
+        return listings_to_update
+
+    @classmethod
+    def post_save_action(cls, product_ids, manager):
+        """Recalculate discounted prices and send webhooks of the updated products.
+
+        Products are split between tasks and loaded for webhooks in batches.
+        """
+        task_size = settings.DISCOUNTED_PRICES_UPDATE_TASK_SIZE
+        for start in range(0, len(product_ids), task_size):
+            task_product_ids = product_ids[start : start + task_size]  # noqa: E203
+            update_products_discounted_prices_task.delay(task_product_ids)
+
+        batch_size = settings.BULK_OPERATION_BATCH_SIZE
+        for start in range(0, len(product_ids), batch_size):
+            batch_product_ids = product_ids[start : start + batch_size]  # noqa: E203
+            products = models.Product.objects.filter(
+                pk__in=batch_product_ids
+            ).prefetched_for_webhook(single_object=False)
+            for product in products:
+                manager.product_updated(product)
+
+
 class ProductTypeBulkDelete(ModelBulkDeleteMutation):
     class Arguments:
         ids = graphene.List(
@@ -10,6 +10,7 @@ from django.db.utils import IntegrityError
 from ....checkout.models import CheckoutLine
 from ....core.permissions import ProductPermissions
 from ....core.tracing import traced_atomic_transaction
+from ....menu.utils import invalidate_menu_cache
 from ....product.error_codes import CollectionErrorCode, ProductErrorCode
 from ....product.models import CollectionChannelListing
 from ....product.models import Product as ProductModel
@@ -521,6 +522,7 @@ class CollectionChannelListingUpdate(BaseChannelListingMutation):
     def save(cls, info, collection: "CollectionModel", cleaned_input: Dict):
         cls.add_channels(collection, cleaned_input.get("add_channels", []))
         cls.remove_channels(collection, cleaned_input.get("remove_channels", []))
+        invalidate_menu_cache()
 
     @classmethod
     def perform_mutation(cls, _root, info, id, input):
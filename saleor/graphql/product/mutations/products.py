@@ -15,6 +15,7 @@ from ....core.permissions import ProductPermissions, ProductTypePermissions
 from ....core.tracing import traced_atomic_transaction
 from ....core.utils.editorjs import clean_editor_js
 from ....core.utils.validators import get_oembed_data
+from ....menu.utils import invalidate_menu_cache
 from ....order import OrderStatus
 from ....order import events as order_events
 from ....order import models as order_models
@@ -159,6 +160,10 @@ class CategoryUpdate(CategoryCreate):
         error_type_class = ProductError
         error_type_field = "product_errors"
 
+    @classmethod
+    def post_save_action(cls, info, instance, cleaned_input):
+        invalidate_menu_cache()
+
 
 class CategoryDelete(ModelDeleteMutation):
     class Arguments:
@@ -286,6 +291,7 @@ class CollectionUpdate(CollectionCreate):
     def post_save_action(cls, info, instance, cleaned_input):
         """Override this method with `pass` to avoid triggering product webhook."""
         info.context.plugins.collection_updated(instance)
+        invalidate_menu_cache()
 
     @classmethod
     def save(cls, info, instance, cleaned_input):
@@ -314,6 +320,7 @@ class CollectionDelete(ModelDeleteMutation):
         products = list(instance.products.prefetched_for_webhook(single_object=False))
 
         result = super().perform_mutation(_root, info, **kwargs)
+        invalidate_menu_cache()
 
         info.context.plugins.collection_deleted(instance)
         for product in products:
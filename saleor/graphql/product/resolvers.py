@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.db.models import Exists, OuterRef, Sum
 
 from ...channel.models import Channel
@@ -6,12 +7,13 @@ from ...core.permissions import has_one_of_permissions
 from ...core.tracing import traced_resolver
 from ...order import OrderStatus
 from ...order.models import Order
+from ...order.reports import annotate_quantity_ordered
 from ...product import models
 from ...product.models import ALL_PRODUCTS_PERMISSIONS
 from ..channel import ChannelQsContext
 from ..core.utils import from_global_id_or_error
 from ..utils import get_user_or_app_from_context
-from ..utils.filters import filter_by_period
+from ..utils.filters import filter_by_period, reporting_period_to_date
 
 
 def resolve_category_by_id(id):
@@ -156,6 +158,13 @@ def resolve_product_variants(
 def resolve_report_product_sales(period, channel_slug) -> ChannelQsContext:
     qs = models.ProductVariant.objects.all()
 
+    if settings.SALES_ROLLUPS_ENABLED:
+        qs = annotate_quantity_ordered(
+            qs, channel_slug, reporting_period_to_date(period)
+        )
+        qs = qs.filter(quantity_ordered__isnull=False).order_by("-quantity_ordered")
+        return ChannelQsContext(qs=qs, channel_slug=channel_slug)
+
     # filter by period
     qs = filter_by_period(qs, period, "order_lines__order__created")
 
@@ -6,7 +6,11 @@ from ...core.permissions import ProductPermissions, has_one_of_permissions
 from ...product.models import ALL_PRODUCTS_PERMISSIONS
 from ..channel import ChannelContext
 from ..channel.utils import get_default_channel_slug_or_graphql_error
-from ..core.connection import create_connection_slice, filter_connection_queryset
+from ..core.connection import (
+    CachedCount,
+    create_connection_slice,
+    filter_connection_queryset,
+)
 from ..core.enums import ReportingPeriod
 from ..core.fields import ConnectionField, FilterConnectionField
 from ..core.utils import from_global_id_or_error
@@ -27,9 +31,11 @@ from .bulk_mutations.products import (
     ProductTypeBulkDelete,
     ProductVariantBulkCreate,
     ProductVariantBulkDelete,
+    ProductVariantChannelListingBulkUpdate,
     ProductVariantStocksCreate,
     ProductVariantStocksDelete,
     ProductVariantStocksUpdate,
+    StockBulkUpdate,
 )
 from .filters import (
     CategoryFilterInput,
@@ -344,7 +350,9 @@ class ProductQueries(graphene.ObjectType):
         qs = resolve_products(info, requestor, channel_slug=channel, **kwargs)
         kwargs["channel"] = channel
         qs = filter_connection_queryset(qs, kwargs)
-        return create_connection_slice(qs, info, kwargs, ProductCountableConnection)
+        return create_connection_slice(
+            qs, info, kwargs, ProductCountableConnection, total_count=CachedCount()
+        )
 
     def resolve_product_type(self, info, id, **_kwargs):
         _, id = from_global_id_or_error(id, ProductType)
@@ -476,10 +484,14 @@ class ProductMutations(graphene.ObjectType):
     product_variant_stocks_create = ProductVariantStocksCreate.Field()
     product_variant_stocks_delete = ProductVariantStocksDelete.Field()
     product_variant_stocks_update = ProductVariantStocksUpdate.Field()
+    stock_bulk_update = StockBulkUpdate.Field()
     product_variant_update = ProductVariantUpdate.Field()
     product_variant_set_default = ProductVariantSetDefault.Field()
     product_variant_translate = ProductVariantTranslate.Field()
     product_variant_channel_listing_update = ProductVariantChannelListingUpdate.Field()
+    product_variant_channel_listing_bulk_update = (
+        ProductVariantChannelListingBulkUpdate.Field()
+    )
     product_variant_reorder_attribute_values = (
         ProductVariantReorderAttributeValues.Field()
     )
@@ -27,6 +27,7 @@ from ....core.units import MeasurementUnits, WeightUnits
 from ....core.utils.editorjs import clean_editor_js
 from ....order import OrderEvents, OrderStatus
 from ....order.models import OrderEvent, OrderLine
+from ....order.reports import update_all_sales_rollups
 from ....plugins.manager import PluginsManager, get_plugins_manager
 from ....product import ProductMediaTypes, ProductTypeKind
 from ....product.error_codes import ProductErrorCode
@@ -10465,6 +10466,38 @@ def test_report_product_sales(
     assert Decimal(amount) == line_b.quantity * line_b.unit_price_gross_amount
 
 
+def test_report_product_sales_from_sales_rollups(
+    staff_api_client,
+    order_with_lines,
+    order_with_lines_channel_PLN,
+    permission_manage_products,
+    permission_manage_orders,
+    channel_USD,
+    settings,
+):
+    # given
+    settings.SALES_ROLLUPS_ENABLED = True
+    order = order_with_lines
+    update_all_sales_rollups()
+    variables = {"period": ReportingPeriod.TODAY.name, "channel": channel_USD.slug}
+    permissions = [permission_manage_orders, permission_manage_products]
+
+    # when
+    response = staff_api_client.post_graphql(
+        QUERY_REPORT_PRODUCT_SALES, variables, permissions
+    )
+
+    # then
+    content = get_graphql_content(response)
+    edges = content["data"]["reportProductSales"]["edges"]
+    assert len(edges) == order.lines.count()
+    quantities = [edge["node"]["quantityOrdered"] for edge in edges]
+    assert quantities == sorted(quantities, reverse=True)
+    for edge in edges:
+        line = order.lines.get(product_sku=edge["node"]["sku"])
+        assert edge["node"]["quantityOrdered"] == line.quantity
+
+
 def test_report_product_sales_channel_pln(
     staff_api_client,
     order_with_lines,
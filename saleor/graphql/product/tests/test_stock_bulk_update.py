@@ -0,0 +1,232 @@
+from unittest.mock import patch
+
+import graphene
+
+from ....product.error_codes import ProductErrorCode
+from ....tests.utils import flush_post_commit_hooks
+from ....warehouse.models import Stock
+from ...tests.utils import assert_no_permission, get_graphql_content
+
+STOCK_BULK_UPDATE_MUTATION = """
+    mutation StockBulkUpdate($stocks: [StockBulkUpdateInput!]!) {
+        stockBulkUpdate(stocks: $stocks) {
+            count
+            errors {
+                field
+                code
+                index
+            }
+        }
+    }
+"""
+
+
+@patch("saleor.plugins.manager.PluginsManager.product_variant_out_of_stock")
+@patch("saleor.plugins.manager.PluginsManager.product_variant_back_in_stock")
+def test_stock_bulk_update(
+    back_in_stock_mock,
+    out_of_stock_mock,
+    staff_api_client,
+    product_variant_list,
+    warehouses,
+    permission_manage_products,
+):
+    # given
+    in_stock, out_of_stock, restocked, new = product_variant_list
+    Stock.objects.bulk_create(
+        [
+            Stock(product_variant=in_stock, warehouse=warehouses[0], quantity=5),
+            Stock(product_variant=out_of_stock, warehouse=warehouses[0], quantity=5),
+            Stock(product_variant=restocked, warehouse=warehouses[0], quantity=0),
+        ]
+    )
+    warehouse_id = graphene.Node.to_global_id("Warehouse", warehouses[0].pk)
+    stocks = [
+        {
+            "variantId": graphene.Node.to_global_id("ProductVariant", in_stock.pk),
+            "warehouse": warehouse_id,
+            "quantity": 10,
+        },
+        {"variantSku": out_of_stock.sku, "warehouse": warehouse_id, "quantity": 0},
+        {"variantSku": restocked.sku, "warehouse": warehouse_id, "quantity": 3},
+        {
+            "variantSku": new.sku,
+            "warehouse": graphene.Node.to_global_id("Warehouse", warehouses[1].pk),
+            "quantity": 7,
+        },
+    ]
+
+    # when
+    response = staff_api_client.post_graphql(
+        STOCK_BULK_UPDATE_MUTATION,
+        {"stocks": stocks},
+        permissions=[permission_manage_products],
+    )
+    content = get_graphql_content(response)
+    flush_post_commit_hooks()
+
+    # then
+    data = content["data"]["stockBulkUpdate"]
+    assert not data["errors"]
+    assert data["count"] == 4
+    quantities = {
+        (stock.product_variant_id, stock.warehouse_id): stock.quantity
+        for stock in Stock.objects.filter(product_variant__in=product_variant_list)
+    }
+    assert quantities == {
+        (in_stock.pk, warehouses[0].pk): 10,
+        (out_of_stock.pk, warehouses[0].pk): 0,
+        (restocked.pk, warehouses[0].pk): 3,
+        (new.pk, warehouses[1].pk): 7,
+    }
+    assert {
+        call.args[0].product_variant_id for call in back_in_stock_mock.call_args_list
+    } == {restocked.pk, new.pk}
+    out_of_stock_mock.assert_called_once()
+    assert out_of_stock_mock.call_args.args[0].product_variant_id == out_of_stock.pk
+
+
+@patch("saleor.plugins.manager.PluginsManager.product_variant_out_of_stock")
+@patch("saleor.plugins.manager.PluginsManager.product_variant_back_in_stock")
+def test_stock_bulk_update_without_threshold_crossing(
+    back_in_stock_mock,
+    out_of_stock_mock,
+    staff_api_client,
+    variant,
+    warehouse,
+    permission_manage_products,
+):
+    # given
+    stock = Stock.objects.create(product_variant=variant, warehouse=warehouse)
+    stocks = [
+        {
+            "variantSku": variant.sku,
+            "warehouse": graphene.Node.to_global_id("Warehouse", warehouse.pk),
+            "quantity": 0,
+        }
+    ]
+
+    # when
+    response = staff_api_client.post_graphql(
+        STOCK_BULK_UPDATE_MUTATION,
+        {"stocks": stocks},
+        permissions=[permission_manage_products],
+    )
+    content = get_graphql_content(response)
+    flush_post_commit_hooks()
+
+    # then
+    assert content["data"]["stockBulkUpdate"]["count"] == 1
+    stock.refresh_from_db()
+    assert stock.quantity == 0
+    back_in_stock_mock.assert_not_called()
+    out_of_stock_mock.assert_not_called()
+
+
+def test_stock_bulk_update_errors(
+    staff_api_client, variant, warehouse, permission_manage_products
+):
+    # given
+    stock = Stock.objects.create(
+        product_variant=variant, warehouse=warehouse, quantity=5
+    )
+    variant_id = graphene.Node.to_global_id("ProductVariant", variant.pk)
+    warehouse_id = graphene.Node.to_global_id("Warehouse", warehouse.pk)
+    stocks = [
+        {"variantId": variant_id, "warehouse": warehouse_id, "quantity": 1},
+        {"warehouse": warehouse_id, "quantity": 1},
+        {"variantSku": "unknown", "warehouse": warehouse_id, "quantity": 1},
+        {"variantSku": variant.sku, "warehouse": warehouse_id, "quantity": 1},
+        {"variantId": variant_id, "warehouse": variant_id, "quantity": 1},
+        {"variantSku": variant.sku, "warehouse": warehouse_id, "quantity": -1},
+    ]
+
+    # when
+    response = staff_api_client.post_graphql(
+        STOCK_BULK_UPDATE_MUTATION,
+        {"stocks": stocks},
+        permissions=[permission_manage_products],
+    )
+    content = get_graphql_content(response)
+
+    # then
+    data = content["data"]["stockBulkUpdate"]
+    assert data["count"] == 0
+    assert sorted(data["errors"], key=lambda error: error["index"]) == [
+        {
+            "field": "variantId",
+            "code": ProductErrorCode.REQUIRED.name,
+            "index": 1,
+        },
+        {
+            "field": "warehouse",
+            "code": ProductErrorCode.GRAPHQL_ERROR.name,
+            "index": 4,
+        },
+        {
+            "field": "quantity",
+            "code": ProductErrorCode.INVALID.name,
+            "index": 5,
+        },
+    ]
+    stock.refresh_from_db()
+    assert stock.quantity == 5
+
+
+def test_stock_bulk_update_not_found_and_duplicated_items(
+    staff_api_client, variant, warehouse, permission_manage_products
+):
+    # given
+    variant_id = graphene.Node.to_global_id("ProductVariant", variant.pk)
+    warehouse_id = graphene.Node.to_global_id("Warehouse", warehouse.pk)
+    stocks = [
+        {"variantId": variant_id, "warehouse": warehouse_id, "quantity": 1},
+        {"variantSku": "unknown", "warehouse": warehouse_id, "quantity": 1},
+        {"variantSku": variant.sku, "warehouse": warehouse_id, "quantity": 2},
+    ]
+
+    # when
+    response = staff_api_client.post_graphql(
+        STOCK_BULK_UPDATE_MUTATION,
+        {"stocks": stocks},
+        permissions=[permission_manage_products],
+    )
+    content = get_graphql_content(response)
+
+    # then
+    data = content["data"]["stockBulkUpdate"]
+    assert data["count"] == 0
+    assert sorted(data["errors"], key=lambda error: error["index"]) == [
+        {
+            "field": "variantSku",
+            "code": ProductErrorCode.NOT_FOUND.name,
+            "index": 1,
+        },
+        {
+            "field": "warehouse",
+            "code": ProductErrorCode.DUPLICATED_INPUT_ITEM.name,
+            "index": 2,
+        },
+    ]
+    assert not Stock.objects.filter(product_variant=variant).exists()
+
+
+def test_stock_bulk_update_by_staff_without_permission(
+    staff_api_client, variant, warehouse
+):
+    # given
+    stocks = [
+        {
+            "variantSku": variant.sku,
+            "warehouse": graphene.Node.to_global_id("Warehouse", warehouse.pk),
+            "quantity": 1,
+        }
+    ]
+
+    # when
+    response = staff_api_client.post_graphql(
+        STOCK_BULK_UPDATE_MUTATION, {"stocks": stocks}
+    )
+
+    # then
+    assert_no_permission(response)
@@ -0,0 +1,230 @@
+from decimal import Decimal
+from unittest.mock import patch
+
+import graphene
+
+from ....product.error_codes import ProductErrorCode
+from ....tests.utils import flush_post_commit_hooks
+from ...tests.utils import assert_no_permission, get_graphql_content
+
+PRODUCT_VARIANT_CHANNEL_LISTING_BULK_UPDATE_MUTATION = """
+    mutation ProductVariantChannelListingBulkUpdate(
+        $input: [ProductVariantChannelListingBulkUpdateInput!]!
+    ) {
+        productVariantChannelListingBulkUpdate(input: $input) {
+            count
+            errors {
+                field
+                code
+                index
+            }
+        }
+    }
+"""
+
+
+@patch("saleor.plugins.manager.PluginsManager.product_updated")
+@patch(
+    "saleor.graphql.product.bulk_mutations.products."
+    "update_products_discounted_prices_task"
+)
+def test_product_variant_channel_listing_bulk_update(
+    update_prices_task_mock,
+    product_updated_mock,
+    staff_api_client,
+    product_variant_list,
+    channel_USD,
+    channel_PLN,
+    permission_manage_products,
+):
+    # given
+    variant_usd, _, variant_pln, _ = product_variant_list
+    input = [
+        {
+            "variantId": graphene.Node.to_global_id("ProductVariant", variant_usd.pk),
+            "channelId": graphene.Node.to_global_id("Channel", channel_USD.pk),
+            "price": 15,
+            "costPrice": 5,
+        },
+        {
+            "variantId": graphene.Node.to_global_id("ProductVariant", variant_pln.pk),
+            "channelId": graphene.Node.to_global_id("Channel", channel_PLN.pk),
+            "price": "20.50",
+        },
+    ]
+
+    # when
+    response = staff_api_client.post_graphql(
+        PRODUCT_VARIANT_CHANNEL_LISTING_BULK_UPDATE_MUTATION,
+        {"input": input},
+        permissions=[permission_manage_products],
+    )
+    content = get_graphql_content(response)
+    flush_post_commit_hooks()
+
+    # then
+    data = content["data"]["productVariantChannelListingBulkUpdate"]
+    assert not data["errors"]
+    assert data["count"] == 2
+    listing_usd = variant_usd.channel_listings.get()
+    assert listing_usd.price_amount == Decimal(15)
+    assert listing_usd.cost_price_amount == Decimal(5)
+    listing_pln = variant_pln.channel_listings.get()
+    assert listing_pln.price_amount == Decimal("20.50")
+    assert listing_pln.cost_price_amount == Decimal(1)
+    update_prices_task_mock.delay.assert_called_once_with([variant_usd.product_id])
+    product_updated_mock.assert_called_once()
+    assert product_updated_mock.call_args.args[0].pk == variant_usd.product_id
+
+
+@patch(
+    "saleor.graphql.product.bulk_mutations.products."
+    "update_products_discounted_prices_task"
+)
+def test_product_variant_channel_listing_bulk_update_in_task_batches(
+    update_prices_task_mock,
+    staff_api_client,
+    product_list,
+    channel_USD,
+    permission_manage_products,
+    settings,
+):
+    # given
+    settings.DISCOUNTED_PRICES_UPDATE_TASK_SIZE = 2
+    channel_id = graphene.Node.to_global_id("Channel", channel_USD.pk)
+    variants = [product.variants.get() for product in product_list]
+    input = [
+        {
+            "variantId": graphene.Node.to_global_id("ProductVariant", variant.pk),
+            "channelId": channel_id,
+            "price": 30,
+        }
+        for variant in variants
+    ]
+
+    # when
+    response = staff_api_client.post_graphql(
+        PRODUCT_VARIANT_CHANNEL_LISTING_BULK_UPDATE_MUTATION,
+        {"input": input},
+        permissions=[permission_manage_products],
+    )
+    content = get_graphql_content(response)
+    flush_post_commit_hooks()
+
+    # then
+    assert content["data"]["productVariantChannelListingBulkUpdate"]["count"] == 3
+    product_ids = sorted(product.pk for product in product_list)
+    assert [call.args[0] for call in update_prices_task_mock.delay.call_args_list] == [
+        product_ids[:2],
+        product_ids[2:],
+    ]
+
+
+def test_product_variant_channel_listing_bulk_update_errors(
+    staff_api_client, product_variant_list, channel_USD, permission_manage_products
+):
+    # given
+    variant_usd = product_variant_list[0]
+    variant_usd_id = graphene.Node.to_global_id("ProductVariant", variant_usd.pk)
+    channel_usd_id = graphene.Node.to_global_id("Channel", channel_USD.pk)
+    input = [
+        {"variantId": variant_usd_id, "channelId": channel_usd_id, "price": 15},
+        {"variantId": variant_usd_id, "channelId": channel_usd_id, "price": 16},
+        {"variantId": variant_usd_id, "channelId": channel_usd_id},
+        {"variantId": variant_usd_id, "channelId": variant_usd_id, "price": 15},
+    ]
+
+    # when
+    response = staff_api_client.post_graphql(
+        PRODUCT_VARIANT_CHANNEL_LISTING_BULK_UPDATE_MUTATION,
+        {"input": input},
+        permissions=[permission_manage_products],
+    )
+    content = get_graphql_content(response)
+
+    # then
+    data = content["data"]["productVariantChannelListingBulkUpdate"]
+    assert data["count"] == 0
+    assert sorted(data["errors"], key=lambda error: error["index"]) == [
+        {
+            "field": "channelId",
+            "code": ProductErrorCode.DUPLICATED_INPUT_ITEM.name,
+            "index": 1,
+        },
+        {
+            "field": "price",
+            "code": ProductErrorCode.REQUIRED.name,
+            "index": 2,
+        },
+        {
+            "field": "channelId",
+            "code": ProductErrorCode.GRAPHQL_ERROR.name,
+            "index": 3,
+        },
+    ]
+    assert variant_usd.channel_listings.get().price_amount == Decimal(10)
+
+
+def test_product_variant_channel_listing_bulk_update_invalid_listings(
+    staff_api_client, product_variant_list, channel_USD, permission_manage_products
+):
+    # given
+    variant_usd, _, variant_pln, _ = product_variant_list
+    input = [
+        {
+            "variantId": graphene.Node.to_global_id("ProductVariant", variant_usd.pk),
+            "channelId": graphene.Node.to_global_id("Channel", channel_USD.pk),
+            "price": "15.123",
+        },
+        {
+            "variantId": graphene.Node.to_global_id("ProductVariant", variant_pln.pk),
+            "channelId": graphene.Node.to_global_id("Channel", channel_USD.pk),
+            "price": 15,
+        },
+    ]
+
+    # when
+    response = staff_api_client.post_graphql(
+        PRODUCT_VARIANT_CHANNEL_LISTING_BULK_UPDATE_MUTATION,
+        {"input": input},
+        permissions=[permission_manage_products],
+    )
+    content = get_graphql_content(response)
+
+    # then
+    data = content["data"]["productVariantChannelListingBulkUpdate"]
+    assert data["count"] == 0
+    assert sorted(data["errors"], key=lambda error: error["index"]) == [
+        {
+            "field": "price",
+            "code": ProductErrorCode.INVALID.name,
+            "index": 0,
+        },
+        {
+            "field": "channelId",
+            "code": ProductErrorCode.NOT_FOUND.name,
+            "index": 1,
+        },
+    ]
+    assert variant_usd.channel_listings.get().price_amount == Decimal(10)
+
+
+def test_product_variant_channel_listing_bulk_update_by_staff_without_permission(
+    staff_api_client, variant, channel_USD
+):
+    # given
+    input = [
+        {
+            "variantId": graphene.Node.to_global_id("ProductVariant", variant.pk),
+            "channelId": graphene.Node.to_global_id("Channel", channel_USD.pk),
+            "price": 15,
+        }
+    ]
+
+    # when
+    response = staff_api_client.post_graphql(
+        PRODUCT_VARIANT_CHANNEL_LISTING_BULK_UPDATE_MUTATION, {"input": input}
+    )
+
+    # then
+    assert_no_permission(response)
@@ -2,6 +2,7 @@ import graphene
 
 from ...core.permissions import ShippingPermissions
 from ...shipping import models
+from ...shipping.rules import invalidate_shipping_rules_index
 from ..core.mutations import ModelBulkDeleteMutation
 from ..core.types.common import ShippingError
 from .types import ShippingMethod, ShippingZone
@@ -23,6 +24,11 @@ class ShippingZoneBulkDelete(ModelBulkDeleteMutation):
         error_type_class = ShippingError
         error_type_field = "shipping_errors"
 
+    @classmethod
+    def bulk_action(cls, info, queryset):
+        super().bulk_action(info, queryset)
+        invalidate_shipping_rules_index()
+
 
 class ShippingPriceBulkDelete(ModelBulkDeleteMutation):
     class Arguments:
@@ -56,3 +62,8 @@ class ShippingPriceBulkDelete(ModelBulkDeleteMutation):
             qs=models.ShippingMethod.objects,
             schema=schema,
         )
+
+    @classmethod
+    def bulk_action(cls, info, queryset):
+        super().bulk_action(info, queryset)
+        invalidate_shipping_rules_index()
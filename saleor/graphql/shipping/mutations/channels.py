@@ -8,6 +8,7 @@ from ....core.permissions import ShippingPermissions
 from ....core.tracing import traced_atomic_transaction
 from ....shipping.error_codes import ShippingErrorCode
 from ....shipping.models import ShippingMethodChannelListing
+from ....shipping.rules import invalidate_shipping_rules_index
 from ....shipping.tasks import (
     drop_invalid_shipping_methods_relations_for_given_channels,
 )
@@ -112,6 +113,7 @@ class ShippingMethodChannelListingUpdate(BaseChannelListingMutation):
     def save(cls, info, shipping_method: "ShippingMethodModel", cleaned_input: Dict):
         cls.add_channels(shipping_method, cleaned_input.get("add_channels", []))
         cls.remove_channels(shipping_method, cleaned_input.get("remove_channels", []))
+        invalidate_shipping_rules_index()
 
     @classmethod
     def get_shipping_method_channel_listing_to_update(
@@ -9,6 +9,7 @@ from ....core.tracing import traced_atomic_transaction
 from ....product import models as product_models
 from ....shipping import models
 from ....shipping.error_codes import ShippingErrorCode
+from ....shipping.rules import invalidate_shipping_rules_index
 from ....shipping.tasks import (
     drop_invalid_shipping_methods_relations_for_given_channels,
 )
@@ -194,6 +195,11 @@ class ShippingZoneMixin:
                 shipping_method_ids, channel_ids
             )
 
+    @classmethod
+    def post_save_action(cls, info, instance, cleaned_input):
+        super().post_save_action(info, instance, cleaned_input)
+        invalidate_shipping_rules_index()
+
 
 class ShippingZoneCreate(ShippingZoneMixin, ModelMutation):
     class Arguments:
@@ -252,6 +258,12 @@ class ShippingZoneDelete(ModelDeleteMutation):
         error_type_class = ShippingError
         error_type_field = "shipping_errors"
 
+    @classmethod
+    def perform_mutation(cls, _root, info, **data):
+        response = super().perform_mutation(_root, info, **data)
+        invalidate_shipping_rules_index()
+        return response
+
     @classmethod
     def success_response(cls, instance):
         instance = ChannelContext(node=instance, channel_slug=None)
@@ -433,6 +445,11 @@ class ShippingPriceMixin:
                         }
                     )
 
+    @classmethod
+    def post_save_action(cls, info, instance, cleaned_input):
+        super().post_save_action(info, instance, cleaned_input)
+        invalidate_shipping_rules_index()
+
 
 class ShippingPriceCreate(ShippingPriceMixin, ShippingMethodTypeMixin, ModelMutation):
     shipping_zone = graphene.Field(
@@ -529,6 +546,7 @@ class ShippingPriceDelete(BaseMutation):
         shipping_zone = shipping_method.shipping_zone
         shipping_method.delete()
         shipping_method.id = shipping_method_id
+        invalidate_shipping_rules_index()
         return ShippingPriceDelete(
             shipping_method=ChannelContext(node=shipping_method, channel_slug=None),
             shipping_zone=ChannelContext(node=shipping_zone, channel_slug=None),
@@ -582,6 +600,7 @@ class ShippingPriceExcludeProducts(BaseMutation):
         shipping_method.excluded_products.set(
             (current_excluded_products | product_to_exclude).distinct()
         )
+        invalidate_shipping_rules_index()
         return ShippingPriceExcludeProducts(
             shipping_method=ChannelContext(node=shipping_method, channel_slug=None)
         )
@@ -621,6 +640,7 @@ class ShippingPriceRemoveProductFromExclude(BaseMutation):
             shipping_method.excluded_products.set(
                 shipping_method.excluded_products.exclude(id__in=product_db_ids)
             )
+            invalidate_shipping_rules_index()
         return ShippingPriceExcludeProducts(
             shipping_method=ChannelContext(node=shipping_method, channel_slug=None)
         )
@@ -8,6 +8,7 @@ from ...core.utils.url import validate_storefront_url
 from ...site import GiftCardSettingsExpiryType
 from ...site.error_codes import GiftCardSettingsErrorCode
 from ...site.models import DEFAULT_LIMIT_QUANTITY_PER_CHECKOUT
+from ...site.utils import get_site_for_update, invalidate_site_cache
 from ..account.i18n import I18nMixin
 from ..account.types import AddressInput, StaffNotificationRecipient
 from ..core.descriptions import ADDED_IN_31
@@ -145,12 +146,13 @@ class ShopSettingsUpdate(BaseMutation):
 
     @classmethod
     def perform_mutation(cls, _root, info, **data):
-        instance = info.context.site.settings
+        instance = get_site_for_update(info.context).settings
         data = data.get("input")
         cleaned_input = cls.clean_input(info, instance, data)
         instance = cls.construct_instance(instance, cleaned_input)
         cls.clean_instance(info, instance)
         instance.save()
+        invalidate_site_cache()
         return ShopSettingsUpdate(shop=Shop())
 
 
@@ -171,7 +173,7 @@ class ShopAddressUpdate(BaseMutation, I18nMixin):
 
     @classmethod
     def perform_mutation(cls, _root, info, **data):
-        site_settings = info.context.site.settings
+        site_settings = get_site_for_update(info.context).settings
         data = data.get("input")
 
         if data:
@@ -188,6 +190,7 @@ class ShopAddressUpdate(BaseMutation, I18nMixin):
         else:
             if site_settings.company_address:
                 site_settings.company_address.delete()
+        invalidate_site_cache()
         return ShopAddressUpdate(shop=Shop())
 
 
@@ -205,7 +208,7 @@ class ShopDomainUpdate(BaseMutation):
 
     @classmethod
     def perform_mutation(cls, _root, info, **data):
-        site = info.context.site
+        site = get_site_for_update(info.context)
         data = data.get("input")
         domain = data.get("domain")
         name = data.get("name")
@@ -215,6 +218,7 @@ class ShopDomainUpdate(BaseMutation):
             site.name = name
         cls.clean_instance(info, site)
         site.save()
+        invalidate_site_cache()
         return ShopDomainUpdate(shop=Shop())
 
 
@@ -381,7 +385,7 @@ class OrderSettingsUpdate(BaseMutation):
             "automatically_fulfill_non_shippable_gift_card",
         ]
 
-        instance = info.context.site.settings
+        instance = get_site_for_update(info.context).settings
         update_fields = []
         for field in FIELDS:
             value = data["input"].get(field)
@@ -391,6 +395,7 @@ class OrderSettingsUpdate(BaseMutation):
 
         if update_fields:
             instance.save(update_fields=update_fields)
+            invalidate_site_cache()
         return OrderSettingsUpdate(order_settings=instance)
 
 
@@ -418,7 +423,7 @@ class GiftCardSettingsUpdate(BaseMutation):
 
     @classmethod
     def perform_mutation(cls, _root, info, **data):
-        instance = info.context.site.settings
+        instance = get_site_for_update(info.context).settings
         input = data["input"]
         cls.clean_input(input, instance)
 
@@ -436,6 +441,7 @@ class GiftCardSettingsUpdate(BaseMutation):
             update_fields.append("gift_card_expiry_type")
 
         instance.save(update_fields=update_fields)
+        invalidate_site_cache()
         return GiftCardSettingsUpdate(gift_card_settings=instance)
 
     @staticmethod
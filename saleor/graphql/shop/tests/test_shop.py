@@ -2,6 +2,7 @@ from unittest.mock import ANY
 
 import graphene
 import pytest
+from django.core.cache import cache
 from django_countries import countries
 
 from .... import __version__
@@ -13,6 +14,8 @@ from ....shipping import PostalCodeRuleInclusionType
 from ....shipping.models import ShippingMethod
 from ....site import GiftCardSettingsExpiryType
 from ....site.models import Site
+from ....site.utils import SITE_CACHE_VERSION_CACHE_KEY
+from ....tests.utils import flush_post_commit_hooks
 from ...account.enums import CountryCodeEnum
 from ...core.utils import str_to_enum
 from ...tests.utils import assert_no_permission, get_graphql_content
@@ -359,6 +362,36 @@ def test_shop_settings_mutation(
     assert site_settings.charge_taxes_on_shipping == new_charge_taxes_on_shipping
 
 
+def test_shop_settings_mutation_invalidates_site_cache(
+    staff_api_client, site_settings, permission_manage_settings, settings
+):
+    # given
+    settings.SITE_CACHE_ENABLED = True
+    cache.delete(SITE_CACHE_VERSION_CACHE_KEY)
+    Site.objects.get_current()
+    query = """
+        mutation updateSettings($input: ShopSettingsInput!) {
+            shopSettingsUpdate(input: $input) {
+                errors {
+                    field
+                }
+            }
+        }
+    """
+    variables = {"input": {"headerText": "Lorem ipsum"}}
+
+    # when
+    response = staff_api_client.post_graphql(
+        query, variables, permissions=[permission_manage_settings]
+    )
+    flush_post_commit_hooks()
+
+    # then
+    content = get_graphql_content(response)
+    assert not content["data"]["shopSettingsUpdate"]["errors"]
+    assert Site.objects.get_current().settings.header_text == "Lorem ipsum"
+
+
 def test_shop_reservation_settings_mutation(
     staff_api_client, site_settings, permission_manage_settings
 ):
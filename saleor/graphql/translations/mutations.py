@@ -8,6 +8,7 @@ from ...core.permissions import SitePermissions
 from ...core.tracing import traced_atomic_transaction
 from ...discount import models as discount_models
 from ...menu import models as menu_models
+from ...menu.utils import invalidate_menu_cache
 from ...page import models as page_models
 from ...product import models as product_models
 from ...shipping import models as shipping_models
@@ -419,6 +420,7 @@ class MenuItemTranslate(BaseTranslateMutation):
     @classmethod
     def perform_mutation(cls, _root, info, **data):
         response = super().perform_mutation(_root, info, **data)
+        invalidate_menu_cache()
         instance = ChannelContext(node=response.menuItem, channel_slug=None)
         return cls(**{cls._meta.return_field_name: instance})
 
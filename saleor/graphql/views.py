@@ -317,6 +317,7 @@ class GraphQLView(View):
                     if app := getattr(request, "app", None):
                         span.set_tag("app.name", app.name)
 
+                    set_latency_breakdowns_on_result(response, request)
                     return set_query_cost_on_result(response, query_cost)
             except Exception as e:
                 span.set_tag(opentracing.tags.ERROR, True)
@@ -463,3 +464,15 @@ def set_query_cost_on_result(execution_result: ExecutionResult, query_cost):
             }
         )
     return execution_result
+
+
+def set_latency_breakdowns_on_result(execution_result: ExecutionResult, request):
+    breakdowns = getattr(request, "latency_breakdowns", None)
+    if not settings.GRAPHQL_LATENCY_BREAKDOWN_ENABLED or not breakdowns:
+        return execution_result
+    if not (getattr(request, "app", None) or request.user.is_staff):
+        return execution_result
+    execution_result.extensions["latencyBreakdown"] = [
+        breakdown.as_dict() for breakdown in breakdowns
+    ]
+    return execution_result
@@ -9,4 +9,4 @@ class PayloadByIdLoader(DataLoader):
         payload = EventPayload.objects.using(self.database_connection_name).in_bulk(
             keys
         )
-        return [payload.get(payload_id).payload for payload_id in keys]
+        return [payload.get(payload_id).get_payload() for payload_id in keys]
@@ -90,6 +90,30 @@ class EventDeliveryAttempt(ModelObjectType):
         model = core_models.EventDeliveryAttempt
         interfaces = [graphene.relay.Node]
 
+    # Attempts made before compression was introduced may still keep their values in
+    # the legacy columns.
+    @staticmethod
+    def resolve_response(root: core_models.EventDeliveryAttempt, *_args, **_kwargs):
+        if root.response is None:
+            return root.legacy_response
+        return root.response
+
+    @staticmethod
+    def resolve_response_headers(
+        root: core_models.EventDeliveryAttempt, *_args, **_kwargs
+    ):
+        if root.response_headers is None:
+            return root.legacy_response_headers
+        return root.response_headers
+
+    @staticmethod
+    def resolve_request_headers(
+        root: core_models.EventDeliveryAttempt, *_args, **_kwargs
+    ):
+        if root.request_headers is None:
+            return root.legacy_request_headers
+        return root.request_headers
+
 
 class EventDeliveryAttemptCountableConnection(CountableConnection):
     class Meta:
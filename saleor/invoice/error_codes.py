@@ -3,6 +3,7 @@ from enum import Enum
 
 class InvoiceErrorCode(Enum):
     REQUIRED = "required"
+    INVALID = "invalid"
     NOT_READY = "not_ready"
     URL_NOT_SET = "url_not_set"
     EMAIL_NOT_SET = "email_not_set"
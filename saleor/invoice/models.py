@@ -1,5 +1,5 @@
 from django.conf import settings
-from django.db import models
+from django.db import connection, models
 from django.db.models import JSONField  # type: ignore
 from django.utils.timezone import now
 
@@ -45,6 +45,44 @@ class Invoice(ModelWithMetadata, Job):
             self.external_url = url
 
 
+class InvoiceNumberSequenceManager(models.Manager):
+    def next_number(self, period: str, get_initial_number) -> int:
+        """Return the next invoice number of the period.
+
+        The first number of a period is returned by `get_initial_number`. Counters
+        are incremented with a single statement, so concurrent requests never get
+        the same number; in a transaction, the counter stays locked until commit
+        and rolled back numbers are reused.
+        """
+        table = self.model._meta.db_table
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"UPDATE {table} SET last_number = last_number + 1 "
+                "WHERE period = %s RETURNING last_number",
+                [period],
+            )
+            row = cursor.fetchone()
+            if row is None:
+                cursor.execute(
+                    f"INSERT INTO {table} (period, last_number) VALUES (%s, %s) "
+                    "ON CONFLICT (period) DO UPDATE "
+                    f"SET last_number = {table}.last_number + 1 "
+                    "RETURNING last_number",
+                    [period, get_initial_number()],
+                )
+                row = cursor.fetchone()
+        return row[0]
+
+
+class InvoiceNumberSequence(models.Model):
+    """Counter of invoice numbers generated in a period, like a month."""
+
+    period = models.CharField(max_length=32, unique=True)
+    last_number = models.PositiveIntegerField()
+
+    objects = InvoiceNumberSequenceManager()
+
+
 class InvoiceEvent(models.Model):
     """Model used to store events that happened during the invoice lifecycle."""
 
@@ -0,0 +1,33 @@
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.db import transaction
+
+MENU_CACHE_VERSION_CACHE_KEY = "menu_cache_version"
+
+
+def _set_new_menu_cache_version():
+    cache.set(MENU_CACHE_VERSION_CACHE_KEY, uuid4().hex, timeout=None)
+
+
+def get_menu_cache_version() -> str:
+    version = cache.get(MENU_CACHE_VERSION_CACHE_KEY)
+    if version is None:
+        cache.add(MENU_CACHE_VERSION_CACHE_KEY, uuid4().hex, timeout=None)
+        version = cache.get(MENU_CACHE_VERSION_CACHE_KEY)
+    return version
+
+
+def get_menu_cache_key(version: str, name: str, *key_parts) -> str:
+    return ":".join(["menu", version, name, *(str(part) for part in key_parts)])
+
+
+def invalidate_menu_cache():
+    """Drop menus cached by all processes.
+
+    The version is changed right away, so the current request doesn't see stale
+    menus, and again once the transaction is committed, so menus cached by other
+    requests in the meantime are dropped as well.
+    """
+    _set_new_menu_cache_version()
+    transaction.on_commit(_set_new_menu_cache_version)
@@ -55,6 +55,7 @@ from .notifications import (
     send_order_refunded_confirmation,
     send_payment_confirmation,
 )
+from .reports import schedule_customer_order_stats_update, schedule_sales_rollups_update
 from .utils import (
     order_line_needs_automatic_fulfillment,
     recalculate_order,
@@ -86,6 +87,8 @@ def order_created(
     order = order_info.order
     events.order_created_event(order=order, user=user, app=app, from_draft=from_draft)
     manager.order_created(order)
+    schedule_sales_rollups_update(order)
+    schedule_customer_order_stats_update(order.user_id)
     payment = order_info.payment
     if payment:
         if order.is_captured():
@@ -165,6 +168,8 @@ def cancel_order(
     deallocate_stock_for_order(order, manager)
     order.status = OrderStatus.CANCELED
     order.save(update_fields=["status"])
+    schedule_sales_rollups_update(order)
+    schedule_customer_order_stats_update(order.user_id)
 
     transaction.on_commit(lambda: manager.order_cancelled(order))
     transaction.on_commit(lambda: manager.order_updated(order))
@@ -184,6 +189,8 @@ def order_refunded(
         order=order, user=user, app=app, amount=amount, payment=payment
     )
     manager.order_updated(order)
+    schedule_sales_rollups_update(order)
+    schedule_customer_order_stats_update(order.user_id)
 
     send_order_refunded_confirmation(
         order, user, app, amount, payment.currency, manager
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from ...reports import update_all_customer_order_stats
+
+
+class Command(BaseCommand):
+    help = "Recalculates order aggregates of customers from existing orders."
+
+    def handle(self, *args, **options):
+        count = update_all_customer_order_stats()
+        self.stdout.write(f"Updated order aggregates of {count} customers.")
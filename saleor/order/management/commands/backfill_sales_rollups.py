@@ -0,0 +1,25 @@
+import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from ...reports import update_all_sales_rollups
+
+
+class Command(BaseCommand):
+    help = "Recalculates daily sales rollups from existing orders."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--from-date",
+            help="Recalculate only days since the given date (YYYY-MM-DD).",
+        )
+
+    def handle(self, *args, **options):
+        since = None
+        if options["from_date"]:
+            try:
+                since = datetime.date.fromisoformat(options["from_date"])
+            except ValueError:
+                raise CommandError("Invalid --from-date, expected YYYY-MM-DD.")
+        count = update_all_sales_rollups(since=since)
+        self.stdout.write(f"Updated sales rollups of {count} channel days.")
@@ -0,0 +1,93 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("channel", "0003_alter_channel_default_country"),
+        ("product", "0158_auto_20220120_1633"),
+        ("order", "0123_update_order_search_document"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ChannelDailySales",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                ("currency", models.CharField(max_length=3)),
+                ("orders_count", models.PositiveIntegerField(default=0)),
+                (
+                    "total_net_amount",
+                    models.DecimalField(decimal_places=3, default=0, max_digits=12),
+                ),
+                (
+                    "total_gross_amount",
+                    models.DecimalField(decimal_places=3, default=0, max_digits=12),
+                ),
+                (
+                    "channel",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_sales",
+                        to="channel.channel",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("date", "pk"),
+                "unique_together": {("channel", "date", "currency")},
+            },
+        ),
+        migrations.CreateModel(
+            name="VariantDailySales",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("date", models.DateField()),
+                ("quantity", models.PositiveIntegerField(default=0)),
+                (
+                    "channel",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="variant_daily_sales",
+                        to="channel.channel",
+                    ),
+                ),
+                (
+                    "variant",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_sales",
+                        to="product.productvariant",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("date", "pk"),
+                "unique_together": {("channel", "variant", "date")},
+            },
+        ),
+        migrations.AddIndex(
+            model_name="variantdailysales",
+            index=models.Index(
+                fields=["channel", "date"], name="order_varia_channel_3ce2ff_idx"
+            ),
+        ),
+    ]
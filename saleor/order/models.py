@@ -693,3 +693,57 @@ class OrderEvent(models.Model):
 
     def __repr__(self):
         return f"{self.__class__.__name__}(type={self.type!r}, user={self.user!r})"
+
+
+class ChannelDailySales(models.Model):
+    """Totals of orders placed in a channel during a day, used in sales reports.
+
+    Days are in UTC. Draft and canceled orders are not included.
+    """
+
+    channel = models.ForeignKey(
+        Channel, related_name="daily_sales", on_delete=models.CASCADE
+    )
+    date = models.DateField()
+    currency = models.CharField(max_length=settings.DEFAULT_CURRENCY_CODE_LENGTH)
+    orders_count = models.PositiveIntegerField(default=0)
+    total_net_amount = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        default=0,
+    )
+    total_gross_amount = models.DecimalField(
+        max_digits=settings.DEFAULT_MAX_DIGITS,
+        decimal_places=settings.DEFAULT_DECIMAL_PLACES,
+        default=0,
+    )
+    total = TaxedMoneyField(
+        net_amount_field="total_net_amount",
+        gross_amount_field="total_gross_amount",
+        currency_field="currency",
+    )
+
+    class Meta:
+        ordering = ("date", "pk")
+        unique_together = [["channel", "date", "currency"]]
+
+
+class VariantDailySales(models.Model):
+    """Quantity of a variant ordered in a channel during a day.
+
+    Days are in UTC. Draft and canceled orders are not included.
+    """
+
+    channel = models.ForeignKey(
+        Channel, related_name="variant_daily_sales", on_delete=models.CASCADE
+    )
+    variant = models.ForeignKey(
+        "product.ProductVariant", related_name="daily_sales", on_delete=models.CASCADE
+    )
+    date = models.DateField()
+    quantity = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        ordering = ("date", "pk")
+        unique_together = [["channel", "variant", "date"]]
+        indexes = [models.Index(fields=["channel", "date"])]
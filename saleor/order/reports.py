@@ -0,0 +1,230 @@
+import datetime
+from typing import TYPE_CHECKING, Iterable, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Max, Min, OuterRef, QuerySet, Subquery, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+from prices import Money, TaxedMoney
+
+from ..account.models import CustomerLifetimeSpend, User
+from ..channel.models import Channel
+from ..core.tracing import traced_atomic_transaction
+from . import OrderStatus
+from .models import ChannelDailySales, Order, OrderLine, VariantDailySales
+
+if TYPE_CHECKING:
+    from ..product.models import ProductVariant
+
+
+def get_reported_orders() -> QuerySet:
+    """Return orders included in sales reports."""
+    return Order.objects.non_draft().exclude(status=OrderStatus.CANCELED)
+
+
+def get_sales_date(order: Order) -> datetime.date:
+    return order.created.astimezone(timezone.utc).date()
+
+
+def _get_day_range(date: datetime.date):
+    start = datetime.datetime.combine(date, datetime.time.min, tzinfo=timezone.utc)
+    return start, start + datetime.timedelta(days=1)
+
+
+@traced_atomic_transaction()
+def update_sales_rollups(channel_id: int, date: datetime.date):
+    """Recalculate sales of the channel on the given day from its orders."""
+    # Lock the channel to serialize updates of its rollups.
+    channel = Channel.objects.select_for_update().filter(pk=channel_id).first()
+    if not channel:
+        return
+
+    start, end = _get_day_range(date)
+    orders = get_reported_orders().filter(
+        channel_id=channel_id, created__gte=start, created__lt=end
+    )
+
+    totals = (
+        orders.order_by()
+        .values("currency")
+        .annotate(
+            orders_count=Count("pk"),
+            total_net_amount=Sum("total_net_amount"),
+            total_gross_amount=Sum("total_gross_amount"),
+        )
+    )
+    ChannelDailySales.objects.filter(channel_id=channel_id, date=date).delete()
+    ChannelDailySales.objects.bulk_create(
+        ChannelDailySales(channel_id=channel_id, date=date, **values)
+        for values in totals
+    )
+
+    quantities = (
+        OrderLine.objects.filter(order__in=orders, variant__isnull=False)
+        .order_by()
+        .values("variant_id")
+        .annotate(quantity=Sum("quantity"))
+    )
+    VariantDailySales.objects.filter(channel_id=channel_id, date=date).delete()
+    VariantDailySales.objects.bulk_create(
+        VariantDailySales(channel_id=channel_id, date=date, **values)
+        for values in quantities
+    )
+
+
+def update_all_sales_rollups(since: datetime.date = None) -> int:
+    """Recalculate sales of all days with orders; return the number of days."""
+    orders = get_reported_orders()
+    if since:
+        start, _ = _get_day_range(since)
+        orders = orders.filter(created__gte=start)
+    days = (
+        orders.annotate(date=TruncDate("created", tzinfo=timezone.utc))
+        .order_by()
+        .values_list("channel_id", "date")
+        .distinct()
+    )
+    count = 0
+    for channel_id, date in days.iterator():
+        update_sales_rollups(channel_id, date)
+        count += 1
+    return count
+
+
+def _get_update_lock_key(channel_id: int, date: datetime.date) -> str:
+    return f"sales_rollups_update:{channel_id}:{date.isoformat()}"
+
+
+def release_sales_rollups_update_lock(channel_id: int, date: datetime.date):
+    cache.delete(_get_update_lock_key(channel_id, date))
+
+
+def schedule_sales_rollups_update(order: Order):
+    """Update sales rollups of the order's channel and day after the commit.
+
+    Updates are delayed by `SALES_ROLLUPS_UPDATE_DELAY`, so a single update covers
+    all orders of the day changed in the meantime.
+    """
+    from .tasks import update_sales_rollups_task
+
+    if order.is_draft():
+        return
+
+    channel_id = order.channel_id
+    date = get_sales_date(order)
+    delay = settings.SALES_ROLLUPS_UPDATE_DELAY.total_seconds()
+
+    def schedule():
+        lock_key = _get_update_lock_key(channel_id, date)
+        if cache.add(lock_key, True, timeout=delay + 60):
+            update_sales_rollups_task.apply_async(
+                (channel_id, date.isoformat()), countdown=delay
+            )
+
+    transaction.on_commit(schedule)
+
+
+@traced_atomic_transaction()
+def update_customer_order_stats(user_ids: Iterable[int]):
+    """Recalculate order aggregates of the given users from their orders.
+
+    Draft orders aren't placed by customers, so they aren't included.
+    """
+    users = list(User.objects.select_for_update().filter(pk__in=user_ids))
+    if not users:
+        return
+    orders = Order.objects.non_draft().filter(user_id__in=[u.pk for u in users])
+
+    stats = {
+        values["user_id"]: values
+        for values in orders.order_by()
+        .values("user_id")
+        .annotate(
+            number_of_orders=Count("pk"),
+            first_order_date=Min("created"),
+            last_order_date=Max("created"),
+        )
+    }
+    for user in users:
+        user_stats = stats.get(user.pk, {})
+        user.number_of_orders = user_stats.get("number_of_orders", 0)
+        user.first_order_date = user_stats.get("first_order_date")
+        user.last_order_date = user_stats.get("last_order_date")
+    User.objects.bulk_update(
+        users, ["number_of_orders", "first_order_date", "last_order_date"]
+    )
+
+    spend = (
+        orders.exclude(status=OrderStatus.CANCELED)
+        .order_by()
+        .values("user_id", "currency")
+        .annotate(total_gross_amount=Sum("total_gross_amount"))
+    )
+    CustomerLifetimeSpend.objects.filter(user__in=users).delete()
+    CustomerLifetimeSpend.objects.bulk_create(
+        CustomerLifetimeSpend(**values) for values in spend
+    )
+
+
+def update_all_customer_order_stats(batch_size: int = 1000) -> int:
+    """Recalculate order aggregates of all customers; return the number of users."""
+    user_ids = (
+        Order.objects.non_draft()
+        .filter(user__isnull=False)
+        .order_by("user_id")
+        .values_list("user_id", flat=True)
+        .distinct()
+    )
+    count = 0
+    batch = []
+    for user_id in user_ids.iterator():
+        batch.append(user_id)
+        if len(batch) == batch_size:
+            update_customer_order_stats(batch)
+            count += len(batch)
+            batch = []
+    if batch:
+        update_customer_order_stats(batch)
+        count += len(batch)
+    return count
+
+
+def schedule_customer_order_stats_update(user_id: Optional[int]):
+    """Update order aggregates of the user after the commit."""
+    from .tasks import update_customer_order_stats_task
+
+    if user_id:
+        transaction.on_commit(lambda: update_customer_order_stats_task.delay(user_id))
+
+
+def get_sales_total(channel: Channel, since: datetime.datetime) -> TaxedMoney:
+    """Return the total of orders placed in the channel since the given day."""
+    totals = ChannelDailySales.objects.filter(
+        channel=channel,
+        currency=channel.currency_code,
+        date__gte=since.astimezone(timezone.utc).date(),
+    ).aggregate(net=Sum("total_net_amount"), gross=Sum("total_gross_amount"))
+    return TaxedMoney(
+        net=Money(totals["net"] or 0, channel.currency_code),
+        gross=Money(totals["gross"] or 0, channel.currency_code),
+    )
+
+
+def annotate_quantity_ordered(
+    variants: "QuerySet[ProductVariant]", channel_slug: str, since: datetime.datetime
+) -> "QuerySet[ProductVariant]":
+    """Annotate variants with the quantity ordered in the channel since the day."""
+    sales = (
+        VariantDailySales.objects.filter(
+            channel__slug=channel_slug,
+            variant_id=OuterRef("pk"),
+            date__gte=since.astimezone(timezone.utc).date(),
+        )
+        .order_by()
+        .values("variant_id")
+        .annotate(quantity_ordered=Sum("quantity"))
+        .values("quantity_ordered")
+    )
+    return variants.annotate(quantity_ordered=Subquery(sales))
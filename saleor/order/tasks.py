@@ -1,7 +1,13 @@
+import datetime
 from typing import List
 
 from ..celeryconf import app
 from .models import Order
+from .reports import (
+    release_sales_rollups_update_lock,
+    update_customer_order_stats,
+    update_sales_rollups,
+)
 from .utils import recalculate_order
 
 
@@ -10,3 +16,16 @@ def recalculate_orders_task(order_ids: List[int]):
     orders = Order.objects.filter(id__in=order_ids)
     for order in orders:
         recalculate_order(order)
+
+
+@app.task
+def update_sales_rollups_task(channel_id: int, date: str):
+    day = datetime.date.fromisoformat(date)
+    # Release the lock first, so changes made during the update schedule a new one.
+    release_sales_rollups_update_lock(channel_id, day)
+    update_sales_rollups(channel_id, day)
+
+
+@app.task
+def update_customer_order_stats_task(user_id: int):
+    update_customer_order_stats([user_id])
@@ -0,0 +1,172 @@
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.db.models import Sum
+
+from ...tests.utils import flush_post_commit_hooks
+from .. import OrderStatus
+from ..actions import cancel_order
+from ..models import ChannelDailySales, Order, VariantDailySales
+from ..reports import (
+    get_sales_date,
+    release_sales_rollups_update_lock,
+    schedule_sales_rollups_update,
+    update_customer_order_stats,
+    update_sales_rollups,
+)
+from ..utils import match_orders_with_new_user
+
+
+def test_update_sales_rollups(order_with_lines, order_list, channel_USD):
+    # given
+    order = order_with_lines
+    date = get_sales_date(order)
+    orders = [order, *order_list]
+
+    # when
+    update_sales_rollups(channel_USD.pk, date)
+
+    # then
+    sales = ChannelDailySales.objects.get(channel=channel_USD, date=date)
+    assert sales.currency == channel_USD.currency_code
+    assert sales.orders_count == len(orders)
+    assert sales.total.gross.amount == sum(o.total_gross_amount for o in orders)
+    for line in order.lines.all():
+        variant_sales = VariantDailySales.objects.get(
+            channel=channel_USD, variant=line.variant, date=date
+        )
+        assert variant_sales.quantity == line.quantity
+
+
+def test_update_sales_rollups_skips_draft_and_canceled_orders(
+    order_with_lines, order_list, channel_USD
+):
+    # given
+    order_list[0].status = OrderStatus.DRAFT
+    order_list[0].save(update_fields=["status"])
+    order_list[1].status = OrderStatus.CANCELED
+    order_list[1].save(update_fields=["status"])
+    date = get_sales_date(order_with_lines)
+
+    # when
+    update_sales_rollups(channel_USD.pk, date)
+
+    # then
+    sales = ChannelDailySales.objects.get(channel=channel_USD, date=date)
+    assert sales.orders_count == 2
+
+
+def test_cancel_order_updates_sales_rollups(
+    order_with_lines, channel_USD, plugins_manager
+):
+    # given
+    order = order_with_lines
+    date = get_sales_date(order)
+    update_sales_rollups(channel_USD.pk, date)
+    assert VariantDailySales.objects.filter(channel=channel_USD, date=date).exists()
+
+    # when
+    cancel_order(order, None, None, plugins_manager)
+    flush_post_commit_hooks()
+
+    # then
+    assert not ChannelDailySales.objects.filter(channel=channel_USD, date=date)
+    assert not VariantDailySales.objects.filter(channel=channel_USD, date=date)
+
+
+@patch("saleor.order.tasks.update_sales_rollups_task.apply_async")
+def test_schedule_sales_rollups_update_once_per_day(
+    mocked_apply_async, order_with_lines, order_list, settings
+):
+    # given
+    date = get_sales_date(order_with_lines)
+
+    # when
+    for order in [order_with_lines, *order_list]:
+        schedule_sales_rollups_update(order)
+    flush_post_commit_hooks()
+
+    # then
+    mocked_apply_async.assert_called_once_with(
+        (order_with_lines.channel_id, date.isoformat()),
+        countdown=settings.SALES_ROLLUPS_UPDATE_DELAY.total_seconds(),
+    )
+    release_sales_rollups_update_lock(order_with_lines.channel_id, date)
+
+
+def test_backfill_sales_rollups_command(order_with_lines, order_list, channel_USD):
+    # when
+    call_command("backfill_sales_rollups")
+
+    # then
+    sales = ChannelDailySales.objects.get(channel=channel_USD)
+    assert sales.orders_count == len(order_list) + 1
+    quantity = VariantDailySales.objects.aggregate(total=Sum("quantity"))["total"]
+    assert quantity == sum(line.quantity for line in order_with_lines.lines.all())
+
+
+def test_update_customer_order_stats(order_list, customer_user, channel_USD):
+    # given
+    order_list[0].status = OrderStatus.DRAFT
+    order_list[1].status = OrderStatus.CANCELED
+    for order in order_list:
+        order.user = customer_user
+    Order.objects.bulk_update(order_list, ["status", "user"])
+    placed_orders = order_list[1:]
+
+    # when
+    update_customer_order_stats([customer_user.pk])
+
+    # then
+    customer_user.refresh_from_db()
+    assert customer_user.number_of_orders == len(placed_orders)
+    assert customer_user.first_order_date == min(o.created for o in placed_orders)
+    assert customer_user.last_order_date == max(o.created for o in placed_orders)
+    spend = customer_user.lifetime_spend.get()
+    assert spend.currency == channel_USD.currency_code
+    assert spend.total_gross_amount == sum(o.total_gross_amount for o in order_list[2:])
+
+
+def test_update_customer_order_stats_user_without_orders(customer_user):
+    # given
+    customer_user.number_of_orders = 2
+    customer_user.save(update_fields=["number_of_orders"])
+
+    # when
+    update_customer_order_stats([customer_user.pk])
+
+    # then
+    customer_user.refresh_from_db()
+    assert customer_user.number_of_orders == 0
+    assert customer_user.first_order_date is None
+    assert customer_user.last_order_date is None
+    assert not customer_user.lifetime_spend.exists()
+
+
+def test_match_orders_with_new_user_updates_customer_order_stats(
+    order_list, staff_user
+):
+    # given
+    Order.objects.filter(pk__in=[o.pk for o in order_list]).update(
+        user=None, user_email=staff_user.email
+    )
+
+    # when
+    match_orders_with_new_user(staff_user)
+    flush_post_commit_hooks()
+
+    # then
+    staff_user.refresh_from_db()
+    assert staff_user.number_of_orders == len(order_list)
+
+
+def test_backfill_customer_order_stats_command(order_list, customer_user):
+    # given
+    Order.objects.filter(pk__in=[o.pk for o in order_list]).update(user=customer_user)
+
+    # when
+    call_command("backfill_customer_order_stats")
+
+    # then
+    customer_user.refresh_from_db()
+    assert customer_user.number_of_orders == len(order_list)
@@ -26,7 +26,8 @@ from ..order.fetch import OrderLineInfo
 from ..order.models import Order, OrderLine
 from ..product.utils.digital_products import get_default_digital_content_settings
 from ..shipping.interface import ShippingMethodData
-from ..shipping.models import ShippingMethod, ShippingMethodChannelListing
+from ..shipping.models import ShippingMethodChannelListing
+from ..shipping.rules import get_applicable_shipping_methods_for_instance
 from ..shipping.utils import (
     convert_to_shipping_method_data,
     initialize_shipping_method_active_status,
@@ -39,6 +40,7 @@ from ..warehouse.management import (
 )
 from ..warehouse.models import Warehouse
 from . import events
+from .reports import schedule_customer_order_stats_update, schedule_sales_rollups_update
 
 if TYPE_CHECKING:
     from ..app.models import App
@@ -186,6 +188,9 @@ def recalculate_order(order: Order, **kwargs):
         ]
     )
     recalculate_order_weight(order)
+    schedule_sales_rollups_update(order)
+    if not order.is_draft():
+        schedule_customer_order_stats_update(order.user_id)
 
 
 def recalculate_order_weight(order):
@@ -672,12 +677,12 @@ def get_valid_shipping_methods_for_order(
 
     valid_methods = []
 
-    shipping_methods = ShippingMethod.objects.applicable_shipping_methods_for_instance(
+    shipping_methods = get_applicable_shipping_methods_for_instance(
         order,
         channel_id=order.channel_id,
         price=order.get_subtotal().gross,
         country_code=order.shipping_address.country.code,
-    ).prefetch_related("channel_listings")
+    )
 
     listing_map = {
         listing.shipping_method_id: listing for listing in shipping_channel_listings
@@ -790,6 +795,7 @@ def get_voucher_discount_for_order(order: Order) -> Money:
 
 def match_orders_with_new_user(user: User) -> None:
     Order.objects.confirmed().filter(user_email=user.email, user=None).update(user=user)
+    schedule_customer_order_stats_update(user.pk)
 
 
 def get_total_order_discount(order: Order) -> Money:
@@ -141,3 +141,23 @@ class StorePaymentMethod:
         (OFF_SESSION, "Off session"),
         (NONE, "None"),
     ]
+
+
+class GatewayNotificationStatus:
+    """Represents the processing status of a notification sent by a gateway.
+
+    The following statuses are possible:
+    - PENDING - the notification is stored and waits to be processed
+    - PROCESSED - the notification was successfully processed
+    - FAILED - an error occurred while processing the notification.
+    """
+
+    PENDING = "pending"
+    PROCESSED = "processed"
+    FAILED = "failed"
+
+    CHOICES = [
+        (PENDING, "Pending"),
+        (PROCESSED, "Processed"),
+        (FAILED, "Failed"),
+    ]
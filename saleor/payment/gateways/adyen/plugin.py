@@ -27,7 +27,7 @@ from ...interface import (
     PaymentData,
     PaymentGateway,
 )
-from ...models import Payment, Transaction
+from ...models import GatewayNotification, Payment, Transaction
 from ..utils import get_supported_currencies, require_active_plugin
 from .utils.apple_pay import initialize_apple_pay, make_request_to_initialize_apple_pay
 from .utils.common import (
@@ -45,7 +45,7 @@ from .utils.common import (
     request_for_payment_cancel,
     update_payment_with_action_required_data,
 )
-from .webhooks import handle_additional_actions, handle_webhook
+from .webhooks import handle_additional_actions, handle_webhook, process_notification
 
 GATEWAY_NAME = "Adyen"
 WEBHOOK_PATH = "/webhooks"
@@ -255,7 +255,7 @@ class AdyenGatewayPlugin(BasePlugin):
         """
         config = self._get_gateway_config()
         if path.startswith(WEBHOOK_PATH):
-            return handle_webhook(request, config)
+            return handle_webhook(request, config, self.channel.slug)  # type: ignore
         elif path.startswith(ADDITIONAL_ACTION_PATH):
             with opentracing.global_tracer().start_active_span(
                 "adyen.checkout.payment_details"
@@ -273,6 +273,10 @@ class AdyenGatewayPlugin(BasePlugin):
     def _get_gateway_config(self) -> GatewayConfig:
         return self.config
 
+    def process_gateway_notification(self, notification: "GatewayNotification"):
+        """Process a stored webhook notification received from Adyen."""
+        process_notification(notification, self._get_gateway_config())
+
     @require_active_plugin
     def token_is_required_as_payment_input(self, previous_value):
         return False
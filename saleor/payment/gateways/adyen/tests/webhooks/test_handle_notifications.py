@@ -1,3 +1,4 @@
+import json
 import logging
 from decimal import Decimal
 from unittest import mock
@@ -11,9 +12,12 @@ from ......checkout import calculations
 from ......checkout.fetch import fetch_checkout_info, fetch_checkout_lines
 from ......order import OrderEvents, OrderStatus
 from ......plugins.manager import get_plugins_manager
-from ..... import ChargeStatus, TransactionKind
+from ......tests.utils import flush_post_commit_hooks
+from ..... import ChargeStatus, GatewayNotificationStatus, TransactionKind
+from .....models import GatewayNotification
 from .....utils import price_to_minor_unit
 from ...webhooks import (
+    EVENT_MAP,
     confirm_payment_and_set_back_to_confirm,
     create_new_transaction,
     handle_authorization,
@@ -28,6 +32,8 @@ from ...webhooks import (
     handle_pending,
     handle_refund,
     handle_reversed_refund,
+    handle_webhook,
+    process_notification,
     webhook_not_implemented,
 )
 
@@ -1875,3 +1881,67 @@ def test_order_closed_with_not_active_payment(
         graphql_payment_id=mock.ANY,
         adyen_client=mock.ANY,
     )
+
+
+@mock.patch("saleor.payment.utils.process_gateway_notifications_task.delay")
+def test_handle_webhook_stores_notification_when_async(
+    mocked_task,
+    notification,
+    adyen_plugin,
+    channel_USD,
+    rf,
+    settings,
+):
+    # given
+    settings.PAYMENT_GATEWAY_NOTIFICATIONS_ASYNC = True
+    notification = notification(merchant_reference="UGF5bWVudDox")
+    request = rf.post(
+        path="/webhooks/",
+        data=json.dumps(
+            {"notificationItems": [{"NotificationRequestItem": notification}]}
+        ),
+        content_type="application/json",
+    )
+    config = adyen_plugin().config
+    mocked_handler = mock.Mock()
+
+    # when
+    with mock.patch.dict(EVENT_MAP, {"AUTHORISATION": mocked_handler}):
+        response = handle_webhook(request, config, channel_USD.slug)
+        # Adyen retries notifications which were not accepted on time.
+        handle_webhook(request, config, channel_USD.slug)
+    flush_post_commit_hooks()
+
+    # then
+    assert response.content == b"[accepted]"
+    assert not mocked_handler.called
+    stored = GatewayNotification.objects.get()
+    assert stored.reference == "UGF5bWVudDox"
+    assert stored.event_type == "AUTHORISATION"
+    assert stored.payload == notification
+    assert stored.status == GatewayNotificationStatus.PENDING
+    mocked_task.assert_called_once_with(
+        "mirumee.payments.adyen", channel_USD.slug, "UGF5bWVudDox"
+    )
+
+
+def test_process_notification(notification, adyen_plugin, channel_USD):
+    # given
+    notification = notification(event_code="CAPTURE")
+    stored = GatewayNotification.objects.create(
+        gateway="mirumee.payments.adyen",
+        channel_slug=channel_USD.slug,
+        notification_id="CAPTURE:852595499936560C:true",
+        reference=notification["merchantReference"],
+        event_type="CAPTURE",
+        payload=notification,
+    )
+    config = adyen_plugin().config
+    mocked_handler = mock.Mock()
+
+    # when
+    with mock.patch.dict(EVENT_MAP, {"CAPTURE": mocked_handler}):
+        process_notification(stored, config)
+
+    # then
+    mocked_handler.assert_called_once_with(notification, config)
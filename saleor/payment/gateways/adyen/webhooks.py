@@ -11,6 +11,7 @@ from urllib.parse import urlencode, urlparse
 
 import Adyen
 import graphene
+from django.conf import settings
 from django.contrib.auth.hashers import check_password
 from django.contrib.auth.models import AnonymousUser
 from django.core.exceptions import ValidationError
@@ -42,7 +43,7 @@ from ....order.actions import (
 )
 from ....order.events import external_notification_event
 from ....order.fetch import fetch_order_info
-from ....payment.models import Payment, Transaction
+from ....payment.models import GatewayNotification, Payment, Transaction
 from ....plugins.manager import get_plugins_manager
 from ... import ChargeStatus, PaymentError, TransactionKind, gateway
 from ...gateway import payment_refund_or_void
@@ -52,6 +53,7 @@ from ...utils import (
     create_transaction,
     gateway_postprocess,
     price_from_minor_unit,
+    store_gateway_notification,
     try_void_or_refund_inactive_payment,
 )
 from .utils.common import (
@@ -960,8 +962,53 @@ def validate_merchant_account(
     )
 
 
+def get_notification_id(notification: Dict[str, Any]) -> str:
+    # Adyen identifies the duplicated notifications by the pspReference, eventCode
+    # and success fields.
+    return ":".join(
+        [
+            notification.get("eventCode", ""),
+            notification.get("pspReference", ""),
+            str(notification.get("success", "")),
+        ]
+    )
+
+
+def store_notification(notification: Dict[str, Any], channel_slug: str):
+    """Store the notification to process it asynchronously.
+
+    Notifications are processed in the received order per payment, identified by
+    the merchantReference which holds the Saleor's payment ID.
+    """
+    reference = (
+        notification.get("merchantReference")
+        or notification.get("originalReference")
+        or notification.get("pspReference", "")
+    )
+    store_gateway_notification(
+        gateway="mirumee.payments.adyen",
+        channel_slug=channel_slug,
+        notification_id=get_notification_id(notification),
+        reference=reference,
+        event_type=notification.get("eventCode", ""),
+        payload=notification,
+    )
+
+
+def process_notification(
+    notification: GatewayNotification, gateway_config: "GatewayConfig"
+):
+    event_handler = EVENT_MAP.get(notification.event_type)
+    if event_handler:
+        event_handler(notification.payload, gateway_config)  # type: ignore
+
+
 @transaction_with_commit_on_errors()
-def handle_webhook(request: WSGIRequest, gateway_config: "GatewayConfig"):
+def handle_webhook(
+    request: WSGIRequest,
+    gateway_config: "GatewayConfig",
+    channel_slug: Optional[str] = None,
+):
     try:
         json_data = json.loads(request.body)
     except JSONDecodeError:
@@ -983,7 +1030,10 @@ def handle_webhook(request: WSGIRequest, gateway_config: "GatewayConfig"):
 
     event_handler = EVENT_MAP.get(notification.get("eventCode", ""))
     if event_handler:
-        event_handler(notification, gateway_config)  # type: ignore
+        if settings.PAYMENT_GATEWAY_NOTIFICATIONS_ASYNC and channel_slug:
+            store_notification(notification, channel_slug)
+        else:
+            event_handler(notification, gateway_config)  # type: ignore
         return HttpResponse("[accepted]")
     return HttpResponse("[accepted]")
 
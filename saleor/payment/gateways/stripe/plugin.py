@@ -18,7 +18,7 @@ from ...interface import (
     PaymentMethodInfo,
     StorePaymentMethodEnum,
 )
-from ...models import Transaction
+from ...models import GatewayNotification, Transaction
 from ...utils import price_from_minor_unit, price_to_minor_unit
 from ..utils import get_supported_currencies, require_active_plugin
 from .stripe_api import (
@@ -34,7 +34,7 @@ from .stripe_api import (
     retrieve_payment_intent,
     subscribe_webhook,
 )
-from .webhooks import handle_webhook
+from .webhooks import handle_webhook, process_notification
 
 if TYPE_CHECKING:
     # flake8: noqa
@@ -128,6 +128,10 @@ class StripeGatewayPlugin(BasePlugin):
         )
         return HttpResponseNotFound()
 
+    def process_gateway_notification(self, notification: "GatewayNotification"):
+        """Process a stored webhook event received from Stripe."""
+        process_notification(notification, self.config)
+
     @require_active_plugin
     def token_is_required_as_payment_input(self, previous_value):
         return False
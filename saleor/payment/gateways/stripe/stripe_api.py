@@ -301,6 +301,10 @@ def construct_stripe_event(
         )
 
 
+def construct_stripe_event_from_dict(api_key: str, data: dict) -> StripeObject:
+    return stripe.Event.construct_from(data, api_key)
+
+
 def get_payment_method_details(
     payment_intent: StripeObject,
 ) -> Optional[PaymentMethodInfo]:
@@ -8,17 +8,21 @@ from stripe.stripe_object import StripeObject
 
 from .....checkout.complete_checkout import complete_checkout
 from .....order.actions import order_captured, order_refunded, order_voided
-from .... import ChargeStatus, TransactionKind
+from .....tests.utils import flush_post_commit_hooks
+from .... import ChargeStatus, GatewayNotificationStatus, TransactionKind
+from ....models import GatewayNotification
 from ....utils import price_to_minor_unit
 from ..consts import (
     AUTHORIZED_STATUS,
     FAILED_STATUSES,
+    PLUGIN_ID,
     PROCESSING_STATUS,
     SUCCESS_STATUS,
     WEBHOOK_AUTHORIZED_EVENT,
     WEBHOOK_CANCELED_EVENT,
     WEBHOOK_FAILED_EVENT,
     WEBHOOK_PROCESSING_EVENT,
+    WEBHOOK_REFUND_EVENT,
     WEBHOOK_SUCCESS_EVENT,
 )
 from ..webhooks import (
@@ -30,6 +34,7 @@ from ..webhooks import (
     handle_processing_payment_intent,
     handle_refund,
     handle_successful_payment_intent,
+    process_notification,
     update_payment_method_details_from_intent,
 )
 
@@ -1319,6 +1324,78 @@ def test_handle_webhook_events(
     )
 
 
+@patch("saleor.payment.utils.process_gateway_notifications_task.delay")
+@patch("saleor.payment.gateways.stripe.webhooks.handle_successful_payment_intent")
+@patch("saleor.payment.gateways.stripe.stripe_api.stripe.Webhook.construct_event")
+def test_handle_webhook_events_stores_notification_when_async(
+    mocked_webhook_event,
+    mocked_handler,
+    mocked_task,
+    stripe_plugin,
+    rf,
+    channel_USD,
+    settings,
+):
+    # given
+    settings.PAYMENT_GATEWAY_NOTIFICATIONS_ASYNC = True
+    request = rf.post(path="/webhooks/", data={}, content_type="application/json")
+    request.META["HTTP_STRIPE_SIGNATURE"] = "1234"
+
+    event = StripeObject.construct_from(
+        {
+            "id": "evt_1Ip9ANH1Vac4G4dbE9ch7zGS",
+            "type": WEBHOOK_SUCCESS_EVENT,
+            "data": {"object": {"id": "pi_ABC", "object": "payment_intent"}},
+        },
+        "key",
+    )
+    mocked_webhook_event.return_value = event
+    plugin = stripe_plugin()
+
+    # when
+    plugin.webhook(request, "/webhooks/", None)
+    plugin.webhook(request, "/webhooks/", None)
+    flush_post_commit_hooks()
+
+    # then
+    assert not mocked_handler.called
+    notification = GatewayNotification.objects.get()
+    assert notification.gateway == PLUGIN_ID
+    assert notification.channel_slug == channel_USD.slug
+    assert notification.notification_id == event.id
+    assert notification.reference == "pi_ABC"
+    assert notification.event_type == WEBHOOK_SUCCESS_EVENT
+    assert notification.status == GatewayNotificationStatus.PENDING
+    mocked_task.assert_called_once_with(PLUGIN_ID, channel_USD.slug, "pi_ABC")
+
+
+@patch("saleor.payment.gateways.stripe.webhooks.handle_refund")
+def test_process_notification(mocked_handler, stripe_plugin, channel_USD):
+    # given
+    plugin = stripe_plugin()
+    notification = GatewayNotification.objects.create(
+        gateway=PLUGIN_ID,
+        channel_slug=channel_USD.slug,
+        notification_id="evt_1",
+        reference="pi_ABC",
+        event_type=WEBHOOK_REFUND_EVENT,
+        payload={
+            "id": "evt_1",
+            "type": WEBHOOK_REFUND_EVENT,
+            "data": {"object": {"id": "ch_1", "payment_intent": "pi_ABC"}},
+        },
+    )
+
+    # when
+    process_notification(notification, plugin.config)
+
+    # then
+    charge = mocked_handler.call_args[0][0]
+    assert charge.id == "ch_1"
+    assert charge.payment_intent == "pi_ABC"
+    mocked_handler.assert_called_once_with(charge, plugin.config, channel_USD.slug)
+
+
 @patch("saleor.payment.gateway.refund")
 @patch("saleor.checkout.complete_checkout._get_order_data")
 def test_finalize_checkout_not_created_order_payment_refund(
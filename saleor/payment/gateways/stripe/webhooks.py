@@ -1,6 +1,7 @@
 import logging
-from typing import List, Optional
+from typing import Callable, Dict, List, Optional
 
+from django.conf import settings
 from django.contrib.auth.models import AnonymousUser
 from django.core.exceptions import ValidationError
 from django.core.handlers.wsgi import WSGIRequest
@@ -22,16 +23,18 @@ from ....plugins.manager import get_plugins_manager
 from ... import ChargeStatus, TransactionKind
 from ...gateway import payment_refund_or_void
 from ...interface import GatewayConfig, GatewayResponse
-from ...models import Payment
+from ...models import GatewayNotification, Payment
 from ...utils import (
     create_transaction,
     gateway_postprocess,
     price_from_minor_unit,
+    store_gateway_notification,
     try_void_or_refund_inactive_payment,
     update_payment_charge_status,
     update_payment_method_details,
 )
 from .consts import (
+    PLUGIN_ID,
     WEBHOOK_AUTHORIZED_EVENT,
     WEBHOOK_CANCELED_EVENT,
     WEBHOOK_FAILED_EVENT,
@@ -41,6 +44,7 @@ from .consts import (
 )
 from .stripe_api import (
     construct_stripe_event,
+    construct_stripe_event_from_dict,
     get_payment_method_details,
     update_payment_method,
 )
@@ -74,15 +78,22 @@ def handle_webhook(
         logger.warning("Invalid signature for Stripe webhook", extra={"error": e})
         return HttpResponse(status=400)
 
-    webhook_handlers = {
-        WEBHOOK_SUCCESS_EVENT: handle_successful_payment_intent,
-        WEBHOOK_AUTHORIZED_EVENT: handle_authorized_payment_intent,
-        WEBHOOK_PROCESSING_EVENT: handle_processing_payment_intent,
-        WEBHOOK_FAILED_EVENT: handle_failed_payment_intent,
-        WEBHOOK_CANCELED_EVENT: handle_failed_payment_intent,
-        WEBHOOK_REFUND_EVENT: handle_refund,
-    }
-    if event.type in webhook_handlers:
+    handler = get_webhook_handler(event.type)
+    if handler is None:
+        logger.warning(
+            "Received unhandled webhook events", extra={"event_type": event.type}
+        )
+    elif settings.PAYMENT_GATEWAY_NOTIFICATIONS_ASYNC:
+        obj = event.data.object
+        store_gateway_notification(
+            gateway=PLUGIN_ID,
+            channel_slug=channel_slug,
+            notification_id=event.id,
+            reference=obj.get("payment_intent") or obj.id,
+            event_type=event.type,
+            payload=event.to_dict_recursive(),
+        )
+    else:
         logger.debug(
             "Processing new Stripe webhook",
             extra={
@@ -91,12 +102,43 @@ def handle_webhook(
                 "channel_slug": channel_slug,
             },
         )
-        webhook_handlers[event.type](event.data.object, gateway_config, channel_slug)
-    else:
+        handler(event.data.object, gateway_config, channel_slug)
+    return HttpResponse(status=200)
+
+
+def get_webhook_handler(event_type: str) -> Optional[Callable]:
+    webhook_handlers: Dict[str, Callable] = {
+        WEBHOOK_SUCCESS_EVENT: handle_successful_payment_intent,
+        WEBHOOK_AUTHORIZED_EVENT: handle_authorized_payment_intent,
+        WEBHOOK_PROCESSING_EVENT: handle_processing_payment_intent,
+        WEBHOOK_FAILED_EVENT: handle_failed_payment_intent,
+        WEBHOOK_CANCELED_EVENT: handle_failed_payment_intent,
+        WEBHOOK_REFUND_EVENT: handle_refund,
+    }
+    return webhook_handlers.get(event_type)
+
+
+def process_notification(
+    notification: GatewayNotification, gateway_config: "GatewayConfig"
+):
+    """Process a Stripe event stored by `handle_webhook`."""
+    api_key = gateway_config.connection_params["secret_api_key"]
+    event = construct_stripe_event_from_dict(api_key, notification.payload)
+    handler = get_webhook_handler(event.type)
+    if handler is None:
         logger.warning(
             "Received unhandled webhook events", extra={"event_type": event.type}
         )
-    return HttpResponse(status=200)
+        return
+    logger.debug(
+        "Processing stored Stripe webhook",
+        extra={
+            "event_type": event.type,
+            "event_id": event.id,
+            "channel_slug": notification.channel_slug,
+        },
+    )
+    handler(event.data.object, gateway_config, notification.channel_slug)
 
 
 def _channel_slug_is_different_from_payment_channel_slug(
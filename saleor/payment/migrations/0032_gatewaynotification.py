@@ -0,0 +1,66 @@
+# Generated by Django 3.2.12 on 2026-10-19 09:12
+
+import django.core.serializers.json
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("payment", "0031_merge_0030_auto_20210908_1346_0030_payment_partial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="GatewayNotification",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("gateway", models.CharField(max_length=255)),
+                ("channel_slug", models.CharField(max_length=255)),
+                ("notification_id", models.CharField(max_length=512)),
+                ("reference", models.CharField(max_length=512)),
+                ("event_type", models.CharField(max_length=255)),
+                (
+                    "payload",
+                    models.JSONField(
+                        blank=True,
+                        default=dict,
+                        encoder=django.core.serializers.json.DjangoJSONEncoder,
+                    ),
+                ),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pending"),
+                            ("processed", "Processed"),
+                            ("failed", "Failed"),
+                        ],
+                        default="pending",
+                        max_length=32,
+                    ),
+                ),
+                ("created_at", models.DateTimeField(auto_now_add=True)),
+                ("processed_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "ordering": ("pk",),
+                "unique_together": {("gateway", "notification_id")},
+            },
+        ),
+        migrations.AddIndex(
+            model_name="gatewaynotification",
+            index=models.Index(
+                fields=["gateway", "reference", "status"],
+                name="payment_gat_gateway_48c91d_idx",
+            ),
+        ),
+    ]
@@ -13,7 +13,13 @@ from ..checkout.models import Checkout
 from ..core.models import ModelWithMetadata
 from ..core.permissions import PaymentPermissions
 from ..core.taxes import zero_money
-from . import ChargeStatus, CustomPaymentChoices, StorePaymentMethod, TransactionKind
+from . import (
+    ChargeStatus,
+    CustomPaymentChoices,
+    GatewayNotificationStatus,
+    StorePaymentMethod,
+    TransactionKind,
+)
 
 
 class Payment(ModelWithMetadata):
@@ -252,3 +258,40 @@ class Transaction(models.Model):
 
     def get_amount(self):
         return Money(self.amount, self.currency)
+
+
+class GatewayNotification(models.Model):
+    """A notification received from a payment gateway.
+
+    Notifications are stored when they arrive and processed later by Celery
+    workers. Notifications with the same `reference` (the gateway's identifier
+    of a payment) are processed one by one, in the order they were received.
+    """
+
+    gateway = models.CharField(max_length=255)
+    channel_slug = models.CharField(max_length=255)
+    notification_id = models.CharField(max_length=512)
+    reference = models.CharField(max_length=512)
+    event_type = models.CharField(max_length=255)
+    payload = JSONField(blank=True, default=dict, encoder=DjangoJSONEncoder)
+    status = models.CharField(
+        max_length=32,
+        choices=GatewayNotificationStatus.CHOICES,
+        default=GatewayNotificationStatus.PENDING,
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ("pk",)
+        unique_together = [["gateway", "notification_id"]]
+        indexes = [
+            models.Index(fields=["gateway", "reference", "status"]),
+        ]
+
+    def __repr__(self):
+        return "GatewayNotification(gateway=%s, event_type=%s, status=%s)" % (
+            self.gateway,
+            self.event_type,
+            self.status,
+        )
@@ -0,0 +1,93 @@
+from typing import Optional
+
+from celery.utils.log import get_task_logger
+from django.conf import settings
+from django.utils import timezone
+
+from ..celeryconf import app
+from ..core.transactions import transaction_with_commit_on_errors
+from ..plugins.manager import get_plugins_manager
+from . import GatewayNotificationStatus
+from .models import GatewayNotification
+
+task_logger = get_task_logger(__name__)
+
+
+def _get_next_pending_notification(
+    gateway: str, reference: str
+) -> Optional[GatewayNotification]:
+    # Locking the oldest pending notification serializes workers processing
+    # notifications for the same payment, which keeps them in the received order.
+    return (
+        GatewayNotification.objects.select_for_update(of=("self",))
+        .filter(
+            gateway=gateway,
+            reference=reference,
+            status=GatewayNotificationStatus.PENDING,
+        )
+        .order_by("pk")
+        .first()
+    )
+
+
+@app.task
+def process_gateway_notifications_task(gateway: str, channel_slug: str, reference: str):
+    """Process pending gateway notifications for a payment in the received order.
+
+    The gateway plugin for the channel is responsible for handling a single
+    notification with its `process_gateway_notification` method.
+    """
+    manager = get_plugins_manager()
+    plugin = manager.get_plugin(gateway, channel_slug)
+    if not plugin or not plugin.active:
+        task_logger.warning(
+            "Active plugin %s not found for channel %s, notifications for %s "
+            "were not processed.",
+            gateway,
+            channel_slug,
+            reference,
+        )
+        return
+
+    while True:
+        notification = None
+        try:
+            with transaction_with_commit_on_errors():
+                notification = _get_next_pending_notification(gateway, reference)
+                if notification is None:
+                    return
+                plugin.process_gateway_notification(notification)  # type: ignore
+                notification.status = GatewayNotificationStatus.PROCESSED
+                notification.processed_at = timezone.now()
+                notification.save(update_fields=["status", "processed_at"])
+        except Exception:
+            if notification is None:
+                raise
+            task_logger.exception(
+                "Failed to process %s notification %s.",
+                gateway,
+                notification.notification_id,
+            )
+            GatewayNotification.objects.filter(pk=notification.pk).update(
+                status=GatewayNotificationStatus.FAILED, processed_at=timezone.now()
+            )
+
+
+@app.task
+def process_stale_gateway_notifications_task():
+    """Schedule processing of notifications that are pending for too long.
+
+    It covers notifications for which the processing task was lost, e.g. when
+    a worker was killed.
+    """
+    stale_before = timezone.now() - settings.PAYMENT_GATEWAY_NOTIFICATIONS_STALE_PERIOD
+    references = (
+        GatewayNotification.objects.filter(
+            status=GatewayNotificationStatus.PENDING, created_at__lt=stale_before
+        )
+        .values_list("gateway", "channel_slug", "reference")
+        .order_by()
+        .distinct()
+    )
+    for gateway, channel_slug, reference in references.iterator():
+        process_gateway_notifications_task.delay(gateway, channel_slug, reference)
@@ -0,0 +1,108 @@
+from datetime import timedelta
+from unittest.mock import Mock, call, patch
+
+from django.utils import timezone
+from freezegun import freeze_time
+
+from .. import GatewayNotificationStatus
+from ..models import GatewayNotification
+from ..tasks import (
+    process_gateway_notifications_task,
+    process_stale_gateway_notifications_task,
+)
+
+GATEWAY = "mirumee.payments.dummy"
+
+
+def _create_notification(notification_id, reference="payment-1", channel="main"):
+    return GatewayNotification.objects.create(
+        gateway=GATEWAY,
+        channel_slug=channel,
+        notification_id=notification_id,
+        reference=reference,
+        event_type="AUTHORISATION",
+        payload={"id": notification_id},
+    )
+
+
+@patch("saleor.payment.tasks.get_plugins_manager")
+def test_process_gateway_notifications_task_keeps_received_order(mocked_manager):
+    # given
+    plugin = Mock(active=True)
+    mocked_manager.return_value.get_plugin.return_value = plugin
+    first = _create_notification("1")
+    second = _create_notification("2")
+    other_payment = _create_notification("3", reference="payment-2")
+
+    # when
+    process_gateway_notifications_task(GATEWAY, "main", "payment-1")
+
+    # then
+    mocked_manager.return_value.get_plugin.assert_called_once_with(GATEWAY, "main")
+    assert plugin.process_gateway_notification.call_args_list == [
+        call(first),
+        call(second),
+    ]
+    first.refresh_from_db()
+    second.refresh_from_db()
+    other_payment.refresh_from_db()
+    assert first.status == GatewayNotificationStatus.PROCESSED
+    assert first.processed_at
+    assert second.status == GatewayNotificationStatus.PROCESSED
+    assert other_payment.status == GatewayNotificationStatus.PENDING
+
+
+@patch("saleor.payment.tasks.get_plugins_manager")
+def test_process_gateway_notifications_task_marks_failed_notification(
+    mocked_manager,
+):
+    # given
+    plugin = Mock(active=True)
+    plugin.process_gateway_notification.side_effect = [Exception("error"), None]
+    mocked_manager.return_value.get_plugin.return_value = plugin
+    first = _create_notification("1")
+    second = _create_notification("2")
+
+    # when
+    process_gateway_notifications_task(GATEWAY, "main", "payment-1")
+
+    # then
+    first.refresh_from_db()
+    second.refresh_from_db()
+    assert first.status == GatewayNotificationStatus.FAILED
+    assert second.status == GatewayNotificationStatus.PROCESSED
+
+
+@patch("saleor.payment.tasks.get_plugins_manager")
+def test_process_gateway_notifications_task_inactive_plugin(mocked_manager):
+    # given
+    plugin = Mock(active=False)
+    mocked_manager.return_value.get_plugin.return_value = plugin
+    notification = _create_notification("1")
+
+    # when
+    process_gateway_notifications_task(GATEWAY, "main", "payment-1")
+
+    # then
+    assert not plugin.process_gateway_notification.called
+    notification.refresh_from_db()
+    assert notification.status == GatewayNotificationStatus.PENDING
+
+
+@patch("saleor.payment.tasks.process_gateway_notifications_task.delay")
+def test_process_stale_gateway_notifications_task(mocked_task, settings):
+    # given
+    settings.PAYMENT_GATEWAY_NOTIFICATIONS_STALE_PERIOD = timedelta(minutes=5)
+    with freeze_time(timezone.now() - timedelta(minutes=10)):
+        _create_notification("1")
+        _create_notification("2")
+        processed = _create_notification("3", reference="payment-2")
+        processed.status = GatewayNotificationStatus.PROCESSED
+        processed.save(update_fields=["status"])
+    _create_notification("4", reference="payment-3")
+
+    # when
+    process_stale_gateway_notifications_task()
+
+    # then
+    mocked_task.assert_called_once_with(GATEWAY, "main", "payment-1")
@@ -1,6 +1,13 @@
 from unittest.mock import patch
 
-from ..utils import get_channel_slug_from_payment, try_void_or_refund_inactive_payment
+from ...tests.utils import flush_post_commit_hooks
+from .. import GatewayNotificationStatus
+from ..models import GatewayNotification
+from ..utils import (
+    get_channel_slug_from_payment,
+    store_gateway_notification,
+    try_void_or_refund_inactive_payment,
+)
 
 
 def test_get_channel_slug_from_payment_with_order(payment_dummy):
@@ -59,3 +66,52 @@ def test_try_void_or_refund_inactive_payment_transaction_success(
     assert update_payment_charge_status_mock.called
     assert get_channel_slug_from_payment_mock.called
     assert refund_or_void_mock.called
+
+
+@patch("saleor.payment.utils.process_gateway_notifications_task.delay")
+def test_store_gateway_notification(mocked_task):
+    # when
+    notification = store_gateway_notification(
+        gateway="mirumee.payments.dummy",
+        channel_slug="main",
+        notification_id="AUTHORISATION:123:true",
+        reference="payment-1",
+        event_type="AUTHORISATION",
+        payload={"pspReference": "123"},
+    )
+    flush_post_commit_hooks()
+
+    # then
+    assert notification == GatewayNotification.objects.get()
+    assert notification.status == GatewayNotificationStatus.PENDING
+    assert notification.payload == {"pspReference": "123"}
+    mocked_task.assert_called_once_with("mirumee.payments.dummy", "main", "payment-1")
+
+
+@patch("saleor.payment.utils.process_gateway_notifications_task.delay")
+def test_store_gateway_notification_skips_duplicate(mocked_task):
+    # given
+    GatewayNotification.objects.create(
+        gateway="mirumee.payments.dummy",
+        channel_slug="main",
+        notification_id="AUTHORISATION:123:true",
+        reference="payment-1",
+        event_type="AUTHORISATION",
+        payload={},
+    )
+
+    # when
+    notification = store_gateway_notification(
+        gateway="mirumee.payments.dummy",
+        channel_slug="main",
+        notification_id="AUTHORISATION:123:true",
+        reference="payment-1",
+        event_type="AUTHORISATION",
+        payload={"pspReference": "123"},
+    )
+    flush_post_commit_hooks()
+
+    # then
+    assert notification is None
+    assert GatewayNotification.objects.count() == 1
+    assert not mocked_task.called
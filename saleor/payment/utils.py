@@ -6,6 +6,7 @@ from typing import TYPE_CHECKING, Dict, List, Optional, cast
 import graphene
 from babel.numbers import get_currency_precision
 from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
 from django.db.models import Q
 
 from ..account.models import User
@@ -29,7 +30,8 @@ from .interface import (
     PaymentMethodInfo,
     StorePaymentMethodEnum,
 )
-from .models import Payment, Transaction
+from .models import GatewayNotification, Payment, Transaction
+from .tasks import process_gateway_notifications_task
 
 if TYPE_CHECKING:
     from ..plugins.manager import PluginsManager
@@ -511,3 +513,39 @@ def payment_owned_by_user(payment_pk: int, user) -> bool:
         ).first()
         is not None
     )
+
+
+def store_gateway_notification(
+    gateway: str,
+    channel_slug: str,
+    notification_id: str,
+    reference: str,
+    event_type: str,
+    payload: dict,
+) -> Optional[GatewayNotification]:
+    """Store a notification received from a gateway and schedule its processing.
+
+    Gateways deliver notifications at least once, so `notification_id` is used to
+    skip the ones that were already received. Return `None` for a duplicate.
+    """
+    notification, created = GatewayNotification.objects.get_or_create(
+        gateway=gateway,
+        notification_id=notification_id,
+        defaults={
+            "channel_slug": channel_slug,
+            "reference": reference,
+            "event_type": event_type,
+            "payload": payload,
+        },
+    )
+    if not created:
+        logger.info(
+            "Skipping already received %s notification %s.", gateway, notification_id
+        )
+        return None
+    transaction.on_commit(
+        lambda: process_gateway_notifications_task.delay(
+            gateway, channel_slug, reference
+        )
+    )
+    return notification
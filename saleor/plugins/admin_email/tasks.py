@@ -1,6 +1,6 @@
 from ...celeryconf import app
 from ...csv.events import export_failed_info_sent_event, export_file_sent_event
-from ..email_common import EmailConfig, send_email
+from ..email_common import EmailConfig, send_email, send_emails
 
 
 @app.task(compression="zlib")
@@ -56,12 +56,11 @@ def send_staff_order_confirmation_email_task(
     recipient_list: str, payload: dict, config: dict, subject, template
 ):
     email_config = EmailConfig(**config)
-    send_email(
+    send_emails(
         config=email_config,
-        recipient_list=recipient_list,
+        recipients_with_context=[(recipient, payload) for recipient in recipient_list],
         subject=subject,
         template_str=template,
-        context=payload,
     )
 
 
@@ -205,10 +205,25 @@ def test_get_email_template(admin_email_plugin, admin_email_template):
     assert template == admin_email_template.value
 
     admin_email_template.delete()
+    plugin = get_plugins_manager().global_plugins[0]
     template = get_email_template(plugin, admin_email_template.name, default)
     assert template == default
 
 
+def test_get_email_template_fetches_templates_once(
+    admin_email_plugin, admin_email_template, django_assert_num_queries
+):
+    plugin = admin_email_plugin()
+    default = "Default template"
+
+    with django_assert_num_queries(1):
+        template = get_email_template(plugin, admin_email_template.name, default)
+        other_template = get_email_template(plugin, "other_template", default)
+
+    assert template == admin_email_template.value
+    assert other_template == default
+
+
 @patch.object(EmailBackend, "open")
 def test_save_plugin_configuration_creates_email_template_instance(
     mocked_open, admin_email_plugin
@@ -292,9 +292,9 @@ def test_send_export_failed_email_task_custom_template(
     )
 
 
-@mock.patch("saleor.plugins.email_common.send_mail")
+@mock.patch("saleor.plugins.email_common.PooledEmailBackend.send_messages")
 def test_send_staff_order_confirmation_email_task_default_template(
-    mocked_send_mail, email_dict_config, order_with_lines
+    mocked_send_messages, email_dict_config, order_with_lines
 ):
     recipient_email = "user@example.com"
     payload = {
@@ -315,12 +315,49 @@ def test_send_staff_order_confirmation_email_task_default_template(
     )
 
     # confirm that mail has correct structure and email was sent
-    assert mocked_send_mail.called
+    assert mocked_send_messages.called
 
 
-@mock.patch("saleor.plugins.admin_email.tasks.send_email")
+@mock.patch("saleor.plugins.email_common.PooledEmailBackend.send_messages")
+def test_send_staff_order_confirmation_email_task_sends_email_per_recipient(
+    mocked_send_messages, email_dict_config, order_with_lines
+):
+    recipient_list = ["staff1@example.com", "staff2@example.com"]
+    payload = {
+        "order": get_default_order_payload(
+            order_with_lines, "http://localhost:8000/redirect"
+        ),
+        "recipient_list": recipient_list,
+        "site_name": "Saleor",
+        "domain": "localhost:8000",
+    }
+
+    send_staff_order_confirmation_email_task(
+        recipient_list,
+        payload,
+        email_dict_config,
+        "subject {{ order.number }}",
+        "<html><body>Order {{ order.number }}</body></html>",
+    )
+
+    # all emails are sent within a single connection
+    mocked_send_messages.assert_called_once()
+    email_messages = mocked_send_messages.call_args[0][0]
+    assert [message.to for message in email_messages] == [
+        ["staff1@example.com"],
+        ["staff2@example.com"],
+    ]
+    order_number = payload["order"]["number"]
+    for message in email_messages:
+        assert message.subject == f"subject {order_number}"
+        assert message.alternatives == [
+            (f"<html><body>Order {order_number}</body></html>", "text/html")
+        ]
+
+
+@mock.patch("saleor.plugins.admin_email.tasks.send_emails")
 def test_send_staff_order_confirmation_email_task_custom_template(
-    mocked_send_email, order_with_lines, email_dict_config, admin_email_plugin
+    mocked_send_emails, order_with_lines, email_dict_config, admin_email_plugin
 ):
     expected_template_str = "<html><body>Template body</body></html>"
     expected_subject = "Test Email Subject"
@@ -347,10 +384,9 @@ def test_send_staff_order_confirmation_email_task_custom_template(
     )
 
     email_config = EmailConfig(**email_dict_config)
-    mocked_send_email.assert_called_with(
+    mocked_send_emails.assert_called_with(
         config=email_config,
-        recipient_list=[recipient_email],
-        context=payload,
+        recipients_with_context=[(recipient_email, payload)],
         subject=expected_subject,
         template_str=expected_template_str,
     )
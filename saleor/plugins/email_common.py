@@ -1,11 +1,16 @@
+import hashlib
 import logging
 import operator
 import os
 import re
+import smtplib
+import threading
+from collections import OrderedDict
 from dataclasses import asdict, dataclass
 from decimal import Decimal, InvalidOperation
 from email.headerregistry import Address
-from typing import TYPE_CHECKING, Dict, List, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Tuple
 
 import dateutil.parser
 import html2text
@@ -13,9 +18,10 @@ import i18naddress
 import pybars
 from babel.numbers import format_currency
 from django.core.exceptions import ValidationError
-from django.core.mail import send_mail
+from django.core.mail import EmailMultiAlternatives, send_mail
 from django.core.mail.backends.smtp import EmailBackend
 from django.core.validators import EmailValidator
+from django.db.models import prefetch_related_objects
 from django_prices.utils.locale import get_locale_data
 
 from ..product.product_images import get_thumbnail_size
@@ -38,6 +44,7 @@ DEFAULT_TEMPLATE_HELP_TEXT = (
 DEFAULT_SUBJECT_HELP_TEXT = "An email subject built with Handlebars template language."
 DEFAULT_EMAIL_VALUE = "DEFAULT"
 DEFAULT_EMAIL_TIMEOUT = 5
+COMPILED_TEMPLATES_CACHE_SIZE = 256
 
 
 @dataclass
@@ -183,26 +190,110 @@ def price(this, net_amount, gross_amount, currency, display_gross=False):
     return pybars.strlist([formatted_price])
 
 
-def send_email(
-    config: EmailConfig, recipient_list, context, subject="", template_str=""
-):
+class PooledEmailBackend(EmailBackend):
+    """SMTP email backend which keeps the connection open between sends."""
+
+    def send_messages(self, email_messages):
+        """Send the messages, reconnecting when the server closed the connection.
+
+        The connection is checked before sending, as the server could close it
+        while it was idle. When it's closed while sending, only the message that
+        failed is sent again, so delivered messages aren't sent twice.
+        """
+        if not email_messages:
+            return 0
+        with self._lock:
+            if not self._is_connected():
+                self.close()
+            self.open()
+            num_sent = 0
+            for message in email_messages:
+                try:
+                    sent = self._send(message)
+                except smtplib.SMTPServerDisconnected:
+                    self.close()
+                    self.open()
+                    sent = self._send(message)
+                if sent:
+                    num_sent += 1
+            return num_sent
+
+    def _is_connected(self) -> bool:
+        if self.connection is None:
+            return False
+        try:
+            status, _ = self.connection.noop()
+        except smtplib.SMTPServerDisconnected:
+            return False
+        return status == 250
+
+
+_email_backends: Dict[Tuple, PooledEmailBackend] = {}
+_email_backends_lock = threading.Lock()
+
+_compiled_templates: "OrderedDict[str, Callable]" = OrderedDict()
+_compiled_templates_lock = threading.Lock()
+
+
+def get_email_backend(config: EmailConfig) -> PooledEmailBackend:
+    """Return the worker's SMTP backend for the given configuration.
+
+    The backend is shared by all emails sent with the same SMTP settings, so the
+    connection is opened once and reused.
+    """
+    key = (
+        config.host,
+        config.port,
+        config.username,
+        config.password,
+        config.use_ssl,
+        config.use_tls,
+    )
+    with _email_backends_lock:
+        email_backend = _email_backends.get(key)
+        if email_backend is None:
+            email_backend = PooledEmailBackend(
+                host=config.host,
+                port=config.port,
+                username=config.username,
+                password=config.password,
+                use_ssl=config.use_ssl,
+                use_tls=config.use_tls,
+                timeout=DEFAULT_EMAIL_TIMEOUT,
+            )
+            _email_backends[key] = email_backend
+    return email_backend
+
+
+def compile_template(template_str: str) -> Callable:
+    """Compile the Handlebars template, reusing already compiled templates.
+
+    Templates are identified by the hash of their content, so a template changed in
+    the plugin configuration is compiled again.
+    """
+    key = hashlib.sha256(template_str.encode("utf-8")).hexdigest()
+    with _compiled_templates_lock:
+        template = _compiled_templates.get(key)
+        if template is not None:
+            _compiled_templates.move_to_end(key)
+            return template
+
+    template = pybars.Compiler().compile(template_str)
+    with _compiled_templates_lock:
+        _compiled_templates[key] = template
+        if len(_compiled_templates) > COMPILED_TEMPLATES_CACHE_SIZE:
+            _compiled_templates.popitem(last=False)
+    return template
+
+
+def get_from_email(config: EmailConfig) -> str:
     sender_name = config.sender_name or ""
     sender_address = config.sender_address
+    return str(Address(sender_name, addr_spec=sender_address))
 
-    from_email = str(Address(sender_name, addr_spec=sender_address))
 
-    email_backend = EmailBackend(
-        host=config.host,
-        port=config.port,
-        username=config.username,
-        password=config.password,
-        use_ssl=config.use_ssl,
-        use_tls=config.use_tls,
-        timeout=DEFAULT_EMAIL_TIMEOUT,
-    )
-    compiler = pybars.Compiler()
-    template = compiler.compile(template_str)
-    subject_template = compiler.compile(subject)
+def render_email(context, subject="", template_str="") -> Tuple[str, str]:
+    """Return the rendered subject and HTML message of the email."""
     helpers = {
         "format_address": format_address,
         "price": price,
@@ -210,18 +301,59 @@ def send_email(
         "get_product_image_thumbnail": get_product_image_thumbnail,
         "compare": compare,
     }
-    message = template(context, helpers=helpers)
-    subject_message = subject_template(context, helpers)
+    message = compile_template(template_str)(context, helpers=helpers)
+    subject_message = compile_template(subject)(context, helpers)
+    return subject_message, message
+
+
+def send_email(
+    config: EmailConfig, recipient_list, context, subject="", template_str=""
+):
+    subject_message, message = render_email(context, subject, template_str)
     send_mail(
         subject_message,
         html2text.html2text(message),
-        from_email,
+        get_from_email(config),
         recipient_list,
         html_message=message,
-        connection=email_backend,
+        connection=get_email_backend(config),
     )
 
 
+def send_emails(
+    config: EmailConfig,
+    recipients_with_context: Iterable[Tuple[str, dict]],
+    subject="",
+    template_str="",
+):
+    """Send a separate email to each recipient within a single SMTP session.
+
+    Emails with the same context are rendered only once.
+    """
+    from_email = get_from_email(config)
+    # Rendered emails are kept together with their context, so the context object
+    # stays alive and its id can't be reused by another context.
+    rendered_emails: Dict[int, Tuple[dict, str, str, str]] = {}
+    email_messages = []
+    for recipient, context in recipients_with_context:
+        if id(context) not in rendered_emails:
+            subject_message, message = render_email(context, subject, template_str)
+            rendered_emails[id(context)] = (
+                context,
+                subject_message,
+                html2text.html2text(message),
+                message,
+            )
+        _, subject_message, text_message, message = rendered_emails[id(context)]
+        email_message = EmailMultiAlternatives(
+            subject_message, text_message, from_email, [recipient]
+        )
+        email_message.attach_alternative(message, "text/html")
+        email_messages.append(email_message)
+    if email_messages:
+        get_email_backend(config).send_messages(email_messages)
+
+
 def validate_email_config(config: EmailConfig):
     email_backend = EmailBackend(
         host=config.host,
@@ -347,11 +479,13 @@ def get_email_template(
     template_str = default
 
     if plugin.db_config:
-        email_template = plugin.db_config.email_templates.filter(
-            name=template_field_name
-        ).first()
-        if email_template:
-            template_str = email_template.value
+        # Fetch all templates of the plugin at once and keep them on the config
+        # instance, as a single notification can require a few templates.
+        prefetch_related_objects([plugin.db_config], "email_templates")
+        for email_template in plugin.db_config.email_templates.all():
+            if email_template.name == template_field_name:
+                template_str = email_template.value
+                break
 
     return template_str
 
@@ -390,6 +524,7 @@ def get_email_subject(
     return default
 
 
+@lru_cache()
 def get_default_email_template(
     template_file_name: str, default_template_path: str
 ) -> str:
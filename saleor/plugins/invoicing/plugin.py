@@ -1,14 +1,13 @@
 from typing import Any, Optional
-from uuid import uuid4
 
-from django.core.files.base import ContentFile
-from django.utils.text import slugify
+from django.conf import settings
+from django.db import transaction
 
-from ...core import JobStatus
 from ...invoice.models import Invoice
 from ...order.models import Order
 from ..base_plugin import BasePlugin
-from .utils import generate_invoice_number, generate_invoice_pdf
+from .tasks import generate_invoice_pdf_task
+from .utils import generate_invoice_number
 
 
 class InvoicingPlugin(BasePlugin):
@@ -25,17 +24,13 @@ class InvoicingPlugin(BasePlugin):
         number: Optional[str],
         previous_value: Any,
     ) -> Any:
-        invoice_number = generate_invoice_number()
-        invoice.update_invoice(number=invoice_number)
-        file_content, creation_date = generate_invoice_pdf(invoice)
-        invoice.created = creation_date
-        slugified_invoice_number = slugify(invoice_number)
-        invoice.invoice_file.save(
-            f"invoice-{slugified_invoice_number}-order-{order.id}-{uuid4()}.pdf",
-            ContentFile(file_content),
-        )
-        invoice.status = JobStatus.SUCCESS
-        invoice.save(
-            update_fields=["created", "number", "invoice_file", "status", "updated_at"]
+        # The number is assigned right away; the PDF is rendered by a worker and
+        # the invoice stays pending until then.
+        invoice.update_invoice(number=generate_invoice_number())
+        invoice.save(update_fields=["number", "updated_at"])
+        transaction.on_commit(
+            lambda: generate_invoice_pdf_task.apply_async(
+                args=[invoice.pk], queue=settings.INVOICE_PDF_QUEUE
+            )
         )
         return invoice
@@ -0,0 +1,41 @@
+import logging
+from uuid import uuid4
+
+from django.core.files.base import ContentFile
+from django.utils.text import slugify
+
+from ...celeryconf import app
+from ...core import JobStatus
+from ...invoice.models import Invoice
+from ...order import events as order_events
+from .utils import generate_invoice_pdf
+
+logger = logging.getLogger(__name__)
+
+
+@app.task
+def generate_invoice_pdf_task(invoice_id):
+    invoice = Invoice.objects.select_related("order").filter(pk=invoice_id).first()
+    if not invoice or not invoice.order or invoice.status != JobStatus.PENDING:
+        return
+    order = invoice.order
+    try:
+        file_content, creation_date = generate_invoice_pdf(invoice)
+    except Exception:
+        logger.exception("Failed to render invoice %s.", invoice.number)
+        invoice.status = JobStatus.FAILED
+        invoice.message = "Failed to render the invoice."
+        invoice.save(update_fields=["status", "message", "updated_at"])
+        return
+
+    invoice.created = creation_date
+    invoice.invoice_file.save(
+        f"invoice-{slugify(invoice.number)}-order-{order.id}-{uuid4()}.pdf",
+        ContentFile(file_content),
+        save=False,
+    )
+    invoice.status = JobStatus.SUCCESS
+    invoice.save(update_fields=["created", "invoice_file", "status", "updated_at"])
+    order_events.invoice_generated_event(
+        order=order, user=None, app=None, invoice_number=invoice.number
+    )
@@ -5,15 +5,20 @@ from unittest.mock import Mock, patch
 import pytz
 from prices import Money
 
+from ....core import JobStatus
 from ....giftcard.events import gift_cards_used_in_order_event
 from ....giftcard.models import GiftCard
+from ....invoice.models import Invoice
+from ....order import OrderEvents
+from ....tests.utils import flush_post_commit_hooks
+from ..plugin import InvoicingPlugin
+from ..tasks import generate_invoice_pdf_task
 from ..utils import (
     chunk_products,
     generate_invoice_number,
     generate_invoice_pdf,
     get_gift_cards_payment_amount,
     get_product_limit_first_page,
-    make_full_invoice_number,
 )
 
 
@@ -35,12 +40,18 @@ def test_get_product_limit_first_page(product):
 
 @patch("saleor.plugins.invoicing.utils.HTML")
 @patch("saleor.plugins.invoicing.utils.get_template")
-@patch("saleor.plugins.invoicing.utils.os")
+@patch("saleor.plugins.invoicing.utils.get_invoice_font_assets")
 def test_generate_invoice_pdf_for_order(
-    os_mock, get_template_mock, HTML_mock, fulfilled_order, customer_user, gift_card
+    get_font_assets_mock,
+    get_template_mock,
+    HTML_mock,
+    fulfilled_order,
+    customer_user,
+    gift_card,
 ):
     get_template_mock.return_value.render = Mock(return_value="<html></html>")
-    os_mock.path.join.return_value = "test"
+    font_stylesheet, font_config = Mock(), Mock()
+    get_font_assets_mock.return_value = (font_stylesheet, font_config)
 
     previous_current_balance = gift_card.current_balance
     gift_card.current_balance = Money(Decimal(5.0), "USD")
@@ -59,7 +70,6 @@ def test_generate_invoice_pdf_for_order(
             "creation_date": datetime.now(tz=pytz.utc).strftime("%d %b %Y"),
             "order": fulfilled_order,
             "gift_cards_payment": previous_current_balance - gift_card.current_balance,
-            "font_path": "file://test",
             "products_first_page": list(fulfilled_order.lines.all()),
             "rest_of_products": [],
         }
@@ -67,18 +77,116 @@ def test_generate_invoice_pdf_for_order(
     HTML_mock.assert_called_once_with(
         string=get_template_mock.return_value.render.return_value
     )
+    HTML_mock.return_value.write_pdf.assert_called_once_with(
+        stylesheets=[font_stylesheet], font_config=font_config
+    )
 
 
-def test_generate_invoice_number_invalid_numeration(fulfilled_order):
+@patch("saleor.plugins.invoicing.utils.datetime")
+def test_generate_invoice_number_invalid_numeration(datetime_mock, fulfilled_order):
+    datetime_mock.now.return_value = datetime(2020, 7, 23, 12, 59, 59)
     invoice = fulfilled_order.invoices.last()
-    invoice.number = "invalid/06/2020"
+    invoice.number = "invalid/07/2020"
     invoice.save(update_fields=["number"])
-    assert generate_invoice_number() == make_full_invoice_number()
+    assert generate_invoice_number() == "1/07/2020"
 
 
-def test_generate_invoice_number_no_existing_invoice(fulfilled_order):
+@patch("saleor.plugins.invoicing.utils.datetime")
+def test_generate_invoice_number_no_existing_invoice(datetime_mock, fulfilled_order):
+    datetime_mock.now.return_value = datetime(2020, 7, 23, 12, 59, 59)
     fulfilled_order.invoices.all().delete()
-    assert generate_invoice_number() == make_full_invoice_number()
+    assert generate_invoice_number() == "1/07/2020"
+
+
+@patch("saleor.plugins.invoicing.utils.datetime")
+def test_generate_invoice_number_uses_counter_of_month(datetime_mock, order):
+    # given
+    datetime_mock.now.return_value = datetime(2020, 7, 23, 12, 59, 59)
+    Invoice.objects.create(order=order, number="5/07/2020")
+    assert generate_invoice_number() == "6/07/2020"
+    Invoice.objects.create(order=order, number="6/07/2020")
+    Invoice.objects.create(order=order, number="8/07/2020/MANUAL")
+
+    # when
+    number = generate_invoice_number()
+
+    # then
+    assert number == "7/07/2020"
+
+
+@patch("saleor.plugins.invoicing.utils.datetime")
+def test_generate_invoice_number_new_month(datetime_mock, order):
+    # given
+    datetime_mock.now.return_value = datetime(2020, 7, 23, 12, 59, 59)
+    generate_invoice_number()
+    datetime_mock.now.return_value = datetime(2020, 8, 1, 0, 0, 1)
+
+    # when
+    number = generate_invoice_number()
+
+    # then
+    assert number == "1/08/2020"
+
+
+@patch("saleor.plugins.invoicing.utils.datetime")
+@patch("saleor.plugins.invoicing.plugin.generate_invoice_pdf_task.apply_async")
+def test_invoice_request_schedules_pdf_generation(
+    apply_async_mock, datetime_mock, fulfilled_order, settings
+):
+    # given
+    datetime_mock.now.return_value = datetime(2020, 7, 23, 12, 59, 59)
+    settings.INVOICE_PDF_QUEUE = "invoices"
+    plugin = InvoicingPlugin(configuration=[], active=True)
+    invoice = Invoice.objects.create(order=fulfilled_order)
+
+    # when
+    result = plugin.invoice_request(fulfilled_order, invoice, None, None)
+    flush_post_commit_hooks()
+
+    # then
+    invoice.refresh_from_db()
+    assert result == invoice
+    assert invoice.number == "1/07/2020"
+    assert invoice.status == JobStatus.PENDING
+    apply_async_mock.assert_called_once_with(args=[invoice.pk], queue="invoices")
+
+
+@patch("saleor.plugins.invoicing.tasks.generate_invoice_pdf")
+def test_generate_invoice_pdf_task(generate_invoice_pdf_mock, fulfilled_order):
+    # given
+    creation_date = datetime.now(tz=pytz.utc)
+    generate_invoice_pdf_mock.return_value = (b"pdf", creation_date)
+    invoice = Invoice.objects.create(order=fulfilled_order, number="1/07/2020")
+
+    # when
+    generate_invoice_pdf_task(invoice.pk)
+
+    # then
+    invoice.refresh_from_db()
+    assert invoice.status == JobStatus.SUCCESS
+    assert invoice.created == creation_date
+    assert invoice.invoice_file.name.startswith("invoices/invoice-1072020-order-")
+    assert fulfilled_order.events.filter(
+        type=OrderEvents.INVOICE_GENERATED, parameters__invoice_number="1/07/2020"
+    ).exists()
+
+
+@patch("saleor.plugins.invoicing.tasks.generate_invoice_pdf")
+def test_generate_invoice_pdf_task_failure(generate_invoice_pdf_mock, fulfilled_order):
+    # given
+    generate_invoice_pdf_mock.side_effect = ValueError()
+    invoice = Invoice.objects.create(order=fulfilled_order, number="1/07/2020")
+
+    # when
+    generate_invoice_pdf_task(invoice.pk)
+
+    # then
+    invoice.refresh_from_db()
+    assert invoice.status == JobStatus.FAILED
+    assert not invoice.invoice_file
+    assert not fulfilled_order.events.filter(
+        type=OrderEvents.INVOICE_GENERATED
+    ).exists()
 
 
 def test_get_gift_cards_payment_amount(
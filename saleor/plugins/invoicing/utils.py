@@ -2,49 +2,48 @@ import os
 import re
 from datetime import datetime
 from decimal import Decimal
+from functools import lru_cache
 
 import pytz
 from django.conf import settings
 from django.template.loader import get_template
 from prices import Money
-from weasyprint import HTML
+from weasyprint import CSS, HTML
+from weasyprint.text.fonts import FontConfiguration
 
 from ...giftcard import GiftCardEvents
 from ...giftcard.models import GiftCardEvent
-from ...invoice.models import Invoice
+from ...invoice.models import Invoice, InvoiceNumberSequence
 
 MAX_PRODUCTS_WITH_TABLE = 3
 MAX_PRODUCTS_WITHOUT_TABLE = 4
 MAX_PRODUCTS_PER_PAGE = 13
 
 
-def make_full_invoice_number(number=None, month=None, year=None):
-    now = datetime.now()
-    current_month = int(now.strftime("%m"))
-    current_year = int(now.strftime("%Y"))
-    month_and_year = now.strftime("%m/%Y")
-
-    if month == current_month and year == current_year:
-        new_number = (number or 0) + 1
-        return f"{new_number}/{month_and_year}"
-    return f"1/{month_and_year}"
-
-
-def parse_invoice_dates(invoice):
-    match = re.match(r"^(\d+)\/(\d+)\/(\d+)", invoice.number)
-    return int(match.group(1)), int(match.group(2)), int(match.group(3))
+def get_last_invoice_number_in_period(period: str) -> int:
+    """Return the highest number of invoices created in the period, 0 if none."""
+    pattern = re.compile(rf"^(\d+)/{re.escape(period)}$")
+    numbers = Invoice.objects.filter(number__endswith=f"/{period}").values_list(
+        "number", flat=True
+    )
+    last_number = 0
+    for number in numbers:
+        if match := pattern.match(number):
+            last_number = max(last_number, int(match.group(1)))
+    return last_number
 
 
 def generate_invoice_number():
-    last_invoice = Invoice.objects.filter(number__isnull=False).last()
-    if not last_invoice or not last_invoice.number:
-        return make_full_invoice_number()
+    """Return the next number of invoices in the current month.
 
-    try:
-        number, month, year = parse_invoice_dates(last_invoice)
-        return make_full_invoice_number(number, month, year)
-    except (IndexError, ValueError, AttributeError):
-        return make_full_invoice_number()
+    Numbers are taken from a counter per month. Its first number continues
+    the numbers of invoices already created in the month.
+    """
+    period = datetime.now().strftime("%m/%Y")
+    number = InvoiceNumberSequence.objects.next_number(
+        period, lambda: get_last_invoice_number_in_period(period) + 1
+    )
+    return f"{number}/{period}"
 
 
 def chunk_products(products, product_limit):
@@ -79,11 +78,28 @@ def get_gift_cards_payment_amount(order):
     return Money(total_paid, order.currency)
 
 
-def generate_invoice_pdf(invoice):
+@lru_cache(maxsize=1)
+def get_invoice_font_assets():
+    """Return the font stylesheet and configuration used by all invoices.
+
+    They're loaded once per process, so the font isn't read and registered again
+    for every rendered invoice.
+    """
     font_path = os.path.join(
         settings.PROJECT_ROOT, "templates", "invoices", "inter.ttf"
     )
+    font_config = FontConfiguration()
+    stylesheet = CSS(
+        string=(
+            "@font-face { font-family: Custom; font-style: normal; "
+            f"src: url(file://{font_path}) format('truetype'); }}"
+        ),
+        font_config=font_config,
+    )
+    return stylesheet, font_config
 
+
+def generate_invoice_pdf(invoice):
     all_products = invoice.order.lines.all()
 
     product_limit_first_page = get_product_limit_first_page(all_products)
@@ -101,9 +117,12 @@ def generate_invoice_pdf(invoice):
             "creation_date": creation_date.strftime("%d %b %Y"),
             "order": order,
             "gift_cards_payment": gift_cards_payment,
-            "font_path": f"file://{font_path}",
             "products_first_page": products_first_page,
             "rest_of_products": rest_of_products,
         }
     )
-    return HTML(string=rendered_template).write_pdf(), creation_date
+    font_stylesheet, font_config = get_invoice_font_assets()
+    pdf = HTML(string=rendered_template).write_pdf(
+        stylesheets=[font_stylesheet], font_config=font_config
+    )
+    return pdf, creation_date
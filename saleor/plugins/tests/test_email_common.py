@@ -1,10 +1,15 @@
-from unittest.mock import patch
+from smtplib import SMTPServerDisconnected
+from unittest.mock import Mock, patch
 
 import pytest
 from django.core.exceptions import ValidationError
 
 from saleor.plugins.email_common import (
     DEFAULT_EMAIL_CONFIGURATION,
+    EmailConfig,
+    PooledEmailBackend,
+    compile_template,
+    get_email_backend,
     validate_default_email_configuration,
 )
 from saleor.plugins.error_codes import PluginErrorCode
@@ -59,3 +64,94 @@ def test_validate_default_email_configuration_backend_raises(
             " Make sure that you provided correct values."
             " [Errno 61] Connection refused"
         )
+
+
+@patch("saleor.plugins.email_common.pybars.Compiler")
+def test_compile_template_reuses_compiled_template(mocked_compiler):
+    compile_template("{{ first }} cached template")
+    compile_template("{{ first }} cached template")
+    compile_template("{{ second }} cached template")
+
+    assert mocked_compiler.return_value.compile.call_count == 2
+
+
+def test_compile_template_renders_template():
+    template = compile_template("Hello {{ name }}")
+
+    assert template({"name": "Saleor"}) == "Hello Saleor"
+
+
+def test_get_email_backend_reuses_backend_for_same_config():
+    config = EmailConfig(host="localhost", port="1025", sender_address="a@b.com")
+    other_sender_config = EmailConfig(
+        host="localhost", port="1025", sender_address="c@d.com"
+    )
+    other_host_config = EmailConfig(host="smtp.example.com", port="1025")
+
+    backend = get_email_backend(config)
+
+    assert get_email_backend(other_sender_config) is backend
+    assert get_email_backend(other_host_config) is not backend
+
+
+@patch.object(PooledEmailBackend, "close")
+@patch.object(PooledEmailBackend, "open")
+@patch.object(PooledEmailBackend, "_send")
+def test_pooled_email_backend_keeps_connection_open(
+    mocked_send, mocked_open, mocked_close
+):
+    backend = PooledEmailBackend(host="localhost", port="1025")
+    backend.connection = Mock()
+    backend.connection.noop.return_value = (250, b"OK")
+    mocked_open.return_value = False
+
+    backend.send_messages([Mock()])
+    backend.send_messages([Mock()])
+
+    assert mocked_send.call_count == 2
+    assert not mocked_close.called
+
+
+@patch.object(PooledEmailBackend, "close")
+@patch.object(PooledEmailBackend, "open")
+@patch.object(PooledEmailBackend, "_send")
+def test_pooled_email_backend_reconnects_when_idle_connection_closed(
+    mocked_send, mocked_open, mocked_close
+):
+    backend = PooledEmailBackend(host="localhost", port="1025")
+    backend.connection = Mock()
+    backend.connection.noop.side_effect = SMTPServerDisconnected()
+    mocked_send.return_value = True
+    message = Mock()
+
+    sent = backend.send_messages([message])
+
+    assert sent == 1
+    mocked_close.assert_called_once_with()
+    mocked_open.assert_called_once_with()
+    mocked_send.assert_called_once_with(message)
+
+
+@patch.object(PooledEmailBackend, "close")
+@patch.object(PooledEmailBackend, "open")
+@patch.object(PooledEmailBackend, "_send")
+def test_pooled_email_backend_resends_only_failed_message_when_disconnected(
+    mocked_send, mocked_open, mocked_close
+):
+    backend = PooledEmailBackend(host="localhost", port="1025")
+    backend.connection = Mock()
+    backend.connection.noop.return_value = (250, b"OK")
+    mocked_open.return_value = False
+    mocked_send.side_effect = [True, SMTPServerDisconnected(), True, True]
+    messages = [Mock(), Mock(), Mock()]
+
+    sent = backend.send_messages(messages)
+
+    assert sent == 3
+    mocked_close.assert_called_once_with()
+    assert [call.args[0] for call in mocked_send.call_args_list] == [
+        messages[0],
+        messages[1],
+        messages[1],
+        messages[2],
+    ]
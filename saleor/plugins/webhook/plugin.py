@@ -35,9 +35,11 @@ from .const import CACHE_EXCLUDED_SHIPPING_KEY
 from .shipping import get_excluded_shipping_data, parse_list_shipping_methods_response
 from .tasks import (
     _get_webhooks_for_event,
+    get_webhooks_for_apps,
     send_webhook_request_async,
     trigger_webhook_sync,
     trigger_webhooks_async,
+    trigger_webhooks_sync_concurrently,
 )
 from .utils import (
     delivery_update,
@@ -516,18 +518,23 @@ class WebhookPlugin(BasePlugin):
         previous_value,
         **kwargs
     ) -> List["PaymentGateway"]:
-        gateways = []
-        apps = App.objects.for_event_type(
-            WebhookEventSyncType.PAYMENT_LIST_GATEWAYS
-        ).prefetch_related("webhooks")
-        for app in apps:
-            response_data = trigger_webhook_sync(
-                event_type=WebhookEventSyncType.PAYMENT_LIST_GATEWAYS,
-                data=generate_list_gateways_payload(currency, checkout),
-                app=app,
-            )
+        gateways: List["PaymentGateway"] = []
+        event_type = WebhookEventSyncType.PAYMENT_LIST_GATEWAYS
+        webhooks = get_webhooks_for_apps(
+            event_type, App.objects.for_event_type(event_type).distinct()
+        )
+        if not webhooks:
+            return gateways
+        responses = trigger_webhooks_sync_concurrently(
+            event_type=event_type,
+            data=generate_list_gateways_payload(currency, checkout),
+            webhooks=webhooks,
+        )
+        for webhook, response_data in responses:
             if response_data:
-                app_gateways = parse_list_payment_gateways_response(response_data, app)
+                app_gateways = parse_list_payment_gateways_response(
+                    response_data, webhook.app
+                )
                 if currency:
                     app_gateways = [
                         gtw for gtw in app_gateways if currency in gtw.currencies
@@ -605,20 +612,19 @@ class WebhookPlugin(BasePlugin):
         self, checkout: "Checkout", previous_value: Any
     ) -> List["ShippingMethodData"]:
         methods = []
-        apps = App.objects.for_event_type(
-            WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT
-        ).prefetch_related("webhooks")
-        if apps:
+        event_type = WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT
+        webhooks = get_webhooks_for_apps(
+            event_type, App.objects.for_event_type(event_type).distinct()
+        )
+        if webhooks:
             payload = generate_checkout_payload(checkout, self.requestor)
-            for app in apps:
-                response_data = trigger_webhook_sync(
-                    event_type=WebhookEventSyncType.SHIPPING_LIST_METHODS_FOR_CHECKOUT,
-                    data=payload,
-                    app=app,
-                )
+            responses = trigger_webhooks_sync_concurrently(
+                event_type=event_type, data=payload, webhooks=webhooks
+            )
+            for webhook, response_data in responses:
                 if response_data:
                     shipping_methods = parse_list_shipping_methods_response(
-                        response_data, app
+                        response_data, webhook.app
                     )
                     methods.extend(shipping_methods)
         return methods
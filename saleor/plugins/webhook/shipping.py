@@ -11,7 +11,11 @@ from prices import Money
 from ...shipping.interface import ShippingMethodData
 from ..base_plugin import ExcludedShippingMethod
 from .const import CACHE_EXCLUDED_SHIPPING_TIME, EXCLUDED_SHIPPING_REQUEST_TIMEOUT
-from .tasks import _get_webhooks_for_event, trigger_webhook_sync
+from .tasks import (
+    _get_webhooks_for_event,
+    get_first_webhook_per_app,
+    trigger_webhooks_sync_concurrently,
+)
 from .utils import APP_ID_PREFIX
 
 if TYPE_CHECKING:
@@ -55,7 +59,8 @@ def get_excluded_shipping_methods_or_fetch(
     """Return data of all excluded shipping methods.
 
     The data will be fetched from the cache. If missing it will fetch it from all
-    defined webhooks by calling a request to each of them one by one.
+    defined webhooks by calling the requests to them concurrently. Webhooks which
+    don't respond in time are skipped.
     """
     cached_data = cache.get(cache_key)
     if cached_data:
@@ -65,13 +70,13 @@ def get_excluded_shipping_methods_or_fetch(
 
     excluded_methods = []
     # Gather responses from webhooks
-    for webhook in webhooks:
-        response_data = trigger_webhook_sync(
-            event_type,
-            payload,
-            webhook.app,
-            EXCLUDED_SHIPPING_REQUEST_TIMEOUT,
-        )
+    responses = trigger_webhooks_sync_concurrently(
+        event_type,
+        payload,
+        get_first_webhook_per_app(webhooks),
+        timeout=EXCLUDED_SHIPPING_REQUEST_TIMEOUT,
+    )
+    for _webhook, response_data in responses:
         if response_data:
             excluded_methods.extend(
                 get_excluded_shipping_methods_from_response(response_data)
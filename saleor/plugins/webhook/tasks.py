@@ -1,9 +1,20 @@
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from enum import Enum
 from json import JSONDecodeError
-from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, Type
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
 from urllib.parse import urlparse, urlunparse
 
 import boto3
@@ -16,10 +27,15 @@ from requests.exceptions import RequestException
 
 from ...celeryconf import app
 from ...core import EventDeliveryStatus
-from ...core.models import EventDelivery, EventPayload
+from ...core.models import EventDelivery, EventDeliveryAttempt, EventPayload
 from ...core.tracing import webhooks_opentracing_trace
 from ...payment import PaymentError
-from ...settings import WEBHOOK_SYNC_TIMEOUT, WEBHOOK_TIMEOUT
+from ...settings import (
+    WEBHOOK_SYNC_FAN_OUT_DEADLINE,
+    WEBHOOK_SYNC_FAN_OUT_MAX_WORKERS,
+    WEBHOOK_SYNC_TIMEOUT,
+    WEBHOOK_TIMEOUT,
+)
 from ...site.models import Site
 from ...webhook.event_types import WebhookEventAsyncType, WebhookEventSyncType
 from ...webhook.models import Webhook
@@ -83,7 +99,7 @@ def _get_webhooks_for_event(event_type, webhooks=None):
 
 
 def trigger_webhooks_async(data, event_type, webhooks):
-    payload = EventPayload.objects.create(payload=data)
+    payload = EventPayload.objects.create_with_payload(data)
     deliveries = create_event_delivery_list_for_webhooks(
         webhooks=webhooks,
         event_payload=payload,
@@ -99,7 +115,7 @@ def trigger_webhook_sync(
     """Send a synchronous webhook request."""
     webhooks = _get_webhooks_for_event(event_type, app.webhooks.all())
     webhook = webhooks.first()
-    event_payload = EventPayload.objects.create(payload=data)
+    event_payload = EventPayload.objects.create_with_payload(data)
     delivery = EventDelivery.objects.create(
         status=EventDeliveryStatus.PENDING,
         event_type=event_type,
@@ -252,7 +268,7 @@ def send_webhook_request_async(self, event_delivery_id):
     except EventDelivery.DoesNotExist:
         logger.error("Event delivery id: %r not found", event_delivery_id)
         return
-    data = delivery.payload.payload
+    data = delivery.payload.get_payload()
     webhook = delivery.webhook
     domain = Site.objects.get_current().domain
     attempt = create_attempt(delivery, self.request.id)
@@ -307,50 +323,48 @@ def send_webhook_request_async(self, event_delivery_id):
     clear_successful_delivery(delivery)
 
 
-def send_webhook_request_sync(
-    app_name, delivery, timeout=WEBHOOK_SYNC_TIMEOUT
-) -> Optional[Dict[Any, Any]]:
-    event_payload = delivery.payload
-    data = event_payload.payload
-    webhook = delivery.webhook
-    parts = urlparse(webhook.target_url)
-    domain = Site.objects.get_current().domain
+def _send_webhook_request_sync(
+    app_name: str,
+    webhook: "Webhook",
+    domain: str,
+    event_type: str,
+    data: str,
+    timeout,
+) -> Tuple[WebhookResponse, Optional[Dict[Any, Any]]]:
+    """Send a synchronous webhook request and parse its JSON response.
+
+    The function doesn't touch the database, so it's safe to call it from
+    a worker thread.
+    """
     message = data.encode("utf-8")
     signature = signature_for_payload(message, webhook.secret_key)
-
-    if parts.scheme.lower() not in [WebhookSchemes.HTTP, WebhookSchemes.HTTPS]:
-        delivery_update(delivery, EventDeliveryStatus.FAILED)
-        raise ValueError("Unknown webhook scheme: %r" % (parts.scheme,))
+    response = WebhookResponse(content="")
+    response_data = None
 
     logger.debug(
         "[Webhook] Sending payload to %r for event %r.",
         webhook.target_url,
-        delivery.event_type,
+        event_type,
     )
-    attempt = create_attempt(delivery=delivery, task_id=None)
-    response = WebhookResponse(content="")
-    response_data = None
-
     try:
         with webhooks_opentracing_trace(
-            delivery.event_type, domain, sync=True, app_name=app_name
+            event_type, domain, sync=True, app_name=app_name
         ):
             response = send_webhook_using_http(
                 webhook.target_url,
                 message,
                 domain,
                 signature,
-                delivery.event_type,
+                event_type,
                 timeout=timeout,
             )
             response_data = json.loads(response.content)
     except RequestException as e:
         logger.warning(
-            "[Webhook] Failed request to %r: %r. "
-            "ID of failed DeliveryAttempt: %r . ",
+            "[Webhook ID: %r] Failed request to %r: %r.",
+            webhook.id,
             webhook.target_url,
             e,
-            attempt.id,
         )
         response.status = EventDeliveryStatus.FAILED
         if e.response:
@@ -359,27 +373,191 @@ def send_webhook_request_sync(
 
     except JSONDecodeError as e:
         logger.warning(
-            "[Webhook] Failed parsing JSON response from %r: %r."
-            "ID of failed DeliveryAttempt: %r . ",
+            "[Webhook ID: %r] Failed parsing JSON response from %r: %r.",
+            webhook.id,
             webhook.target_url,
             e,
-            attempt.id,
         )
         response.status = EventDeliveryStatus.FAILED
     else:
         if response.status == EventDeliveryStatus.SUCCESS:
             logger.debug(
-                "[Webhook] Success response from %r."
-                "Successful DeliveryAttempt id: %r",
+                "[Webhook ID: %r] Success response from %r.",
+                webhook.id,
                 webhook.target_url,
-                attempt.id,
             )
 
+    if response.status != EventDeliveryStatus.SUCCESS:
+        response_data = None
+    return response, response_data
+
+
+def send_webhook_request_sync(
+    app_name, delivery, timeout=WEBHOOK_SYNC_TIMEOUT
+) -> Optional[Dict[Any, Any]]:
+    webhook = delivery.webhook
+    parts = urlparse(webhook.target_url)
+    domain = Site.objects.get_current().domain
+
+    if parts.scheme.lower() not in [WebhookSchemes.HTTP, WebhookSchemes.HTTPS]:
+        delivery_update(delivery, EventDeliveryStatus.FAILED)
+        raise ValueError("Unknown webhook scheme: %r" % (parts.scheme,))
+
+    attempt = create_attempt(delivery=delivery, task_id=None)
+    response, response_data = _send_webhook_request_sync(
+        app_name,
+        webhook,
+        domain,
+        delivery.event_type,
+        delivery.payload.get_payload(),
+        timeout,
+    )
+    if response.status == EventDeliveryStatus.FAILED:
+        logger.warning(
+            "[Webhook] ID of failed DeliveryAttempt: %r.",
+            attempt.id,
+        )
+
     attempt_update(attempt, response)
     delivery_update(delivery, response.status)
     clear_successful_delivery(delivery)
 
-    return response_data if response.status == EventDeliveryStatus.SUCCESS else None
+    return response_data
+
+
+def get_first_webhook_per_app(webhooks: Iterable["Webhook"]) -> List["Webhook"]:
+    """Return only the first webhook of each app, keeping the original order.
+
+    It's the same webhook that `trigger_webhook_sync` would use for an app.
+    """
+    webhooks_per_app: Dict[int, "Webhook"] = {}
+    for webhook in webhooks:
+        webhooks_per_app.setdefault(webhook.app_id, webhook)
+    return list(webhooks_per_app.values())
+
+
+def get_webhooks_for_apps(event_type: str, apps: Iterable["App"]) -> List["Webhook"]:
+    """Return the first active webhook for the sync event of each given app.
+
+    The webhooks are returned in the order of the given apps.
+    """
+    apps = list(apps)
+    webhooks = _get_webhooks_for_event(
+        event_type, Webhook.objects.filter(app__in=[app.pk for app in apps])
+    )
+    webhooks_per_app = {
+        webhook.app_id: webhook for webhook in get_first_webhook_per_app(webhooks)
+    }
+    return [webhooks_per_app[app.pk] for app in apps if app.pk in webhooks_per_app]
+
+
+# Shared by all fan-out requests of the process, so the number of threads sending
+# requests is bounded, including requests that outlive their deadline.
+sync_fan_out_executor = ThreadPoolExecutor(
+    max_workers=WEBHOOK_SYNC_FAN_OUT_MAX_WORKERS, thread_name_prefix="webhook-sync"
+)
+
+
+def trigger_webhooks_sync_concurrently(
+    event_type: str,
+    data: str,
+    webhooks: Iterable["Webhook"],
+    timeout=WEBHOOK_SYNC_TIMEOUT,
+    deadline=WEBHOOK_SYNC_FAN_OUT_DEADLINE,
+) -> List[Tuple["Webhook", Optional[Dict[Any, Any]]]]:
+    """Send the same synchronous webhook request to many webhooks in parallel.
+
+    Each request is limited by `timeout` and all of them together by `deadline`.
+    Requests that didn't finish before the deadline are considered failed, so
+    the caller gets partial results instead of waiting for the slowest app.
+    Requests are sent by `sync_fan_out_executor`, shared by the whole process.
+    Event payload, deliveries and attempts are saved with bulk queries.
+
+    Return a list of `(webhook, response_data)` pairs in the order of the given
+    webhooks; `response_data` is `None` for failed requests.
+    """
+    webhooks = list(webhooks)
+    if not webhooks:
+        return []
+
+    domain = Site.objects.get_current().domain
+    event_payload = EventPayload.objects.create_with_payload(data)
+    deliveries = create_event_delivery_list_for_webhooks(
+        webhooks=webhooks, event_payload=event_payload, event_type=event_type
+    )
+
+    futures = {}
+    for webhook in webhooks:
+        if urlparse(webhook.target_url).scheme.lower() in [
+            WebhookSchemes.HTTP,
+            WebhookSchemes.HTTPS,
+        ]:
+            futures[webhook.pk] = sync_fan_out_executor.submit(
+                _send_webhook_request_sync,
+                webhook.app.name,
+                webhook,
+                domain,
+                event_type,
+                data,
+                timeout,
+            )
+    done, not_done = wait(futures.values(), timeout=deadline)
+    # Requests still waiting for a thread are dropped; the running ones are limited
+    # by the request timeout.
+    for future in not_done:
+        future.cancel()
+
+    results = []
+    failed_deliveries = []
+    failed_attempts = []
+    successful_delivery_ids = []
+    for webhook, delivery in zip(webhooks, deliveries):
+        future = futures.get(webhook.pk)
+        if future is None:
+            response = WebhookResponse(
+                content="Unknown webhook scheme: %r"
+                % (urlparse(webhook.target_url).scheme,),
+                status=EventDeliveryStatus.FAILED,
+            )
+            response_data = None
+        elif future in done:
+            response, response_data = future.result()
+        else:
+            logger.warning(
+                "[Webhook ID: %r] Request to %r exceeded the deadline of %rs.",
+                webhook.id,
+                webhook.target_url,
+                deadline,
+            )
+            response = WebhookResponse(
+                content="Deadline exceeded.", status=EventDeliveryStatus.FAILED
+            )
+            response_data = None
+
+        if response.status == EventDeliveryStatus.SUCCESS:
+            successful_delivery_ids.append(delivery.pk)
+        else:
+            delivery.status = response.status
+            failed_deliveries.append(delivery)
+            failed_attempts.append(
+                EventDeliveryAttempt(
+                    delivery=delivery,
+                    task_id=None,
+                    duration=response.duration,
+                    response=response.content,
+                    response_headers=json.dumps(response.response_headers),
+                    request_headers=json.dumps(response.request_headers),
+                    status=response.status,
+                )
+            )
+        results.append((webhook, response_data))
+
+    if failed_deliveries:
+        EventDelivery.objects.bulk_update(failed_deliveries, ["status"])
+        EventDeliveryAttempt.objects.bulk_create(failed_attempts)
+    if successful_delivery_ids:
+        EventDelivery.objects.filter(pk__in=successful_delivery_ids).delete()
+    return results
 
 
 # DEPRECATED
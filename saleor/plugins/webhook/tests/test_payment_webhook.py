@@ -1,5 +1,6 @@
 import datetime
 import json
+import time
 from collections import namedtuple
 from unittest import mock
 
@@ -14,7 +15,12 @@ from ....payment import PaymentError, TransactionKind
 from ....payment.utils import create_payment_information
 from ....webhook.event_types import WebhookEventAsyncType, WebhookEventSyncType
 from ....webhook.models import Webhook, WebhookEvent
-from ..tasks import send_webhook_request_sync, trigger_webhook_sync
+from ..tasks import (
+    WebhookResponse,
+    send_webhook_request_sync,
+    trigger_webhook_sync,
+    trigger_webhooks_sync_concurrently,
+)
 from ..utils import (
     parse_list_payment_gateways_response,
     parse_payment_action_response,
@@ -81,6 +87,79 @@ def test_trigger_webhook_sync_no_webhook_available():
         trigger_webhook_sync(WebhookEventSyncType.PAYMENT_REFUND, {}, app)
 
 
+@mock.patch("saleor.plugins.webhook.tasks._send_webhook_request_sync")
+def test_trigger_webhooks_sync_concurrently(
+    mock_request, payment_app, shipping_app_factory
+):
+    # given
+    shipping_app = shipping_app_factory()
+    webhooks = [payment_app.webhooks.first(), shipping_app.webhooks.first()]
+    response_data = {"key": "response"}
+    mock_request.side_effect = lambda app_name, webhook, *args: (
+        (WebhookResponse(content=json.dumps(response_data)), response_data)
+        if webhook == webhooks[0]
+        else (WebhookResponse(content="", status=EventDeliveryStatus.FAILED), None)
+    )
+    data = '{"key": "value"}'
+
+    # when
+    responses = trigger_webhooks_sync_concurrently(
+        WebhookEventSyncType.PAYMENT_LIST_GATEWAYS, data, webhooks
+    )
+
+    # then
+    assert responses == [(webhooks[0], response_data), (webhooks[1], None)]
+    assert mock_request.call_count == 2
+    assert EventPayload.objects.count() == 1
+    failed_delivery = EventDelivery.objects.get()
+    assert failed_delivery.webhook == webhooks[1]
+    assert failed_delivery.status == EventDeliveryStatus.FAILED
+    assert failed_delivery.attempts.get().status == EventDeliveryStatus.FAILED
+
+
+@mock.patch("saleor.plugins.webhook.tasks.requests.post")
+def test_trigger_webhooks_sync_concurrently_deadline_exceeded(
+    mock_post, payment_app, shipping_app_factory
+):
+    # given
+    shipping_app = shipping_app_factory()
+    webhooks = [payment_app.webhooks.first(), shipping_app.webhooks.first()]
+    response_data = {"key": "response"}
+
+    def post(target_url, **kwargs):
+        if target_url == webhooks[1].target_url:
+            time.sleep(1)
+        response = mock.Mock(ok=True, text=json.dumps(response_data), headers={})
+        response.elapsed = datetime.timedelta(seconds=1)
+        return response
+
+    mock_post.side_effect = post
+
+    # when
+    responses = trigger_webhooks_sync_concurrently(
+        WebhookEventSyncType.PAYMENT_LIST_GATEWAYS,
+        '{"key": "value"}',
+        webhooks,
+        deadline=0.5,
+    )
+
+    # then
+    assert responses == [(webhooks[0], response_data), (webhooks[1], None)]
+    failed_delivery = EventDelivery.objects.get()
+    assert failed_delivery.webhook == webhooks[1]
+    assert failed_delivery.attempts.get().response == "Deadline exceeded."
+
+
+def test_trigger_webhooks_sync_concurrently_no_webhooks():
+    assert (
+        trigger_webhooks_sync_concurrently(
+            WebhookEventSyncType.PAYMENT_LIST_GATEWAYS, "{}", []
+        )
+        == []
+    )
+    assert not EventPayload.objects.exists()
+
+
 @mock.patch("saleor.plugins.webhook.tasks.requests.post")
 def test_send_webhook_request_sync_failed_attempt(mock_post, app, event_delivery):
     # given
@@ -218,7 +297,7 @@ def test_send_webhook_request_sync_invalid_scheme(webhook, app):
         send_webhook_request_sync(app.name, delivery)
 
 
-@mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_sync")
+@mock.patch("saleor.plugins.webhook.tasks._send_webhook_request_sync")
 def test_get_payment_gateways(
     mock_send_request, payment_app, permission_manage_payments, webhook_plugin
 ):
@@ -247,7 +326,10 @@ def test_get_payment_gateways(
             "config": [],
         }
     ]
-    mock_send_request.return_value = mock_json_response
+    mock_send_request.return_value = (
+        WebhookResponse(content=json.dumps(mock_json_response)),
+        mock_json_response,
+    )
     response_data = plugin.get_payment_gateways("USD", None, None)
     expected_response_1 = parse_list_payment_gateways_response(
         mock_json_response, payment_app
@@ -260,7 +342,7 @@ def test_get_payment_gateways(
     assert response_data[1] == expected_response_2[0]
 
 
-@mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_sync")
+@mock.patch("saleor.plugins.webhook.tasks._send_webhook_request_sync")
 def test_get_payment_gateways_filters_out_unsupported_currencies(
     mock_send_request, payment_app, webhook_plugin
 ):
@@ -273,12 +355,15 @@ def test_get_payment_gateways_filters_out_unsupported_currencies(
             "config": [],
         }
     ]
-    mock_send_request.return_value = mock_json_response
+    mock_send_request.return_value = (
+        WebhookResponse(content=json.dumps(mock_json_response)),
+        mock_json_response,
+    )
     response_data = plugin.get_payment_gateways("PLN", None, None)
     assert response_data == []
 
 
-@mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_sync")
+@mock.patch("saleor.plugins.webhook.tasks._send_webhook_request_sync")
 @mock.patch("saleor.plugins.webhook.plugin.generate_list_gateways_payload")
 def test_get_payment_gateways_for_checkout(
     mock_generate_payload, mock_send_request, checkout, payment_app, webhook_plugin
@@ -292,7 +377,10 @@ def test_get_payment_gateways_for_checkout(
             "config": [],
         }
     ]
-    mock_send_request.return_value = mock_json_response
+    mock_send_request.return_value = (
+        WebhookResponse(content=json.dumps(mock_json_response)),
+        mock_json_response,
+    )
     mock_generate_payload.return_value = ""
     plugin.get_payment_gateways("USD", checkout, None)
     assert mock_generate_payload.call_args[0][1] == checkout
@@ -66,7 +66,7 @@ CHECKOUT_QUERY_SHIPPING_METHOD = """
 
 
 @mock.patch("saleor.plugins.webhook.shipping.cache.set")
-@mock.patch("saleor.plugins.webhook.shipping.trigger_webhook_sync")
+@mock.patch("saleor.plugins.webhook.shipping.trigger_webhooks_sync_concurrently")
 @mock.patch(
     "saleor.plugins.webhook.plugin.generate_excluded_shipping_methods_for_order_payload"
 )
@@ -84,14 +84,19 @@ def test_excluded_shipping_methods_for_order(
     webhook_reason = "Order contains dangerous products."
     other_reason = "Shipping is not applicable for this order."
 
-    mocked_webhook.return_value = {
-        "excluded_methods": [
+    mocked_webhook.return_value = [
+        (
+            shipping_app.webhooks.first(),
             {
-                "id": graphene.Node.to_global_id("ShippingMethod", "1"),
-                "reason": webhook_reason,
-            }
-        ]
-    }
+                "excluded_methods": [
+                    {
+                        "id": graphene.Node.to_global_id("ShippingMethod", "1"),
+                        "reason": webhook_reason,
+                    }
+                ]
+            },
+        )
+    ]
     payload = mock.MagicMock()
     mocked_payload.return_value = payload
     plugin = webhook_plugin()
@@ -116,8 +121,8 @@ def test_excluded_shipping_methods_for_order(
     mocked_webhook.assert_called_once_with(
         WebhookEventSyncType.ORDER_FILTER_SHIPPING_METHODS,
         payload,
-        shipping_app,
-        EXCLUDED_SHIPPING_REQUEST_TIMEOUT,
+        [shipping_app.webhooks.first()],
+        timeout=EXCLUDED_SHIPPING_REQUEST_TIMEOUT,
     )
     expected_cache_key = CACHE_EXCLUDED_SHIPPING_KEY + order_with_lines.token
 
@@ -131,7 +136,7 @@ def test_excluded_shipping_methods_for_order(
 
 
 @mock.patch("saleor.plugins.webhook.shipping.cache.set")
-@mock.patch("saleor.plugins.webhook.shipping.trigger_webhook_sync")
+@mock.patch("saleor.plugins.webhook.shipping.trigger_webhooks_sync_concurrently")
 @mock.patch(
     "saleor.plugins.webhook.plugin.generate_excluded_shipping_methods_for_order_payload"
 )
@@ -150,27 +155,33 @@ def test_multiple_app_with_excluded_shipping_methods_for_order(
     webhook_reason = "Order contains dangerous products."
     webhook_second_reason = "Shipping is not applicable for this order."
 
-    mocked_webhook.side_effect = [
-        {
-            "excluded_methods": [
-                {
-                    "id": graphene.Node.to_global_id("ShippingMethod", "1"),
-                    "reason": webhook_reason,
-                }
-            ]
-        },
-        {
-            "excluded_methods": [
-                {
-                    "id": graphene.Node.to_global_id("ShippingMethod", "1"),
-                    "reason": webhook_second_reason,
-                },
-                {
-                    "id": graphene.Node.to_global_id("ShippingMethod", "2"),
-                    "reason": webhook_second_reason,
-                },
-            ]
-        },
+    mocked_webhook.return_value = [
+        (
+            shipping_app.webhooks.first(),
+            {
+                "excluded_methods": [
+                    {
+                        "id": graphene.Node.to_global_id("ShippingMethod", "1"),
+                        "reason": webhook_reason,
+                    }
+                ]
+            },
+        ),
+        (
+            second_shipping_app.webhooks.first(),
+            {
+                "excluded_methods": [
+                    {
+                        "id": graphene.Node.to_global_id("ShippingMethod", "1"),
+                        "reason": webhook_second_reason,
+                    },
+                    {
+                        "id": graphene.Node.to_global_id("ShippingMethod", "2"),
+                        "reason": webhook_second_reason,
+                    },
+                ]
+            },
+        ),
     ]
 
     payload = mock.MagicMock()
@@ -192,17 +203,11 @@ def test_multiple_app_with_excluded_shipping_methods_for_order(
     assert em.id == "1"
     assert webhook_reason in em.reason
     assert webhook_second_reason in em.reason
-    mocked_webhook.assert_any_call(
-        WebhookEventSyncType.ORDER_FILTER_SHIPPING_METHODS,
-        payload,
-        shipping_app,
-        EXCLUDED_SHIPPING_REQUEST_TIMEOUT,
-    )
-    mocked_webhook.assert_any_call(
+    mocked_webhook.assert_called_once_with(
         WebhookEventSyncType.ORDER_FILTER_SHIPPING_METHODS,
         payload,
-        second_shipping_app,
-        EXCLUDED_SHIPPING_REQUEST_TIMEOUT,
+        [shipping_app.webhooks.first(), second_shipping_app.webhooks.first()],
+        timeout=EXCLUDED_SHIPPING_REQUEST_TIMEOUT,
     )
     expected_cache_key = CACHE_EXCLUDED_SHIPPING_KEY + order_with_lines.token
 
@@ -411,7 +416,7 @@ def test_trigger_webhook_sync(mock_request, shipping_app):
 
 
 @mock.patch("saleor.plugins.webhook.shipping.cache.set")
-@mock.patch("saleor.plugins.webhook.shipping.trigger_webhook_sync")
+@mock.patch("saleor.plugins.webhook.shipping.trigger_webhooks_sync_concurrently")
 @mock.patch(
     "saleor.plugins.webhook.plugin."
     "generate_excluded_shipping_methods_for_checkout_payload"
@@ -430,14 +435,19 @@ def test_excluded_shipping_methods_for_checkout(
     webhook_reason = "Checkout contains dangerous products."
     other_reason = "Shipping is not applicable for this checkout."
 
-    mocked_webhook.return_value = {
-        "excluded_methods": [
+    mocked_webhook.return_value = [
+        (
+            shipping_app.webhooks.first(),
             {
-                "id": graphene.Node.to_global_id("ShippingMethod", "1"),
-                "reason": webhook_reason,
-            }
-        ]
-    }
+                "excluded_methods": [
+                    {
+                        "id": graphene.Node.to_global_id("ShippingMethod", "1"),
+                        "reason": webhook_reason,
+                    }
+                ]
+            },
+        )
+    ]
     payload = mock.MagicMock()
     mocked_payload.return_value = payload
     plugin = webhook_plugin()
@@ -461,8 +471,8 @@ def test_excluded_shipping_methods_for_checkout(
     mocked_webhook.assert_called_once_with(
         WebhookEventSyncType.CHECKOUT_FILTER_SHIPPING_METHODS,
         payload,
-        shipping_app,
-        EXCLUDED_SHIPPING_REQUEST_TIMEOUT,
+        [shipping_app.webhooks.first()],
+        timeout=EXCLUDED_SHIPPING_REQUEST_TIMEOUT,
     )
 
     expected_cache_key = CACHE_EXCLUDED_SHIPPING_KEY + str(checkout_with_items.token)
@@ -477,7 +487,7 @@ def test_excluded_shipping_methods_for_checkout(
 
 
 @mock.patch("saleor.plugins.webhook.shipping.cache.set")
-@mock.patch("saleor.plugins.webhook.shipping.trigger_webhook_sync")
+@mock.patch("saleor.plugins.webhook.shipping.trigger_webhooks_sync_concurrently")
 @mock.patch(
     "saleor.plugins.webhook.plugin."
     "generate_excluded_shipping_methods_for_checkout_payload"
@@ -497,27 +507,33 @@ def test_multiple_app_with_excluded_shipping_methods_for_checkout(
     webhook_reason = "Checkout contains dangerous products."
     webhook_second_reason = "Shipping is not applicable for this checkout."
 
-    mocked_webhook.side_effect = [
-        {
-            "excluded_methods": [
-                {
-                    "id": graphene.Node.to_global_id("ShippingMethod", "1"),
-                    "reason": webhook_reason,
-                }
-            ]
-        },
-        {
-            "excluded_methods": [
-                {
-                    "id": graphene.Node.to_global_id("ShippingMethod", "1"),
-                    "reason": webhook_second_reason,
-                },
-                {
-                    "id": graphene.Node.to_global_id("ShippingMethod", "2"),
-                    "reason": webhook_second_reason,
-                },
-            ]
-        },
+    mocked_webhook.return_value = [
+        (
+            shipping_app.webhooks.first(),
+            {
+                "excluded_methods": [
+                    {
+                        "id": graphene.Node.to_global_id("ShippingMethod", "1"),
+                        "reason": webhook_reason,
+                    }
+                ]
+            },
+        ),
+        (
+            second_shipping_app.webhooks.first(),
+            {
+                "excluded_methods": [
+                    {
+                        "id": graphene.Node.to_global_id("ShippingMethod", "1"),
+                        "reason": webhook_second_reason,
+                    },
+                    {
+                        "id": graphene.Node.to_global_id("ShippingMethod", "2"),
+                        "reason": webhook_second_reason,
+                    },
+                ]
+            },
+        ),
     ]
     payload = mock.MagicMock()
     mocked_payload.return_value = payload
@@ -538,17 +554,11 @@ def test_multiple_app_with_excluded_shipping_methods_for_checkout(
     assert em.id == "1"
     assert webhook_reason in em.reason
     assert webhook_second_reason in em.reason
-    mocked_webhook.assert_any_call(
-        WebhookEventSyncType.CHECKOUT_FILTER_SHIPPING_METHODS,
-        payload,
-        shipping_app,
-        EXCLUDED_SHIPPING_REQUEST_TIMEOUT,
-    )
-    mocked_webhook.assert_any_call(
+    mocked_webhook.assert_called_once_with(
         WebhookEventSyncType.CHECKOUT_FILTER_SHIPPING_METHODS,
         payload,
-        second_shipping_app,
-        EXCLUDED_SHIPPING_REQUEST_TIMEOUT,
+        [shipping_app.webhooks.first(), second_shipping_app.webhooks.first()],
+        timeout=EXCLUDED_SHIPPING_REQUEST_TIMEOUT,
     )
 
     expected_cache_key = CACHE_EXCLUDED_SHIPPING_KEY + str(checkout_with_items.token)
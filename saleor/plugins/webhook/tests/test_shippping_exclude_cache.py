@@ -5,11 +5,12 @@ import graphene
 
 from ...base_plugin import ExcludedShippingMethod
 from ..const import CACHE_EXCLUDED_SHIPPING_KEY, CACHE_EXCLUDED_SHIPPING_TIME
+from ..tasks import WebhookResponse
 
 
 @mock.patch("saleor.plugins.webhook.shipping.cache.get")
 @mock.patch("saleor.plugins.webhook.shipping.cache.set")
-@mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_sync")
+@mock.patch("saleor.plugins.webhook.tasks._send_webhook_request_sync")
 @mock.patch(
     "saleor.plugins.webhook.plugin.generate_excluded_shipping_methods_for_order_payload"
 )
@@ -28,14 +29,17 @@ def test_excluded_shipping_methods_for_order_use_cache(
     webhook_reason = "Order contains dangerous products."
     other_reason = "Shipping is not applicable for this order."
 
-    mocked_webhook.return_value = {
-        "excluded_methods": [
-            {
-                "id": graphene.Node.to_global_id("ShippingMethod", "1"),
-                "reason": webhook_reason,
-            }
-        ]
-    }
+    mocked_webhook.return_value = (
+        WebhookResponse(content=""),
+        {
+            "excluded_methods": [
+                {
+                    "id": graphene.Node.to_global_id("ShippingMethod", "1"),
+                    "reason": webhook_reason,
+                }
+            ]
+        },
+    )
     payload = json.dumps({"order": {"id": 1, "some_field": "12"}})
     mocked_payload.return_value = payload
 
@@ -62,7 +66,7 @@ def test_excluded_shipping_methods_for_order_use_cache(
 
 @mock.patch("saleor.plugins.webhook.shipping.cache.get")
 @mock.patch("saleor.plugins.webhook.shipping.cache.set")
-@mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_sync")
+@mock.patch("saleor.plugins.webhook.tasks._send_webhook_request_sync")
 @mock.patch(
     "saleor.plugins.webhook.plugin.generate_excluded_shipping_methods_for_order_payload"
 )
@@ -81,14 +85,17 @@ def test_excluded_shipping_methods_for_order_stores_in_cache_when_empty(
     webhook_reason = "Order contains dangerous products."
     other_reason = "Shipping is not applicable for this order."
 
-    mocked_webhook.return_value = {
-        "excluded_methods": [
-            {
-                "id": graphene.Node.to_global_id("ShippingMethod", "1"),
-                "reason": webhook_reason,
-            }
-        ]
-    }
+    mocked_webhook.return_value = (
+        WebhookResponse(content=""),
+        {
+            "excluded_methods": [
+                {
+                    "id": graphene.Node.to_global_id("ShippingMethod", "1"),
+                    "reason": webhook_reason,
+                }
+            ]
+        },
+    )
     payload = json.dumps({"order": {"id": 1, "some_field": "12"}})
     mocked_payload.return_value = payload
 
@@ -123,7 +130,7 @@ def test_excluded_shipping_methods_for_order_stores_in_cache_when_empty(
 
 @mock.patch("saleor.plugins.webhook.shipping.cache.get")
 @mock.patch("saleor.plugins.webhook.shipping.cache.set")
-@mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_sync")
+@mock.patch("saleor.plugins.webhook.tasks._send_webhook_request_sync")
 @mock.patch(
     "saleor.plugins.webhook.plugin.generate_excluded_shipping_methods_for_order_payload"
 )
@@ -142,14 +149,17 @@ def test_excluded_shipping_methods_for_order_stores_in_cache_when_payload_is_dif
     webhook_reason = "Order contains dangerous products."
     other_reason = "Shipping is not applicable for this order."
 
-    mocked_webhook.return_value = {
-        "excluded_methods": [
-            {
-                "id": graphene.Node.to_global_id("ShippingMethod", "1"),
-                "reason": webhook_reason,
-            }
-        ]
-    }
+    mocked_webhook.return_value = (
+        WebhookResponse(content=""),
+        {
+            "excluded_methods": [
+                {
+                    "id": graphene.Node.to_global_id("ShippingMethod", "1"),
+                    "reason": webhook_reason,
+                }
+            ]
+        },
+    )
     payload = json.dumps({"order": {"id": 1, "some_field": "12"}})
     mocked_payload.return_value = payload
 
@@ -187,7 +197,7 @@ def test_excluded_shipping_methods_for_order_stores_in_cache_when_payload_is_dif
 
 @mock.patch("saleor.plugins.webhook.shipping.cache.get")
 @mock.patch("saleor.plugins.webhook.shipping.cache.set")
-@mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_sync")
+@mock.patch("saleor.plugins.webhook.tasks._send_webhook_request_sync")
 @mock.patch(
     "saleor.plugins.webhook.plugin."
     "generate_excluded_shipping_methods_for_checkout_payload"
@@ -207,14 +217,17 @@ def test_excluded_shipping_methods_for_checkout_use_cache(
     webhook_reason = "Order contains dangerous products."
     other_reason = "Shipping is not applicable for this order."
 
-    mocked_webhook.return_value = {
-        "excluded_methods": [
-            {
-                "id": graphene.Node.to_global_id("ShippingMethod", "1"),
-                "reason": webhook_reason,
-            }
-        ]
-    }
+    mocked_webhook.return_value = (
+        WebhookResponse(content=""),
+        {
+            "excluded_methods": [
+                {
+                    "id": graphene.Node.to_global_id("ShippingMethod", "1"),
+                    "reason": webhook_reason,
+                }
+            ]
+        },
+    )
 
     payload = json.dumps({"checkout": {"id": 1, "some_field": "12"}})
     mocked_payload.return_value = payload
@@ -241,7 +254,7 @@ def test_excluded_shipping_methods_for_checkout_use_cache(
 
 @mock.patch("saleor.plugins.webhook.shipping.cache.get")
 @mock.patch("saleor.plugins.webhook.shipping.cache.set")
-@mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_sync")
+@mock.patch("saleor.plugins.webhook.tasks._send_webhook_request_sync")
 @mock.patch(
     "saleor.plugins.webhook.plugin."
     "generate_excluded_shipping_methods_for_checkout_payload"
@@ -261,14 +274,17 @@ def test_excluded_shipping_methods_for_checkout_stores_in_cache_when_empty(
     webhook_reason = "Order contains dangerous products."
     other_reason = "Shipping is not applicable for this order."
 
-    mocked_webhook.return_value = {
-        "excluded_methods": [
-            {
-                "id": graphene.Node.to_global_id("ShippingMethod", "1"),
-                "reason": webhook_reason,
-            }
-        ]
-    }
+    mocked_webhook.return_value = (
+        WebhookResponse(content=""),
+        {
+            "excluded_methods": [
+                {
+                    "id": graphene.Node.to_global_id("ShippingMethod", "1"),
+                    "reason": webhook_reason,
+                }
+            ]
+        },
+    )
 
     payload = json.dumps({"checkout": {"id": 1, "some_field": "12"}})
     mocked_payload.return_value = payload
@@ -303,7 +319,7 @@ def test_excluded_shipping_methods_for_checkout_stores_in_cache_when_empty(
 
 @mock.patch("saleor.plugins.webhook.shipping.cache.get")
 @mock.patch("saleor.plugins.webhook.shipping.cache.set")
-@mock.patch("saleor.plugins.webhook.tasks.send_webhook_request_sync")
+@mock.patch("saleor.plugins.webhook.tasks._send_webhook_request_sync")
 @mock.patch(
     "saleor.plugins.webhook.plugin."
     "generate_excluded_shipping_methods_for_checkout_payload"
@@ -323,14 +339,17 @@ def test_excluded_shipping_methods_for_checkout_stores_in_cache_when_payload_dif
     webhook_reason = "Order contains dangerous products."
     other_reason = "Shipping is not applicable for this order."
 
-    mocked_webhook.return_value = {
-        "excluded_methods": [
-            {
-                "id": graphene.Node.to_global_id("ShippingMethod", "1"),
-                "reason": webhook_reason,
-            }
-        ]
-    }
+    mocked_webhook.return_value = (
+        WebhookResponse(content=""),
+        {
+            "excluded_methods": [
+                {
+                    "id": graphene.Node.to_global_id("ShippingMethod", "1"),
+                    "reason": webhook_reason,
+                }
+            ]
+        },
+    )
 
     payload = json.dumps({"checkout": {"id": 1, "some_field": "12"}})
     mocked_payload.return_value = payload
@@ -4,7 +4,7 @@ from django.core.management.base import BaseCommand
 
 from ....discount.utils import fetch_active_discounts
 from ...models import Product
-from ...utils.variant_prices import update_product_discounted_price
+from ...utils.variant_prices import update_products_discounted_prices_in_batches
 
 logger = logging.getLogger(__name__)
 
@@ -12,12 +12,28 @@ logger = logging.getLogger(__name__)
 class Command(BaseCommand):
     help = "Recalculates the discounted prices for products in all channels."
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of products recalculated at once.",
+        )
+
     def handle(self, *args, **options):
         self.stdout.write('Updating "discounted_price" field of all the products.')
         # Fetching the discounts just once and reusing them
         discounts = fetch_active_discounts()
         # Run the update on all the products
-        qs = Product.objects.all()
-        for product in qs.iterator():
-            self.stdout.write(f"Updating product PK: {product.pk}")
-            update_product_discounted_price(product, discounts=discounts)
+        processed = updated = 0
+        for (
+            products_count,
+            listings_count,
+        ) in update_products_discounted_prices_in_batches(
+            Product.objects.all(), discounts, options["batch_size"]
+        ):
+            processed += products_count
+            updated += listings_count
+            self.stdout.write(
+                f"Processed {processed} products, updated {updated} channel listings."
+            )
@@ -1,17 +1,21 @@
 import logging
-from typing import Iterable, List, Optional
+from typing import Iterable, List, Optional, Tuple
 
 from celery.utils.log import get_task_logger
+from django.conf import settings
 from django.core.exceptions import ObjectDoesNotExist
 from django.utils import timezone
 
 from ..attribute.models import Attribute
 from ..celeryconf import app
+from ..core.db.batches import get_pk_ranges
 from ..core.exceptions import PreorderAllocationError
 from ..discount.models import Sale
 from ..warehouse.management import deactivate_preorder_for_variant
 from .models import Product, ProductType, ProductVariant
 from .utils.variant_prices import (
+    get_products_of_catalogues,
+    get_products_of_discount,
     update_product_discounted_price,
     update_products_discounted_prices,
     update_products_discounted_prices_of_catalogues,
@@ -65,26 +69,63 @@ def update_product_discounted_price_task(product_pk: int):
     update_product_discounted_price(product)
 
 
+def _get_product_id_ranges_to_split(products) -> List[Tuple[int, int]]:
+    """Return product ID ranges for separate tasks if there are too many products."""
+    if products is None:
+        return []
+    ranges = get_pk_ranges(products, settings.DISCOUNTED_PRICES_UPDATE_TASK_SIZE)
+    return ranges if len(ranges) > 1 else []
+
+
 @app.task
 def update_products_discounted_prices_of_catalogues_task(
     product_ids: Optional[List[int]] = None,
     category_ids: Optional[List[int]] = None,
     collection_ids: Optional[List[int]] = None,
     variant_ids: Optional[List[int]] = None,
+    product_id_range: Optional[Tuple[int, int]] = None,
 ):
-    update_products_discounted_prices_of_catalogues(
+    if product_id_range is not None:
+        update_products_discounted_prices_of_catalogues(
+            product_ids, category_ids, collection_ids, variant_ids, product_id_range
+        )
+        return
+    products = get_products_of_catalogues(
         product_ids, category_ids, collection_ids, variant_ids
     )
+    id_ranges = _get_product_id_ranges_to_split(products)
+    for id_range in id_ranges:
+        update_products_discounted_prices_of_catalogues_task.delay(
+            product_ids, category_ids, collection_ids, variant_ids, id_range
+        )
+    if not id_ranges:
+        update_products_discounted_prices_of_catalogues(
+            product_ids, category_ids, collection_ids, variant_ids
+        )
 
 
 @app.task
-def update_products_discounted_prices_of_discount_task(discount_pk: int):
+def update_products_discounted_prices_of_discount_task(
+    discount_pk: int, product_id_range: Optional[Tuple[int, int]] = None
+):
     try:
         discount = Sale.objects.get(pk=discount_pk)
     except ObjectDoesNotExist:
         logging.warning(f"Cannot find discount with id: {discount_pk}.")
         return
-    update_products_discounted_prices_of_discount(discount)
+    if product_id_range is not None:
+        update_products_discounted_prices_of_discount(discount, product_id_range)
+        return
+    # Start and end dates of the sale that already passed are covered by this run.
+    Sale.objects.filter(pk=discount_pk).update(
+        discounted_prices_updated_at=timezone.now()
+    )
+    # Large sales are split between tasks, so they can run on several workers.
+    id_ranges = _get_product_id_ranges_to_split(get_products_of_discount(discount))
+    for id_range in id_ranges:
+        update_products_discounted_prices_of_discount_task.delay(discount_pk, id_range)
+    if not id_ranges:
+        update_products_discounted_prices_of_discount(discount)
 
 
 @app.task
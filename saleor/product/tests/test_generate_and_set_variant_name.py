@@ -10,7 +10,10 @@ from ...product import ProductTypeKind
 from ...product.models import ProductVariantChannelListing
 from ..models import Product, ProductType, ProductVariant
 from ..tasks import _update_variants_names
-from ..utils.variants import generate_and_set_variant_name
+from ..utils.variants import (
+    generate_and_set_variant_name,
+    generate_and_set_variants_names,
+)
 
 
 @pytest.fixture()
@@ -231,3 +234,29 @@ def test_only_not_variant_selection_attr_left_variant_name_change_to_global_id(p
     _update_variants_names(product.product_type, [attribute])
     product_variant.refresh_from_db()
     assert product_variant.name == product_variant.get_global_id()
+
+
+def test_generate_and_set_variants_names(
+    variant_with_no_attributes, size_attribute, django_assert_num_queries
+):
+    # given
+    variant = variant_with_no_attributes
+    variant.product.product_type.variant_attributes.add(
+        size_attribute, through_defaults={"variant_selection": True}
+    )
+    associate_attribute_values_to_instance(
+        variant, size_attribute, size_attribute.values.get(slug="big")
+    )
+    variant_without_values = ProductVariant.objects.create(
+        product=variant.product, sku="456"
+    )
+
+    # when
+    with django_assert_num_queries(4):
+        generate_and_set_variants_names([variant, variant_without_values])
+
+    # then
+    variant.refresh_from_db()
+    variant_without_values.refresh_from_db()
+    assert variant.name == "Big"
+    assert variant_without_values.name == "456"
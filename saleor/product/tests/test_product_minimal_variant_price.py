@@ -1,13 +1,16 @@
-from unittest.mock import patch
-
 from django.core.management import call_command
 from prices import Money
 
+from ...discount.utils import fetch_active_discounts
+from ..models import Product, ProductChannelListing, ProductVariantChannelListing
 from ..tasks import (
     update_products_discounted_prices_of_catalogues,
     update_products_discounted_prices_task,
 )
-from ..utils.variant_prices import update_product_discounted_price
+from ..utils.variant_prices import (
+    update_product_discounted_price,
+    update_products_discounted_prices_in_batches,
+)
 
 
 def test_update_product_discounted_price(product, channel_USD):
@@ -125,15 +128,52 @@ def test_update_products_discounted_prices_task(product_list):
         assert product_channel_listing.discounted_price == price
 
 
-@patch(
-    "saleor.product.management.commands"
-    ".update_all_products_discounted_prices"
-    ".update_product_discounted_price"
-)
 def test_management_commmand_update_all_products_discounted_price(
-    mock_update_product_discounted_price, product_list
+    product_list, channel_USD
 ):
-    call_command("update_all_products_discounted_prices")
-    call_args_list = mock_update_product_discounted_price.call_args_list
-    for (args, kwargs), product in zip(call_args_list, product_list):
-        assert args[0] == product
+    # given
+    ProductChannelListing.objects.filter(channel=channel_USD).update(
+        discounted_price_amount=None
+    )
+
+    # when
+    call_command("update_all_products_discounted_prices", "--batch-size", "2")
+
+    # then
+    for product in product_list:
+        variant_channel_listing = ProductVariantChannelListing.objects.get(
+            variant__product=product, channel=channel_USD
+        )
+        product_channel_listing = product.channel_listings.get(channel=channel_USD)
+        assert product_channel_listing.discounted_price == variant_channel_listing.price
+
+
+def test_update_products_discounted_prices_in_batches(
+    product_list, new_sale, category, channel_USD, django_assert_num_queries
+):
+    # given
+    new_sale.categories.add(category)
+    discounts = fetch_active_discounts()
+
+    # when
+    # Each batch selects product IDs, products, collections, variant prices, product
+    # channel listings and saves the changes, then the last select returns no IDs.
+    with django_assert_num_queries(2 * 6 + 1):
+        results = list(
+            update_products_discounted_prices_in_batches(
+                Product.objects.filter(pk__in=[product.pk for product in product_list]),
+                discounts,
+                batch_size=2,
+            )
+        )
+
+    # then
+    assert [count for count, _ in results] == [2, 1]
+    for product in product_list:
+        variant_channel_listing = ProductVariantChannelListing.objects.get(
+            variant__product=product, channel=channel_USD
+        )
+        product_channel_listing = product.channel_listings.get(channel=channel_USD)
+        assert product_channel_listing.discounted_price == (
+            variant_channel_listing.price - Money(5, "USD")
+        )
@@ -1,7 +1,8 @@
 import logging
 from datetime import timedelta
-from unittest.mock import patch
+from unittest.mock import call, patch
 
+from django.test import override_settings
 from django.utils import timezone
 
 from ..tasks import (
@@ -23,6 +24,38 @@ def test_update_products_discounted_prices_of_discount_task(
     update_product_prices_mock.assert_called_once_with(sale)
 
 
+@override_settings(DISCOUNTED_PRICES_UPDATE_TASK_SIZE=2)
+@patch("saleor.product.tasks.update_products_discounted_prices_of_discount")
+@patch("saleor.product.tasks.update_products_discounted_prices_of_discount_task.delay")
+def test_update_products_discounted_prices_of_discount_task_splits_large_sale(
+    task_delay_mock, update_product_prices_mock, new_sale, category, product_list
+):
+    # given
+    new_sale.categories.add(category)
+    product_ids = sorted(product.pk for product in product_list)
+
+    # when
+    update_products_discounted_prices_of_discount_task(new_sale.id)
+
+    # then
+    update_product_prices_mock.assert_not_called()
+    assert task_delay_mock.call_args_list == [
+        call(new_sale.id, (product_ids[0], product_ids[1])),
+        call(new_sale.id, (product_ids[2], product_ids[2])),
+    ]
+
+
+@patch("saleor.product.tasks.update_products_discounted_prices_of_discount")
+def test_update_products_discounted_prices_of_discount_task_with_id_range(
+    update_product_prices_mock, sale
+):
+    # when
+    update_products_discounted_prices_of_discount_task(sale.id, [1, 10])
+
+    # then
+    update_product_prices_mock.assert_called_once_with(sale, [1, 10])
+
+
 @patch("saleor.product.tasks.update_products_discounted_prices_of_discount")
 def test_update_products_discounted_prices_of_discount_task_discount_does_not_exist(
     update_product_prices_mock, caplog
@@ -2,6 +2,7 @@ from typing import TYPE_CHECKING, Dict, Iterable, List, Union
 
 from ...core.taxes import TaxedMoney, zero_taxed_money
 from ...core.tracing import traced_atomic_transaction
+from ...menu.utils import invalidate_menu_cache
 from ..models import Product, ProductChannelListing
 from ..tasks import update_products_discounted_prices_task
 
@@ -53,6 +54,7 @@ def delete_categories(categories_ids: List[str], manager):
     products = list(products)
 
     categories.delete()
+    invalidate_menu_cache()
     product_ids = [product.id for product in products]
     for product in products:
         manager.product_updated(product)
@@ -1,58 +1,103 @@
 import operator
 from collections import defaultdict
 from functools import reduce
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple
 
+from django.db.models import QuerySet
 from django.db.models.query_utils import Q
 from prices import Money
 
-from ...discount.utils import calculate_discounted_price, fetch_active_discounts
-from ..models import Product, ProductChannelListing, ProductVariantChannelListing
-
-
-def _get_variant_prices_in_channels_dict(product):
+from ...channel.models import Channel
+from ...core.db.batches import iterate_pks_in_batches
+from ...discount import DiscountInfo
+from ...discount.models import NotApplicable
+from ...discount.utils import fetch_active_discounts, get_product_discount_on_sale
+from ..models import (
+    CollectionProduct,
+    Product,
+    ProductChannelListing,
+    ProductVariant,
+    ProductVariantChannelListing,
+)
+
+if TYPE_CHECKING:
+    from ...discount.models import Sale
+
+
+def _get_variant_prices_in_channels_dict(
+    product_ids: Iterable[int],
+) -> Dict[Tuple[int, int], List[Money]]:
     prices_dict = defaultdict(list)
-    for variant_channel_listing in ProductVariantChannelListing.objects.filter(
-        variant__product_id=product, price_amount__isnull=False
-    ):
-        channel_id = variant_channel_listing.channel_id
-        prices_dict[channel_id].append(variant_channel_listing.price)
+    variant_channel_listings = ProductVariantChannelListing.objects.filter(
+        variant__product_id__in=product_ids, price_amount__isnull=False
+    ).values_list("variant__product_id", "channel_id", "price_amount", "currency")
+    for product_id, channel_id, price_amount, currency in variant_channel_listings:
+        prices_dict[(product_id, channel_id)].append(Money(price_amount, currency))
     return prices_dict
 
 
+def _get_collection_ids_dict(product_ids: Iterable[int]) -> Dict[int, set]:
+    collections_dict = defaultdict(set)
+    collection_products = CollectionProduct.objects.filter(
+        product_id__in=product_ids
+    ).values_list("product_id", "collection_id")
+    for product_id, collection_id in collection_products:
+        collections_dict[product_id].add(collection_id)
+    return collections_dict
+
+
 def _get_product_discounted_price(
-    variant_prices, product, collections, discounts, channel
+    variant_prices, product, collection_ids, discounts, channel
 ) -> Optional[Money]:
+    # Applicable discounts depend only on the product, so they are checked once
+    # instead of for every variant price.
+    product_discounts = []
+    for discount in discounts:
+        try:
+            _, discount_value = get_product_discount_on_sale(
+                product, collection_ids, discount, channel
+            )
+        except NotApplicable:
+            continue
+        product_discounts.append(discount_value)
     discounted_variants_price = []
     for variant_price in variant_prices:
-        discounted_variant_price = calculate_discounted_price(
-            product=product,
-            price=variant_price,
-            collections=collections,
-            discounts=discounts,
-            channel=channel,
-        )
-        discounted_variants_price.append(discounted_variant_price)
+        if product_discounts:
+            variant_price = min(
+                discount(variant_price) for discount in product_discounts
+            )
+        discounted_variants_price.append(variant_price)
     return min(discounted_variants_price)
 
 
-def update_product_discounted_price(product, discounts=None):
-    if discounts is None:
-        discounts = fetch_active_discounts()
-    collections = list(product.collections.all())
-    variant_prices_in_channels_dict = _get_variant_prices_in_channels_dict(product)
+def _update_products_discounted_prices(
+    product_ids: List[int],
+    discounts: List[DiscountInfo],
+    channels: Dict[int, Channel],
+) -> int:
+    """Recalculate discounted prices of the given products with a few queries.
+
+    Return the number of updated product channel listings.
+    """
+    products = Product.objects.only("id", "category_id").in_bulk(product_ids)
+    collection_ids_dict = _get_collection_ids_dict(product_ids)
+    variant_prices_dict = _get_variant_prices_in_channels_dict(product_ids)
     changed_products_channels_to_update = []
-    for product_channel_listing in product.channel_listings.all():
+    product_channel_listings = ProductChannelListing.objects.filter(
+        product_id__in=product_ids
+    ).only("id", "product_id", "channel_id", "currency", "discounted_price_amount")
+    for product_channel_listing in product_channel_listings:
+        product_id = product_channel_listing.product_id
         channel_id = product_channel_listing.channel_id
-        variant_prices_dict = variant_prices_in_channels_dict.get(channel_id)
-        if not variant_prices_dict:
+        variant_prices = variant_prices_dict.get((product_id, channel_id))
+        if not variant_prices:
             continue
         product_discounted_price = _get_product_discounted_price(
-            variant_prices_dict,
-            product,
-            collections,
+            variant_prices,
+            products[product_id],
+            collection_ids_dict[product_id],
             discounts,
-            product_channel_listing.channel,
+            channels[channel_id],
         )
         if product_channel_listing.discounted_price != product_discounted_price:
             product_channel_listing.discounted_price_amount = (
@@ -62,42 +107,105 @@ def update_product_discounted_price(product, discounts=None):
     ProductChannelListing.objects.bulk_update(
         changed_products_channels_to_update, ["discounted_price_amount"]
     )
+    return len(changed_products_channels_to_update)
 
 
-def update_products_discounted_prices(products, discounts=None):
+def update_product_discounted_price(product, discounts=None):
     if discounts is None:
         discounts = fetch_active_discounts()
+    _update_products_discounted_prices(
+        [product.pk], discounts, Channel.objects.in_bulk()
+    )
 
-    for product in products.prefetch_related("channel_listings"):
-        update_product_discounted_price(product, discounts)
 
+def update_products_discounted_prices_in_batches(
+    products: QuerySet, discounts=None, batch_size: Optional[int] = None
+) -> Iterator[Tuple[int, int]]:
+    """Recalculate discounted prices of products in batches.
 
-def update_products_discounted_prices_of_catalogues(
+    Prices, listings and collections of a whole batch of products are fetched
+    with a query each and the changed listings are saved with a single update.
+    Yield the number of products and of updated listings in each batch.
+    """
+    if discounts is None:
+        discounts = fetch_active_discounts()
+    channels = Channel.objects.in_bulk()
+    for product_ids in iterate_pks_in_batches(products, batch_size):
+        updated = _update_products_discounted_prices(product_ids, discounts, channels)
+        yield len(product_ids), updated
+
+
+def update_products_discounted_prices(products: QuerySet, discounts=None):
+    for _ in update_products_discounted_prices_in_batches(products, discounts):
+        pass
+
+
+def get_products_of_catalogues(
     product_ids=None, category_ids=None, collection_ids=None, variant_ids=None
-):
-    # Building the matching products query
+) -> Optional[QuerySet]:
+    """Return products matching any of the catalogues, None if none is given."""
+    # Subqueries are used instead of joins, so the result doesn't need `distinct`.
     q_list = []
     if product_ids:
         q_list.append(Q(pk__in=product_ids))
     if category_ids:
         q_list.append(Q(category_id__in=category_ids))
     if collection_ids:
-        q_list.append(Q(collectionproduct__collection_id__in=collection_ids))
-    # Asserting that the function was called with some ids
+        q_list.append(
+            Q(
+                pk__in=CollectionProduct.objects.filter(
+                    collection_id__in=collection_ids
+                ).values("product_id")
+            )
+        )
     if variant_ids:
-        q_list.append(Q(variants__id__in=variant_ids))
-    if q_list:
-        # Querying the products
-        q_or = reduce(operator.or_, q_list)
-        products = Product.objects.filter(q_or).distinct()
-
-        update_products_discounted_prices(products)
+        q_list.append(
+            Q(
+                pk__in=ProductVariant.objects.filter(pk__in=variant_ids).values(
+                    "product_id"
+                )
+            )
+        )
+    if not q_list:
+        return None
+    return Product.objects.filter(reduce(operator.or_, q_list))
 
 
-def update_products_discounted_prices_of_discount(discount):
-    update_products_discounted_prices_of_catalogues(
+def get_products_of_discount(discount: "Sale") -> Optional[QuerySet]:
+    return get_products_of_catalogues(
         product_ids=discount.products.all().values_list("id", flat=True),
         category_ids=discount.categories.all().values_list("id", flat=True),
         collection_ids=discount.collections.all().values_list("id", flat=True),
         variant_ids=discount.variants.all().values_list("id", flat=True),
     )
+
+
+def _update_products_discounted_prices_in_range(products, product_id_range):
+    if products is None:
+        return
+    if product_id_range:
+        products = products.filter(pk__range=product_id_range)
+    update_products_discounted_prices(products)
+
+
+def update_products_discounted_prices_of_catalogues(
+    product_ids=None,
+    category_ids=None,
+    collection_ids=None,
+    variant_ids=None,
+    product_id_range=None,
+):
+    """Update products matching the catalogues.
+
+    With `product_id_range`, only products with IDs in the inclusive range are
+    updated, so the work can be split between tasks.
+    """
+    products = get_products_of_catalogues(
+        product_ids, category_ids, collection_ids, variant_ids
+    )
+    _update_products_discounted_prices_in_range(products, product_id_range)
+
+
+def update_products_discounted_prices_of_discount(discount, product_id_range=None):
+    products = get_products_of_discount(discount)
+    _update_products_discounted_prices_in_range(products, product_id_range)
@@ -1,4 +1,5 @@
-from typing import TYPE_CHECKING, List, Optional, Sequence, Tuple
+from collections import defaultdict
+from typing import TYPE_CHECKING, Iterable, List, Optional, Sequence, Tuple
 
 from ...attribute import AttributeType
 
@@ -30,6 +31,39 @@ def generate_and_set_variant_name(variant: "ProductVariant", sku: Optional[str])
     variant.save(update_fields=["name"])
 
 
+def generate_and_set_variants_names(variants: Iterable["ProductVariant"]):
+    """Generate names of many variants like `generate_and_set_variant_name`.
+
+    Attributes of all variants are fetched at once and the names are saved with
+    a single bulk update.
+    """
+    from ...attribute.models import AssignedVariantAttribute
+    from ..models import ProductVariant
+
+    variants = list(variants)
+    if not variants:
+        return
+
+    attributes_display = defaultdict(list)
+    variant_selection_attributes = AssignedVariantAttribute.objects.filter(
+        variant__in=variants,
+        assignment__variant_selection=True,
+        assignment__attribute__type=AttributeType.PRODUCT_TYPE,
+    ).prefetch_related("values__translations")
+    for attribute_rel in variant_selection_attributes:
+        translated_values = [
+            str(value.translated) for value in attribute_rel.values.all()
+        ]
+        attributes_display[attribute_rel.variant_id].append(
+            ", ".join(translated_values)
+        )
+
+    for variant in variants:
+        name = " / ".join(sorted(attributes_display[variant.pk]))
+        variant.name = name or variant.sku or variant.get_global_id()
+    ProductVariant.objects.bulk_update(variants, ["name"])
+
+
 def get_variant_selection_attributes(
     attributes: Sequence[Tuple["Attribute", bool]]
 ) -> List[Tuple["Attribute", bool]]:
@@ -155,6 +155,9 @@ loaders = [
     "django.template.loaders.filesystem.Loader",
     "django.template.loaders.app_directories.Loader",
 ]
+if not DEBUG:
+    # Compile templates, like the invoice PDF template, once per process.
+    loaders = [("django.template.loaders.cached.Loader", loaders)]
 
 TEMPLATES_DIR = os.path.join(PROJECT_ROOT, "templates")
 TEMPLATES = [
@@ -508,6 +511,12 @@ CELERY_TASK_SERIALIZER = "json"
 CELERY_RESULT_SERIALIZER = "json"
 CELERY_RESULT_BACKEND = os.environ.get("CELERY_RESULT_BACKEND", None)
 
+# Discounted prices of products are recalculated when sales start or end; transitions
+# are scheduled this often and applied at their exact dates.
+SALE_PRICE_TRANSITIONS_CHECK_INTERVAL = timedelta(
+    seconds=parse(os.environ.get("SALE_PRICE_TRANSITIONS_CHECK_INTERVAL", "5m"))
+)
+
 CELERY_BEAT_SCHEDULE = {
     "delete-empty-allocations": {
         "task": "saleor.warehouse.tasks.delete_empty_allocations_task",
@@ -537,11 +546,132 @@ CELERY_BEAT_SCHEDULE = {
         "task": "saleor.warehouse.tasks.update_stocks_quantity_allocated_task",
         "schedule": crontab(hour=0, minute=0),
     },
+    "process-stale-gateway-notifications": {
+        "task": "saleor.payment.tasks.process_stale_gateway_notifications_task",
+        "schedule": timedelta(minutes=10),
+    },
+    "complete-stale-checkouts": {
+        "task": "saleor.checkout.tasks.complete_stale_checkouts_task",
+        "schedule": timedelta(minutes=5),
+    },
+    "schedule-sale-price-transitions": {
+        "task": "saleor.discount.tasks.schedule_sale_price_transitions_task",
+        "schedule": SALE_PRICE_TRANSITIONS_CHECK_INTERVAL,
+    },
 }
 
 EVENT_PAYLOAD_DELETE_PERIOD = timedelta(
     seconds=parse(os.environ.get("EVENT_PAYLOAD_DELETE_PERIOD", "14 days"))
 )
+# Webhook payloads larger than this number of characters are kept in the file storage
+# instead of the database; 0 keeps all payloads in the database.
+EVENT_PAYLOAD_STORAGE_THRESHOLD = int(
+    os.environ.get("EVENT_PAYLOAD_STORAGE_THRESHOLD", 0)
+)
+# Expired event payloads and deliveries are deleted in batches of this size.
+EVENT_PAYLOAD_DELETE_BATCH_SIZE = int(
+    os.environ.get("EVENT_PAYLOAD_DELETE_BATCH_SIZE", 5000)
+)
+
+# Maintenance tasks delete and update expired objects in batches of this size.
+BULK_OPERATION_BATCH_SIZE = int(os.environ.get("BULK_OPERATION_BATCH_SIZE", 1000))
+# A maintenance task run stops after this period and schedules another run to resume.
+MAINTENANCE_TASK_TIME_BUDGET = timedelta(
+    seconds=parse(os.environ.get("MAINTENANCE_TASK_TIME_BUDGET", "5m"))
+)
+
+# Sales with more products than this have discounted prices updated by several tasks,
+# each covering a range of product IDs.
+DISCOUNTED_PRICES_UPDATE_TASK_SIZE = int(
+    os.environ.get("DISCOUNTED_PRICES_UPDATE_TASK_SIZE", 10000)
+)
+
+# Number of threads preparing batches of exported products. With more than one, the
+# next batches are prepared while the current one is written to the file.
+EXPORT_FILE_WORKERS = int(os.environ.get("EXPORT_FILE_WORKERS", 1))
+
+# Allocate stocks with conditional updates of `Stock.quantity_allocated` instead of
+# locking all stocks of the ordered variants. Orders with lines that have to be split
+# between warehouses are still allocated with locks.
+ATOMIC_STOCK_ALLOCATION = get_bool_from_env("ATOMIC_STOCK_ALLOCATION", False)
+
+# Queue checkouts completed with `checkoutComplete` and create their orders by Celery
+# workers. Clients poll the returned `CheckoutCompleteRequest` for the order.
+CHECKOUT_COMPLETE_QUEUE_ENABLED = get_bool_from_env(
+    "CHECKOUT_COMPLETE_QUEUE_ENABLED", False
+)
+# Celery queue of the order placement tasks, served by dedicated workers. The default
+# queue is used when not set.
+CHECKOUT_COMPLETE_QUEUE = os.environ.get("CHECKOUT_COMPLETE_QUEUE")
+# Number of checkouts of a channel completed by a single task.
+CHECKOUT_COMPLETE_BATCH_SIZE = int(os.environ.get("CHECKOUT_COMPLETE_BATCH_SIZE", 50))
+# Checkouts processed for longer than this, e.g. by a killed worker, are processed
+# again by the next task.
+CHECKOUT_COMPLETE_PROCESSING_TIMEOUT = timedelta(
+    seconds=parse(os.environ.get("CHECKOUT_COMPLETE_PROCESSING_TIMEOUT", "5m"))
+)
+
+# Celery queue of tasks rendering invoice PDFs. Serve it with workers of limited
+# concurrency to bound resources used by rendering. The default queue is used when
+# not set.
+INVOICE_PDF_QUEUE = os.environ.get("INVOICE_PDF_QUEUE")
+
+# Store notifications sent by payment gateways (Adyen, Stripe) and process them with
+# Celery workers instead of handling them during the gateway's HTTP request.
+PAYMENT_GATEWAY_NOTIFICATIONS_ASYNC = get_bool_from_env(
+    "PAYMENT_GATEWAY_NOTIFICATIONS_ASYNC", False
+)
+# Pending notifications older than this are scheduled for processing again.
+PAYMENT_GATEWAY_NOTIFICATIONS_STALE_PERIOD = timedelta(
+    seconds=parse(os.environ.get("PAYMENT_GATEWAY_NOTIFICATIONS_STALE_PERIOD", "5m"))
+)
+
+# Find shipping methods available for checkouts and orders using an in-memory index
+# of shipping rules, built per channel and rebuilt after shipping changes.
+SHIPPING_RULES_INDEX_ENABLED = get_bool_from_env("SHIPPING_RULES_INDEX_ENABLED", False)
+# The index is also rebuilt after this period to pick up changes made outside the API.
+SHIPPING_RULES_INDEX_TTL = timedelta(
+    seconds=parse(os.environ.get("SHIPPING_RULES_INDEX_TTL", "10m"))
+)
+
+# Share menu trees resolved by the API between requests through the cache, keyed by
+# menu, channel and language. Entries are dropped after menu and linked object changes.
+MENU_CACHE_ENABLED = get_bool_from_env("MENU_CACHE_ENABLED", False)
+# Cached menus also expire after this period to pick up changes made outside the API.
+MENU_CACHE_TIMEOUT = timedelta(
+    seconds=parse(os.environ.get("MENU_CACHE_TIMEOUT", "10m"))
+)
+
+# Share apps authenticated by tokens, with their permissions, between requests
+# through the cache. Entries are dropped when tokens are deleted and when apps are
+# updated, (de)activated or deleted through the API.
+APP_AUTH_CACHE_ENABLED = get_bool_from_env("APP_AUTH_CACHE_ENABLED", False)
+# Cached apps also expire after this period to pick up changes made outside the API.
+APP_AUTH_CACHE_TIMEOUT = timedelta(
+    seconds=parse(os.environ.get("APP_AUTH_CACHE_TIMEOUT", "5m"))
+)
+
+# Keep the current site with its settings in each process instead of loading them
+# on each request. Processes reload them when settings are changed through the API,
+# so the cache backend has to be shared by all processes.
+SITE_CACHE_ENABLED = get_bool_from_env("SITE_CACHE_ENABLED", False)
+# Sites are also reloaded after this period to pick up changes made outside the API.
+SITE_CACHE_TIMEOUT = timedelta(
+    seconds=parse(os.environ.get("SITE_CACHE_TIMEOUT", "10m"))
+)
+
+# Read sales reports from daily rollups maintained from orders instead of aggregating
+# orders. Run the `backfill_sales_rollups` command before enabling.
+SALES_ROLLUPS_ENABLED = get_bool_from_env("SALES_ROLLUPS_ENABLED", False)
+# Rollups of a day are updated once per this period after its orders change.
+SALES_ROLLUPS_UPDATE_DELAY = timedelta(
+    seconds=parse(os.environ.get("SALES_ROLLUPS_UPDATE_DELAY", "1m"))
+)
+
+# Filter and sort customers by order aggregates stored on users instead of counting
+# their orders. Run the `backfill_customer_order_stats` command before enabling.
+# Unlike the counts of orders, the aggregates don't include draft orders.
+CUSTOMER_ORDER_STATS_ENABLED = get_bool_from_env("CUSTOMER_ORDER_STATS_ENABLED", False)
 
 # Change this value if your application is running behind a proxy,
 # e.g. HTTP_CF_Connecting_IP for Cloudflare or X_FORWARDED_FOR
@@ -578,6 +708,24 @@ GRAPHENE = {
 # Set GRAPHQL_QUERY_MAX_COMPLEXITY=0 in env to disable (not recommended)
 GRAPHQL_QUERY_MAX_COMPLEXITY = int(os.environ.get("GRAPHQL_QUERY_MAX_COMPLEXITY", 250))
 
+# Return timings of instrumented operations, like phases of checkoutComplete,
+# in the "extensions" of responses to staff users and apps.
+GRAPHQL_LATENCY_BREAKDOWN_ENABLED = get_bool_from_env(
+    "GRAPHQL_LATENCY_BREAKDOWN_ENABLED", False
+)
+
+# Strategies used by connections to resolve `totalCount` without counting all rows.
+# Cached counts are exact counts reused for this period.
+GRAPHQL_TOTAL_COUNT_CACHE_TIMEOUT = timedelta(
+    seconds=parse(os.environ.get("GRAPHQL_TOTAL_COUNT_CACHE_TIMEOUT", "30s"))
+)
+# Estimated counts come from the query planner when it expects more rows than this.
+GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD = int(
+    os.environ.get("GRAPHQL_TOTAL_COUNT_ESTIMATE_THRESHOLD", 10000)
+)
+# Capped counts stop counting at this number of rows.
+GRAPHQL_TOTAL_COUNT_CAP = int(os.environ.get("GRAPHQL_TOTAL_COUNT_CAP", 10000))
+
 # Max number entities that can be requested in single query by Apollo Federation
 # Federation protocol implements no securities on its own part - malicious actor
 # may build a query that requests for potentially few thousands of entities.
@@ -629,6 +777,17 @@ if (
 WEBHOOK_TIMEOUT = 10
 WEBHOOK_SYNC_TIMEOUT = 20
 
+# When a sync webhook is sent to many apps at once (eg. listing payment gateways or
+# shipping methods), requests are sent in parallel by a pool of threads shared by the
+# process and the responses which didn't arrive before the deadline (in seconds) are
+# skipped. By default apps get as much time as a single sync webhook request.
+WEBHOOK_SYNC_FAN_OUT_DEADLINE = int(
+    os.environ.get("WEBHOOK_SYNC_FAN_OUT_DEADLINE", WEBHOOK_SYNC_TIMEOUT)
+)
+WEBHOOK_SYNC_FAN_OUT_MAX_WORKERS = int(
+    os.environ.get("WEBHOOK_SYNC_FAN_OUT_MAX_WORKERS", 10)
+)
+
 # Initialize a simple and basic Jaeger Tracing integration
 # for open-tracing if enabled.
 #
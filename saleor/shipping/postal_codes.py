@@ -41,15 +41,46 @@ def compare_values(code, start, end):
     return start <= code <= end
 
 
+UK_POSTAL_CODE_PATTERN = r"^([A-Z]{1,2})([0-9]+)([A-Z]?) ?([0-9][A-Z]{2})$"
+IRISH_POSTAL_CODE_PATTERN = r"([\dA-Z]{3}) ?([\dA-Z]{4})"
+
+
+def get_uk_postal_code_key(code):
+    """Split the UK postal code into sections comparable with other codes."""
+    (key,) = cast_tuple_index_to_type(
+        1, int, *group_values(UK_POSTAL_CODE_PATTERN, code)
+    )
+    return key
+
+
+def get_irish_postal_code_key(code):
+    """Split the Irish postal code into sections comparable with other codes."""
+    (key,) = group_values(IRISH_POSTAL_CODE_PATTERN, code)
+    return key
+
+
+def get_any_postal_code_key(code):
+    return code
+
+
+def get_postal_code_key_function(country):
+    """Return the function converting postal codes of the country to range keys."""
+    country_func_map = {
+        "GB": get_uk_postal_code_key,  # United Kingdom
+        "IM": get_uk_postal_code_key,  # Isle of Man
+        "GG": get_uk_postal_code_key,  # Guernsey
+        "JE": get_uk_postal_code_key,  # Jersey
+        "IE": get_irish_postal_code_key,  # Ireland
+    }
+    return country_func_map.get(country, get_any_postal_code_key)
+
+
 def check_uk_postal_code(code, start, end):
     """Check postal code for uk, split the code by regex.
 
     Example postal codes: BH20 2BC  (UK), IM16 7HF  (Isle of Man).
     """
-    pattern = r"^([A-Z]{1,2})([0-9]+)([A-Z]?) ?([0-9][A-Z]{2})$"
-    code, start, end = group_values(pattern, code, start, end)
-    # replace second item of each tuple with it's value casted to int
-    code, start, end = cast_tuple_index_to_type(1, int, code, start, end)
+    code, start, end = map(get_uk_postal_code_key, (code, start, end))
     return compare_values(code, start, end)
 
 
@@ -58,8 +89,7 @@ def check_irish_postal_code(code, start, end):
 
     Example postal codes: A65 2F0A, A61 2F0G.
     """
-    pattern = r"([\dA-Z]{3}) ?([\dA-Z]{4})"
-    code, start, end = group_values(pattern, code, start, end)
+    code, start, end = map(get_irish_postal_code_key, (code, start, end))
     return compare_values(code, start, end)
 
 
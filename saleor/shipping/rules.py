@@ -0,0 +1,294 @@
+import time
+from bisect import bisect_right
+from collections import defaultdict
+from dataclasses import dataclass, field
+from operator import itemgetter
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+from uuid import uuid4
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from measurement.measures import Weight
+from prices import Money
+
+from . import PostalCodeRuleInclusionType, ShippingMethodType
+from .models import (
+    ShippingMethod,
+    ShippingMethodChannelListing,
+    ShippingMethodPostalCodeRule,
+)
+from .postal_codes import get_postal_code_key_function
+
+if TYPE_CHECKING:
+    from ..checkout.models import Checkout
+    from ..order.models import Order
+
+
+SHIPPING_RULES_INDEX_VERSION_CACHE_KEY = "shipping_rules_index_version"
+
+# Marks postal code ranges without the upper bound.
+_NO_END = object()
+
+
+class PostalCodeRanges:
+    """Postal code ranges which can be checked with a binary search.
+
+    Ranges are sorted by their start and for each of them the highest end among
+    the preceding ranges is kept, so the code is within any range when it doesn't
+    exceed the highest end of ranges starting before it.
+    """
+
+    def __init__(self, ranges: Iterable[Tuple]):
+        sorted_ranges = sorted(
+            ((start, end) for start, end in ranges if start), key=itemgetter(0)
+        )
+        self.starts = [start for start, _ in sorted_ranges]
+        self.max_ends: List = []
+        max_end = None
+        for _, end in sorted_ranges:
+            if max_end is _NO_END or not end:
+                max_end = _NO_END
+            elif max_end is None or end > max_end:
+                max_end = end
+            self.max_ends.append(max_end)
+
+    def __contains__(self, code) -> bool:
+        if not code:
+            return False
+        index = bisect_right(self.starts, code)
+        if not index:
+            return False
+        max_end = self.max_ends[index - 1]
+        return max_end is _NO_END or code <= max_end
+
+
+@dataclass
+class ShippingMethodRules:
+    shipping_method: ShippingMethod
+    listing: ShippingMethodChannelListing
+    countries: FrozenSet[str]
+    excluded_product_ids: FrozenSet[int]
+    postal_code_rules: List[ShippingMethodPostalCodeRule]
+    postal_code_ranges: Dict[Callable, PostalCodeRanges] = field(default_factory=dict)
+
+    def is_applicable_for_price(self, price: Money) -> bool:
+        minimum = self.listing.minimum_order_price_amount
+        maximum = self.listing.maximum_order_price_amount
+        if minimum is None or minimum > price.amount:
+            return False
+        return maximum is None or maximum >= price.amount
+
+    def is_applicable_for_weight(self, weight: Weight) -> bool:
+        minimum = self.shipping_method.minimum_order_weight
+        maximum = self.shipping_method.maximum_order_weight
+        if minimum is not None and minimum > weight:
+            return False
+        return maximum is None or maximum >= weight
+
+    def is_applicable_for_postal_code(self, country_code: str, postal_code) -> bool:
+        """Return if the method is applicable with its postal code rules.
+
+        Mirrors `is_shipping_method_applicable_for_postal_code`.
+        """
+        if not self.postal_code_rules:
+            return True
+        inclusion_types = {rule.inclusion_type for rule in self.postal_code_rules}
+        if len(inclusion_types) > 1:
+            # Shipping methods with complex rules are not supported for now
+            return False
+
+        key_function = get_postal_code_key_function(country_code)
+        ranges = self.postal_code_ranges.get(key_function)
+        if ranges is None:
+            ranges = PostalCodeRanges(
+                (key_function(rule.start), key_function(rule.end))
+                for rule in self.postal_code_rules
+            )
+            self.postal_code_ranges[key_function] = ranges
+
+        in_range = key_function(postal_code) in ranges
+        if inclusion_types == {PostalCodeRuleInclusionType.INCLUDE}:
+            return in_range
+        return not in_range
+
+    def is_applicable(
+        self,
+        price: Money,
+        weight: Weight,
+        country_code: str,
+        postal_code,
+        product_ids: Set[int],
+    ) -> bool:
+        if self.listing.currency != price.currency:
+            return False
+        if not self.excluded_product_ids.isdisjoint(product_ids):
+            return False
+        method_type = self.shipping_method.type
+        if method_type == ShippingMethodType.PRICE_BASED:
+            applicable = self.is_applicable_for_price(price)
+        elif method_type == ShippingMethodType.WEIGHT_BASED:
+            applicable = self.is_applicable_for_weight(weight)
+        else:
+            applicable = False
+        return applicable and self.is_applicable_for_postal_code(
+            country_code, postal_code
+        )
+
+
+class ShippingRulesIndex:
+    """Shipping method rules of a channel, grouped by country."""
+
+    def __init__(self, method_rules: Iterable[ShippingMethodRules]):
+        self.rules_by_country: Dict[str, List[ShippingMethodRules]] = defaultdict(list)
+        # Keep the order of `ShippingMethodQueryset.applicable_shipping_methods`.
+        for rules in sorted(
+            method_rules, key=lambda r: (r.listing.price_amount, r.shipping_method.pk)
+        ):
+            for country_code in rules.countries:
+                self.rules_by_country[country_code].append(rules)
+
+    def get_applicable_shipping_methods(
+        self,
+        price: Money,
+        weight: Weight,
+        country_code: str,
+        postal_code,
+        product_ids: Set[int],
+        postal_code_country_code: Optional[str] = None,
+    ) -> List[ShippingMethod]:
+        postal_code_country_code = postal_code_country_code or country_code
+        return [
+            rules.shipping_method
+            for rules in self.rules_by_country.get(country_code, [])
+            if rules.is_applicable(
+                price, weight, postal_code_country_code, postal_code, product_ids
+            )
+        ]
+
+
+def build_shipping_rules_index(channel_id: int) -> ShippingRulesIndex:
+    listings = list(
+        ShippingMethodChannelListing.objects.filter(
+            channel_id=channel_id,
+            shipping_method__shipping_zone__channels__id=channel_id,
+        ).select_related("shipping_method__shipping_zone")
+    )
+    method_ids = [listing.shipping_method_id for listing in listings]
+
+    excluded_product_ids = defaultdict(set)
+    excluded_products = ShippingMethod.excluded_products.through.objects.filter(
+        shippingmethod_id__in=method_ids
+    ).values_list("shippingmethod_id", "product_id")
+    for method_id, product_id in excluded_products:
+        excluded_product_ids[method_id].add(product_id)
+
+    postal_code_rules = defaultdict(list)
+    for rule in ShippingMethodPostalCodeRule.objects.filter(
+        shipping_method_id__in=method_ids
+    ):
+        postal_code_rules[rule.shipping_method_id].append(rule)
+
+    return ShippingRulesIndex(
+        ShippingMethodRules(
+            shipping_method=listing.shipping_method,
+            listing=listing,
+            countries=frozenset(
+                country.code
+                for country in listing.shipping_method.shipping_zone.countries
+            ),
+            excluded_product_ids=frozenset(
+                excluded_product_ids[listing.shipping_method_id]
+            ),
+            postal_code_rules=postal_code_rules[listing.shipping_method_id],
+        )
+        for listing in listings
+    )
+
+
+# Indexes built by this process, stored with the index version and build time.
+_shipping_rules_indexes: Dict[int, Tuple[str, float, ShippingRulesIndex]] = {}
+
+
+def _get_shipping_rules_index_version() -> str:
+    version = cache.get(SHIPPING_RULES_INDEX_VERSION_CACHE_KEY)
+    if version is None:
+        cache.add(SHIPPING_RULES_INDEX_VERSION_CACHE_KEY, uuid4().hex, timeout=None)
+        version = cache.get(SHIPPING_RULES_INDEX_VERSION_CACHE_KEY)
+    return version
+
+
+def get_shipping_rules_index(channel_id: int) -> ShippingRulesIndex:
+    """Return the channel's shipping rules index, building it when outdated."""
+    version = _get_shipping_rules_index_version()
+    now = time.monotonic()
+    cached = _shipping_rules_indexes.get(channel_id)
+    if cached:
+        cached_version, built_at, index = cached
+        max_age = settings.SHIPPING_RULES_INDEX_TTL.total_seconds()
+        if cached_version == version and now - built_at < max_age:
+            return index
+
+    index = build_shipping_rules_index(channel_id)
+    _shipping_rules_indexes[channel_id] = (version, now, index)
+    return index
+
+
+def invalidate_shipping_rules_index():
+    """Make all processes rebuild their indexes once the transaction is committed."""
+    transaction.on_commit(
+        lambda: cache.set(
+            SHIPPING_RULES_INDEX_VERSION_CACHE_KEY, uuid4().hex, timeout=None
+        )
+    )
+
+
+def get_applicable_shipping_methods_for_instance(
+    instance: Union["Checkout", "Order"],
+    channel_id,
+    price: Money,
+    country_code=None,
+    lines=None,
+) -> Optional[Iterable[ShippingMethod]]:
+    """Return shipping methods applicable for the checkout or the order.
+
+    When `SHIPPING_RULES_INDEX_ENABLED` is set, the methods are evaluated against
+    the in-memory shipping rules index instead of querying the database.
+    """
+    if not settings.SHIPPING_RULES_INDEX_ENABLED:
+        return ShippingMethod.objects.applicable_shipping_methods_for_instance(
+            instance,
+            channel_id=channel_id,
+            price=price,
+            country_code=country_code,
+            lines=lines,
+        )
+
+    shipping_address = instance.shipping_address
+    if not shipping_address:
+        return None
+    if lines is None:
+        lines = instance.lines.prefetch_related("variant__product").all()
+        product_ids = set(lines.values_list("variant__product", flat=True))
+    else:
+        product_ids = {line.product.id for line in lines}
+    index = get_shipping_rules_index(channel_id)
+    return index.get_applicable_shipping_methods(
+        price=price,
+        weight=instance.get_total_weight(lines),
+        country_code=country_code or shipping_address.country.code,
+        postal_code=shipping_address.postal_code,
+        product_ids=product_ids,
+        postal_code_country_code=shipping_address.country.code,
+    )
@@ -0,0 +1,315 @@
+from unittest.mock import patch
+
+import pytest
+from measurement.measures import Weight
+from prices import Money
+
+from ...checkout.fetch import fetch_checkout_lines
+from ...tests.utils import flush_post_commit_hooks
+from .. import PostalCodeRuleInclusionType, ShippingMethodType
+from ..models import ShippingMethod, ShippingMethodChannelListing
+from ..postal_codes import check_postal_code_in_range, get_postal_code_key_function
+from ..rules import (
+    PostalCodeRanges,
+    _shipping_rules_indexes,
+    build_shipping_rules_index,
+    get_applicable_shipping_methods_for_instance,
+    get_shipping_rules_index,
+    invalidate_shipping_rules_index,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_shipping_rules_indexes():
+    _shipping_rules_indexes.clear()
+    yield
+    _shipping_rules_indexes.clear()
+
+
+def _get_applicable_methods(channel, price, weight=None, postal_code="53-601"):
+    index = build_shipping_rules_index(channel.id)
+    return index.get_applicable_shipping_methods(
+        price=price,
+        weight=weight or Weight(kg=0),
+        country_code="PL",
+        postal_code=postal_code,
+        product_ids=set(),
+    )
+
+
+@pytest.mark.parametrize(
+    "country, ranges, code, expected",
+    (
+        ("PL", [("00-001", "00-999")], "00-950", True),
+        ("PL", [("00-001", "00-999")], "01-001", False),
+        ("PL", [("00-001", "00-100"), ("00-200", None)], "00-150", False),
+        ("PL", [("00-001", "00-100"), ("00-200", None)], "99-999", True),
+        ("PL", [("00-001", "00-999"), ("00-100", "00-200")], "00-500", True),
+        ("GB", [("BH16 7HF", "BH16 7HG")], "BH16 7HF", True),
+        ("GB", [("BH2 1AA", "BH9 9ZZ")], "BH16 7HF", False),
+        ("GB", [("BH2 1AA", "BH20 9ZZ")], "BH16 7HF", True),
+        ("GB", [("BH16 7HF", "invalid")], "BH17 7HF", True),
+        ("IE", [("A65 2F0A", "A65 2F0C")], "A65 2F0B", True),
+        ("IE", [("A65 2F0A", "A65 2F0C")], "A65 2F0D", False),
+        ("PL", [("00-001", "00-999")], "", False),
+    ),
+)
+def test_postal_code_ranges(country, ranges, code, expected):
+    # given
+    key_function = get_postal_code_key_function(country)
+
+    # when
+    postal_code_ranges = PostalCodeRanges(
+        (key_function(start), key_function(end)) for start, end in ranges
+    )
+
+    # then
+    assert (key_function(code) in postal_code_ranges) is expected
+    assert expected is any(
+        check_postal_code_in_range(country, code, start, end) for start, end in ranges
+    )
+
+
+@pytest.mark.parametrize(
+    "price, min_price, max_price, shipping_included",
+    (
+        (10, 10, 20, True),
+        (10, 1, 10, True),
+        (9, 10, 15, False),
+        (10, 1, 9, False),
+        (10000000, 1, None, True),
+        (10, None, None, False),
+    ),
+)
+def test_shipping_rules_index_price(
+    shipping_zone, channel_USD, price, min_price, max_price, shipping_included
+):
+    # given
+    method = shipping_zone.shipping_methods.create(type=ShippingMethodType.PRICE_BASED)
+    ShippingMethodChannelListing.objects.create(
+        currency=channel_USD.currency_code,
+        minimum_order_price_amount=min_price,
+        maximum_order_price_amount=max_price,
+        shipping_method=method,
+        channel=channel_USD,
+    )
+
+    # when
+    result = _get_applicable_methods(channel_USD, Money(price, "USD"))
+
+    # then
+    assert (method in result) == shipping_included
+    assert (
+        method
+        in ShippingMethod.objects.applicable_shipping_methods(
+            price=Money(price, "USD"),
+            weight=Weight(kg=0),
+            country_code="PL",
+            channel_id=channel_USD.id,
+        )
+    ) == shipping_included
+
+
+@pytest.mark.parametrize(
+    "weight, min_weight, max_weight, shipping_included",
+    (
+        (Weight(kg=1), Weight(kg=1), Weight(kg=2), True),
+        (Weight(kg=10), Weight(kg=1), Weight(kg=10), True),
+        (Weight(kg=5), Weight(kg=8), Weight(kg=15), False),
+        (Weight(kg=10), Weight(kg=1), Weight(kg=9), False),
+        (Weight(kg=10000000), Weight(kg=1), None, True),
+        (Weight(g=500), Weight(kg=1), None, False),
+    ),
+)
+def test_shipping_rules_index_weight(
+    shipping_zone, channel_USD, weight, min_weight, max_weight, shipping_included
+):
+    # given
+    method = shipping_zone.shipping_methods.create(
+        minimum_order_weight=min_weight,
+        maximum_order_weight=max_weight,
+        type=ShippingMethodType.WEIGHT_BASED,
+    )
+    ShippingMethodChannelListing.objects.create(
+        shipping_method=method, channel=channel_USD, currency=channel_USD.currency_code
+    )
+
+    # when
+    result = _get_applicable_methods(channel_USD, Money(0, "USD"), weight)
+
+    # then
+    assert (method in result) == shipping_included
+
+
+def test_shipping_rules_index_orders_methods_by_price(shipping_zone, channel_USD):
+    # given
+    default_method = shipping_zone.shipping_methods.get()
+    cheap_method = shipping_zone.shipping_methods.create(
+        type=ShippingMethodType.PRICE_BASED
+    )
+    ShippingMethodChannelListing.objects.create(
+        shipping_method=cheap_method,
+        channel=channel_USD,
+        currency=channel_USD.currency_code,
+        price_amount=1,
+    )
+
+    # when
+    result = _get_applicable_methods(channel_USD, Money(10, "USD"))
+
+    # then
+    assert result == [cheap_method, default_method]
+
+
+def test_shipping_rules_index_other_channel_and_country(
+    shipping_zone, channel_USD, channel_PLN
+):
+    # given
+    method = shipping_zone.shipping_methods.get()
+    shipping_zone.countries = ["DE"]
+    shipping_zone.save(update_fields=["countries"])
+
+    # when
+    index = build_shipping_rules_index(channel_USD.id)
+
+    # then
+    assert method in index.get_applicable_shipping_methods(
+        Money(10, "USD"), Weight(kg=0), "DE", "10115", set()
+    )
+    assert not index.get_applicable_shipping_methods(
+        Money(10, "USD"), Weight(kg=0), "PL", "53-601", set()
+    )
+    assert not build_shipping_rules_index(channel_PLN.id).rules_by_country
+
+
+def test_shipping_rules_index_excluded_products(shipping_zone, channel_USD, product):
+    # given
+    method = shipping_zone.shipping_methods.get()
+    method.excluded_products.add(product)
+    index = build_shipping_rules_index(channel_USD.id)
+
+    # when
+    result = index.get_applicable_shipping_methods(
+        Money(10, "USD"), Weight(kg=0), "PL", "53-601", {product.id}
+    )
+
+    # then
+    assert method not in result
+
+
+@pytest.mark.parametrize(
+    "inclusion_type, postal_code, shipping_included",
+    (
+        (PostalCodeRuleInclusionType.INCLUDE, "53-601", True),
+        (PostalCodeRuleInclusionType.INCLUDE, "00-001", False),
+        (PostalCodeRuleInclusionType.EXCLUDE, "53-601", False),
+        (PostalCodeRuleInclusionType.EXCLUDE, "00-001", True),
+    ),
+)
+def test_shipping_rules_index_postal_codes(
+    shipping_zone, channel_USD, inclusion_type, postal_code, shipping_included
+):
+    # given
+    method = shipping_zone.shipping_methods.get()
+    method.postal_code_rules.create(
+        start="53-000", end="53-999", inclusion_type=inclusion_type
+    )
+    method.postal_code_rules.create(start="54-000", inclusion_type=inclusion_type)
+
+    # when
+    result = _get_applicable_methods(
+        channel_USD, Money(10, "USD"), postal_code=postal_code
+    )
+
+    # then
+    assert (method in result) == shipping_included
+
+
+def test_shipping_rules_index_mixed_postal_code_rules(shipping_zone, channel_USD):
+    # given
+    method = shipping_zone.shipping_methods.get()
+    method.postal_code_rules.create(
+        start="53-000", inclusion_type=PostalCodeRuleInclusionType.INCLUDE
+    )
+    method.postal_code_rules.create(
+        start="00-000", end="00-999", inclusion_type=PostalCodeRuleInclusionType.EXCLUDE
+    )
+
+    # when
+    result = _get_applicable_methods(channel_USD, Money(10, "USD"))
+
+    # then
+    assert method not in result
+
+
+def test_get_shipping_rules_index_reuses_index(
+    shipping_zone, channel_USD, django_assert_num_queries
+):
+    # given
+    index = get_shipping_rules_index(channel_USD.id)
+
+    # when
+    with django_assert_num_queries(0):
+        cached_index = get_shipping_rules_index(channel_USD.id)
+
+    # then
+    assert cached_index is index
+
+
+def test_get_shipping_rules_index_rebuilt_after_invalidation(
+    shipping_zone, channel_USD
+):
+    # given
+    index = get_shipping_rules_index(channel_USD.id)
+
+    # when
+    invalidate_shipping_rules_index()
+    flush_post_commit_hooks()
+
+    # then
+    assert get_shipping_rules_index(channel_USD.id) is not index
+
+
+def test_get_shipping_rules_index_rebuilt_after_ttl(
+    shipping_zone, channel_USD, settings
+):
+    # given
+    index = get_shipping_rules_index(channel_USD.id)
+    max_age = settings.SHIPPING_RULES_INDEX_TTL.total_seconds()
+
+    # when
+    with patch("saleor.shipping.rules.time.monotonic") as mocked_monotonic:
+        mocked_monotonic.return_value = _shipping_rules_indexes[channel_USD.id][1]
+        mocked_monotonic.return_value += max_age + 1
+        rebuilt_index = get_shipping_rules_index(channel_USD.id)
+
+    # then
+    assert rebuilt_index is not index
+
+
+def test_get_applicable_shipping_methods_for_instance_with_index(
+    checkout_with_item, address, shipping_zone, settings, django_assert_num_queries
+):
+    # given
+    checkout = checkout_with_item
+    checkout.shipping_address = address
+    checkout.save(update_fields=["shipping_address"])
+    lines, _ = fetch_checkout_lines(checkout)
+    price = Money(10, "USD")
+    expected_methods = list(
+        get_applicable_shipping_methods_for_instance(
+            checkout, checkout.channel_id, price, lines=lines
+        )
+    )
+    settings.SHIPPING_RULES_INDEX_ENABLED = True
+    get_shipping_rules_index(checkout.channel_id)
+
+    # when
+    with django_assert_num_queries(0):
+        methods = get_applicable_shipping_methods_for_instance(
+            checkout, checkout.channel_id, price, lines=lines
+        )
+
+    # then
+    assert expected_methods
+    assert methods == expected_methods
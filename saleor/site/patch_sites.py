@@ -10,42 +10,43 @@ from django.contrib.sites.models import Site, SiteManager
 from django.core.exceptions import ImproperlyConfigured
 from django.http.request import split_domain_port
 
+from .utils import get_site_cache_version
+
 lock = threading.Lock()
 with lock:
     THREADED_SITE_CACHE = {}
 
 
-def new_get_current(self, request=None):
+def _get_cached_site(manager, version, key, **lookup):
+    # sites are cached with the version they were loaded for, so a site loaded
+    # while the version was being changed is not served for the new version
+    cache_key = (version, key)
+    site = THREADED_SITE_CACHE.get(cache_key)
+    if site is None:
+        site = manager.prefetch_related("settings").filter(**lookup)[0]
+        with lock:
+            # sites of other versions won't be used anymore
+            for stale_key in [k for k in THREADED_SITE_CACHE if k[0] != version]:
+                del THREADED_SITE_CACHE[stale_key]
+            THREADED_SITE_CACHE[cache_key] = site
+    return site
+
+
+def _get_current_site(manager, version, request=None):
     from django.conf import settings
 
     if getattr(settings, "SITE_ID", ""):
         site_id = settings.SITE_ID
-        if site_id not in THREADED_SITE_CACHE:
-            with lock:
-                site = self.prefetch_related("settings").filter(pk=site_id)[0]
-                THREADED_SITE_CACHE[site_id] = site
-        return THREADED_SITE_CACHE[site_id]
+        return _get_cached_site(manager, version, site_id, pk=site_id)
     elif request:
         host = request.get_host()
         try:
             # First attempt to look up the site by host with or without port.
-            if host not in THREADED_SITE_CACHE:
-                with lock:
-                    site = self.prefetch_related("settings").filter(
-                        domain__iexact=host
-                    )[0]
-                    THREADED_SITE_CACHE[host] = site
-            return THREADED_SITE_CACHE[host]
+            return _get_cached_site(manager, version, host, domain__iexact=host)
         except Site.DoesNotExist:
             # Fallback to looking up site after stripping port from the host.
             domain, dummy_port = split_domain_port(host)
-            if domain not in THREADED_SITE_CACHE:
-                with lock:
-                    site = self.prefetch_related("settings").filter(
-                        domain__iexact=domain
-                    )[0]
-                    THREADED_SITE_CACHE[domain] = site
-        return THREADED_SITE_CACHE[domain]
+            return _get_cached_site(manager, version, domain, domain__iexact=domain)
 
     raise ImproperlyConfigured(
         "You're using the Django sites framework without having"
@@ -55,10 +56,20 @@ def new_get_current(self, request=None):
     )
 
 
+def new_get_current(self, request=None):
+    from django.conf import settings
+
+    if not settings.SITE_CACHE_ENABLED:
+        return _get_current_site(self, None, request)
+
+    # the cached site is shared by all threads of the process, callers changing it
+    # have to use `get_site_for_update`
+    return _get_current_site(self, get_site_cache_version(), request)
+
+
 def new_clear_cache(self):
-    global THREADED_SITE_CACHE
     with lock:
-        THREADED_SITE_CACHE = {}
+        THREADED_SITE_CACHE.clear()
 
 
 def new_get_by_natural_key(self, domain):
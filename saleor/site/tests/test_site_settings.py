@@ -1,6 +1,17 @@
+from unittest.mock import patch
+
+import pytest
 from django.contrib.sites.models import Site
+from django.core.cache import cache
 
+from ...tests.utils import flush_post_commit_hooks
 from ..models import SiteSettings
+from ..utils import (
+    SITE_CACHE_VERSION_CACHE_KEY,
+    get_site_for_update,
+    invalidate_site_cache,
+    site_cache_version_for_request,
+)
 
 
 def test_new_get_current():
@@ -9,3 +20,82 @@ def test_new_get_current():
     assert result.domain == "mirumee.com"
     assert type(result.settings) == SiteSettings
     assert str(result.settings) == "mirumee.com"
+
+
+@pytest.fixture
+def site_cache(settings):
+    settings.SITE_CACHE_ENABLED = True
+    cache.delete(SITE_CACHE_VERSION_CACHE_KEY)
+
+
+def test_new_get_current_cached(site_cache, django_assert_num_queries):
+    # given
+    Site.objects.get_current()
+
+    # when
+    with django_assert_num_queries(0):
+        result = Site.objects.get_current()
+        site_settings = result.settings
+
+    # then
+    assert result.domain == "mirumee.com"
+    assert site_settings.default_mail_sender_name == "Mirumee Labs"
+
+
+def test_new_get_current_cached_in_request_checks_version_once(site_cache):
+    # given
+    Site.objects.get_current()
+
+    # when
+    with patch(
+        "saleor.site.utils.cache.get", wraps=cache.get
+    ) as cache_get_mock, site_cache_version_for_request():
+        first_result = Site.objects.get_current()
+        second_result = Site.objects.get_current()
+
+    # then
+    assert first_result is second_result
+    cache_get_mock.assert_called_once_with(SITE_CACHE_VERSION_CACHE_KEY)
+
+
+def test_get_site_for_update_returns_copy(site_cache, rf):
+    # given
+    request = rf.get("/")
+    cached_site = Site.objects.get_current()
+
+    # when
+    site = get_site_for_update(request)
+    site.settings.header_text = "Changed"
+
+    # then
+    assert request.site is site
+    assert site is not cached_site
+    assert Site.objects.get_current().settings.header_text == ""
+
+
+def test_invalidate_site_cache_in_request(site_cache, site_settings):
+    # given
+    with site_cache_version_for_request():
+        Site.objects.get_current()
+        SiteSettings.objects.filter(pk=site_settings.pk).update(header_text="Changed")
+
+        # when
+        invalidate_site_cache()
+        result = Site.objects.get_current()
+
+    # then
+    assert result.settings.header_text == "Changed"
+
+
+def test_new_get_current_cached_after_invalidation(site_cache, site_settings):
+    # given
+    Site.objects.get_current()
+    SiteSettings.objects.filter(pk=site_settings.pk).update(header_text="Changed")
+
+    # when
+    invalidate_site_cache()
+    flush_post_commit_hooks()
+    result = Site.objects.get_current()
+
+    # then
+    assert result.settings.header_text == "Changed"
@@ -0,0 +1,88 @@
+import copy
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Dict, Optional
+from uuid import uuid4
+
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.db import transaction
+
+if TYPE_CHECKING:
+    from django.http import HttpRequest
+
+SITE_CACHE_VERSION_CACHE_KEY = "site_cache_version"
+
+# Version of the cached sites checked once for the whole request.
+_request_site_cache_version: ContextVar[Optional[Dict[str, str]]] = ContextVar(
+    "request_site_cache_version", default=None
+)
+
+
+def _get_site_cache_timeout() -> float:
+    return settings.SITE_CACHE_TIMEOUT.total_seconds()
+
+
+def _set_new_site_cache_version():
+    version = uuid4().hex
+    cache.set(SITE_CACHE_VERSION_CACHE_KEY, version, _get_site_cache_timeout())
+    request_version = _request_site_cache_version.get()
+    if request_version is not None:
+        request_version["version"] = version
+
+
+def get_site_cache_version() -> str:
+    """Return the version of sites and site settings cached by processes.
+
+    The version expires after `SITE_CACHE_TIMEOUT`, so processes also reload sites
+    changed outside the API.
+    """
+    request_version = _request_site_cache_version.get()
+    if request_version is not None and "version" in request_version:
+        return request_version["version"]
+    version = cache.get(SITE_CACHE_VERSION_CACHE_KEY)
+    if version is None:
+        cache.add(SITE_CACHE_VERSION_CACHE_KEY, uuid4().hex, _get_site_cache_timeout())
+        version = cache.get(SITE_CACHE_VERSION_CACHE_KEY)
+    if request_version is not None:
+        request_version["version"] = version
+    return version
+
+
+@contextmanager
+def site_cache_version_for_request():
+    """Check the version of cached sites once for all sites got in the block.
+
+    The version is fetched from the shared cache when the site is first needed;
+    sites got later in the block use the same version, unless it's changed by
+    `invalidate_site_cache`.
+    """
+    token = _request_site_cache_version.set({})
+    try:
+        yield
+    finally:
+        _request_site_cache_version.reset(token)
+
+
+def get_site_for_update(request: "HttpRequest") -> Site:
+    """Return a copy of the current site which can be changed and saved.
+
+    Cached sites are shared by all threads of the process, so they can't be changed
+    in place. The copy is assigned to the request, so the rest of the request sees
+    the changes.
+    """
+    site = copy.deepcopy(Site.objects.get_current())
+    request.site = site  # type: ignore
+    return site
+
+
+def invalidate_site_cache():
+    """Make all processes reload the site and its settings.
+
+    The version is changed right away, so the current request doesn't see a stale
+    site, and again once the transaction is committed, so sites cached by other
+    requests in the meantime are reloaded as well.
+    """
+    _set_new_site_cache_version()
+    transaction.on_commit(_set_new_site_cache_version)
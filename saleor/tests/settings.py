@@ -38,6 +38,9 @@ MEDIA_ROOT = None
 MEDIA_URL = "/media/"
 MAX_CHECKOUT_LINE_QUANTITY = 50
 
+# Don't reuse `totalCount` values between tests.
+GRAPHQL_TOTAL_COUNT_CACHE_TIMEOUT = timedelta(0)  # noqa: F405
+
 AUTH_PASSWORD_VALIDATORS = []
 
 PASSWORD_HASHERS = ["saleor.tests.dummy_password_hasher.DummyHasher"]
@@ -1,9 +1,10 @@
 from collections import defaultdict, namedtuple
 from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Tuple, cast
 
+from django.conf import settings
 from django.db import transaction
-from django.db.models import F, Sum
-from django.db.models.expressions import Exists, OuterRef
+from django.db.models import F, IntegerField, Sum, Value
+from django.db.models.expressions import Exists, OuterRef, Subquery
 from django.db.models.functions import Coalesce
 
 from ..checkout.models import CheckoutLine
@@ -52,6 +53,10 @@ def allocate_stocks(
     Iterate by stocks and allocate as many items as needed or available in stock
     for order line, until allocated all required quantity for the order line.
     If there is less quantity in stocks then rise InsufficientStock exception.
+
+    With `ATOMIC_STOCK_ALLOCATION` enabled, lines are allocated from single stocks
+    with conditional updates, see `_allocate_stocks_atomically`. Orders with lines
+    that have to be split between stocks are allocated with the locks.
     """
     # allocation only applied to order lines with variants with track inventory
     # set to True
@@ -59,12 +64,44 @@ def allocate_stocks(
     if not order_lines_info:
         return
 
-    variants = [line_info.variant for line_info in order_lines_info]
-    filter_lookup = {"product_variant__in": variants}
-
+    filter_lookup: Dict[str, Any] = {}
     if additional_filter_lookup is not None:
         filter_lookup.update(additional_filter_lookup)
 
+    if settings.ATOMIC_STOCK_ALLOCATION and _allocate_stocks_atomically(
+        order_lines_info,
+        country_code,
+        channel_slug,
+        manager,
+        filter_lookup,
+        check_reservations,
+        checkout_lines,
+    ):
+        return
+
+    _allocate_stocks_with_locks(
+        order_lines_info,
+        country_code,
+        channel_slug,
+        manager,
+        filter_lookup,
+        check_reservations,
+        checkout_lines,
+    )
+
+
+def _allocate_stocks_with_locks(
+    order_lines_info: Iterable["OrderLineInfo"],
+    country_code: str,
+    channel_slug: str,
+    manager: PluginsManager,
+    filter_lookup: Dict[str, Any],
+    check_reservations: bool,
+    checkout_lines: Optional[Iterable["CheckoutLine"]],
+):
+    variants = [line_info.variant for line_info in order_lines_info]
+    filter_lookup = {"product_variant__in": variants, **filter_lookup}
+
     stocks = list(
         Stock.objects.select_for_update(of=("self",))
         .for_country_and_channel(country_code, channel_slug)
@@ -152,6 +189,109 @@ def allocate_stocks(
                 )
 
 
+def _allocate_stocks_atomically(
+    order_lines_info: Iterable["OrderLineInfo"],
+    country_code: str,
+    channel_slug: str,
+    manager: PluginsManager,
+    filter_lookup: Dict[str, Any],
+    check_reservations: bool,
+    checkout_lines: Optional[Iterable["CheckoutLine"]],
+) -> bool:
+    """Allocate each line from a single stock with conditional updates.
+
+    Stocks aren't locked and allocations aren't summed upfront. The maintained
+    `Stock.quantity_allocated` counter is increased by an update that matches only
+    when the stock has enough quantity available, so concurrent allocations of one
+    variant wait only for each other's single row update.
+
+    Stocks are tried in the order of variants and stock IDs, so transactions
+    allocating only this way lock rows in a consistent order.
+
+    When no single stock can cover a line, it has to be split between stocks by the
+    locking path, which locks stocks in the order of their IDs. The updated rows
+    would stay locked meanwhile and the two orders of locks could deadlock with
+    other transactions, so the allocations are rolled back and False is returned
+    to allocate the whole order with the locks. Raise InsufficientStock for lines
+    of variants with one stock only that can't be allocated.
+    """
+    stocks = (
+        Stock.objects.for_country_and_channel(country_code, channel_slug)
+        .filter(
+            product_variant__in=[line_info.variant for line_info in order_lines_info],
+            **filter_lookup,
+        )
+        .order_by("pk")
+        .values_list("pk", "product_variant_id")
+    )
+    variant_to_stock_ids: Dict[int, List[int]] = defaultdict(list)
+    for stock_pk, variant_id in stocks:
+        variant_to_stock_ids[variant_id].append(stock_pk)
+
+    quantity_reserved: Any = Value(0)
+    if check_reservations:
+        reservations = (
+            Reservation.objects.filter(stock_id=OuterRef("pk"))
+            .not_expired()
+            .exclude_checkout_lines(checkout_lines or [])
+            .values("stock_id")
+            .annotate(quantity_reserved_sum=Sum("quantity_reserved"))
+            .values("quantity_reserved_sum")
+        )
+        quantity_reserved = Coalesce(
+            Subquery(reservations, output_field=IntegerField()), 0
+        )
+
+    # releases row locks taken by the updates when rolled back
+    savepoint = transaction.savepoint()
+    insufficient_stock: List[InsufficientStockData] = []
+    allocations: List[Allocation] = []
+    for line_info in sorted(
+        order_lines_info, key=lambda line_info: line_info.variant.pk  # type: ignore
+    ):
+        variant = cast(ProductVariant, line_info.variant)
+        stock_ids = variant_to_stock_ids[variant.pk]
+        for stock_pk in stock_ids:
+            updated = Stock.objects.filter(
+                pk=stock_pk,
+                quantity__gte=F("quantity_allocated")
+                + quantity_reserved
+                + line_info.quantity,
+            ).update(quantity_allocated=F("quantity_allocated") + line_info.quantity)
+            if updated:
+                allocations.append(
+                    Allocation(
+                        order_line=line_info.line,
+                        stock_id=stock_pk,
+                        quantity_allocated=line_info.quantity,
+                    )
+                )
+                break
+        else:
+            if len(stock_ids) > 1:
+                transaction.savepoint_rollback(savepoint)
+                return False
+            insufficient_stock.append(
+                InsufficientStockData(variant=variant, order_line=line_info.line)
+            )
+    transaction.savepoint_commit(savepoint)
+
+    if insufficient_stock:
+        raise InsufficientStock(insufficient_stock)
+
+    if allocations:
+        Allocation.objects.bulk_create(allocations)
+        out_of_stock = Stock.objects.filter(
+            pk__in=[allocation.stock_id for allocation in allocations],
+            quantity__lte=F("quantity_allocated"),
+        )
+        for stock in out_of_stock:
+            transaction.on_commit(
+                lambda stock=stock: manager.product_variant_out_of_stock(stock)
+            )
+    return True
+
+
 def _create_allocations(
     line_info: "OrderLineInfo",
     stocks: List[StockData],
@@ -1,9 +1,13 @@
+from datetime import timedelta
+
 from celery.utils.log import get_task_logger
+from django.conf import settings
 from django.db.models import F, Sum
 from django.db.models.functions import Coalesce
 from django.utils import timezone
 
 from ..celeryconf import app
+from ..core.db.batches import delete_in_batches
 from .models import Allocation, PreorderReservation, Reservation, Stock
 
 task_logger = get_task_logger(__name__)
@@ -11,26 +15,39 @@ task_logger = get_task_logger(__name__)
 
 @app.task
 def delete_empty_allocations_task():
-    count, _ = Allocation.objects.filter(quantity_allocated=0).delete()
-    if count:
-        task_logger.debug("Removed %s allocations", count)
+    result = delete_in_batches(
+        Allocation.objects.filter(quantity_allocated=0),
+        time_budget=settings.MAINTENANCE_TASK_TIME_BUDGET,
+        log=task_logger,
+    )
+    if result.count:
+        task_logger.debug("Removed %s allocations", result.count)
+    if not result.finished:
+        delete_empty_allocations_task.delay()
 
 
 @app.task
 def delete_expired_reservations_task():
-    stock_reservations, _ = Reservation.objects.filter(
-        reserved_until__lt=timezone.now()
-    ).delete()
-    preorder_reservations, _ = PreorderReservation.objects.filter(
-        reserved_until__lt=timezone.now()
-    ).delete()
-
-    if stock_reservations or preorder_reservations:
+    deadline = timezone.now() + settings.MAINTENANCE_TASK_TIME_BUDGET
+    stock_reservations = delete_in_batches(
+        Reservation.objects.filter(reserved_until__lt=timezone.now()),
+        time_budget=deadline - timezone.now(),
+        log=task_logger,
+    )
+    preorder_reservations = delete_in_batches(
+        PreorderReservation.objects.filter(reserved_until__lt=timezone.now()),
+        time_budget=max(deadline - timezone.now(), timedelta(0)),
+        log=task_logger,
+    )
+
+    if stock_reservations.count or preorder_reservations.count:
         task_logger.debug(
             "Removed %s stock reservations and %s preorder reservations",
-            stock_reservations,
-            preorder_reservations,
+            stock_reservations.count,
+            preorder_reservations.count,
         )
+    if not (stock_reservations.finished and preorder_reservations.finished):
+        delete_expired_reservations_task.delay()
 
 
 def update_stocks_quantity_allocated_task():
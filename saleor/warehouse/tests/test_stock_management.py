@@ -8,9 +8,11 @@ from ...core.exceptions import InsufficientStock
 from ...order.fetch import OrderLineInfo
 from ...order.models import OrderLine
 from ...plugins.manager import get_plugins_manager
+from ...product.models import ProductVariant
 from ...tests.utils import flush_post_commit_hooks
 from ...warehouse.models import Stock
 from ..management import (
+    _allocate_stocks_with_locks,
     allocate_preorders,
     allocate_stocks,
     deallocate_stock,
@@ -250,6 +252,187 @@ def test_allocate_stock_insufficient_stocks_for_multiple_lines(
     ).exists()
 
 
+def test_allocate_stocks_atomically(order_line, stock, channel_USD, settings):
+    # given
+    settings.ATOMIC_STOCK_ALLOCATION = True
+    stock.quantity = 100
+    stock.save(update_fields=["quantity"])
+
+    line_data = OrderLineInfo(line=order_line, variant=order_line.variant, quantity=50)
+
+    # when
+    allocate_stocks(
+        [line_data], COUNTRY_CODE, channel_USD.slug, manager=get_plugins_manager()
+    )
+
+    # then
+    stock.refresh_from_db()
+    assert stock.quantity == 100
+    allocation = Allocation.objects.get(order_line=order_line, stock=stock)
+    assert allocation.quantity_allocated == stock.quantity_allocated == 50
+
+
+@pytest.mark.parametrize("quantity", [3, 4])
+def test_allocate_stocks_atomically_from_single_stock(
+    quantity, order_line, variant_with_many_stocks, channel_USD, settings
+):
+    # given
+    settings.ATOMIC_STOCK_ALLOCATION = True
+    stocks = variant_with_many_stocks.stocks.order_by("pk")
+
+    line_data = OrderLineInfo(
+        line=order_line, variant=order_line.variant, quantity=quantity
+    )
+
+    # when
+    allocate_stocks(
+        [line_data], COUNTRY_CODE, channel_USD.slug, manager=get_plugins_manager()
+    )
+
+    # then
+    allocation = Allocation.objects.get(order_line=order_line)
+    assert allocation.stock == stocks[0]
+    assert allocation.quantity_allocated == quantity
+    assert stocks[0].quantity_allocated == quantity
+    assert stocks[1].quantity_allocated == 0
+
+
+def test_allocate_stocks_atomically_split_between_stocks(
+    order_line, variant_with_many_stocks, channel_USD, settings
+):
+    # given
+    settings.ATOMIC_STOCK_ALLOCATION = True
+    stocks = variant_with_many_stocks.stocks.order_by("pk")
+
+    line_data = OrderLineInfo(line=order_line, variant=order_line.variant, quantity=5)
+
+    # when
+    allocate_stocks(
+        [line_data], COUNTRY_CODE, channel_USD.slug, manager=get_plugins_manager()
+    )
+
+    # then
+    allocations = Allocation.objects.filter(order_line=order_line).order_by("stock")
+    assert allocations[0].quantity_allocated == stocks[0].quantity_allocated == 4
+    assert allocations[1].quantity_allocated == stocks[1].quantity_allocated == 1
+
+
+def test_allocate_stocks_atomically_with_lines_to_split(
+    order_line, variant_with_many_stocks, channel_USD, settings
+):
+    # given
+    settings.ATOMIC_STOCK_ALLOCATION = True
+    stocks = variant_with_many_stocks.stocks.order_by("pk")
+    other_variant = ProductVariant.objects.create(
+        product=variant_with_many_stocks.product, sku="SKU_OTHER"
+    )
+    other_stock = Stock.objects.create(
+        product_variant=other_variant, warehouse=stocks[0].warehouse, quantity=10
+    )
+    other_line = OrderLine.objects.get(pk=order_line.pk)
+    other_line.pk = None
+    other_line.variant = other_variant
+    other_line.save()
+
+    lines_data = [
+        OrderLineInfo(line=other_line, variant=other_variant, quantity=2),
+        OrderLineInfo(line=order_line, variant=order_line.variant, quantity=5),
+    ]
+
+    # when
+    with mock.patch(
+        "saleor.warehouse.management._allocate_stocks_with_locks",
+        wraps=_allocate_stocks_with_locks,
+    ) as allocate_with_locks_mock:
+        allocate_stocks(
+            lines_data, COUNTRY_CODE, channel_USD.slug, manager=get_plugins_manager()
+        )
+
+    # then
+    # the whole order is allocated with the locks, not only the line to split
+    assert allocate_with_locks_mock.call_args.args[0] == lines_data
+    other_stock.refresh_from_db()
+    other_allocation = Allocation.objects.get(order_line=other_line)
+    assert other_allocation.quantity_allocated == other_stock.quantity_allocated == 2
+    allocations = Allocation.objects.filter(order_line=order_line).order_by("stock")
+    assert allocations[0].quantity_allocated == stocks[0].quantity_allocated == 4
+    assert allocations[1].quantity_allocated == stocks[1].quantity_allocated == 1
+    assert Allocation.objects.count() == 3
+
+
+def test_allocate_stocks_atomically_with_reservations(
+    order_line,
+    variant_with_many_stocks,
+    channel_USD,
+    checkout_line_with_one_reservation,
+    settings,
+):
+    # given
+    settings.ATOMIC_STOCK_ALLOCATION = True
+    stocks = variant_with_many_stocks.stocks.order_by("pk")
+
+    line_data = OrderLineInfo(line=order_line, variant=order_line.variant, quantity=3)
+
+    # when
+    allocate_stocks(
+        [line_data],
+        COUNTRY_CODE,
+        channel_USD.slug,
+        manager=get_plugins_manager(),
+        check_reservations=True,
+    )
+
+    # then
+    allocation = Allocation.objects.get(order_line=order_line)
+    assert allocation.stock == stocks[1]
+    assert allocation.quantity_allocated == 3
+
+
+def test_allocate_stocks_atomically_insufficient_stock(
+    order_line, stock, channel_USD, settings
+):
+    # given
+    settings.ATOMIC_STOCK_ALLOCATION = True
+    stock.quantity = 10
+    stock.quantity_allocated = 5
+    stock.save(update_fields=["quantity", "quantity_allocated"])
+
+    line_data = OrderLineInfo(line=order_line, variant=order_line.variant, quantity=6)
+
+    # when
+    with pytest.raises(InsufficientStock) as exc:
+        allocate_stocks(
+            [line_data], COUNTRY_CODE, channel_USD.slug, manager=get_plugins_manager()
+        )
+
+    # then
+    assert exc.value.items[0].order_line == order_line
+    stock.refresh_from_db()
+    assert stock.quantity_allocated == 5
+    assert not Allocation.objects.filter(order_line=order_line).exists()
+
+
+@mock.patch("saleor.plugins.manager.PluginsManager.product_variant_out_of_stock")
+def test_allocate_stocks_atomically_triggers_out_of_stock(
+    out_of_stock_mock, order_line, stock, channel_USD, settings
+):
+    # given
+    settings.ATOMIC_STOCK_ALLOCATION = True
+    stock.quantity = 10
+    stock.save(update_fields=["quantity"])
+
+    line_data = OrderLineInfo(line=order_line, variant=order_line.variant, quantity=10)
+
+    # when
+    allocate_stocks(
+        [line_data], COUNTRY_CODE, channel_USD.slug, manager=get_plugins_manager()
+    )
+    flush_post_commit_hooks()
+
+    # then
+    out_of_stock_mock.assert_called_once_with(stock)
+
+
 def test_deallocate_stock(allocation):
     stock = allocation.stock
     stock.quantity = 100